@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+"""Measure archive download throughput against a local form endpoint."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Sequence
+from urllib.parse import parse_qs
+
+DEFAULT_ARCHIVES = 64
+DEFAULT_ARCHIVE_BYTES = 2 * 1024 * 1024
+DEFAULT_LATENCY_MS = 20.0
+DEFAULT_HOST_CONCURRENCY = 4
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the archive download benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Download synthetic HistData archives from a local HTTP stand-in "
+            "for get.php, once with a new connection per serial request and "
+            "once through the pooled ArchiveDownloadEngine, and report "
+            "archives per second for each path."
+        )
+    )
+    parser.add_argument(
+        "--archives",
+        type=int,
+        default=DEFAULT_ARCHIVES,
+        help="Number of month archives to download per path.",
+    )
+    parser.add_argument(
+        "--archive-bytes",
+        type=int,
+        default=DEFAULT_ARCHIVE_BYTES,
+        help="Approximate uncompressed CSV size inside each archive.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=DEFAULT_LATENCY_MS,
+        help="Server think time added before each response.",
+    )
+    parser.add_argument(
+        "--host-concurrency",
+        type=int,
+        default=DEFAULT_HOST_CONCURRENCY,
+        help="Concurrent downloads allowed by the pooled engine.",
+    )
+    return parser
+
+
+def archive_payload(archive_bytes: int) -> bytes:
+    """Return one stored (uncompressed) ZIP of about ``archive_bytes``."""
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("DAT_ASCII_EURUSD_T_200001.csv", b"r" * archive_bytes)
+    return stream.getvalue()
+
+
+def serve_archives(
+    payload_for: Callable[[str], bytes],
+    *,
+    latency_seconds: float,
+) -> ThreadingHTTPServer:
+    """Start a keep-alive HTTP/1.1 stand-in for the archive form endpoint."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", "0"))
+            form = parse_qs(self.rfile.read(length).decode())
+            datemonth = form["datemonth"][0]
+            payload = payload_for(datemonth)
+            time.sleep(latency_seconds)
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header(
+                "Content-Disposition",
+                f'attachment; filename="DAT_ASCII_EURUSD_T_{datemonth}.zip"',
+            )
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args: object) -> None:
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure(
+    count: int,
+    *,
+    archive_bytes: int,
+    latency_ms: float,
+    host_concurrency: int,
+) -> list[dict]:
+    """Time serial unpooled downloads against the pooled engine."""
+    import requests
+
+    from histdatacom.activity_stages import download_histdata_archive_to_record
+    from histdatacom.archive_downloads import ArchiveDownloadEngine
+    from histdatacom.records import Record
+
+    payload = archive_payload(archive_bytes)
+    server = serve_archives(
+        lambda datemonth: payload,
+        latency_seconds=latency_ms / 1000,
+    )
+    host, port = server.server_address[:2]
+    archive_url = f"http://{host}:{port}/get.php"
+
+    def records(data_dir: Path) -> list[Record]:
+        return [
+            Record(
+                url=(
+                    "http://www.histdata.com/download-free-forex-data/"
+                    f"?/ascii/tick-data-quotes/eurusd/{2000 + index // 12}/"
+                    f"{index % 12 + 1}"
+                ),
+                data_dir=f"{data_dir}/",
+                data_tk="bench",
+                data_date=str(2000 + index // 12),
+                data_datemonth=f"{2000 + index // 12}{index % 12 + 1:02d}",
+                data_format="ASCII",
+                data_timeframe="T",
+                data_fxpair="eurusd",
+            )
+            for index in range(count)
+        ]
+
+    def serial_requests_post(data_dir: Path) -> None:
+        for record in records(data_dir):
+            download_histdata_archive_to_record(
+                record,
+                timeout=30,
+                post_headers={"Connection": "close"},
+                post_archive=requests.post,
+                archive_url=archive_url,
+            )
+
+    def pooled_engine(data_dir: Path) -> None:
+        engine = ArchiveDownloadEngine(
+            host_concurrency=host_concurrency,
+            requests_per_second=0,
+        )
+
+        def download(record: Record) -> None:
+            download_histdata_archive_to_record(
+                record,
+                timeout=30,
+                post_headers={},
+                engine=engine,
+                archive_url=archive_url,
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=host_concurrency) as executor:
+                list(executor.map(download, records(data_dir)))
+        finally:
+            engine.close()
+
+    cases: tuple[tuple[str, Callable[[Path], None]], ...] = (
+        ("serial_requests_post", serial_requests_post),
+        ("pooled_engine", pooled_engine),
+    )
+    reports = []
+    try:
+        for name, run in cases:
+            with tempfile.TemporaryDirectory() as workspace:
+                started = time.perf_counter()
+                run(Path(workspace))
+                seconds = time.perf_counter() - started
+            reports.append(
+                {
+                    "path": name,
+                    "archive_count": count,
+                    "archive_bytes": len(payload),
+                    "seconds": round(seconds, 3),
+                    "archives_per_second": (
+                        round(count / seconds, 1) if seconds else 0
+                    ),
+                }
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return reports
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print JSON results."""
+    args = build_parser().parse_args(argv)
+    print(
+        json.dumps(
+            measure(
+                max(1, args.archives),
+                archive_bytes=max(1, args.archive_bytes),
+                latency_ms=max(0.0, args.latency_ms),
+                host_concurrency=max(1, args.host_concurrency),
+            ),
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""Measure broker capture append and replay throughput per durability mode."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import tempfile
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from histdatacom.broker_capture import (
+    AppendOnlyBrokerCaptureWriterV1,
+    BrokerAdapterMessageV1,
+    BrokerCaptureEventKind,
+    BrokerCaptureEventV1,
+    BrokerCapturePartitionEncoding,
+    BrokerCapturePriceTextSemantics,
+    BrokerCaptureSessionV1,
+    BrokerCaptureSourceTimestampSemantics,
+    BrokerCaptureStoragePolicyV1,
+    consume_broker_capture_source,
+    replay_broker_capture_session,
+)
+
+DEFAULT_EVENTS = 20_000
+DEFAULT_PARTITION_EVENTS = 5_000
+DEFAULT_GROUP_BYTES = 256 * 1024
+DEFAULT_GROUP_DELAY_MS = 50.0
+MODES = ("fsync-each-event", "flush-each-event", "group-commit")
+_WALL_BASE = 1_700_000_000_000_000_000
+_MONOTONIC_BASE = 2_000_000_000
+_EVENT_SPACING_NS = 250_000
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticQuoteSource:
+    """In-memory ``BrokerCaptureEventSourceV1`` over prebuilt events.
+
+    Events are built before timing starts so the benchmark measures the
+    writer rather than contract validation.
+    """
+
+    session: BrokerCaptureSessionV1
+    events: tuple[BrokerCaptureEventV1, ...]
+
+    @property
+    def session_id(self) -> str:
+        """Return the capture session identity."""
+        return self.session.session_id
+
+    def iter_events(self) -> Iterator[BrokerCaptureEventV1]:
+        """Yield the prebuilt events in capture order."""
+        return iter(self.events)
+
+
+def synthetic_quote_events(
+    session: BrokerCaptureSessionV1,
+    count: int,
+) -> tuple[BrokerCaptureEventV1, ...]:
+    """Return deterministic EURUSD quotes a quarter millisecond apart."""
+    events = []
+    for sequence in range(count):
+        offset = sequence * _EVENT_SPACING_NS
+        bid = f"1.{10000 + sequence % 997:05d}"
+        ask = f"1.{10008 + sequence % 997:05d}"
+        events.append(
+            BrokerCaptureEventV1(
+                session_id=session.session_id,
+                capture_sequence=sequence,
+                receive_time_utc_ns=_WALL_BASE + offset,
+                receive_time_monotonic_ns=_MONOTONIC_BASE + offset,
+                message=BrokerAdapterMessageV1(
+                    kind=BrokerCaptureEventKind.QUOTE,
+                    source_event_time_ns=_WALL_BASE + offset - 1_000_000,
+                    source_timestamp_semantics=(
+                        BrokerCaptureSourceTimestampSemantics.BROKER_EVENT
+                    ),
+                    source_timestamp_precision_ns=1_000,
+                    symbol="EURUSD",
+                    bid=float(bid),
+                    ask=float(ask),
+                    bid_text=bid,
+                    ask_text=ask,
+                    price_text_semantics=(
+                        BrokerCapturePriceTextSemantics.SOURCE_LEXEME
+                    ),
+                ),
+            )
+        )
+    return tuple(events)
+
+
+def synthetic_session(seed: int = 0) -> BrokerCaptureSessionV1:
+    """Return a public synthetic capture session."""
+
+    def digest(text: str) -> str:
+        return hashlib.sha256(f"{text}-{seed}".encode("utf-8")).hexdigest()
+
+    return BrokerCaptureSessionV1(
+        adapter_id="synthetic.benchmark",
+        adapter_version="1.0.0",
+        adapter_config_sha256=digest("config"),
+        protocol="synthetic-stream",
+        environment_id="benchmark",
+        server_id="benchmark-server",
+        started_at_utc_ns=_WALL_BASE + seed,
+        started_at_monotonic_ns=_MONOTONIC_BASE + seed,
+        account_id_sha256=digest("account"),
+        host_id_sha256=digest("host"),
+    )
+
+
+def storage_policy(
+    mode: str,
+    *,
+    partition_events: int,
+    group_bytes: int,
+    group_delay_ms: float,
+    encoding: str = BrokerCapturePartitionEncoding.JSONL.value,
+) -> BrokerCaptureStoragePolicyV1:
+    """Return the storage policy exercised by one benchmark mode."""
+    group_commit = mode == "group-commit"
+    return BrokerCaptureStoragePolicyV1(
+        max_partition_events=partition_events,
+        fsync_each_event=mode == "fsync-each-event",
+        group_commit_max_bytes=group_bytes if group_commit else 0,
+        group_commit_max_delay_ns=(
+            max(1, int(group_delay_ms * 1_000_000)) if group_commit else 0
+        ),
+        partition_encoding=BrokerCapturePartitionEncoding.from_value(encoding),
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the broker capture write benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Append synthetic quote events through AppendOnlyBrokerCapture"
+            "WriterV1 with per-event fsync, per-event flush, and group "
+            "commit, and report events per second for each mode."
+        )
+    )
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument(
+        "--partition-events",
+        type=int,
+        default=DEFAULT_PARTITION_EVENTS,
+        help="Events per partition before rotation.",
+    )
+    parser.add_argument(
+        "--group-bytes",
+        type=int,
+        default=DEFAULT_GROUP_BYTES,
+        help="Group-commit size bound in bytes.",
+    )
+    parser.add_argument(
+        "--group-delay-ms",
+        type=float,
+        default=DEFAULT_GROUP_DELAY_MS,
+        help="Group-commit durability window in milliseconds.",
+    )
+    parser.add_argument(
+        "--mode",
+        action="append",
+        choices=MODES,
+        help="Run only this mode; repeat to select several.",
+    )
+    parser.add_argument(
+        "--encoding",
+        choices=[item.value for item in BrokerCapturePartitionEncoding],
+        default=BrokerCapturePartitionEncoding.JSONL.value,
+        help="Partition encoding; arrow-ipc requires histdatacom[arrow].",
+    )
+    parser.add_argument(
+        "--read-ahead",
+        type=int,
+        default=0,
+        help="Partitions replay reads and hashes ahead on a thread pool.",
+    )
+    return parser
+
+
+def measure(
+    events: int,
+    *,
+    partition_events: int = DEFAULT_PARTITION_EVENTS,
+    group_bytes: int = DEFAULT_GROUP_BYTES,
+    group_delay_ms: float = DEFAULT_GROUP_DELAY_MS,
+    modes: Sequence[str] = MODES,
+    encoding: str = BrokerCapturePartitionEncoding.JSONL.value,
+    read_ahead: int = 0,
+) -> list[dict]:
+    """Time writing and replaying one capture session per mode."""
+    reports = []
+    for seed, mode in enumerate(modes):
+        session = synthetic_session(seed)
+        source = SyntheticQuoteSource(
+            session, synthetic_quote_events(session, events)
+        )
+        policy = storage_policy(
+            mode,
+            partition_events=partition_events,
+            group_bytes=group_bytes,
+            group_delay_ms=group_delay_ms,
+            encoding=encoding,
+        )
+        with tempfile.TemporaryDirectory() as workspace:
+            writer = AppendOnlyBrokerCaptureWriterV1(
+                Path(workspace), session=session, storage_policy=policy
+            )
+            started = time.perf_counter()
+            result = consume_broker_capture_source(source, sink=writer)
+            manifest = writer.close()
+            seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            replay_broker_capture_session(
+                Path(workspace), manifest, read_ahead=read_ahead
+            )
+            replay_seconds = time.perf_counter() - started
+        reports.append(
+            {
+                "mode": mode,
+                "encoding": encoding,
+                "event_count": result.event_count,
+                "partition_count": len(manifest.partitions),
+                "stored_bytes": sum(
+                    item.data_artifact.size_bytes
+                    for item in manifest.partitions
+                ),
+                "seconds": round(seconds, 3),
+                "events_per_second": (
+                    round(result.event_count / seconds) if seconds else 0
+                ),
+                "replay_seconds": round(replay_seconds, 3),
+                "replay_events_per_second": (
+                    round(result.event_count / replay_seconds)
+                    if replay_seconds
+                    else 0
+                ),
+            }
+        )
+    return reports
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print JSON results."""
+    args = build_parser().parse_args(argv)
+    print(
+        json.dumps(
+            measure(
+                max(1, args.events),
+                partition_events=max(1, args.partition_events),
+                group_bytes=max(1, args.group_bytes),
+                group_delay_ms=max(0.001, args.group_delay_ms),
+                modes=tuple(args.mode or MODES),
+                encoding=args.encoding,
+                read_ahead=max(0, args.read_ahead),
+            ),
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""Compare peak RSS of whole-file and streaming ASCII tick ingest."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Sequence
+
+DEFAULT_ROWS = 2_000_000
+MODES = ("whole-file", "streaming")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the cache-build memory benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Parse a synthetic HistData tick month with the whole-file and "
+            "streaming readers in isolated processes and report peak RSS."
+        )
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=DEFAULT_ROWS,
+        help="Synthetic tick rows written to the month archive.",
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=None,
+        help="Cache-build memory ceiling used to size streaming blocks.",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help="Existing HistData tick ZIP to parse instead of synthetic data.",
+    )
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    return parser
+
+
+def write_synthetic_archive(path: Path, rows: int) -> Path:
+    """Write a deterministic tick month ZIP shaped like a HistData download."""
+    member = "DAT_ASCII_EURUSD_T_201202.csv"
+    rng = random.Random(180)
+    bid = 1.3
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        with archive.open(member, "w") as stream:
+            for index in range(rows):
+                bid = round(bid + rng.uniform(-0.0002, 0.0002), 5)
+                millis = index * 1_000
+                day, millis = divmod(millis, 86_400_000)
+                stamp = (
+                    f"201202{day % 28 + 1:02d} "
+                    f"{millis // 3_600_000:02d}"
+                    f"{millis // 60_000 % 60:02d}"
+                    f"{millis // 1_000 % 60:02d}"
+                    f"{millis % 1_000:03d}"
+                )
+                stream.write(
+                    f"{stamp},{bid:.5f},{bid + 0.00012:.5f},0\n".encode()
+                )
+    return path
+
+
+def measure(mode: str, archive: Path, memory_limit_mb: int | None) -> dict:
+    """Parse ``archive`` in this process and return its peak RSS report."""
+    from histdatacom.histdata_ascii import (
+        ascii_chunk_bytes_for_memory_limit,
+        convert_polars_datetime_to_utc_ms,
+        iter_ascii_polars_chunks,
+        read_ascii_file_to_polars,
+    )
+    from histdatacom.resource_usage import peak_rss_bytes
+
+    import polars as pl
+
+    baseline = peak_rss_bytes()
+    started = time.perf_counter()
+    if mode == "whole-file":
+        frame = convert_polars_datetime_to_utc_ms(
+            read_ascii_file_to_polars(archive, "T"),
+            "T",
+        )
+    else:
+        limit = None if memory_limit_mb is None else memory_limit_mb << 20
+        frame = pl.concat(
+            iter_ascii_polars_chunks(
+                archive,
+                "T",
+                chunk_bytes=ascii_chunk_bytes_for_memory_limit(limit),
+            ),
+            rechunk=False,
+        )
+    return {
+        "mode": mode,
+        "rows": frame.height,
+        "seconds": round(time.perf_counter() - started, 3),
+        "frame_bytes": frame.estimated_size(),
+        "baseline_peak_rss_bytes": baseline,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run each ingest mode in a fresh interpreter and print JSON results."""
+    args = build_parser().parse_args(argv)
+    if args.mode is not None:
+        print(
+            json.dumps(measure(args.mode, args.archive, args.memory_limit_mb))
+        )
+        return 0
+
+    with tempfile.TemporaryDirectory() as workspace:
+        archive = args.archive or write_synthetic_archive(
+            Path(workspace, "HISTDATA_COM_ASCII_EURUSD_T201202.zip"),
+            args.rows,
+        )
+        reports = []
+        for mode in MODES:
+            command = [
+                sys.executable,
+                __file__,
+                "--mode",
+                mode,
+                "--archive",
+                str(archive),
+            ]
+            if args.memory_limit_mb is not None:
+                command += ["--memory-limit-mb", str(args.memory_limit_mb)]
+            completed = subprocess.run(
+                command, check=True, capture_output=True, text=True
+            )
+            reports.append(json.loads(completed.stdout))
+    print(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""Compare disk footprint and read latency of the cache layouts."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+DEFAULT_ROWS = 2_000_000
+DEFAULT_REPEATS = 5
+DAY_MS = 86_400_000
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the cache-format benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Write one tick month as an unversioned and a versioned .data "
+            "cache and report file size plus full and one-day read latency."
+        )
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="Existing .data cache to benchmark instead of synthetic ticks.",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=DEFAULT_ROWS,
+        help="Synthetic tick rows when no cache is given.",
+    )
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    return parser
+
+
+def synthetic_month(rows: int) -> Any:
+    """Return a deterministic one-month tick frame in cache dtypes."""
+    import polars as pl
+
+    start = 1_328_054_400_000
+    step = max(1, 28 * DAY_MS // max(rows, 1))
+    return pl.DataFrame(
+        {
+            "datetime": pl.int_range(0, rows, eager=True) * step + start,
+            "bid": 1.3
+            + (pl.int_range(0, rows, eager=True) % 997).cast(pl.Float64)
+            * 0.00001,
+        }
+    ).with_columns(
+        (pl.col("bid") + 0.00012).alias("ask"),
+        pl.lit(0, dtype=pl.Int32).alias("vol"),
+    )
+
+
+def median_seconds(operation: Callable[[], Any], repeats: int) -> float:
+    """Return the median wall time of ``operation`` over ``repeats`` runs."""
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples), 4)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Write both layouts and print a JSON comparison."""
+    from histdatacom.histdata_ascii import (
+        read_polars_cache,
+        write_polars_cache,
+    )
+
+    args = build_parser().parse_args(argv)
+    frame = (
+        read_polars_cache(args.cache)
+        if args.cache is not None
+        else synthetic_month(args.rows)
+    )
+    first = int(frame.get_column("datetime").min())
+    window = (first + 14 * DAY_MS, first + 15 * DAY_MS)
+    reports = []
+    with tempfile.TemporaryDirectory() as workspace:
+        unversioned = Path(workspace, "unversioned", ".data")
+        versioned = Path(workspace, "versioned", ".data")
+        unversioned.parent.mkdir()
+        versioned.parent.mkdir()
+        frame.write_ipc(unversioned)
+        write_polars_cache(frame, versioned)
+        for layout, path in (
+            ("unversioned", unversioned),
+            ("versioned", versioned),
+        ):
+            reports.append(
+                {
+                    "layout": layout,
+                    "rows": frame.height,
+                    "size_bytes": path.stat().st_size,
+                    "full_read_seconds": median_seconds(
+                        lambda path=path: read_polars_cache(path),
+                        args.repeats,
+                    ),
+                    "day_read_seconds": median_seconds(
+                        lambda path=path: read_polars_cache(
+                            path,
+                            start_utc_ms=window[0],
+                            end_utc_ms=window[1],
+                        ),
+                        args.repeats,
+                    ),
+                }
+            )
+    print(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
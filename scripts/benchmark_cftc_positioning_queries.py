@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""Measure CFTC positioning window sweeps, one query versus one batch."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections import Counter
+from datetime import date, datetime, time as datetime_time, timedelta, timezone
+from typing import Sequence
+
+from histdatacom.market_context import (
+    CftcPositioningCorpusV1,
+    query_cftc_positioning_corpus,
+    query_cftc_positioning_corpus_windows,
+    read_cftc_positioning_corpus,
+)
+from histdatacom.synthetic.information import InformationMode
+
+DEFAULT_WINDOWS = 8_760
+DEFAULT_WINDOW_MINUTES = 60
+_MINUTE_NS = 60 * 1_000_000_000
+
+
+def window_sweep(
+    start: date,
+    end: date,
+    windows: int,
+    *,
+    window_minutes: int,
+    ex_ante: bool,
+) -> list[tuple[int, int, int | None]]:
+    """Return evenly spaced start-sorted ``(start, end, as_of)`` windows."""
+    first = _date_ns(start)
+    width = window_minutes * _MINUTE_NS
+    step = max(1, (_date_ns(end) - first - width) // windows)
+    return [
+        (
+            first + index * step,
+            first + index * step + width,
+            first + index * step if ex_ante else None,
+        )
+        for index in range(windows)
+    ]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CFTC positioning query benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Sweep reconstruction windows across a CFTC positioning corpus "
+            "with one query per window and with the batched window query, "
+            "and report queries per second for each."
+        )
+    )
+    parser.add_argument(
+        "--corpus",
+        required=True,
+        help="Content-addressed cftc-positioning-corpus-<sha256>.json.",
+    )
+    parser.add_argument("--windows", type=int, default=DEFAULT_WINDOWS)
+    parser.add_argument(
+        "--window-minutes",
+        type=int,
+        default=DEFAULT_WINDOW_MINUTES,
+        help="Width of each query window.",
+    )
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        help="First window date (default: the year before the profile end).",
+    )
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        help="Sweep end date (default: the corpus profile end date).",
+    )
+    parser.add_argument(
+        "--information-mode",
+        choices=[item.value for item in InformationMode],
+        default=InformationMode.EX_ANTE_SIMULATION.value,
+        help="Ex-ante sweeps use each window start as its as-of cutoff.",
+    )
+    return parser
+
+
+def measure(
+    corpus: CftcPositioningCorpusV1,
+    windows: Sequence[tuple[int, int, int | None]],
+    *,
+    information_mode: InformationMode,
+) -> list[dict]:
+    """Time the same sweep as single queries and as one batch."""
+    started = time.perf_counter()
+    single = [
+        query_cftc_positioning_corpus(
+            corpus,
+            start_ns=start,
+            end_ns=end,
+            as_of_ns=as_of,
+            information_mode=information_mode,
+        )
+        for start, end, as_of in windows
+    ]
+    single_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    batch = query_cftc_positioning_corpus_windows(
+        corpus, windows=windows, information_mode=information_mode
+    )
+    batch_seconds = time.perf_counter() - started
+    if [item.query_id for item in batch] != [item.query_id for item in single]:
+        raise RuntimeError("batched positioning queries differ from singles")
+    statuses = Counter(item.status.value for item in batch)
+    return [
+        {
+            "method": method,
+            "information_mode": information_mode.value,
+            "snapshot_count": len(corpus.snapshots),
+            "window_count": len(windows),
+            "status_counts": dict(sorted(statuses.items())),
+            "seconds": round(seconds, 3),
+            "queries_per_second": (
+                round(len(windows) / seconds) if seconds else 0
+            ),
+        }
+        for method, seconds in (
+            ("single", single_seconds),
+            ("batch", batch_seconds),
+        )
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print JSON results."""
+    args = build_parser().parse_args(argv)
+    corpus = read_cftc_positioning_corpus(args.corpus)
+    end = args.end_date or date.fromisoformat(corpus.profile.end_date)
+    start = args.start_date or end - timedelta(days=365)
+    mode = InformationMode.from_value(args.information_mode)
+    windows = window_sweep(
+        start,
+        end,
+        max(1, args.windows),
+        window_minutes=max(1, args.window_minutes),
+        ex_ante=mode is InformationMode.EX_ANTE_SIMULATION,
+    )
+    print(json.dumps(measure(corpus, windows, information_mode=mode), indent=2))
+    return 0
+
+
+def _date_ns(value: date) -> int:
+    return int(
+        datetime.combine(
+            value, datetime_time(), tzinfo=timezone.utc
+        ).timestamp()
+        * 1_000_000_000
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+"""Measure InfluxDB write throughput against a local write endpoint."""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Sequence
+
+import requests
+
+DEFAULT_LINES = 200_000
+DEFAULT_EMIT_LINES = 1_000
+DEFAULT_LATENCY_MS = 10.0
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_REJECT_EVERY = 0
+
+
+class WriteEndpoint(ThreadingHTTPServer):
+    """Local stand-in for the InfluxDB v2 ``/api/v2/write`` endpoint.
+
+    Lines containing ``reject`` fail the whole body with HTTP 400, as a
+    real server does for a malformed point.  ``throttle_every`` answers
+    every Nth request with HTTP 429.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        *,
+        latency_seconds: float = 0.0,
+        throttle_every: int = 0,
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _WriteHandler)
+        self.latency_seconds = latency_seconds
+        self.throttle_every = throttle_every
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self.lines = 0
+        self.gzip_bodies = 0
+        self.connections: set[int] = set()
+
+    @property
+    def url(self) -> str:
+        """Return the base URL to use as ``INFLUX_URL``."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "WriteEndpoint":
+        """Serve requests on a daemon thread."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self.shutdown()
+        self.server_close()
+
+
+class _WriteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: WriteEndpoint
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        body = self.rfile.read(length)
+        gzipped = self.headers.get("Content-Encoding") == "gzip"
+        if gzipped:
+            body = gzip.decompress(body)
+        lines = [line for line in body.split(b"\n") if line]
+        with self.server.lock:
+            self.server.requests += 1
+            request_number = self.server.requests
+            self.server.active += 1
+            self.server.max_active = max(
+                self.server.max_active,
+                self.server.active,
+            )
+            self.server.connections.add(id(self.connection))
+        try:
+            time.sleep(self.server.latency_seconds)
+            throttle_every = self.server.throttle_every
+            if throttle_every and request_number % throttle_every == 0:
+                self._reply(429, b'{"code":"too many requests"}')
+            elif any(b"reject" in line for line in lines):
+                self._reply(400, b'{"code":"invalid","message":"bad point"}')
+            else:
+                with self.server.lock:
+                    self.server.lines += len(lines)
+                    self.server.gzip_bodies += int(gzipped)
+                self._reply(204, b"")
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def _reply(self, status: int, payload: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args: object) -> None:
+        return
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the Influx write benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Write synthetic line protocol to a local HTTP stand-in for "
+            "InfluxDB /api/v2/write, once as one uncompressed request per "
+            "emitted batch and once through InfluxBulkWriter, and report "
+            "lines per second and the peak number of in-flight requests."
+        )
+    )
+    parser.add_argument(
+        "--lines",
+        type=int,
+        default=DEFAULT_LINES,
+        help="Number of line-protocol points to write per path.",
+    )
+    parser.add_argument(
+        "--emit-lines",
+        type=int,
+        default=DEFAULT_EMIT_LINES,
+        help="Lines per emitted batch, as produced by the import activity.",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=DEFAULT_LATENCY_MS,
+        help="Server think time added before each response.",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help="Concurrent request bodies allowed by the bulk writer.",
+    )
+    parser.add_argument(
+        "--reject-every",
+        type=int,
+        default=DEFAULT_REJECT_EVERY,
+        help="Make every Nth line invalid to exercise 4xx bisection.",
+    )
+    return parser
+
+
+def synthetic_batches(
+    lines: int,
+    emit_lines: int,
+    reject_every: int,
+) -> list[bytes]:
+    """Return encoded line-protocol batches shaped like import output."""
+    batches = []
+    for start in range(0, lines, emit_lines):
+        batch = []
+        for index in range(start, min(lines, start + emit_lines)):
+            measurement = (
+                "reject"
+                if reject_every and (index + 1) % reject_every == 0
+                else "ticks"
+            )
+            batch.append(
+                f"{measurement},source=histdata.com,format=ascii,"
+                f"timeframe=tick-data-quotes,fxpair=EURUSD "
+                f"bidquote=1.{index % 10000:04d},askquote=1.{index % 9999:04d} "
+                f"{946684800000 + index}"
+            )
+        batches.append("\n".join(batch).encode())
+    return batches
+
+
+def measure(
+    lines: int,
+    *,
+    emit_lines: int,
+    latency_ms: float,
+    max_in_flight: int,
+    reject_every: int,
+) -> list[dict]:
+    """Time per-batch synchronous posts against the bulk writer."""
+    from histdatacom.exceptions import InfluxImportError
+    from histdatacom.influx_bulk import InfluxBulkWriter
+
+    batches = synthetic_batches(lines, emit_lines, reject_every)
+    endpoint = WriteEndpoint(latency_seconds=latency_ms / 1000).start()
+    args = {
+        "INFLUX_ORG": "bench",
+        "INFLUX_BUCKET": "bench",
+        "INFLUX_URL": endpoint.url,
+        "INFLUX_TOKEN": "token",
+    }
+
+    def synchronous_posts() -> None:
+        session = requests.Session()
+        try:
+            for batch in batches:
+                session.post(
+                    f"{endpoint.url}/api/v2/write",
+                    params={"org": "bench", "bucket": "bench"},
+                    data=batch,
+                    timeout=30,
+                ).close()
+        finally:
+            session.close()
+
+    def bulk_writer() -> None:
+        writer = InfluxBulkWriter(args, max_in_flight=max_in_flight)
+        try:
+            for batch in batches:
+                writer.write_lines(batch)
+            writer.close()
+        except InfluxImportError as err:
+            if err.code != "INFLUX_WRITE_REJECTED":
+                raise
+
+    cases: tuple[tuple[str, Callable[[], None]], ...] = (
+        ("synchronous_posts", synchronous_posts),
+        ("bulk_writer", bulk_writer),
+    )
+    reports = []
+    try:
+        for name, run in cases:
+            with endpoint.lock:
+                endpoint.requests = endpoint.lines = endpoint.max_active = 0
+            started = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - started
+            reports.append(
+                {
+                    "path": name,
+                    "line_count": lines,
+                    "lines_accepted": endpoint.lines,
+                    "requests": endpoint.requests,
+                    "max_in_flight": endpoint.max_active,
+                    "seconds": round(seconds, 3),
+                    "lines_per_second": (
+                        round(endpoint.lines / seconds) if seconds else 0
+                    ),
+                }
+            )
+    finally:
+        endpoint.stop()
+    return reports
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print JSON results."""
+    args = build_parser().parse_args(argv)
+    print(
+        json.dumps(
+            measure(
+                max(1, args.lines),
+                emit_lines=max(1, args.emit_lines),
+                latency_ms=max(0.0, args.latency_ms),
+                max_in_flight=max(1, args.max_in_flight),
+                reject_every=max(0, args.reject_every),
+            ),
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
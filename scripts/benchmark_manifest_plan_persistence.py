@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""Measure dataset-plan persistence throughput in the manifest store."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+DEFAULT_WORK_ITEMS = 10_000
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the manifest persistence benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Persist a synthetic dataset plan through per-item writes and "
+            "through the batched ManifestStatusStore APIs, and report work "
+            "items per second for each path."
+        )
+    )
+    parser.add_argument(
+        "--work-items",
+        type=int,
+        default=DEFAULT_WORK_ITEMS,
+        help="Number of synthetic work items in the plan.",
+    )
+    return parser
+
+
+def synthetic_work_items(count: int) -> tuple:
+    """Return ``count`` month-level work items across a few symbols."""
+    from histdatacom.runtime_contracts import WorkItem, WorkStatus
+
+    return tuple(
+        WorkItem(
+            work_id=f"bench-{index:06d}",
+            status=WorkStatus.URL_NEW,
+            data_format="ASCII",
+            data_timeframe="T",
+            data_fxpair=f"pair{index % 16:02d}",
+            data_datemonth=f"{2000 + index // 12 % 25}{index % 12 + 1:02d}",
+        )
+        for index in range(count)
+    )
+
+
+def measure(count: int) -> list[dict]:
+    """Time each persistence path against a fresh store."""
+    from histdatacom.manifest_store import ManifestStatusStore
+    from histdatacom.runtime_contracts import StageResult, WorkStatus
+
+    items = synthetic_work_items(count)
+    stage_results = tuple(
+        StageResult(
+            work_id=item.work_id,
+            stage="validate_url",
+            status=WorkStatus.URL_VALID,
+            metrics={"attempts": 1},
+        )
+        for item in items
+    )
+
+    def per_item(store: ManifestStatusStore) -> None:
+        for item in items:
+            store.write_work_item(item, source="dataset_plan")
+
+    def dataset_plan(store: ManifestStatusStore) -> None:
+        store.write_dataset_plan(
+            plan_id="bench-plan",
+            request_id="bench",
+            work_items=items,
+        )
+
+    def stage_results_per_item(store: ManifestStatusStore) -> None:
+        for result in stage_results:
+            store.write_stage_result(result)
+
+    def stage_results_many(store: ManifestStatusStore) -> None:
+        store.write_stage_results_many(stage_results)
+
+    cases: tuple[tuple[str, Callable[[ManifestStatusStore], None]], ...] = (
+        ("write_work_item", per_item),
+        ("write_dataset_plan", dataset_plan),
+        ("write_stage_result", stage_results_per_item),
+        ("write_stage_results_many", stage_results_many),
+    )
+    reports = []
+    for name, run in cases:
+        with tempfile.TemporaryDirectory() as workspace:
+            store = ManifestStatusStore(Path(workspace))
+            started = time.perf_counter()
+            run(store)
+            seconds = time.perf_counter() - started
+        reports.append(
+            {
+                "path": name,
+                "work_item_count": count,
+                "seconds": round(seconds, 3),
+                "items_per_second": round(count / seconds, 1) if seconds else 0,
+            }
+        )
+    return reports
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print JSON results."""
+    args = build_parser().parse_args(argv)
+    print(json.dumps(measure(max(1, args.work_items)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
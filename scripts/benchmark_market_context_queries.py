@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+"""Measure market-context window sweeps against a full timeline scan."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import time
+from datetime import datetime, timezone
+from typing import Sequence
+
+from histdatacom.market_context import (
+    MAX_MARKET_CONTEXT_EVENTS,
+    MarketContextEventV1,
+    MarketContextKind,
+    MarketContextPrecision,
+    MarketContextSourceV1,
+    MarketContextTimelineV1,
+    MarketContextView,
+    query_market_context,
+)
+
+DEFAULT_EVENTS = MAX_MARKET_CONTEXT_EVENTS
+DEFAULT_WINDOWS = 10_000
+DEFAULT_WINDOW_MINUTES = 60
+_SECOND_NS = 1_000_000_000
+_HOUR_NS = 3_600 * _SECOND_NS
+_DAY_NS = 24 * _HOUR_NS
+_COVERAGE_START_NS = 1_640_995_200 * _SECOND_NS
+_COVERAGE_DAYS = 365
+_CURRENCIES = ("USD", "EUR", "GBP", "JPY", "CHF", "AUD", "CAD", "NZD")
+_KINDS = (
+    MarketContextKind.MACRO_RELEASE,
+    MarketContextKind.CENTRAL_BANK_DECISION,
+    MarketContextKind.SCHEDULED_COMMUNICATION,
+)
+
+
+def synthetic_source() -> MarketContextSourceV1:
+    """Return one public synthetic source retrieved after coverage ends."""
+    return MarketContextSourceV1(
+        name="Synthetic benchmark calendar",
+        source_version="benchmark-v1",
+        retrieved_at_ns=_COVERAGE_START_NS + (_COVERAGE_DAYS + 1) * _DAY_NS,
+        content_sha256=hashlib.sha256(b"benchmark").hexdigest(),
+        adapter_name="synthetic.benchmark",
+        adapter_version="1.0.0",
+        license_name="Synthetic benchmark fixture",
+        redistribution_allowed=False,
+        redistribution_constraints=("Synthetic benchmark data only.",),
+        limitations=("Events are generated, not observed.",),
+    )
+
+
+def synthetic_timeline(events: int, seed: int = 0) -> MarketContextTimelineV1:
+    """Return a deterministic year of scheduled context events."""
+    rng = random.Random(seed)
+    source = synthetic_source()
+    values = []
+    for index in range(events):
+        event_time = _COVERAGE_START_NS + _SECOND_NS * rng.randrange(
+            _COVERAGE_DAYS * 86_400
+        )
+        available = event_time - rng.randrange(-_HOUR_NS, 7 * _DAY_NS)
+        values.append(
+            MarketContextEventV1(
+                canonical_key=f"benchmark.event.{index}",
+                kind=rng.choice(_KINDS),
+                title=f"Synthetic event {index}",
+                source=source,
+                source_event_time=datetime.fromtimestamp(
+                    event_time // _SECOND_NS, tz=timezone.utc
+                ).isoformat(),
+                source_timezone="UTC",
+                event_time_ns=event_time,
+                first_known_at_ns=available,
+                available_at_ns=available,
+                pre_event_ns=rng.choice((0, 15 * 60, 30 * 60)) * _SECOND_NS,
+                post_event_ns=rng.choice((30 * 60, 2 * 3_600)) * _SECOND_NS,
+                affected_currencies=tuple(rng.sample(_CURRENCIES, 2)),
+                affected_symbols=(),
+                confidence=1.0,
+                precision=MarketContextPrecision.EXACT,
+                limitations=("Synthetic benchmark event.",),
+                vintage_id="benchmark-v1",
+            )
+        )
+    return MarketContextTimelineV1(
+        timeline_version="benchmark-v1",
+        coverage_start_ns=_COVERAGE_START_NS,
+        coverage_end_ns=_COVERAGE_START_NS + _COVERAGE_DAYS * _DAY_NS,
+        complete=True,
+        events=tuple(values),
+        limitations=("Synthetic benchmark timeline.",),
+    )
+
+
+def window_sweep(
+    windows: int, window_minutes: int
+) -> list[tuple[int, int, tuple[str, ...]]]:
+    """Return evenly spaced ``(start, end, currencies)`` query windows."""
+    width = window_minutes * 60 * _SECOND_NS
+    step = max(1, (_COVERAGE_DAYS * _DAY_NS - width) // windows)
+    return [
+        (
+            _COVERAGE_START_NS + index * step,
+            _COVERAGE_START_NS + index * step + width,
+            (_CURRENCIES[index % 4], _CURRENCIES[4 + index % 4]),
+        )
+        for index in range(windows)
+    ]
+
+
+def scan_event_ids(
+    timeline: MarketContextTimelineV1,
+    *,
+    start_ns: int,
+    end_ns: int,
+    as_of_ns: int,
+    currencies: tuple[str, ...],
+) -> list[str]:
+    """Return ex-ante matches by scanning every timeline event."""
+    return [
+        event.event_id
+        for event in timeline.events
+        if event.overlaps(start_ns, end_ns)
+        and set(currencies).intersection(event.affected_currencies)
+        and event.first_known_at_ns <= as_of_ns
+        and event.available_at_ns <= as_of_ns
+    ]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the market-context query benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Sweep ex-ante market-context queries across one synthetic "
+            "timeline and compare the indexed query with a full scan."
+        )
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=DEFAULT_EVENTS,
+        help="Timeline events (at most the v1 timeline limit).",
+    )
+    parser.add_argument("--windows", type=int, default=DEFAULT_WINDOWS)
+    parser.add_argument(
+        "--window-minutes",
+        type=int,
+        default=DEFAULT_WINDOW_MINUTES,
+        help="Width of each query window.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def measure(
+    events: int,
+    windows: int,
+    *,
+    window_minutes: int = DEFAULT_WINDOW_MINUTES,
+    seed: int = 0,
+) -> list[dict]:
+    """Time one window sweep through the index and through a full scan."""
+    started = time.perf_counter()
+    timeline = synthetic_timeline(events, seed)
+    build_seconds = time.perf_counter() - started
+    sweep = window_sweep(windows, window_minutes)
+    started = time.perf_counter()
+    indexed = [
+        [
+            item.event_id
+            for item in query_market_context(
+                timeline,
+                start_ns=start,
+                end_ns=end,
+                view=MarketContextView.EX_ANTE,
+                as_of_ns=start,
+                currencies=currencies,
+                include_calendar=False,
+            ).events
+        ]
+        for start, end, currencies in sweep
+    ]
+    indexed_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    scanned = [
+        scan_event_ids(
+            timeline,
+            start_ns=start,
+            end_ns=end,
+            as_of_ns=start,
+            currencies=currencies,
+        )
+        for start, end, currencies in sweep
+    ]
+    scan_seconds = time.perf_counter() - started
+    if indexed != scanned:
+        raise RuntimeError("indexed query results differ from a full scan")
+    matched = sum(len(item) for item in indexed)
+    return [
+        {
+            "method": method,
+            "event_count": len(timeline.events),
+            "window_count": len(sweep),
+            "matched_events": matched,
+            "timeline_build_seconds": round(build_seconds, 3),
+            "seconds": round(seconds, 3),
+            "queries_per_second": round(len(sweep) / seconds) if seconds else 0,
+        }
+        for method, seconds in (
+            ("indexed", indexed_seconds),
+            ("full-scan", scan_seconds),
+        )
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print JSON results."""
+    args = build_parser().parse_args(argv)
+    print(
+        json.dumps(
+            measure(
+                min(MAX_MARKET_CONTEXT_EVENTS, max(1, args.events)),
+                max(1, args.windows),
+                window_minutes=max(1, args.window_minutes),
+                seed=args.seed,
+            ),
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
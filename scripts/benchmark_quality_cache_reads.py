@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""Compare copied and memory-mapped cache reads across a quality run."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Sequence
+
+DEFAULT_MONTHS = 2
+DEFAULT_ROWS = 100_000
+DEFAULT_CHECK_GROUPS = ("ingestion", "time", "ticks", "domain")
+MODES = ("copied", "memory-mapped")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the quality cache-read benchmark parser."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Run a multi-rule quality assessment over enriched, uncompressed "
+            "tick caches with and without HISTDATACOM_CACHE_MEMORY_MAP and "
+            "report wall time and peak RSS for each run."
+        )
+    )
+    parser.add_argument("--months", type=int, default=DEFAULT_MONTHS)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument(
+        "--quality-checks",
+        nargs="+",
+        default=DEFAULT_CHECK_GROUPS,
+        metavar="GROUP",
+    )
+    parser.add_argument("--root", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    return parser
+
+
+def write_cache_tree(root: Path, *, months: int, rows: int) -> None:
+    """Write enriched, uncompressed EURUSD tick caches under ``root``."""
+    import polars as pl
+
+    from histdatacom.data_quality.training_features import (
+        enrich_tick_cache_with_training_features,
+    )
+    from histdatacom.histdata_ascii import CACHE_FILENAME, write_polars_cache
+    from histdatacom.records import Record
+
+    month_ms = 28 * 86_400_000
+    step = max(1, month_ms // max(rows, 1))
+    for month in range(1, months + 1):
+        path = Path(root, "ascii", "T", "EURUSD", "2012", f"{month:02d}")
+        path.mkdir(parents=True)
+        start = 1_325_376_000_000 + (month - 1) * 31 * 86_400_000
+        index = pl.int_range(0, rows, eager=True)
+        frame = pl.DataFrame(
+            {
+                "datetime": index * step + start,
+                "bid": 1.3 + (index % 997).cast(pl.Float64) * 0.00001,
+            }
+        ).with_columns(
+            (pl.col("bid") + 0.00012).alias("ask"),
+            pl.lit(0, dtype=pl.Int32).alias("vol"),
+        )
+        record = Record(
+            data_format="ascii",
+            data_timeframe="T",
+            data_fxpair="eurusd",
+            data_year="2012",
+            data_month=str(month),
+        )
+        write_polars_cache(
+            enrich_tick_cache_with_training_features(
+                frame,
+                target=record,
+                source="histdata.com",
+            ),
+            path / CACHE_FILENAME,
+            compression="uncompressed",
+        )
+
+
+def measure(root: Path, check_groups: Sequence[str]) -> dict:
+    """Run one quality assessment in this process and report its cost."""
+    from histdatacom.data_quality.discovery import discover_quality_targets
+    from histdatacom.data_quality.engine import run_quality_assessment
+    from histdatacom.data_quality.rules import quality_rules_for_groups
+    from histdatacom.resource_usage import peak_rss_bytes
+
+    targets = discover_quality_targets([root]).targets
+    rules = quality_rules_for_groups(check_groups)
+    started = time.perf_counter()
+    report = run_quality_assessment(targets, rules)
+    return {
+        "target_count": len(targets),
+        "rule_count": len(rules),
+        "rule_result_count": len(report.rule_results),
+        "seconds": round(time.perf_counter() - started, 3),
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run each read mode in a fresh interpreter and print JSON results."""
+    args = build_parser().parse_args(argv)
+    if args.mode is not None:
+        print(json.dumps(measure(args.root, args.quality_checks)))
+        return 0
+
+    reports = []
+    with tempfile.TemporaryDirectory() as workspace:
+        write_cache_tree(Path(workspace), months=args.months, rows=args.rows)
+        for mode in MODES:
+            env = dict(os.environ)
+            env["HISTDATACOM_CACHE_MEMORY_MAP"] = (
+                "1" if mode == "memory-mapped" else "0"
+            )
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--mode",
+                    mode,
+                    "--root",
+                    workspace,
+                    "--quality-checks",
+                    *args.quality_checks,
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=env,
+            )
+            reports.append({"mode": mode, **json.loads(completed.stdout)})
+    print(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
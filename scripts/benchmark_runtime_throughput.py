@@ -58,6 +58,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=2,
         help="Benchmark fan-out window for independent child workflows.",
     )
+    parser.add_argument(
+        "--stream-work-items",
+        action="store_true",
+        help="Pipeline work items across stages inside each batch.",
+    )
+    parser.add_argument(
+        "--max-in-flight-per-lane",
+        type=int,
+        default=4,
+        help="Per-lane child window used with --stream-work-items.",
+    )
     parser.add_argument(
         "--startup-timeout",
         type=float,
@@ -97,6 +108,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         fanout_end_period=args.fanout_end_period,
         max_work_items_per_batch=args.max_work_items_per_batch,
         max_parallel_child_workflows=args.max_parallel_child_workflows,
+        stream_work_items=args.stream_work_items,
+        max_in_flight_per_lane=args.max_in_flight_per_lane,
     )
     report = run_live_orchestration_throughput_benchmark(
         workspace=args.workspace,
@@ -143,6 +143,7 @@ class APICaller(sys.modules[__name__].__class__):  # type: ignore # noqa:H601
             "list" | "PolarsDataFrame" | "DataFrame" | "Table":
                 - (list) if called with -A or -U
                 - (PolarsDataFrame) if options.api_return_type = "polars"
+                - (LazyFrame) if options.api_return_type = "lazy"
                 - (DataFrame) if options.api_return_type = "pandas"
                 - (Table) if options.api_return_type = "arrow"
         """
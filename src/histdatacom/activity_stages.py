@@ -9,6 +9,9 @@ import os
 import shutil
 import ssl
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, replace
 from email.message import Message
 from pathlib import Path, PurePosixPath
@@ -18,6 +21,7 @@ from typing import (
     Callable,
     cast,
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     Sequence,
@@ -28,6 +32,11 @@ from urllib.request import urlopen
 import certifi
 import requests
 
+from histdatacom.archive_downloads import (
+    ARCHIVE_STREAM_CHUNK_BYTES,
+    ArchiveDownloadEngine,
+    default_archive_download_engine,
+)
 from histdatacom.cancellation import deterministic_partial_path
 from histdatacom.exceptions import (
     ArchiveDownloadError,
@@ -40,24 +49,32 @@ from histdatacom.exceptions import (
 from histdatacom.fx_enums import Format, Timeframe, get_valid_format_timeframes
 from histdatacom.histdata_ascii import (
     CACHE_FILENAME,
-    convert_polars_datetime_to_utc_ms,
+    MAX_HISTDATA_SOURCE_ORDER_REGRESSION_MS,
+    ascii_chunk_bytes_for_memory_limit,
     filename_has_unsupported_raw_dimensions,
-    format_influx_line,
-    read_ascii_file_to_polars,
+    influx_line_encoder,
+    iter_ascii_polars_chunks,
+    cache_index_path,
     read_polars_cache,
+    replace_polars_cache,
+    scan_polars_cache,
     write_polars_cache,
 )
+from histdatacom.manifest_store import ManifestStatusStore
 from histdatacom.records import Record
 from histdatacom.random_windows import (
     RANDOM_WINDOW_SELECTION_METADATA_KEY,
     RandomWindowEmptySelectionError,
     RandomWindowSelectionV1,
     filter_polars_frame_to_random_window,
+    random_window_intervals_for_range,
     random_window_planning_yearmonths,
+    random_window_polars_predicate,
     random_window_selection_from_metadata,
     resolve_random_window_selection,
 )
 from histdatacom.repository_quality import REPOSITORY_QUALITY_KEY
+from histdatacom.stage_timing import StageTimer
 from histdatacom.runtime_contracts import (
     ArtifactRef,
     FailureInfo,
@@ -82,11 +99,14 @@ from histdatacom.utils import (
     normalize_output_timezone,
 )
 
+CACHE_MEMORY_LIMIT_ENV = "HISTDATACOM_CACHE_MEMORY_LIMIT_MB"
+DEFAULT_CACHE_MERGE_READ_WORKERS = min(8, os.cpu_count() or 1)
 DEFAULT_REPOSITORY_URL = (
     "https://raw.githubusercontent.com/dmidlo/"
     "histdata.com-tools/main/data/.repo"
 )
 DEFAULT_HISTDATA_BASE_URL = "http://www.histdata.com/download-free-forex-data/"
+HISTDATA_ARCHIVE_URL = "http://www.histdata.com/get.php"
 HISTDATA_FORM_FIELDS = (
     "tk",
     "date",
@@ -383,7 +403,7 @@ class CacheBuildResult:
 RecordTransformer = Callable[[Record], Record]
 RecordAction = Callable[[Record], None]
 NoArgBool = Callable[[], bool]
-LineSink = Callable[[list[str]], None]
+LineSink = Callable[[bytes], None]
 RepositoryFetcher = Callable[[str], Mapping[str, Any]]
 UrlPageFetcher = Callable[[str, int], UrlPageData | Mapping[str, Any]]
 ArchivePoster = Callable[..., Any]
@@ -647,6 +667,7 @@ def download_archive_work_item(
 ) -> ActivityStageOutput:
     """Download one ZIP archive through an explicit work item."""
     record = _record_from_work_item(work_item)
+    timer = StageTimer()
     try:
         _validate_archive_raw_dimensions(record)
         _ensure_record_data_dir(record, args)
@@ -680,15 +701,20 @@ def download_archive_work_item(
             args.get("from_api")
         )
         if should_download:
-            if download_file is None:
-                download_result = download_histdata_archive_to_record(
-                    record,
-                    timeout=_requests_timeout(args),
-                    post_archive=post_archive,
-                )
-            else:
-                download_file(record)
-                download_result = archive_download_result_for_record(record)
+            with timer.span("archive_download"):
+                if download_file is None:
+                    download_result = download_histdata_archive_to_record(
+                        record,
+                        timeout=_requests_timeout(args),
+                        post_archive=post_archive,
+                    )
+                else:
+                    download_file(record)
+                    download_result = archive_download_result_for_record(record)
+            timer.count_bytes(
+                bytes_in=download_result.size_bytes,
+                bytes_out=download_result.size_bytes,
+            )
 
             _validate_archive_raw_dimensions(record)
             record.status = WorkStatus.CSV_ZIP
@@ -705,6 +731,7 @@ def download_archive_work_item(
                     "filename": download_result.filename,
                     "size_bytes": download_result.size_bytes,
                     "sha256": download_result.sha256,
+                    **timer.metrics(),
                 },
             )
 
@@ -764,23 +791,46 @@ def download_histdata_archive_to_record(
     timeout: int,
     post_headers: Mapping[str, str] | None = None,
     post_archive: ArchivePoster | None = None,
+    engine: ArchiveDownloadEngine | None = None,
+    archive_url: str = HISTDATA_ARCHIVE_URL,
 ) -> ArchiveDownloadResult:
-    """POST for a HistData ZIP and atomically persist it on success."""
-    response = post_histdata_archive(
-        record,
-        timeout=timeout,
-        post_headers=post_headers,
-        post_archive=post_archive,
-    )
-    filename = archive_filename_from_response(response)
-    _validate_downloaded_archive_filename(filename, record)
-    content = _response_content_bytes(response)
-    target_path = atomic_write_zip_archive(
-        Path(record.data_dir),
-        filename,
-        content,
-        work_id=record.url,
-    )
+    """POST for a HistData ZIP and atomically persist it on success.
+
+    Without an injected ``post_archive`` the request goes through the
+    process's pooled ``ArchiveDownloadEngine``, which holds a per-host slot
+    while the body is streamed to the temp file.  A completed temp file
+    left by an interrupted earlier attempt is validated and promoted
+    instead of downloading the archive again.
+    """
+    resumed = _resume_completed_archive(record)
+    if resumed is not None:
+        return archive_download_result_for_path(resumed)
+    slot: AbstractContextManager[Any] = nullcontext()
+    if post_archive is None:
+        engine = engine or default_archive_download_engine()
+        post_archive = engine.post
+        slot = engine.host_slot(archive_url)
+    with slot:
+        response = post_histdata_archive(
+            record,
+            timeout=timeout,
+            post_headers=post_headers,
+            post_archive=post_archive,
+            archive_url=archive_url,
+        )
+        try:
+            filename = archive_filename_from_response(response)
+            _validate_downloaded_archive_filename(filename, record)
+            target_path = atomic_write_zip_archive(
+                Path(record.data_dir),
+                filename,
+                _response_content_chunks(response, url=record.url),
+                work_id=record.url,
+            )
+        finally:
+            close = getattr(response, "close", None)
+            if callable(close):
+                close()
     record.zip_filename = target_path.name
     return archive_download_result_for_path(target_path)
 
@@ -791,6 +841,7 @@ def post_histdata_archive(
     timeout: int,
     post_headers: Mapping[str, str] | None = None,
     post_archive: ArchivePoster | None = None,
+    archive_url: str = HISTDATA_ARCHIVE_URL,
 ) -> Any:
     """Submit the HistData archive download form."""
     _validate_archive_request(record)
@@ -798,7 +849,7 @@ def post_histdata_archive(
     post = post_archive or requests.post
     try:
         response = post(
-            "http://www.histdata.com/get.php",
+            archive_url,
             data={
                 "tk": record.data_tk,
                 "date": record.data_date,
@@ -865,11 +916,15 @@ def archive_filename_from_response(response: Any) -> str:
 def atomic_write_zip_archive(
     data_dir: Path,
     filename: str,
-    content: bytes,
+    content: bytes | Iterable[bytes],
     *,
     work_id: str,
 ) -> Path:
-    """Write a ZIP through a temp file, validate it, then rename."""
+    """Write a ZIP through a temp file, validate it, then rename.
+
+    ``content`` may be the whole body or an iterable of chunks, which are
+    written as they arrive instead of being buffered in memory.
+    """
     if filename_has_unsupported_raw_dimensions(filename):
         raise ArchiveDownloadError(
             "UNSUPPORTED_RAW_INPUT",
@@ -879,11 +934,16 @@ def atomic_write_zip_archive(
         )
     target_path = data_dir / filename
     temp_path = target_path.with_name(
-        f".{target_path.name}.{derive_work_id(work_id).removeprefix('work-')}.tmp"
+        f".{target_path.name}.{_archive_partial_suffix(work_id)}"
     )
     try:
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        temp_path.write_bytes(content)
+        with temp_path.open("wb") as target:
+            if isinstance(content, bytes):
+                target.write(content)
+            else:
+                for chunk in content:
+                    target.write(chunk)
         _validate_zip_payload(temp_path)
         temp_path.replace(target_path)
         return target_path
@@ -1016,10 +1076,17 @@ def extract_csv_work_item(
             )
 
         if record.status is WorkStatus.CSV_ZIP:
-            extraction = extract_archive_to_record(
-                record,
-                zip_persist=zip_persist,
+            timer = StageTimer()
+            zip_path = _source_artifact_path(record, record.zip_filename)
+            timer.count_bytes(
+                bytes_in=zip_path.stat().st_size if zip_path else 0
             )
+            with timer.span("zip_extract"):
+                extraction = extract_archive_to_record(
+                    record,
+                    zip_persist=zip_persist,
+                )
+            timer.count_bytes(bytes_out=extraction.size_bytes)
             record.status = WorkStatus.CSV_FILE
             record.write_manifest_status(base_dir=_default_download_dir(args))
             updated = _work_item_from_record(record, work_item)
@@ -1036,6 +1103,7 @@ def extract_csv_work_item(
                         else "extracted"
                     ),
                     **extraction.to_dict(),
+                    **timer.metrics(),
                 },
             )
 
@@ -1204,6 +1272,7 @@ def build_cache_work_item(
 
         cache_path = Path(record.data_dir, CACHE_FILENAME)
         created = False
+        timer = StageTimer()
         if cache_path.exists():
             record.cache_filename = CACHE_FILENAME
             cache_result = cache_build_result_for_record(
@@ -1225,9 +1294,10 @@ def build_cache_work_item(
                     )
                 download_file(record)
 
-            create_cache_file(record, args)
+            create_cache_file(record, args, timer=timer)
             created = True
-            cache_result = cache_build_result_for_record(record)
+            with timer.span("cache_hash"):
+                cache_result = cache_build_result_for_record(record)
 
         deleted_sources = _delete_cache_source_artifacts(record, args)
         record.status = WorkStatus.CACHE_READY
@@ -1247,6 +1317,7 @@ def build_cache_work_item(
             "timeframe": cache_result.timeframe,
             "schema": cache_result.schema,
             **cache_result.to_dict(),
+            **timer.metrics(),
         }
         return _activity_output(
             updated,
@@ -1371,10 +1442,15 @@ def merge_cache_work_items(
     *,
     return_type: str = "polars",
     materialize: bool = True,
+    stream: bool = False,
     output_timezone: str = "",
     random_selection: RandomWindowSelectionV1 | Mapping[str, Any] | None = None,
 ) -> MergeStageOutput:
-    """Merge cache artifacts from explicit work items."""
+    """Merge cache artifacts from explicit work items.
+
+    With ``stream=True`` each set's ``data`` is an iterator of per-month
+    frames instead of one concatenated frame; see ``merge_cache_items``.
+    """
     mergeable = _mergeable_cache_items(work_items)
     selection = _resolve_random_window_selection(
         mergeable,
@@ -1406,6 +1482,7 @@ def merge_cache_work_items(
                 ordered_items,
                 return_type=return_type,
                 already_ordered=True,
+                materialize=not stream,
                 output_timezone=output_timezone,
                 random_selection=selection,
             )
@@ -1473,12 +1550,32 @@ def merge_cache_items(
     *,
     return_type: str,
     already_ordered: bool = False,
+    materialize: bool = True,
     output_timezone: str = "",
     random_selection: RandomWindowSelectionV1 | Mapping[str, Any] | None = None,
+    read_workers: int | None = None,
+    max_in_flight: int | None = None,
 ) -> Any:
-    """Merge one pair/timeframe cache set into the requested API type."""
+    """Merge one pair/timeframe cache set into the requested API type.
+
+    Month caches are read on up to ``read_workers`` threads.  By default the
+    frames are concatenated into one result.  With ``materialize=False`` an
+    iterator of per-month frames in ``order_cache_items`` order is returned
+    instead, and at most ``max_in_flight`` decoded months are held ahead of
+    the consumer.
+    """
     import polars as pl
 
+    if return_type == "lazy":
+        if not materialize:
+            raise ValueError("lazy cache merges cannot be streamed")
+        return scan_cache_items(
+            work_items,
+            already_ordered=already_ordered,
+            output_timezone=output_timezone,
+            random_selection=random_selection,
+        )
+
     unsupported = [
         item
         for item in work_items
@@ -1497,20 +1594,274 @@ def merge_cache_items(
         ordered_items,
         explicit=random_selection,
     )
-    frames = [
-        filter_polars_frame_to_random_window(
-            read_polars_cache(Path(item.data_dir, item.cache_filename)),
+    frames = iter_cache_item_frames(
+        ordered_items,
+        already_ordered=True,
+        output_timezone=output_timezone,
+        random_selection=selection,
+        read_workers=read_workers,
+        max_in_flight=max_in_flight,
+    )
+    if not materialize:
+        return (_convert_cache_frame(frame, return_type) for frame in frames)
+    collected = list(frames)
+    merged = pl.concat(collected) if collected else pl.DataFrame()
+    return _convert_cache_frame(merged, return_type)
+
+
+def iter_cache_item_frames(
+    work_items: Sequence[WorkItem],
+    *,
+    already_ordered: bool = False,
+    output_timezone: str = "",
+    random_selection: RandomWindowSelectionV1 | Mapping[str, Any] | None = None,
+    read_workers: int | None = None,
+    max_in_flight: int | None = None,
+) -> Iterator[Any]:
+    """Yield one Polars frame per month cache in ``order_cache_items`` order.
+
+    Caches are decoded on a bounded thread pool.  At most ``max_in_flight``
+    months (default: twice the worker count) are read ahead of the consumer,
+    which bounds peak memory for long multi-month requests.  Each frame is
+    already filtered to the resolved random window and carries the output
+    timezone projection.  Months whose manifest ``cache_start``/``cache_end``
+    bounds overlap no selected interval are never opened, and the rest only
+    decode the record batches spanning their selected intervals.  Closing
+    the iterator early cancels pending reads.
+    """
+    ordered_items = (
+        tuple(work_items) if already_ordered else order_cache_items(work_items)
+    )
+    selection = _resolve_random_window_selection(
+        ordered_items,
+        explicit=random_selection,
+    )
+    reads: list[tuple[WorkItem, tuple[int | None, int | None]]] = []
+    for item in ordered_items:
+        if selection is None:
+            reads.append((item, (None, None)))
+            continue
+        read_range = _cache_item_read_range(
+            item,
+            start_utc_ms=None,
+            end_utc_ms=None,
+            selection=selection,
+        )
+        if read_range is not None:
+            reads.append((item, (read_range[0], read_range[1])))
+    workers = max(
+        1,
+        min(
+            (
+                DEFAULT_CACHE_MERGE_READ_WORKERS
+                if read_workers is None
+                else int(read_workers)
+            ),
+            len(reads) or 1,
+        ),
+    )
+    window = max(
+        workers,
+        2 * workers if max_in_flight is None else int(max_in_flight),
+    )
+
+    def read_month(read: tuple[WorkItem, tuple[int | None, int | None]]) -> Any:
+        item, (start_utc_ms, end_utc_ms) = read
+        frame = filter_polars_frame_to_random_window(
+            read_polars_cache(
+                Path(item.data_dir, item.cache_filename),
+                start_utc_ms=start_utc_ms,
+                end_utc_ms=end_utc_ms,
+            ),
             selection,
         )
-        for item in ordered_items
-    ]
-    merged = pl.concat(frames) if frames else pl.DataFrame()
-    if selection is not None and merged.height < 1:
+        return _append_output_timezone_projection(frame, output_timezone)
+
+    return _iter_ordered_reads(
+        reads,
+        read_month,
+        workers=workers,
+        window=window,
+        require_rows=selection is not None,
+    )
+
+
+def _iter_ordered_reads(
+    items: Sequence[Any],
+    read: Callable[[Any], Any],
+    *,
+    workers: int,
+    window: int,
+    require_rows: bool,
+) -> Iterator[Any]:
+    row_count = 0
+    pending_items = iter(items)
+    in_flight: deque[Future[Any]] = deque()
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="histdatacom-cache-merge",
+    ) as executor:
+        try:
+            for item in pending_items:
+                in_flight.append(executor.submit(read, item))
+                if len(in_flight) >= window:
+                    break
+            while in_flight:
+                frame = in_flight.popleft().result()
+                next_item = next(pending_items, None)
+                if next_item is not None:
+                    in_flight.append(executor.submit(read, next_item))
+                row_count += frame.height
+                yield frame
+        finally:
+            for future in in_flight:
+                future.cancel()
+    if require_rows and row_count < 1:
         raise RandomWindowEmptySelectionError(
             "resolved random window contains no cache rows"
         )
-    merged = _append_output_timezone_projection(merged, output_timezone)
-    return _convert_cache_frame(merged, return_type)
+
+
+def scan_cache_items(
+    work_items: Sequence[WorkItem],
+    *,
+    already_ordered: bool = False,
+    columns: Sequence[str] | None = None,
+    start_utc_ms: int | None = None,
+    end_utc_ms: int | None = None,
+    output_timezone: str = "",
+    random_selection: RandomWindowSelectionV1 | Mapping[str, Any] | None = None,
+) -> Any:
+    """Return a lazy scan over one pair/timeframe cache set.
+
+    Months whose ``cache_start``/``cache_end`` bounds cannot overlap the
+    half-open ``[start_utc_ms, end_utc_ms)`` range or the resolved random
+    window are never opened.  The remaining ``.data`` caches are scanned with
+    the window and range predicates and the column projection attached, so
+    collecting the frame only materializes the selected rows.
+    """
+    import polars as pl
+
+    unsupported = [
+        item
+        for item in work_items
+        if not _supports_raw_dimensions(
+            item.data_format,
+            item.data_timeframe,
+        )
+    ]
+    if unsupported:
+        raise ValueError("cache merge supports ASCII tick inputs only")
+    if (
+        start_utc_ms is not None
+        and end_utc_ms is not None
+        and start_utc_ms >= end_utc_ms
+    ):
+        raise ValueError("cache scan range start must be before its end")
+
+    ordered_items = (
+        tuple(work_items) if already_ordered else order_cache_items(work_items)
+    )
+    selection = _resolve_random_window_selection(
+        ordered_items,
+        explicit=random_selection,
+    )
+    scans = []
+    for item in ordered_items:
+        read_range = _cache_item_read_range(
+            item,
+            start_utc_ms=start_utc_ms,
+            end_utc_ms=end_utc_ms,
+            selection=selection,
+        )
+        if read_range is None:
+            continue
+        scan_start, scan_end, intervals = read_range
+        scan = scan_polars_cache(
+            Path(item.data_dir, item.cache_filename),
+            start_utc_ms=scan_start,
+            end_utc_ms=scan_end,
+        )
+        if intervals is not None:
+            scan = scan.filter(random_window_polars_predicate(intervals))
+        if columns is not None:
+            scan = scan.select(list(columns))
+        scans.append(scan)
+
+    if not scans:
+        if selection is not None:
+            raise RandomWindowEmptySelectionError(
+                "resolved random window contains no cache rows"
+            )
+        return pl.LazyFrame()
+    merged = pl.concat(scans)
+    return _append_output_timezone_projection(merged, output_timezone)
+
+
+def _cache_item_read_range(
+    item: WorkItem,
+    *,
+    start_utc_ms: int | None,
+    end_utc_ms: int | None,
+    selection: RandomWindowSelectionV1 | None,
+) -> tuple[int | None, int | None, tuple[tuple[int, int], ...] | None] | None:
+    """Return the range and window intervals to read from one month cache.
+
+    ``None`` means the month cannot contribute a row and is never opened.
+    With a selection the range is narrowed to the first and last interval
+    overlapping the month, and the sorted intervals are returned as well.
+    """
+    bounds = _cache_scan_bounds(
+        item,
+        start_utc_ms=start_utc_ms,
+        end_utc_ms=end_utc_ms,
+        selection=selection,
+    )
+    if bounds is None:
+        return None
+    if selection is None:
+        return start_utc_ms, end_utc_ms, None
+    intervals = random_window_intervals_for_range(
+        selection,
+        range_start_utc_ms=bounds[0],
+        range_end_utc_ms=bounds[1],
+    )
+    if not intervals:
+        return None
+    return intervals[0][0], intervals[-1][1], intervals
+
+
+def _cache_scan_bounds(
+    item: WorkItem,
+    *,
+    start_utc_ms: int | None,
+    end_utc_ms: int | None,
+    selection: RandomWindowSelectionV1 | None,
+) -> tuple[int, int] | None:
+    """Return the half-open range one cache can contribute, if any.
+
+    Manifest bounds are the first and last source rows, so they are widened
+    by the tolerated source-order regression before comparing ranges.
+    """
+    lower = [] if start_utc_ms is None else [start_utc_ms]
+    upper = [] if end_utc_ms is None else [end_utc_ms]
+    try:
+        lower.append(
+            int(item.cache_start) - MAX_HISTDATA_SOURCE_ORDER_REGRESSION_MS
+        )
+        upper.append(
+            int(item.cache_end) + MAX_HISTDATA_SOURCE_ORDER_REGRESSION_MS + 1
+        )
+    except ValueError:
+        pass
+    if selection is not None:
+        lower.append(selection.support_start_utc_ms)
+        upper.append(selection.support_end_utc_ms)
+    range_start = max(lower, default=-(2**63))
+    range_end = min(upper, default=2**63 - 1)
+    if range_start >= range_end:
+        return None
+    return range_start, range_end
 
 
 def merge_cache_records(
@@ -1571,6 +1922,7 @@ def import_to_influx_work_item(
     record = _record_from_work_item(work_item)
     batch_count = 0
     line_count = 0
+    timer = StageTimer()
     try:
         if not _supports_raw_dimensions(
             record.data_format,
@@ -1614,6 +1966,7 @@ def import_to_influx_work_item(
                     _work_item_from_record(record, work_item),
                     args=args,
                     emit_lines=emit_lines,
+                    timer=timer,
                 )
             else:
                 raise FileNotFoundError(
@@ -1632,7 +1985,11 @@ def import_to_influx_work_item(
             updated,
             stage="import_to_influx",
             status=WorkStatus.INFLUX_UPLOAD,
-            metrics={"batch_count": batch_count, "line_count": line_count},
+            metrics={
+                "batch_count": batch_count,
+                "line_count": line_count,
+                **timer.metrics(),
+            },
         )
     except Exception:
         record.delete_manifest_status()
@@ -1644,8 +2001,14 @@ def emit_influx_cache_batches(
     *,
     args: Mapping[str, Any],
     emit_lines: LineSink,
+    timer: StageTimer | None = None,
 ) -> tuple[int, int]:
-    """Emit bounded Influx line-protocol batches for one cache artifact."""
+    """Emit bounded Influx line-protocol payloads for one cache artifact.
+
+    Each payload is the newline-delimited UTF-8 line protocol for one
+    ``batch_size`` slice of the cache.  ``timer`` separates cache reads,
+    feature enrichment, line formatting, and time spent in ``emit_lines``.
+    """
     from histdatacom.data_quality.training_features import (
         ensure_tick_training_features,
     )
@@ -1656,34 +2019,42 @@ def emit_influx_cache_batches(
     ):
         raise ValueError("Influx projection supports ASCII tick inputs only")
 
-    cache_filename = work_item.cache_filename or CACHE_FILENAME
-    cache = read_polars_cache(Path(work_item.data_dir, cache_filename))
-    selection = random_window_selection_from_metadata(work_item.metadata)
-    cache = filter_polars_frame_to_random_window(cache, selection)
+    timer = timer or StageTimer()
+    cache_path = Path(
+        work_item.data_dir,
+        work_item.cache_filename or CACHE_FILENAME,
+    )
+    with timer.span("cache_read"):
+        cache = read_polars_cache(cache_path)
+        selection = random_window_selection_from_metadata(work_item.metadata)
+        cache = filter_polars_frame_to_random_window(cache, selection)
+    timer.count_bytes(bytes_in=cache_path.stat().st_size)
     if selection is not None and cache.height < 1:
         raise RandomWindowEmptySelectionError(
             "resolved random window contains no rows in the planned cache"
         )
-    cache = ensure_tick_training_features(cache, target=work_item)
+    with timer.span("training_features"):
+        cache = ensure_tick_training_features(cache, target=work_item)
     batch_size = coerce_batch_size(args["batch_size"])
     batch_count = 0
     line_count = 0
-    columns = tuple(cache.columns)
-    for rows in iter_polars_row_batches(cache, batch_size):
-        lines = [
-            format_influx_line(
-                work_item.data_fxpair,
-                work_item.data_format,
-                work_item.data_timeframe,
-                row,
-                columns=columns,
-            )
-            for row in rows
-        ]
-        if lines:
-            emit_lines(lines)
-            batch_count += 1
-            line_count += len(lines)
+    with timer.span("line_format"):
+        encoder = influx_line_encoder(
+            work_item.data_fxpair,
+            work_item.data_format,
+            work_item.data_timeframe,
+            cache,
+        )
+    for frame_slice in cache.iter_slices(n_rows=batch_size):
+        if frame_slice.height < 1:
+            continue
+        with timer.span("line_format"):
+            payload = encoder.encode(frame_slice)
+        with timer.span("line_write"):
+            emit_lines(payload)
+        timer.count_bytes(bytes_out=len(payload))
+        batch_count += 1
+        line_count += frame_slice.height
     return batch_count, line_count
 
 
@@ -2222,6 +2593,11 @@ def write_repository_data_file(
     except (OSError, TypeError, ValueError):
         _unlink_path(temp_path)
         raise
+    ManifestStatusStore(repo_path.parent).sync_repository_index(
+        hashed_data,
+        repo_path=repo_path,
+        source_stat=repo_path.stat(),
+    )
     return ArtifactRef(
         kind="repository",
         path=str(repo_path),
@@ -2230,6 +2606,34 @@ def write_repository_data_file(
     )
 
 
+def read_repository_index(
+    repo_local_path: str | Path,
+    pairs: Iterable[str] = (),
+    *,
+    by: str | None = None,
+) -> dict[str, Any] | None:
+    """Return sorted pair ranges from the manifest repository index.
+
+    The index lives in the manifest store next to the ``.repo`` file and is
+    rebuilt from that file only when its identity changed, so listing a few
+    pairs does not parse or sort the whole repository.  Returns ``None``
+    when no repository file exists.
+    """
+    repo_path = Path(repo_local_path)
+    try:
+        source_stat = repo_path.stat()
+    except OSError:
+        return None
+    store = ManifestStatusStore(repo_path.parent)
+    if not store.repository_index_is_current(repo_path):
+        store.sync_repository_index(
+            read_repository_data_file(repo_path),
+            repo_path=repo_path,
+            source_stat=source_stat,
+        )
+    return store.query_repository_pairs(pairs, by=by)
+
+
 def hash_repository_data(repo_data: Mapping[str, Any]) -> dict[str, Any]:
     """Return repository metadata with refreshed hash fields."""
     clean_repo = {
@@ -3043,6 +3447,57 @@ def _archive_post_headers(
     return headers
 
 
+def _response_content_chunks(response: Any, *, url: str) -> Iterator[bytes]:
+    """Yield a response body in chunks, streaming it when possible."""
+    iter_content = getattr(response, "iter_content", None)
+    if not callable(iter_content):
+        yield _response_content_bytes(response)
+        return
+    try:
+        for chunk in iter_content(chunk_size=ARCHIVE_STREAM_CHUNK_BYTES):
+            if chunk:
+                yield chunk
+    except requests.RequestException as err:
+        raise ArchiveDownloadError(
+            "ARCHIVE_NETWORK_ERROR",
+            str(err),
+            retryable=True,
+            detail={"url": url},
+        ) from err
+
+
+def _archive_partial_suffix(work_id: str) -> str:
+    return f"{derive_work_id(work_id).removeprefix('work-')}.tmp"
+
+
+def _resume_completed_archive(record: Record) -> Path | None:
+    """Promote a complete temp ZIP left by an interrupted attempt.
+
+    HistData serves archives from a form POST without byte ranges, so an
+    incomplete temp file cannot be continued; it is removed and the
+    archive is downloaded again.
+    """
+    data_dir = Path(record.data_dir)
+    if not record.data_dir or not data_dir.is_dir():
+        return None
+    suffix = f".{_archive_partial_suffix(record.url)}"
+    for temp_path in sorted(data_dir.glob(f".*{suffix}")):
+        filename = temp_path.name[1 : -len(suffix)]
+        try:
+            if not filename.lower().endswith(".zip"):
+                raise zipfile.BadZipFile(f"not a ZIP archive: {filename}")
+            _validate_downloaded_archive_filename(filename, record)
+            _validate_zip_payload(temp_path)
+        except (ArchiveDownloadError, OSError, zipfile.BadZipFile):
+            _unlink_path(temp_path)
+            continue
+        target_path = temp_path.with_name(filename)
+        temp_path.replace(target_path)
+        record.zip_filename = target_path.name
+        return target_path
+    return None
+
+
 def _response_content_bytes(response: Any) -> bytes:
     content = getattr(response, "content", b"")
     if isinstance(content, bytes):
@@ -3178,15 +3633,26 @@ def _source_artifact_path(record: Record, filename: str) -> Path | None:
     return path
 
 
-def create_cache_file(record: Record, args: Mapping[str, Any]) -> None:
+def create_cache_file(
+    record: Record,
+    args: Mapping[str, Any],
+    *,
+    timer: StageTimer | None = None,
+) -> None:
+    timer = timer or StageTimer()
     _validate_cache_raw_dimensions(record)
     zip_path = _source_artifact_path(record, record.zip_filename)
     csv_path = _source_artifact_path(record, record.csv_filename)
 
-    if zip_path is not None:
-        file_data = _import_source_to_polars(record, zip_path)
-    elif csv_path is not None:
-        file_data = _import_source_to_polars(record, csv_path)
+    source_path = zip_path or csv_path
+    if source_path is not None:
+        timer.count_bytes(bytes_in=source_path.stat().st_size)
+        file_data = _import_source_to_polars(
+            record,
+            source_path,
+            args,
+            timer=timer,
+        )
     else:
         raise CacheBuildError(
             "CACHE_SOURCE_NOT_FOUND",
@@ -3213,11 +3679,13 @@ def create_cache_file(record: Record, args: Mapping[str, Any]) -> None:
 
     record.cache_filename = CACHE_FILENAME
     cache_path = Path(record.data_dir, record.cache_filename)
-    atomic_write_polars_cache(
-        file_data,
-        cache_path,
-        work_id=record.url or str(zip_path or csv_path),
-    )
+    with timer.span("ipc_write"):
+        atomic_write_polars_cache(
+            file_data,
+            cache_path,
+            work_id=record.url or str(source_path),
+        )
+    timer.count_bytes(bytes_out=cache_path.stat().st_size)
 
     record.cache_line_count = file_data.height
     record.cache_start = str(_extract_single_value(file_data, 0, "datetime"))
@@ -3227,24 +3695,34 @@ def create_cache_file(record: Record, args: Mapping[str, Any]) -> None:
     record.write_manifest_status(base_dir=_default_download_dir(args))
 
 
-def _import_source_to_polars(record: Record, source_path: Path) -> Any:
+def _import_source_to_polars(
+    record: Record,
+    source_path: Path,
+    args: Mapping[str, Any] | None = None,
+    *,
+    timer: StageTimer | None = None,
+) -> Any:
     from histdatacom.data_quality.training_features import (
         enrich_tick_cache_with_training_features,
     )
 
+    timer = timer or StageTimer()
+    memory_limit = cache_memory_limit_bytes(args)
     try:
-        raw_frame = read_ascii_file_to_polars(
-            source_path, record.data_timeframe
-        )
-        normalized = convert_polars_datetime_to_utc_ms(
-            raw_frame,
-            record.data_timeframe,
-        )
-        return enrich_tick_cache_with_training_features(
-            normalized,
-            target=record,
-            source="histdata.com",
+        normalized = _stream_source_to_polars(
+            record,
+            source_path,
+            memory_limit=memory_limit,
+            timer=timer,
         )
+        with timer.span("training_features"):
+            return enrich_tick_cache_with_training_features(
+                normalized,
+                target=record,
+                source="histdata.com",
+            )
+    except CacheBuildError:
+        raise
     except ValueError as err:
         raise CacheBuildError(
             "CACHE_SOURCE_INVALID",
@@ -3267,23 +3745,83 @@ def _import_source_to_polars(record: Record, source_path: Path) -> Any:
         ) from err
 
 
+def cache_memory_limit_bytes(args: Mapping[str, Any] | None) -> int | None:
+    """Return the configured cache-build ingest ceiling in bytes, if any."""
+    value = (args or {}).get("cache_memory_limit_mb")
+    if value is None:
+        value = os.environ.get(CACHE_MEMORY_LIMIT_ENV) or None
+    if value is None:
+        return None
+    try:
+        megabytes = int(value)
+    except (TypeError, ValueError) as err:
+        raise CacheBuildError(
+            "CACHE_MEMORY_LIMIT_INVALID",
+            f"cache memory limit must be a whole number of MiB: {value!r}",
+            retryable=False,
+        ) from err
+    if megabytes < 1:
+        raise CacheBuildError(
+            "CACHE_MEMORY_LIMIT_INVALID",
+            "cache memory limit must be at least 1 MiB",
+            retryable=False,
+        )
+    return megabytes * 1024 * 1024
+
+
+def _stream_source_to_polars(
+    record: Record,
+    source_path: Path,
+    *,
+    memory_limit: int | None,
+    timer: StageTimer | None = None,
+) -> Any:
+    import polars as pl
+
+    chunks = []
+    decoded_bytes = 0
+    for chunk in iter_ascii_polars_chunks(
+        source_path,
+        record.data_timeframe,
+        chunk_bytes=ascii_chunk_bytes_for_memory_limit(memory_limit),
+        timer=timer,
+    ):
+        decoded_bytes += chunk.estimated_size()
+        if memory_limit is not None and decoded_bytes > memory_limit:
+            raise CacheBuildError(
+                "CACHE_MEMORY_LIMIT_EXCEEDED",
+                "decoded cache source exceeds the configured memory limit",
+                retryable=False,
+                detail={
+                    "path": str(source_path),
+                    "timeframe": record.data_timeframe,
+                    "memory_limit_bytes": memory_limit,
+                    "decoded_bytes": decoded_bytes,
+                },
+            )
+        chunks.append(chunk)
+    if not chunks:
+        raise ValueError("cache source contains no rows")
+    return pl.concat(chunks, rechunk=False)
+
+
 def atomic_write_polars_cache(
     frame: Any,
     target_path: Path,
     *,
     work_id: str,
 ) -> Path:
-    """Write a Polars IPC cache through a temp file, then rename."""
+    """Write a Polars IPC cache and its index through temp files, then rename."""
     temp_path = target_path.with_name(
         f".{target_path.name}.{derive_work_id(work_id).removeprefix('work-')}.tmp"
     )
     try:
         target_path.parent.mkdir(parents=True, exist_ok=True)
         write_polars_cache(frame, temp_path)
-        temp_path.replace(target_path)
-        return target_path
+        return replace_polars_cache(temp_path, target_path)
     except OSError as err:
         _unlink_path(temp_path)
+        _unlink_path(cache_index_path(temp_path))
         raise CacheBuildError(
             "CACHE_FILESYSTEM_ERROR",
             str(err),
@@ -3292,6 +3830,7 @@ def atomic_write_polars_cache(
         ) from err
     except Exception as err:
         _unlink_path(temp_path)
+        _unlink_path(cache_index_path(temp_path))
         raise CacheBuildError(
             "CACHE_WRITE_FAILED",
             str(err),
@@ -3328,7 +3867,7 @@ def _append_output_timezone_projection(frame: Any, timezone_name: str) -> Any:
     normalized = normalize_output_timezone(timezone_name)
     if not normalized:
         return frame
-    if "datetime" not in frame.columns:
+    if "datetime" not in frame.collect_schema().names():
         raise ValueError("timezone projection requires a datetime column")
 
     import polars as pl
@@ -7,13 +7,14 @@ Raises:
 Returns:
     "PolarsDataFrame" | "DataFrame" | "Table":
         - (PolarsDataFrame) if options.api_return_type = "polars"
+        - (LazyFrame) if options.api_return_type = "lazy"
         - (DataFrame) if options.api_return_type = "pandas"
         - (Table) if options.api_return_type = "arrow"
 """
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -49,6 +50,7 @@ from histdatacom.utils import (
 if TYPE_CHECKING:
     from pandas.core.frame import DataFrame
     from polars import DataFrame as PolarsDataFrame
+    from polars import LazyFrame
     from pyarrow import Table
 
     from histdatacom.records import Record
@@ -64,6 +66,7 @@ class Api:  # noqa:H601
     Returns:
         "PolarsDataFrame" | "DataFrame" | "Table":
             - (PolarsDataFrame) if options.api_return_type = "polars"
+            - (LazyFrame) if options.api_return_type = "lazy"
             - (DataFrame) if options.api_return_type = "pandas"
             - (Table) if options.api_return_type = "arrow"
     """
@@ -279,8 +282,20 @@ class Api:  # noqa:H601
         random_selection: (
             RandomWindowSelectionV1 | Mapping[str, Any] | None
         ) = None,
-    ) -> list | PolarsDataFrame | DataFrame | Table:
-        """Merge explicit cache records into the configured API return type."""
+        materialize: bool = True,
+    ) -> list | PolarsDataFrame | LazyFrame | DataFrame | Table | Iterator:
+        """Merge explicit cache records into the configured API return type.
+
+        ``return_type="lazy"`` returns a Polars ``LazyFrame`` over the month
+        caches instead of materializing them; months outside the random
+        window are skipped and further projections or filters are pushed
+        down into the cache scans.
+
+        ``materialize=False`` returns an iterator of per-month frames in
+        cache order for each pair/timeframe set.  Months are decoded on a
+        bounded thread pool a few months ahead of the consumer, so memory
+        stays bounded however many months are merged.
+        """
         if not records_to_merge:
             return []
         if self.args.get("random_window") and random_selection is None:
@@ -298,6 +313,7 @@ class Api:  # noqa:H601
             [WorkItem.from_record(record) for record in records_to_merge],
             return_type=resolved_return_type,
             materialize=True,
+            stream=not materialize,
             output_timezone=resolved_output_timezone,
             random_selection=random_selection,
         )
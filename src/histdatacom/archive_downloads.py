@@ -0,0 +1,165 @@
+"""Pooled HTTP session and per-host limits for HistData archive downloads."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from histdatacom.exceptions import ArchiveDownloadError
+
+ARCHIVE_HOST_CONCURRENCY_ENV = "HISTDATACOM_ARCHIVE_HOST_CONCURRENCY"
+ARCHIVE_REQUESTS_PER_SECOND_ENV = "HISTDATACOM_ARCHIVE_REQUESTS_PER_SECOND"
+DEFAULT_ARCHIVE_HOST_CONCURRENCY = 4
+DEFAULT_ARCHIVE_REQUESTS_PER_SECOND = 4.0
+ARCHIVE_STREAM_CHUNK_BYTES = 256 * 1024
+
+
+class HostRateLimiter:
+    """Space request starts to each host by ``1 / requests_per_second``.
+
+    A non-positive rate disables spacing.  Callers reserve the next start
+    slot under a lock and sleep outside it, so waiting threads do not
+    serialize each other's bookkeeping.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.interval = (
+            1.0 / float(requests_per_second) if requests_per_second > 0 else 0.0
+        )
+        self._clock = clock
+        self._sleep = sleep
+        self._next_start: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str) -> None:
+        """Block until ``host`` may receive another request."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.interval
+        if start > now:
+            self._sleep(start - now)
+
+
+class ArchiveDownloadEngine:
+    """Shared ``requests.Session`` with per-host concurrency and rate limits.
+
+    Archive POSTs reuse keep-alive connections from one pool.  At most
+    ``host_concurrency`` downloads hold a slot for the same host at a time,
+    and request starts are spaced by ``requests_per_second``.
+    """
+
+    def __init__(
+        self,
+        *,
+        host_concurrency: int = DEFAULT_ARCHIVE_HOST_CONCURRENCY,
+        requests_per_second: float = DEFAULT_ARCHIVE_REQUESTS_PER_SECOND,
+    ) -> None:
+        self.host_concurrency = max(1, int(host_concurrency))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.host_concurrency,
+            pool_maxsize=self.host_concurrency,
+            pool_block=True,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._rate_limiter = HostRateLimiter(requests_per_second)
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def host_slot(self, url: str) -> Iterator[None]:
+        """Hold one of the host's download slots for a request and its body."""
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.setdefault(
+                host,
+                threading.BoundedSemaphore(self.host_concurrency),
+            )
+        with slot:
+            self._rate_limiter.acquire(host)
+            yield
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST through the pooled session, leaving the body to be streamed."""
+        return self.session.post(url, stream=True, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+
+_DEFAULT_ENGINES: dict[int, ArchiveDownloadEngine] = {}
+_DEFAULT_ENGINE_LOCK = threading.Lock()
+
+
+def default_archive_download_engine() -> ArchiveDownloadEngine:
+    """Return this process's shared engine, configured from the environment.
+
+    A forked child gets its own engine instead of the parent's sockets.
+    """
+    pid = os.getpid()
+    with _DEFAULT_ENGINE_LOCK:
+        engine = _DEFAULT_ENGINES.get(pid)
+        if engine is None:
+            _DEFAULT_ENGINES.clear()
+            engine = ArchiveDownloadEngine(
+                host_concurrency=archive_host_concurrency(),
+                requests_per_second=archive_requests_per_second(),
+            )
+            _DEFAULT_ENGINES[pid] = engine
+        return engine
+
+
+def archive_host_concurrency() -> int:
+    """Return the configured number of concurrent downloads per host."""
+    value = os.environ.get(ARCHIVE_HOST_CONCURRENCY_ENV) or None
+    if value is None:
+        return DEFAULT_ARCHIVE_HOST_CONCURRENCY
+    try:
+        concurrency = int(value)
+    except (TypeError, ValueError) as err:
+        raise _invalid_limit(ARCHIVE_HOST_CONCURRENCY_ENV, value) from err
+    if concurrency < 1:
+        raise _invalid_limit(ARCHIVE_HOST_CONCURRENCY_ENV, value)
+    return concurrency
+
+
+def archive_requests_per_second() -> float:
+    """Return the configured request rate per host; ``0`` disables it."""
+    value = os.environ.get(ARCHIVE_REQUESTS_PER_SECOND_ENV) or None
+    if value is None:
+        return DEFAULT_ARCHIVE_REQUESTS_PER_SECOND
+    try:
+        rate = float(value)
+    except (TypeError, ValueError) as err:
+        raise _invalid_limit(ARCHIVE_REQUESTS_PER_SECOND_ENV, value) from err
+    if rate < 0:
+        raise _invalid_limit(ARCHIVE_REQUESTS_PER_SECOND_ENV, value)
+    return rate
+
+
+def _invalid_limit(name: str, value: str) -> ArchiveDownloadError:
+    return ArchiveDownloadError(
+        "ARCHIVE_DOWNLOAD_LIMIT_INVALID",
+        f"{name} must be a non-negative number: {value!r}",
+        retryable=False,
+        detail={"name": name},
+    )
@@ -0,0 +1,126 @@
+"""Installed CLI for offline data-plane micro-benchmarks."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from histdatacom.data_plane_benchmark import (
+    DEFAULT_BENCHMARK_MONTHS,
+    DEFAULT_BENCHMARK_ROUNDS,
+    DEFAULT_BENCHMARK_ROWS,
+    DEFAULT_REGRESSION_TOLERANCE,
+    benchmark_case_names,
+    compare_benchmark_reports,
+    format_benchmark_report,
+    run_data_plane_benchmark_suite,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the data-plane benchmark parser."""
+    parser = argparse.ArgumentParser(
+        prog="histdatacom bench",
+        description=(
+            "Generate synthetic HistData tick fixtures and time parsing, "
+            "datetime conversion, cache IO, cache merges, line-protocol "
+            "formatting, and tick/time quality scans offline."
+        ),
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=DEFAULT_BENCHMARK_ROWS,
+        help="synthetic tick rows per fixture month",
+    )
+    parser.add_argument(
+        "--months",
+        type=int,
+        default=DEFAULT_BENCHMARK_MONTHS,
+        help="fixture months, used by cache merges and quality scans",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=DEFAULT_BENCHMARK_ROUNDS,
+        help="timed rounds per benchmark case",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=benchmark_case_names(),
+        metavar="CASE",
+        help="run only this case; repeat to select several",
+    )
+    parser.add_argument(
+        "--save",
+        type=Path,
+        metavar="PATH",
+        help="write the pytest-benchmark style JSON report to PATH",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="PATH",
+        help="compare median times against a saved report",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_REGRESSION_TOLERANCE,
+        help="allowed slowdown against the baseline, as a fraction",
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        help="directory for temporary fixtures (default: system temp)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="emit the machine-readable report",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmarks; exit 1 when a case regresses past tolerance."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    baseline = None
+    if args.baseline is not None:
+        try:
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"baseline error: {exc}", file=sys.stderr)  # noqa:T201
+            return 1
+
+    report = run_data_plane_benchmark_suite(
+        rows=args.rows,
+        months=args.months,
+        rounds=args.rounds,
+        cases=args.case,
+        workdir=args.workdir,
+    )
+    comparisons = (
+        compare_benchmark_reports(report, baseline, tolerance=args.tolerance)
+        if baseline is not None
+        else ()
+    )
+    if comparisons:
+        report["baseline_comparison"] = [
+            comparison.to_dict() for comparison in comparisons
+        ]
+    if args.save is not None:
+        args.save.write_text(
+            json.dumps(report, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))  # noqa:T201
+    else:
+        print(format_benchmark_report(report, comparisons))  # noqa:T201
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
@@ -15,6 +15,7 @@ from histdatacom.broker_capture.adapters import (
 )
 from histdatacom.broker_capture.contracts import (
     BROKER_ADAPTER_MESSAGE_SCHEMA_VERSION,
+    BROKER_CAPTURE_ARROW_ARTIFACT_KIND,
     BROKER_CAPTURE_COLLECTOR_ID,
     BROKER_CAPTURE_COLLECTOR_VERSION,
     BROKER_CAPTURE_DATA_ARTIFACT_KIND,
@@ -29,6 +30,7 @@ from histdatacom.broker_capture.contracts import (
     BrokerCaptureBackpressureMode,
     BrokerCaptureEventKind,
     BrokerCaptureEventV1,
+    BrokerCapturePartitionEncoding,
     BrokerCapturePartitionManifestV1,
     BrokerCapturePriceTextSemantics,
     BrokerCaptureReplaySummaryV1,
@@ -100,6 +102,7 @@ from histdatacom.broker_capture.fingerprints import (
 
 __all__ = [
     "BROKER_ADAPTER_MESSAGE_SCHEMA_VERSION",
+    "BROKER_CAPTURE_ARROW_ARTIFACT_KIND",
     "BROKER_CAPTURE_COLLECTOR_ID",
     "BROKER_CAPTURE_COLLECTOR_VERSION",
     "BROKER_CAPTURE_DATA_ARTIFACT_KIND",
@@ -137,6 +140,7 @@ __all__ = [
     "BrokerCaptureEligibilityV1",
     "BrokerCaptureExistingSessionError",
     "BrokerCaptureIntegrityError",
+    "BrokerCapturePartitionEncoding",
     "BrokerCapturePartitionManifestV1",
     "BrokerCapturePriceTextSemantics",
     "BrokerCaptureQuotaError",
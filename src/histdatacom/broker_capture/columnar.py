@@ -0,0 +1,191 @@
+"""Arrow IPC column layout for broker capture partitions.
+
+Each row is one capture event with its adapter message flattened into
+columns, so replay can hand whole record batches to columnar consumers and
+rebuild verified ``BrokerCaptureEventV1`` objects only when asked.  Session
+identity and schema versions travel in the Arrow schema metadata; public
+metadata is stored as canonical JSON text.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from histdatacom.broker_capture.contracts import (
+    BROKER_ADAPTER_MESSAGE_SCHEMA_VERSION,
+    BROKER_CAPTURE_EVENT_SCHEMA_VERSION,
+    BrokerCaptureEventV1,
+    canonical_capture_json,
+)
+
+BROKER_CAPTURE_COLUMNS_VERSION = "histdatacom.broker-capture-columns.v1"
+ARROW_STREAM_END = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
+EVENT_COLUMNS = (
+    ("capture_sequence", "int", False),
+    ("receive_time_utc_ns", "int", False),
+    ("receive_time_monotonic_ns", "int", False),
+    ("clock_offset_change_ns", "int", True),
+    ("event_id", "text", False),
+)
+MESSAGE_COLUMNS = (
+    ("kind", "text", False),
+    ("source_event_time_ns", "int", True),
+    ("source_timestamp_semantics", "text", False),
+    ("source_timestamp_precision_ns", "int", True),
+    ("source_sequence", "int", True),
+    ("source_message_id", "text", True),
+    ("source_batch_id", "text", True),
+    ("symbol", "text", True),
+    ("bid", "float", True),
+    ("ask", "float", True),
+    ("bid_text", "text", True),
+    ("ask_text", "text", True),
+    ("price_text_semantics", "text", False),
+    ("bid_size", "float", True),
+    ("ask_size", "float", True),
+    ("size_semantics", "text", False),
+    ("activity_value", "float", True),
+    ("activity_semantics", "text", False),
+    ("connection_id", "text", True),
+    ("subscription_id", "text", True),
+    ("gap_duration_ns", "int", True),
+    ("reason_code", "text", True),
+    ("raw_message_sha256", "text", True),
+    ("public_metadata", "text", False),
+    ("message_id", "text", False),
+)
+_ENUM_MESSAGE_COLUMNS = frozenset(
+    {
+        "kind",
+        "source_timestamp_semantics",
+        "price_text_semantics",
+        "size_semantics",
+        "activity_semantics",
+    }
+)
+
+
+def capture_arrow_schema(session_id: str) -> Any:
+    """Return the Arrow schema for one capture session's partitions."""
+    pa = _pyarrow()
+    types = {"int": pa.int64(), "float": pa.float64(), "text": pa.string()}
+    return pa.schema(
+        [
+            pa.field(name, types[kind], nullable=nullable)
+            for name, kind, nullable in (*EVENT_COLUMNS, *MESSAGE_COLUMNS)
+        ],
+        metadata={
+            "columns_version": BROKER_CAPTURE_COLUMNS_VERSION,
+            "event_schema_version": BROKER_CAPTURE_EVENT_SCHEMA_VERSION,
+            "message_schema_version": BROKER_ADAPTER_MESSAGE_SCHEMA_VERSION,
+            "session_id": session_id,
+        },
+    )
+
+
+def capture_events_to_record_batch(
+    events: Sequence[BrokerCaptureEventV1], *, session_id: str
+) -> Any:
+    """Flatten same-session capture events into one Arrow record batch."""
+    pa = _pyarrow()
+    if any(event.session_id != session_id for event in events):
+        raise ValueError("capture events belong to another session")
+    messages = [event.message for event in events]
+    columns: list[list[Any]] = [
+        [getattr(event, name) for event in events]
+        for name, _, _ in EVENT_COLUMNS
+    ]
+    for name, _, _ in MESSAGE_COLUMNS:
+        if name in _ENUM_MESSAGE_COLUMNS:
+            columns.append([getattr(item, name).value for item in messages])
+        elif name == "public_metadata":
+            columns.append(
+                [
+                    canonical_capture_json(item.public_metadata)
+                    for item in messages
+                ]
+            )
+        else:
+            columns.append([getattr(item, name) for item in messages])
+    return pa.record_batch(columns, schema=capture_arrow_schema(session_id))
+
+
+def capture_record_batch_events(
+    batch: Any, *, session_id: str
+) -> Iterator[BrokerCaptureEventV1]:
+    """Rebuild and re-verify capture events from one record batch."""
+    for row in batch.to_pylist():
+        message = {name: row[name] for name, _, _ in MESSAGE_COLUMNS}
+        message["public_metadata"] = json.loads(row["public_metadata"])
+        message["schema_version"] = BROKER_ADAPTER_MESSAGE_SCHEMA_VERSION
+        yield BrokerCaptureEventV1.from_dict(
+            {
+                **{name: row[name] for name, _, _ in EVENT_COLUMNS},
+                "session_id": session_id,
+                "message": message,
+                "schema_version": BROKER_CAPTURE_EVENT_SCHEMA_VERSION,
+            }
+        )
+
+
+def arrow_stream_schema_bytes(session_id: str) -> bytes:
+    """Return the encapsulated schema message that opens a partition."""
+    return capture_arrow_schema(session_id).serialize().to_pybytes()
+
+
+def arrow_stream_batch_bytes(
+    events: Sequence[BrokerCaptureEventV1], *, session_id: str
+) -> bytes:
+    """Return one encapsulated record-batch message for ``events``."""
+    batch = capture_events_to_record_batch(events, session_id=session_id)
+    return batch.serialize().to_pybytes()
+
+
+def read_capture_arrow_stream(data: bytes, *, session_id: str) -> Iterator[Any]:
+    """Yield record batches from one complete partition stream.
+
+    Raises ``ValueError`` when the stream schema is not this session's
+    capture layout.
+    """
+    pa = _pyarrow()
+    ipc = _pyarrow_ipc()
+    reader = ipc.open_stream(pa.py_buffer(data))
+    if not reader.schema.equals(
+        capture_arrow_schema(session_id), check_metadata=True
+    ):
+        raise ValueError("capture partition Arrow schema does not match")
+    for batch in reader:
+        if batch.num_rows:
+            yield batch
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise RuntimeError(
+            "arrow-ipc capture partitions require histdatacom[arrow]"
+        ) from exc
+    return pa
+
+
+def _pyarrow_ipc() -> Any:
+    _pyarrow()
+    import pyarrow.ipc as ipc  # pylint: disable=import-outside-toplevel
+
+    return ipc
+
+
+__all__ = [
+    "ARROW_STREAM_END",
+    "BROKER_CAPTURE_COLUMNS_VERSION",
+    "arrow_stream_batch_bytes",
+    "arrow_stream_schema_bytes",
+    "capture_arrow_schema",
+    "capture_events_to_record_batch",
+    "capture_record_batch_events",
+    "read_capture_arrow_stream",
+]
@@ -40,6 +40,7 @@ BROKER_CAPTURE_REPLAY_SUMMARY_SCHEMA_VERSION = (
 BROKER_CAPTURE_COLLECTOR_ID = "histdatacom.broker-capture"
 BROKER_CAPTURE_COLLECTOR_VERSION = "1.0.0"
 BROKER_CAPTURE_DATA_ARTIFACT_KIND = "broker_capture_jsonl"
+BROKER_CAPTURE_ARROW_ARTIFACT_KIND = "broker_capture_arrow_ipc"
 
 INT64_MAX = 2**63 - 1
 MAX_CAPTURE_TEXT = 1024
@@ -209,6 +210,27 @@ class BrokerCaptureBackpressureMode(str, Enum):
         return _enum_value(cls, value, "broker capture backpressure mode")
 
 
+class BrokerCapturePartitionEncoding(str, Enum):
+    """On-disk encoding of completed capture partitions."""
+
+    JSONL = "jsonl"
+    ARROW_IPC = "arrow-ipc"
+
+    @classmethod
+    def from_value(
+        cls, value: str | "BrokerCapturePartitionEncoding"
+    ) -> "BrokerCapturePartitionEncoding":
+        """Return a strict normalized partition encoding."""
+        return _enum_value(cls, value, "broker capture partition encoding")
+
+    @property
+    def artifact_kind(self) -> str:
+        """Return the data-artifact kind advertised for this encoding."""
+        if self is BrokerCapturePartitionEncoding.ARROW_IPC:
+            return BROKER_CAPTURE_ARROW_ARTIFACT_KIND
+        return BROKER_CAPTURE_DATA_ARTIFACT_KIND
+
+
 @dataclass(frozen=True, slots=True)
 class BrokerAdapterMessageV1:
     """One public, credential-free message emitted by a broker adapter."""
@@ -814,6 +836,11 @@ class BrokerCaptureStoragePolicyV1:
     backpressure_mode: BrokerCaptureBackpressureMode = (
         BrokerCaptureBackpressureMode.REFUSE
     )
+    group_commit_max_bytes: int = 0
+    group_commit_max_delay_ns: int = 0
+    partition_encoding: BrokerCapturePartitionEncoding = (
+        BrokerCapturePartitionEncoding.JSONL
+    )
     policy_id: str = ""
     schema_version: str = BROKER_CAPTURE_STORAGE_POLICY_SCHEMA_VERSION
 
@@ -846,6 +873,25 @@ class BrokerCaptureStoragePolicyV1:
             "fsync_each_event",
             _strict_bool(self.fsync_each_event, "fsync_each_event"),
         )
+        for name in ("group_commit_max_bytes", "group_commit_max_delay_ns"):
+            object.__setattr__(
+                self, name, _nonnegative_int64(getattr(self, name), name)
+            )
+        if (self.group_commit_max_bytes == 0) != (
+            self.group_commit_max_delay_ns == 0
+        ):
+            raise ValueError(
+                "group commit requires both a byte and a delay bound"
+            )
+        if self.group_commit_max_bytes > self.max_partition_bytes:
+            raise ValueError(
+                "group commit bytes exceed the partition byte limit"
+            )
+        object.__setattr__(
+            self,
+            "partition_encoding",
+            BrokerCapturePartitionEncoding.from_value(self.partition_encoding),
+        )
         retention = BrokerCaptureRetentionMode.from_value(self.retention_mode)
         backpressure = BrokerCaptureBackpressureMode.from_value(
             self.backpressure_mode
@@ -862,9 +908,19 @@ class BrokerCaptureStoragePolicyV1:
             raise ValueError("policy_id does not match deterministic identity")
         object.__setattr__(self, "policy_id", expected)
 
+    @property
+    def group_commit(self) -> bool:
+        """Return whether appends are buffered and fsynced per group."""
+        return self.group_commit_max_bytes > 0
+
     def identity_payload(self) -> dict[str, JSONValue]:
-        """Return fields defining storage behavior."""
-        return {
+        """Return fields defining storage behavior.
+
+        Group-commit bounds and a non-JSONL partition encoding are included
+        only when enabled, so per-event JSONL policies keep their existing
+        identities.
+        """
+        payload: dict[str, JSONValue] = {
             "schema_version": self.schema_version,
             "max_partition_events": self.max_partition_events,
             "max_partition_bytes": self.max_partition_bytes,
@@ -877,6 +933,14 @@ class BrokerCaptureStoragePolicyV1:
             "retention_mode": self.retention_mode.value,
             "backpressure_mode": self.backpressure_mode.value,
         }
+        if self.group_commit:
+            payload["group_commit_max_bytes"] = self.group_commit_max_bytes
+            payload["group_commit_max_delay_ns"] = (
+                self.group_commit_max_delay_ns
+            )
+        if self.partition_encoding is not BrokerCapturePartitionEncoding.JSONL:
+            payload["partition_encoding"] = self.partition_encoding.value
+        return payload
 
     def to_dict(self) -> dict[str, JSONValue]:
         """Return deterministic JSON-compatible policy metadata."""
@@ -913,6 +977,15 @@ class BrokerCaptureStoragePolicyV1:
             backpressure_mode=BrokerCaptureBackpressureMode.from_value(
                 str(data.get("backpressure_mode", ""))
             ),
+            group_commit_max_bytes=cast(
+                int, data.get("group_commit_max_bytes", 0)
+            ),
+            group_commit_max_delay_ns=cast(
+                int, data.get("group_commit_max_delay_ns", 0)
+            ),
+            partition_encoding=BrokerCapturePartitionEncoding.from_value(
+                str(data.get("partition_encoding", "jsonl"))
+            ),
             policy_id=str(data.get("policy_id", "")),
             schema_version=str(data.get("schema_version", "")),
         )
@@ -925,7 +998,7 @@ class BrokerCaptureStoragePolicyV1:
 
 @dataclass(frozen=True, slots=True)
 class BrokerCapturePartitionManifestV1:
-    """Compact immutable manifest for one completed JSONL partition."""
+    """Compact immutable manifest for one completed capture partition."""
 
     session_id: str
     policy_id: str
@@ -939,6 +1012,9 @@ class BrokerCapturePartitionManifestV1:
     first_receive_time_monotonic_ns: int
     last_receive_time_monotonic_ns: int
     event_kind_counts: dict[str, int]
+    encoding: BrokerCapturePartitionEncoding = (
+        BrokerCapturePartitionEncoding.JSONL
+    )
     completed: bool = True
     partition_id: str = ""
     schema_version: str = BROKER_CAPTURE_PARTITION_MANIFEST_SCHEMA_VERSION
@@ -990,7 +1066,11 @@ class BrokerCapturePartitionManifestV1:
         if sum(counts.values()) != self.event_count:
             raise ValueError("partition event-kind counts do not reconcile")
         object.__setattr__(self, "event_kind_counts", counts)
-        artifact = _validated_capture_artifact(self.data_artifact)
+        encoding = BrokerCapturePartitionEncoding.from_value(self.encoding)
+        object.__setattr__(self, "encoding", encoding)
+        artifact = _validated_capture_artifact(
+            self.data_artifact, kind=encoding.artifact_kind
+        )
         object.__setattr__(self, "data_artifact", artifact)
         if not _strict_bool(self.completed, "completed"):
             raise ValueError(
@@ -1009,7 +1089,7 @@ class BrokerCapturePartitionManifestV1:
 
     def identity_payload(self) -> dict[str, JSONValue]:
         """Return fields defining this immutable partition."""
-        return {
+        payload: dict[str, JSONValue] = {
             "schema_version": self.schema_version,
             "session_id": self.session_id,
             "policy_id": self.policy_id,
@@ -1029,6 +1109,9 @@ class BrokerCapturePartitionManifestV1:
             "event_kind_counts": dict(self.event_kind_counts),
             "completed": True,
         }
+        if self.encoding is not BrokerCapturePartitionEncoding.JSONL:
+            payload["encoding"] = self.encoding.value
+        return payload
 
     def to_dict(self) -> dict[str, JSONValue]:
         """Return deterministic JSON-compatible manifest metadata."""
@@ -1074,6 +1157,9 @@ class BrokerCapturePartitionManifestV1:
                     data.get("event_kind_counts")
                 ).items()
             },
+            encoding=BrokerCapturePartitionEncoding.from_value(
+                str(data.get("encoding", "jsonl"))
+            ),
             completed=cast(bool, data.get("completed")),
             partition_id=str(data.get("partition_id", "")),
             schema_version=str(data.get("schema_version", "")),
@@ -1135,6 +1221,8 @@ class BrokerCaptureSessionManifestV1:
                 raise ValueError("capture partition session does not match")
             if partition.policy_id != self.storage_policy.policy_id:
                 raise ValueError("capture partition policy does not match")
+            if partition.encoding is not self.storage_policy.partition_encoding:
+                raise ValueError("capture partition encoding does not match")
             if expected_ordinal and (
                 partition.first_capture_sequence
                 != partitions[expected_ordinal - 1].last_capture_sequence + 1
@@ -1429,10 +1517,12 @@ def logical_capture_content_sha256(
     return digest.hexdigest()
 
 
-def _validated_capture_artifact(value: ArtifactRef) -> ArtifactRef:
+def _validated_capture_artifact(
+    value: ArtifactRef, *, kind: str
+) -> ArtifactRef:
     if not isinstance(value, ArtifactRef):
         raise TypeError("data_artifact must be ArtifactRef")
-    if value.kind != BROKER_CAPTURE_DATA_ARTIFACT_KIND:
+    if value.kind != kind:
         raise ValueError("unsupported broker capture artifact kind")
     path = _relative_artifact_path(value.path)
     size = _positive_int64(value.size_bytes, "data_artifact.size_bytes")
@@ -1709,6 +1799,7 @@ def _json_mapping(text: str) -> Mapping[str, Any]:
 
 __all__ = [
     "BROKER_ADAPTER_MESSAGE_SCHEMA_VERSION",
+    "BROKER_CAPTURE_ARROW_ARTIFACT_KIND",
     "BROKER_CAPTURE_COLLECTOR_ID",
     "BROKER_CAPTURE_COLLECTOR_VERSION",
     "BROKER_CAPTURE_DATA_ARTIFACT_KIND",
@@ -1723,6 +1814,7 @@ __all__ = [
     "BrokerCaptureBackpressureMode",
     "BrokerCaptureEventKind",
     "BrokerCaptureEventV1",
+    "BrokerCapturePartitionEncoding",
     "BrokerCapturePartitionManifestV1",
     "BrokerCapturePriceTextSemantics",
     "BrokerCaptureReplaySummaryV1",
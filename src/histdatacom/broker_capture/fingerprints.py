@@ -10,10 +10,12 @@ import re
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from histdatacom.broker_capture.contracts import (
     BrokerCaptureEventKind,
     BrokerCaptureEventV1,
+    BrokerCapturePartitionEncoding,
     BrokerCaptureSessionManifestV1,
     canonical_capture_json,
 )
@@ -34,6 +36,7 @@ from histdatacom.broker_capture.fingerprint_contracts import (
     BrokerDeliverySupportStatus,
 )
 from histdatacom.broker_capture.storage import (
+    BrokerCaptureReplaySourceV1,
     BrokerCaptureStorageError,
     inspect_broker_capture_session,
     replay_broker_capture_session,
@@ -403,6 +406,43 @@ class _PreviousQuote:
     message_id: str
 
 
+@dataclass(slots=True)
+class _CaptureRow:
+    kind: BrokerCaptureEventKind
+    event_id: str
+    receive_time_utc_ns: int
+    receive_time_monotonic_ns: int
+    clock_offset_change_ns: int | None
+    gap_duration_ns: int | None
+    symbol: str | None
+    bid: float | None
+    ask: float | None
+    bid_text: str | None
+    ask_text: str | None
+    source_timestamp_precision_ns: int | None
+    source_batch_id: str | None
+    message_id: str
+
+
+# Field order matches _CaptureRow so record-batch columns zip into rows.
+_CAPTURE_ROW_COLUMNS = (
+    "kind",
+    "event_id",
+    "receive_time_utc_ns",
+    "receive_time_monotonic_ns",
+    "clock_offset_change_ns",
+    "gap_duration_ns",
+    "symbol",
+    "bid",
+    "ask",
+    "bid_text",
+    "ask_text",
+    "source_timestamp_precision_ns",
+    "source_batch_id",
+    "message_id",
+)
+
+
 class _FingerprintConsumer:
     def __init__(
         self,
@@ -469,6 +509,38 @@ class _FingerprintConsumer:
             )
 
     def on_event(self, event: BrokerCaptureEventV1) -> None:
+        message = event.message
+        self.on_row(
+            _CaptureRow(
+                kind=event.kind,
+                event_id=event.event_id,
+                receive_time_utc_ns=event.receive_time_utc_ns,
+                receive_time_monotonic_ns=event.receive_time_monotonic_ns,
+                clock_offset_change_ns=event.clock_offset_change_ns,
+                gap_duration_ns=message.gap_duration_ns,
+                symbol=message.symbol,
+                bid=message.bid,
+                ask=message.ask,
+                bid_text=message.bid_text,
+                ask_text=message.ask_text,
+                source_timestamp_precision_ns=(
+                    message.source_timestamp_precision_ns
+                ),
+                source_batch_id=message.source_batch_id,
+                message_id=message.message_id,
+            )
+        )
+
+    def on_record_batch(self, batch: Any) -> None:
+        """Consume one verified capture record batch column by column."""
+        columns = [
+            batch.column(name).to_pylist() for name in _CAPTURE_ROW_COLUMNS
+        ]
+        kinds = {kind.value: kind for kind in BrokerCaptureEventKind}
+        for values in zip(*columns):
+            self.on_row(_CaptureRow(kinds[values[0]], *values[1:]))
+
+    def on_row(self, event: _CaptureRow) -> None:
         self.event_count += 1
         self._session_event_count += 1
         if self._session_first_monotonic_ns is None:
@@ -511,10 +583,10 @@ class _FingerprintConsumer:
                 event.event_id,
                 kind="rate",
             )
-        if event.message.gap_duration_ns is not None:
+        if event.gap_duration_ns is not None:
             global_cell.add(
                 "outage_or_gap_duration_ns",
-                float(event.message.gap_duration_ns),
+                float(event.gap_duration_ns),
                 event.event_id,
                 unit="ns",
             )
@@ -544,29 +616,28 @@ class _FingerprintConsumer:
     def finish(self) -> None:
         self.end_session()
 
-    def _on_quote(self, event: BrokerCaptureEventV1) -> None:
-        message = event.message
-        assert message.symbol is not None
-        assert message.bid is not None
-        assert message.ask is not None
+    def _on_quote(self, event: _CaptureRow) -> None:
+        assert event.symbol is not None
+        assert event.bid is not None
+        assert event.ask is not None
         self.quote_count += 1
         self._session_quote_count += 1
         conditions = self._quote_conditions(event)
         cells = [self._ensure_cell(dimensions) for dimensions in conditions]
         for cell in cells:
             cell.observe_quote()
-        spread = message.ask - message.bid
-        previous = self._previous_quotes.get(message.symbol)
+        spread = event.ask - event.bid
+        previous = self._previous_quotes.get(event.symbol)
         for cell in cells:
             cell.add("spread", spread, event.event_id, unit="price")
-            if message.source_timestamp_precision_ns is not None:
+            if event.source_timestamp_precision_ns is not None:
                 cell.add(
                     "source_timestamp_precision_ns",
-                    float(message.source_timestamp_precision_ns),
+                    float(event.source_timestamp_precision_ns),
                     event.event_id,
                     unit="ns",
                 )
-            decimals = _price_decimal_places(message.bid_text, message.ask_text)
+            decimals = _price_decimal_places(event.bid_text, event.ask_text)
             if decimals is not None:
                 cell.add(
                     "price_decimal_places",
@@ -576,15 +647,13 @@ class _FingerprintConsumer:
                 )
                 cell.add(
                     "price_trailing_zero_rate",
-                    float(
-                        _has_trailing_zero(message.bid_text, message.ask_text)
-                    ),
+                    float(_has_trailing_zero(event.bid_text, event.ask_text)),
                     event.event_id,
                     kind="rate",
                 )
         if previous is not None:
             interval = event.receive_time_monotonic_ns - previous.monotonic_ns
-            changed = message.bid != previous.bid or message.ask != previous.ask
+            changed = event.bid != previous.bid or event.ask != previous.ask
             burst = interval <= self.config.burst_interval_ns
             quiet = interval >= self.config.quiet_interval_ns
             stale = (
@@ -618,7 +687,7 @@ class _FingerprintConsumer:
                 ("transition_rate", float(changed), "rate", "ratio"),
                 (
                     "exact_duplicate_rate",
-                    float(message.message_id == previous.message_id),
+                    float(event.message_id == previous.message_id),
                     "rate",
                     "ratio",
                 ),
@@ -654,23 +723,23 @@ class _FingerprintConsumer:
                 cell.observe_run("burst_interval", burst, event.event_id)
                 cell.observe_run("quiet_interval", quiet, event.event_id)
                 cell.observe_run("stale_quote", stale, event.event_id)
-        self._previous_quotes[message.symbol] = _PreviousQuote(
+        self._previous_quotes[event.symbol] = _PreviousQuote(
             monotonic_ns=event.receive_time_monotonic_ns,
-            bid=message.bid,
-            ask=message.ask,
+            bid=event.bid,
+            ask=event.ask,
             spread=spread,
-            message_id=message.message_id,
+            message_id=event.message_id,
         )
-        self._observe_batch(message.source_batch_id, event.event_id)
+        self._observe_batch(event.source_batch_id, event.event_id)
         if self._lifecycle_quotes_remaining:
             self._lifecycle_quotes_remaining -= 1
             if not self._lifecycle_quotes_remaining:
                 self._lifecycle = None
 
     def _quote_conditions(
-        self, event: BrokerCaptureEventV1
+        self, event: _CaptureRow
     ) -> tuple[dict[str, str], ...]:
-        symbol = event.message.symbol
+        symbol = event.symbol
         assert symbol is not None
         state = market_context_calendar_state(
             event.receive_time_utc_ns,
@@ -827,6 +896,17 @@ def fit_broker_delivery_fingerprint(
     evidence_by_session = {item.session_id: item for item in evidence}
     for manifest in ordered:
         consumer.start_session(manifest.session.session_id)
+        if (
+            manifest.storage_policy.partition_encoding
+            is BrokerCapturePartitionEncoding.ARROW_IPC
+        ):
+            # The replay source re-checks every artifact digest pinned by
+            # this manifest, so the columns are the bytes eligibility replayed.
+            source = BrokerCaptureReplaySourceV1(root, manifest)
+            for batch in source.iter_record_batches():
+                consumer.on_record_batch(batch)
+            consumer.end_session()
+            continue
         summary = replay_broker_capture_session(
             root, manifest, consumers=(consumer,)
         )
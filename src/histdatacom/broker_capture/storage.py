@@ -3,20 +3,33 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import os
-from collections.abc import Iterable, Iterator, Sequence
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
 from histdatacom.broker_capture.adapters import (
     BrokerCaptureEventConsumerV1,
     BrokerCaptureEventSourceV1,
     consume_broker_capture_source,
 )
+from histdatacom.broker_capture.columnar import (
+    ARROW_STREAM_END,
+    arrow_stream_batch_bytes,
+    arrow_stream_schema_bytes,
+    capture_events_to_record_batch,
+    capture_record_batch_events,
+    read_capture_arrow_stream,
+)
 from histdatacom.broker_capture.contracts import (
-    BROKER_CAPTURE_DATA_ARTIFACT_KIND,
+    BrokerCaptureEventKind,
     BrokerCaptureEventV1,
+    BrokerCapturePartitionEncoding,
     BrokerCapturePartitionManifestV1,
     BrokerCaptureReplaySummaryV1,
     BrokerCaptureSessionManifestV1,
@@ -28,7 +41,9 @@ from histdatacom.runtime_contracts import ArtifactRef
 
 SESSION_MANIFEST_FILENAME = "session.manifest.json"
 PARTITION_DATA_TEMPLATE = "partition-{ordinal:06d}.jsonl"
+PARTITION_ARROW_DATA_TEMPLATE = "partition-{ordinal:06d}.arrow"
 PARTITION_MANIFEST_TEMPLATE = "partition-{ordinal:06d}.manifest.json"
+_READ_BLOCK_BYTES = 1024 * 1024
 
 
 class BrokerCaptureStorageError(RuntimeError):
@@ -76,7 +91,26 @@ class BrokerCaptureSessionInspectionV1:
 
 
 class AppendOnlyBrokerCaptureWriterV1:
-    """Rotate canonical JSONL partitions and publish only completed evidence."""
+    """Rotate capture partitions and publish only completed evidence.
+
+    Partitions are canonical JSON lines unless the policy selects the
+    ``arrow-ipc`` encoding, in which case each durable write appends one
+    Arrow IPC record batch to a stream that is closed at rotation.
+
+    Storage limits are checked against a running total of the bytes this
+    writer has put in the session directory, so an append never walks it.
+
+    With a group-commit policy, appended lines are buffered and written with
+    one fsync when the group reaches ``group_commit_max_bytes`` or its oldest
+    event has waited ``group_commit_max_delay_ns`` on ``clock``.  Buffered
+    events are acknowledged before they are durable, so a crash can lose at
+    most one group; rotation, ``flush`` and ``close`` always commit the group
+    first, and the partial/sidecar/manifest publication order is unchanged.
+    An idle collector should call ``flush`` to keep the window bounded.
+    Arrow partitions pair best with group commit: without it every event is
+    its own single-row batch.  Buffered Arrow events count toward rotation
+    and quotas at their canonical JSON size until the batch is encoded.
+    """
 
     def __init__(
         self,
@@ -84,10 +118,19 @@ class AppendOnlyBrokerCaptureWriterV1:
         *,
         session: BrokerCaptureSessionV1,
         storage_policy: BrokerCaptureStoragePolicyV1,
+        clock: Callable[[], int] = time.monotonic_ns,
     ) -> None:
         self.root = Path(root)
         self.session = session
         self.storage_policy = storage_policy
+        self._clock = clock
+        self._arrow = (
+            storage_policy.partition_encoding
+            is BrokerCapturePartitionEncoding.ARROW_IPC
+        )
+        if self._arrow:
+            # Fail before touching the capture root when pyarrow is missing.
+            arrow_stream_schema_bytes(session.session_id)
         self.session_directory = self.root / session.session_id
         if self.session_directory.exists() and any(
             self.session_directory.iterdir()
@@ -107,6 +150,12 @@ class AppendOnlyBrokerCaptureWriterV1:
         self._partition_first_event: BrokerCaptureEventV1 | None = None
         self._partition_last_event: BrokerCaptureEventV1 | None = None
         self._partition_kind_counts: dict[str, int] = {}
+        self._group_lines: list[bytes] = []
+        self._group_events: list[BrokerCaptureEventV1] = []
+        self._group_bytes = 0
+        self._group_started_ns = 0
+        self._artifact_bytes: dict[Path, int] = {}
+        self._stored_bytes = 0
         self._closed = False
         self._manifest = self._publish_session_manifest(
             BrokerCaptureSessionState.OPEN, limitations=()
@@ -130,7 +179,12 @@ class AppendOnlyBrokerCaptureWriterV1:
             and event.receive_time_monotonic_ns < self._last_monotonic_ns
         ):
             raise ValueError("capture event monotonic time moved backwards")
-        line = (event.to_json() + "\n").encode("utf-8")
+        if self._arrow and not self.storage_policy.group_commit:
+            line = arrow_stream_batch_bytes(
+                (event,), session_id=self.session.session_id
+            )
+        else:
+            line = (event.to_json() + "\n").encode("utf-8")
         if len(line) > self.storage_policy.max_partition_bytes:
             raise BrokerCaptureQuotaError(
                 "one capture event exceeds the partition byte limit"
@@ -142,15 +196,24 @@ class AppendOnlyBrokerCaptureWriterV1:
         if starting_partition:
             self._open_partition()
         assert self._file is not None
-        try:
-            self._file.write(line)
-            self._file.flush()
-            if self.storage_policy.fsync_each_event:
-                os.fsync(self._file.fileno())
-        except OSError as err:
-            raise BrokerCaptureStorageError(
-                "capture partition append failed"
-            ) from err
+        if self.storage_policy.group_commit:
+            if not self._group_bytes:
+                self._group_started_ns = self._clock()
+            if self._arrow:
+                self._group_events.append(event)
+            else:
+                self._group_lines.append(line)
+            self._group_bytes += len(line)
+        else:
+            try:
+                self._file.write(line)
+                self._file.flush()
+                if self.storage_policy.fsync_each_event:
+                    os.fsync(self._file.fileno())
+            except OSError as err:
+                raise BrokerCaptureStorageError(
+                    "capture partition append failed"
+                ) from err
         self._partition_bytes += len(line)
         self._partition_event_count += 1
         if self._partition_first_event is None:
@@ -164,6 +227,18 @@ class AppendOnlyBrokerCaptureWriterV1:
         )
         self._total_events += 1
         self._last_monotonic_ns = event.receive_time_monotonic_ns
+        if self._group_bytes and (
+            self._group_bytes >= self.storage_policy.group_commit_max_bytes
+            or self._clock() - self._group_started_ns
+            >= self.storage_policy.group_commit_max_delay_ns
+        ):
+            self._commit_group()
+
+    def flush(self) -> None:
+        """Write and fsync any buffered group-commit events now."""
+        if self._closed:
+            raise BrokerCaptureStorageError("capture writer is closed")
+        self._commit_group()
 
     def close(
         self,
@@ -231,7 +306,8 @@ class AppendOnlyBrokerCaptureWriterV1:
                 "capture retention ceiling reached; committed evidence was not deleted"
             )
         projected = (
-            _directory_size(self.session_directory)
+            self._stored_bytes
+            + self._partition_bytes
             + line_bytes
             + self.storage_policy.manifest_reserve_bytes
         )
@@ -244,21 +320,57 @@ class AppendOnlyBrokerCaptureWriterV1:
                 "capture storage high watermark requires backpressure"
             )
 
+    def _commit_group(self) -> None:
+        if not self._group_bytes:
+            return
+        assert self._file is not None
+        if self._arrow:
+            payload = arrow_stream_batch_bytes(
+                self._group_events, session_id=self.session.session_id
+            )
+            self._partition_bytes += len(payload) - self._group_bytes
+        else:
+            payload = b"".join(self._group_lines)
+        self._group_lines = []
+        self._group_events = []
+        self._group_bytes = 0
+        try:
+            self._file.write(payload)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as err:
+            raise BrokerCaptureStorageError(
+                "capture group commit failed"
+            ) from err
+
+    def _data_template(self) -> str:
+        return (
+            PARTITION_ARROW_DATA_TEMPLATE
+            if self._arrow
+            else PARTITION_DATA_TEMPLATE
+        )
+
     def _open_partition(self) -> None:
         ordinal = len(self._partitions)
         partial_name = (
-            PARTITION_DATA_TEMPLATE.format(ordinal=ordinal) + ".partial"
+            self._data_template().format(ordinal=ordinal) + ".partial"
         )
         partial_path = self.session_directory / partial_name
+        header = (
+            arrow_stream_schema_bytes(self.session.session_id)
+            if self._arrow
+            else b""
+        )
         try:
             self._file = partial_path.open("xb")
+            self._file.write(header)
         except OSError as err:
             raise BrokerCaptureStorageError(
                 "could not create capture partial partition"
             ) from err
         self._partial_path = partial_path
         self._partition_event_count = 0
-        self._partition_bytes = 0
+        self._partition_bytes = len(header)
         self._partition_first_event = None
         self._partition_last_event = None
         self._partition_kind_counts = {}
@@ -275,33 +387,46 @@ class AppendOnlyBrokerCaptureWriterV1:
                 "capture partition state is incomplete"
             )
         try:
+            self._commit_group()
+            if self._arrow:
+                file_handle.write(ARROW_STREAM_END)
+                self._partition_bytes += len(ARROW_STREAM_END)
             file_handle.flush()
             os.fsync(file_handle.fileno())
             file_handle.close()
             ordinal = len(self._partitions)
-            final_path = (
-                self.session_directory
-                / PARTITION_DATA_TEMPLATE.format(ordinal=ordinal)
+            final_path = self.session_directory / self._data_template().format(
+                ordinal=ordinal
             )
             partial_path.replace(final_path)
             _fsync_directory(self.session_directory)
             size_bytes = final_path.stat().st_size
+            self._record_artifact_bytes(final_path, size_bytes)
             if size_bytes != self._partition_bytes:
                 raise BrokerCaptureIntegrityError(
                     "capture partition byte count changed before publication"
                 )
+            encoding = self.storage_policy.partition_encoding
             artifact = ArtifactRef(
-                kind=BROKER_CAPTURE_DATA_ARTIFACT_KIND,
+                kind=encoding.artifact_kind,
                 path=str(final_path.relative_to(self.root)).replace(
                     os.sep, "/"
                 ),
                 size_bytes=size_bytes,
                 sha256=_file_sha256(final_path),
-                metadata={
-                    "encoding": "utf-8",
-                    "format": "canonical-json-lines",
-                    "ordering": "capture_sequence",
-                },
+                metadata=(
+                    {
+                        "encoding": "arrow-ipc-stream",
+                        "format": "flattened-capture-events",
+                        "ordering": "capture_sequence",
+                    }
+                    if self._arrow
+                    else {
+                        "encoding": "utf-8",
+                        "format": "canonical-json-lines",
+                        "ordering": "capture_sequence",
+                    }
+                ),
             )
             partition = BrokerCapturePartitionManifestV1(
                 session_id=self.session.session_id,
@@ -318,12 +443,13 @@ class AppendOnlyBrokerCaptureWriterV1:
                 ),
                 last_receive_time_monotonic_ns=(last.receive_time_monotonic_ns),
                 event_kind_counts=dict(self._partition_kind_counts),
+                encoding=encoding,
             )
             partition_manifest_path = (
                 self.session_directory
                 / PARTITION_MANIFEST_TEMPLATE.format(ordinal=ordinal)
             )
-            _atomic_write_text(
+            self._publish_text(
                 partition_manifest_path, partition.to_json() + "\n"
             )
             self._partitions.append(partition)
@@ -346,6 +472,17 @@ class AppendOnlyBrokerCaptureWriterV1:
             self._partition_first_event = None
             self._partition_last_event = None
             self._partition_kind_counts = {}
+            self._group_lines = []
+            self._group_events = []
+            self._group_bytes = 0
+
+    def _publish_text(self, path: Path, text: str) -> None:
+        _atomic_write_text(path, text)
+        self._record_artifact_bytes(path, len(text.encode("utf-8")))
+
+    def _record_artifact_bytes(self, path: Path, size_bytes: int) -> None:
+        self._stored_bytes += size_bytes - self._artifact_bytes.get(path, 0)
+        self._artifact_bytes[path] = size_bytes
 
     def _publish_session_manifest(
         self,
@@ -375,7 +512,7 @@ class AppendOnlyBrokerCaptureWriterV1:
             partial_artifact_count=0,
             limitations=tuple(limitations),
         )
-        _atomic_write_text(
+        self._publish_text(
             self.session_directory / SESSION_MANIFEST_FILENAME,
             manifest.to_json() + "\n",
         )
@@ -384,18 +521,35 @@ class AppendOnlyBrokerCaptureWriterV1:
 
 @dataclass(frozen=True, slots=True)
 class BrokerCaptureReplaySourceV1:
-    """Verified event source over completed, advertised capture partitions."""
+    """Verified event source over completed, advertised capture partitions.
+
+    Each partition is read once: its bytes are hashed as they are decoded,
+    and a size or SHA-256 mismatch raises ``BrokerCaptureIntegrityError``
+    before the partition's iteration completes, taking precedence over any
+    decode error the corruption caused.  Events yielded from a partition are
+    therefore provisional until the next partition starts or iteration
+    ends; consumers must discard partial results on error, as the fitter and
+    replay summaries do.  With ``read_ahead`` greater than zero, that many
+    upcoming partitions are read and hashed on a thread pool while the
+    current one is decoded, and each is verified before it is decoded.
+    """
 
     root: Path
     manifest: BrokerCaptureSessionManifestV1
+    read_ahead: int
 
     def __init__(
         self,
         root: str | Path,
         manifest: BrokerCaptureSessionManifestV1,
+        *,
+        read_ahead: int = 0,
     ) -> None:
+        if isinstance(read_ahead, bool) or read_ahead < 0:
+            raise ValueError("read_ahead must be a non-negative integer")
         object.__setattr__(self, "root", Path(root))
         object.__setattr__(self, "manifest", manifest)
+        object.__setattr__(self, "read_ahead", int(read_ahead))
 
     @property
     def session_id(self) -> str:
@@ -406,98 +560,380 @@ class BrokerCaptureReplaySourceV1:
         """Verify hashes/counts/order and yield events partition by partition."""
         return self._event_iterator()
 
+    def iter_record_batches(self) -> Iterator[Any]:
+        """Verify hashes/counts/order and yield Arrow record batches.
+
+        Arrow partitions are yielded batch by batch straight from the
+        verified stream, with order and counts checked on the columns and no
+        per-event objects built.  JSONL partitions are parsed, verified, and
+        yielded as one batch each.  Requires ``histdatacom[arrow]``.
+        """
+        return self._record_batch_iterator()
+
     def _event_iterator(self) -> Iterator[BrokerCaptureEventV1]:
+        ledger = _ReplayLedger(self.manifest)
+        for partition, reader in self._partition_readers():
+            ledger.start_partition(partition)
+            with reader:
+                try:
+                    for event in reader.events(self.session_id):
+                        ledger.observe_event(event, self.session_id)
+                        yield event
+                except (BrokerCaptureIntegrityError, TypeError, ValueError):
+                    reader.verify()
+                    raise
+                reader.verify()
+            ledger.end_partition()
+        ledger.finish()
+
+    def _record_batch_iterator(self) -> Iterator[Any]:
+        ledger = _ReplayLedger(self.manifest)
+        for partition, reader in self._partition_readers():
+            ledger.start_partition(partition)
+            with reader:
+                try:
+                    for batch in reader.record_batches(self.session_id):
+                        ledger.observe_batch(batch)
+                        yield batch
+                except (BrokerCaptureIntegrityError, TypeError, ValueError):
+                    reader.verify()
+                    raise
+                reader.verify()
+            ledger.end_partition()
+        ledger.finish()
+
+    def _partition_readers(
+        self,
+    ) -> Iterator[tuple[BrokerCapturePartitionManifestV1, _PartitionReader]]:
         verify_broker_capture_partition_manifests(self.root, self.manifest)
-        expected_sequence = self.manifest.first_capture_sequence
-        total_count = 0
-        combined_counts: dict[str, int] = {}
-        for partition in self.manifest.partitions:
-            path = _contained_artifact_path(
-                self.root, partition.data_artifact.path
-            )
-            if not path.is_file():
-                raise BrokerCaptureIntegrityError(
-                    "advertised capture partition is missing"
+        partitions = [
+            (partition, self._partition_path(partition))
+            for partition in self.manifest.partitions
+        ]
+        if not self.read_ahead:
+            for partition, path in partitions:
+                yield partition, _PartitionReader(partition, path)
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=self.read_ahead,
+            thread_name_prefix="broker-capture-replay",
+        )
+        pending: deque[Future[_PartitionBytes]] = deque()
+        upcoming = iter(partitions)
+        try:
+            for partition, path in partitions:
+                while len(pending) <= self.read_ahead:
+                    item = next(upcoming, None)
+                    if item is None:
+                        break
+                    pending.append(executor.submit(_read_partition, item[1]))
+                loaded = pending.popleft().result()
+                yield partition, _PartitionReader(partition, path, loaded)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _partition_path(
+        self, partition: BrokerCapturePartitionManifestV1
+    ) -> Path:
+        path = _contained_artifact_path(self.root, partition.data_artifact.path)
+        if not path.is_file():
+            raise BrokerCaptureIntegrityError(
+                "advertised capture partition is missing"
+            )
+        if path.stat().st_size != partition.data_artifact.size_bytes:
+            raise BrokerCaptureIntegrityError(
+                "capture partition size does not match manifest"
+            )
+        return path
+
+
+@dataclass(frozen=True, slots=True)
+class _PartitionBytes:
+    data: bytes
+    sha256: str
+
+
+def _read_partition(path: Path) -> _PartitionBytes:
+    data = path.read_bytes()
+    return _PartitionBytes(data, hashlib.sha256(data).hexdigest())
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw reader that hashes and counts every byte it hands out."""
+
+    def __init__(self, handle: BinaryIO) -> None:
+        super().__init__()
+        self._handle = handle
+        self.digest = hashlib.sha256()
+        self.size_bytes = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        count = self._handle.readinto(buffer) or 0
+        if count:
+            self.digest.update(memoryview(buffer)[:count])
+            self.size_bytes += count
+        return count
+
+
+class _PartitionReader:
+    """One pass over a partition's bytes that hashes while it decodes."""
+
+    def __init__(
+        self,
+        partition: BrokerCapturePartitionManifestV1,
+        path: Path,
+        loaded: _PartitionBytes | None = None,
+    ) -> None:
+        self.partition = partition
+        self._loaded = loaded
+        self._handle: BinaryIO | None = None
+        self._hashing: _HashingReader | None = None
+        self._verified = False
+        if loaded is not None:
+            self._check(len(loaded.data), loaded.sha256)
+        else:
+            self._handle = path.open("rb")
+            self._hashing = _HashingReader(self._handle)
+
+    def __enter__(self) -> "_PartitionReader":
+        return self
+
+    def __exit__(
+        self, exc_type: object, exc: object, traceback: object
+    ) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+    def events(self, session_id: str) -> Iterator[BrokerCaptureEventV1]:
+        if self.partition.encoding is BrokerCapturePartitionEncoding.ARROW_IPC:
+            for batch in self.record_batches(session_id):
+                yield from capture_record_batch_events(
+                    batch, session_id=session_id
+                )
+            return
+        if self._loaded is not None:
+            raw: BinaryIO = io.BytesIO(self._loaded.data)
+        else:
+            assert self._hashing is not None
+            raw = io.BufferedReader(self._hashing, _READ_BLOCK_BYTES)
+        text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        try:
+            for line in text:
+                if not line.endswith("\n") or not line.strip():
+                    raise BrokerCaptureIntegrityError(
+                        "capture partition contains a partial JSON line"
+                    )
+                yield BrokerCaptureEventV1.from_json(line)
+        except UnicodeDecodeError as err:
+            raise BrokerCaptureIntegrityError(
+                "capture partition is not valid UTF-8"
+            ) from err
+        finally:
+            text.detach()
+
+    def record_batches(self, session_id: str) -> Iterator[Any]:
+        if self.partition.encoding is BrokerCapturePartitionEncoding.ARROW_IPC:
+            if self._loaded is not None:
+                data = self._loaded.data
+            else:
+                assert self._hashing is not None
+                data = io.BufferedReader(
+                    self._hashing, _READ_BLOCK_BYTES
+                ).read()
+                self.verify()
+            try:
+                yield from read_capture_arrow_stream(
+                    data, session_id=session_id
                 )
-            if path.stat().st_size != partition.data_artifact.size_bytes:
+            except (OSError, ValueError) as err:
+                raise BrokerCaptureIntegrityError(
+                    "capture partition is not a valid Arrow capture stream"
+                ) from err
+            return
+        events = list(self.events(session_id))
+        self.verify()
+        yield capture_events_to_record_batch(events, session_id=session_id)
+
+    def verify(self) -> None:
+        """Finish hashing unread bytes and compare against the manifest."""
+        if self._verified:
+            return
+        assert self._hashing is not None
+        block = bytearray(_READ_BLOCK_BYTES)
+        while self._hashing.readinto(block):
+            pass
+        self._check(self._hashing.size_bytes, self._hashing.digest.hexdigest())
+
+    def _check(self, size_bytes: int, sha256: str) -> None:
+        if size_bytes != self.partition.data_artifact.size_bytes:
+            raise BrokerCaptureIntegrityError(
+                "capture partition size does not match manifest"
+            )
+        if sha256 != self.partition.data_artifact.sha256:
+            raise BrokerCaptureIntegrityError(
+                "capture partition hash does not match manifest"
+            )
+        self._verified = True
+
+
+class _ReplayLedger:
+    """Sequence, order, and count reconciliation shared by replay paths."""
+
+    def __init__(self, manifest: BrokerCaptureSessionManifestV1) -> None:
+        self.manifest = manifest
+        self.expected_sequence = manifest.first_capture_sequence
+        self.total_count = 0
+        self.combined_counts: dict[str, int] = {}
+        self.partition: BrokerCapturePartitionManifestV1 | None = None
+        self.partition_count = 0
+        self.partition_counts: dict[str, int] = {}
+        self.first: tuple[int, int, int] | None = None
+        self.last: tuple[int, int, int] | None = None
+
+    def start_partition(
+        self, partition: BrokerCapturePartitionManifestV1
+    ) -> None:
+        self.partition = partition
+        self.partition_count = 0
+        self.partition_counts = {}
+        self.first = None
+        self.last = None
+
+    def observe_event(
+        self, event: BrokerCaptureEventV1, session_id: str
+    ) -> None:
+        if event.session_id != session_id:
+            raise BrokerCaptureIntegrityError(
+                "capture partition contains another session"
+            )
+        self._observe_run(
+            (
+                event.capture_sequence,
+                event.receive_time_utc_ns,
+                event.receive_time_monotonic_ns,
+            ),
+            (
+                event.capture_sequence,
+                event.receive_time_utc_ns,
+                event.receive_time_monotonic_ns,
+            ),
+            count=1,
+            counts={event.kind.value: 1},
+        )
+
+    def observe_batch(self, batch: Any) -> None:
+        import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel
+
+        sequences = batch.column("capture_sequence")
+        utc = batch.column("receive_time_utc_ns")
+        monotonic = batch.column("receive_time_monotonic_ns")
+        kinds = batch.column("kind")
+        if any(
+            column.null_count for column in (sequences, utc, monotonic, kinds)
+        ):
+            raise BrokerCaptureIntegrityError(
+                "capture partition contains null ordering columns"
+            )
+        count = batch.num_rows
+        if count > 1:
+            if pc.min(pc.pairwise_diff(sequences)).as_py() < 1:
                 raise BrokerCaptureIntegrityError(
-                    "capture partition size does not match manifest"
+                    "capture replay sequence is not contiguous"
                 )
-            if _file_sha256(path) != partition.data_artifact.sha256:
+            if pc.min(pc.pairwise_diff(monotonic)).as_py() < 0:
                 raise BrokerCaptureIntegrityError(
-                    "capture partition hash does not match manifest"
+                    "capture replay monotonic time moved backwards"
                 )
-            partition_count = 0
-            partition_counts: dict[str, int] = {}
-            first_event: BrokerCaptureEventV1 | None = None
-            last_event: BrokerCaptureEventV1 | None = None
+        if sequences[count - 1].as_py() - sequences[0].as_py() != count - 1:
+            raise BrokerCaptureIntegrityError(
+                "capture replay sequence is not contiguous"
+            )
+        counts: dict[str, int] = {}
+        for item in pc.value_counts(kinds).to_pylist():
             try:
-                with path.open("rt", encoding="utf-8", newline="") as handle:
-                    for line in handle:
-                        if not line.endswith("\n") or not line.strip():
-                            raise BrokerCaptureIntegrityError(
-                                "capture partition contains a partial JSON line"
-                            )
-                        event = BrokerCaptureEventV1.from_json(line)
-                        if event.session_id != self.session_id:
-                            raise BrokerCaptureIntegrityError(
-                                "capture partition contains another session"
-                            )
-                        if expected_sequence is None:
-                            expected_sequence = event.capture_sequence
-                        if event.capture_sequence != expected_sequence:
-                            raise BrokerCaptureIntegrityError(
-                                "capture replay sequence is not contiguous"
-                            )
-                        if (
-                            last_event is not None
-                            and event.receive_time_monotonic_ns
-                            < last_event.receive_time_monotonic_ns
-                        ):
-                            raise BrokerCaptureIntegrityError(
-                                "capture replay monotonic time moved backwards"
-                            )
-                        if first_event is None:
-                            first_event = event
-                        last_event = event
-                        partition_count += 1
-                        total_count += 1
-                        partition_counts[event.kind.value] = (
-                            partition_counts.get(event.kind.value, 0) + 1
-                        )
-                        combined_counts[event.kind.value] = (
-                            combined_counts.get(event.kind.value, 0) + 1
-                        )
-                        expected_sequence += 1
-                        yield event
-            except UnicodeDecodeError as err:
+                kind = BrokerCaptureEventKind.from_value(item["values"])
+            except ValueError as err:
                 raise BrokerCaptureIntegrityError(
-                    "capture partition is not valid UTF-8"
+                    "capture partition contains an unknown event kind"
                 ) from err
-            if (
-                partition_count != partition.event_count
-                or partition_counts != partition.event_kind_counts
-                or first_event is None
-                or last_event is None
-                or first_event.capture_sequence
-                != partition.first_capture_sequence
-                or last_event.capture_sequence
-                != partition.last_capture_sequence
-                or first_event.receive_time_utc_ns
-                != partition.first_receive_time_utc_ns
-                or last_event.receive_time_utc_ns
-                != partition.last_receive_time_utc_ns
-                or first_event.receive_time_monotonic_ns
-                != partition.first_receive_time_monotonic_ns
-                or last_event.receive_time_monotonic_ns
-                != partition.last_receive_time_monotonic_ns
-            ):
-                raise BrokerCaptureIntegrityError(
-                    "capture partition contents do not reconcile with manifest"
-                )
+            counts[kind.value] = int(item["counts"])
+        self._observe_run(
+            (
+                sequences[0].as_py(),
+                utc[0].as_py(),
+                monotonic[0].as_py(),
+            ),
+            (
+                sequences[count - 1].as_py(),
+                utc[count - 1].as_py(),
+                monotonic[count - 1].as_py(),
+            ),
+            count=count,
+            counts=counts,
+        )
+
+    def _observe_run(
+        self,
+        first: tuple[int, int, int],
+        last: tuple[int, int, int],
+        *,
+        count: int,
+        counts: dict[str, int],
+    ) -> None:
+        if self.expected_sequence is None:
+            self.expected_sequence = first[0]
+        if first[0] != self.expected_sequence:
+            raise BrokerCaptureIntegrityError(
+                "capture replay sequence is not contiguous"
+            )
+        if self.last is not None and first[2] < self.last[2]:
+            raise BrokerCaptureIntegrityError(
+                "capture replay monotonic time moved backwards"
+            )
+        if self.first is None:
+            self.first = first
+        self.last = last
+        self.partition_count += count
+        self.total_count += count
+        for kind, kind_count in counts.items():
+            self.partition_counts[kind] = (
+                self.partition_counts.get(kind, 0) + kind_count
+            )
+            self.combined_counts[kind] = (
+                self.combined_counts.get(kind, 0) + kind_count
+            )
+        self.expected_sequence += count
+
+    def end_partition(self) -> None:
+        partition = self.partition
+        assert partition is not None
+        if (
+            self.partition_count != partition.event_count
+            or self.partition_counts != partition.event_kind_counts
+            or self.first
+            != (
+                partition.first_capture_sequence,
+                partition.first_receive_time_utc_ns,
+                partition.first_receive_time_monotonic_ns,
+            )
+            or self.last
+            != (
+                partition.last_capture_sequence,
+                partition.last_receive_time_utc_ns,
+                partition.last_receive_time_monotonic_ns,
+            )
+        ):
+            raise BrokerCaptureIntegrityError(
+                "capture partition contents do not reconcile with manifest"
+            )
+
+    def finish(self) -> None:
         if (
-            total_count != self.manifest.event_count
-            or combined_counts != self.manifest.event_kind_counts
+            self.total_count != self.manifest.event_count
+            or self.combined_counts != self.manifest.event_kind_counts
         ):
             raise BrokerCaptureIntegrityError(
                 "capture replay does not reconcile with session manifest"
@@ -584,7 +1020,12 @@ def inspect_broker_capture_session(
     )
     orphan_data = tuple(
         path.name
-        for path in sorted(session_directory.glob("partition-*.jsonl"))
+        for path in sorted(
+            [
+                *session_directory.glob("partition-*.jsonl"),
+                *session_directory.glob("partition-*.arrow"),
+            ]
+        )
         if path.name not in advertised_data
     )
     orphan_manifests = tuple(
@@ -608,11 +1049,16 @@ def replay_broker_capture_session(
     manifest: BrokerCaptureSessionManifestV1,
     *,
     consumers: Sequence[BrokerCaptureEventConsumerV1] = (),
+    read_ahead: int = 0,
 ) -> BrokerCaptureReplaySummaryV1:
-    """Replay verified evidence through the live-compatible consumer seam."""
+    """Replay verified evidence through the live-compatible consumer seam.
+
+    ``read_ahead`` partitions are read and hashed concurrently with decoding;
+    see ``BrokerCaptureReplaySourceV1``.
+    """
     digest_consumer = _LogicalDigestConsumer()
     source: BrokerCaptureEventSourceV1 = BrokerCaptureReplaySourceV1(
-        root, manifest
+        root, manifest, read_ahead=read_ahead
     )
     result = consume_broker_capture_source(
         source,
@@ -670,17 +1116,11 @@ def _contained_artifact_path(root: Path, relative_path: str) -> Path:
 def _file_sha256(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as handle:
-        while block := handle.read(1024 * 1024):
+        while block := handle.read(_READ_BLOCK_BYTES):
             digest.update(block)
     return digest.hexdigest()
 
 
-def _directory_size(path: Path) -> int:
-    return sum(
-        item.stat().st_size for item in path.rglob("*") if item.is_file()
-    )
-
-
 def _fsync_directory(path: Path) -> None:
     flags = getattr(os, "O_DIRECTORY", 0) | os.O_RDONLY
     try:
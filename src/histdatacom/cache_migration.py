@@ -0,0 +1,139 @@
+"""Migration of local ``.data`` caches to the current versioned format."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from histdatacom.histdata_ascii import (
+    CACHE_FILENAME,
+    CACHE_FORMAT_VERSION,
+    LEGACY_CACHE_ERROR,
+    cache_index_path,
+    read_cache_index,
+    read_polars_cache,
+    replace_polars_cache,
+    write_polars_cache,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheMigrationResult:
+    """Summary of a cache-format migration scan."""
+
+    root: str
+    dry_run: bool
+    format_version: int
+    cache_count: int
+    current_count: int
+    pending_count: int
+    migrated_count: int
+    legacy_count: int
+    size_before_bytes: int
+    size_after_bytes: int
+    legacy_paths: tuple[str, ...] = ()
+    errors: tuple[dict[str, str], ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable payload."""
+        return {
+            "root": self.root,
+            "dry_run": self.dry_run,
+            "format_version": self.format_version,
+            "cache_count": self.cache_count,
+            "current_count": self.current_count,
+            "pending_count": self.pending_count,
+            "migrated_count": self.migrated_count,
+            "legacy_count": self.legacy_count,
+            "size_before_bytes": self.size_before_bytes,
+            "size_after_bytes": self.size_after_bytes,
+            "legacy_paths": list(self.legacy_paths),
+            "errors": list(self.errors),
+        }
+
+
+def migrate_polars_caches(
+    root: str | Path,
+    *,
+    apply: bool = False,  # pylint: disable=redefined-builtin
+) -> CacheMigrationResult:
+    """Inspect or rewrite unversioned ``.data`` caches below ``root``.
+
+    Readable Arrow IPC caches without a current footer index are rewritten in
+    place through a temp file.  Caches that cannot be read at all are legacy
+    caches: they are reported with ``LEGACY_CACHE_ERROR`` guidance and left
+    for a rebuild.
+    """
+    root_path = Path(root).expanduser()
+    paths = (
+        sorted(root_path.rglob(CACHE_FILENAME), key=lambda item: str(item))
+        if root_path.exists()
+        else []
+    )
+    errors: list[dict[str, str]] = []
+    legacy_paths: list[str] = []
+    current_count = 0
+    pending_count = 0
+    migrated_count = 0
+    size_before_bytes = 0
+    size_after_bytes = 0
+
+    for path in paths:
+        if not path.is_file():
+            continue
+        size_bytes = path.stat().st_size
+        size_before_bytes += size_bytes
+        if read_cache_index(path) is not None:
+            current_count += 1
+            size_after_bytes += size_bytes
+            continue
+        try:
+            frame = read_polars_cache(path)
+        except ValueError as exc:
+            size_after_bytes += size_bytes
+            if str(exc) == LEGACY_CACHE_ERROR:
+                legacy_paths.append(str(path))
+            else:
+                errors.append(
+                    {
+                        "path": str(path),
+                        "operation": "read",
+                        "message": str(exc),
+                    }
+                )
+            continue
+        pending_count += 1
+        if not apply:
+            size_after_bytes += size_bytes
+            continue
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.migrate.tmp")
+        try:
+            write_polars_cache(frame, temp_path)
+            replace_polars_cache(temp_path, path)
+        except OSError as exc:
+            temp_path.unlink(missing_ok=True)
+            cache_index_path(temp_path).unlink(missing_ok=True)
+            size_after_bytes += size_bytes
+            errors.append(
+                {"path": str(path), "operation": "write", "message": str(exc)}
+            )
+            continue
+        migrated_count += 1
+        size_after_bytes += path.stat().st_size
+
+    return CacheMigrationResult(
+        root=str(root_path.resolve(strict=False)),
+        dry_run=not apply,
+        format_version=CACHE_FORMAT_VERSION,
+        cache_count=len(paths),
+        current_count=current_count,
+        pending_count=pending_count,
+        migrated_count=migrated_count,
+        legacy_count=len(legacy_paths),
+        size_before_bytes=size_before_bytes,
+        size_after_bytes=size_after_bytes,
+        legacy_paths=tuple(legacy_paths),
+        errors=tuple(errors),
+    )
@@ -7,6 +7,10 @@ import json
 import sys
 from typing import Any, Sequence
 
+from histdatacom.cache_migration import (
+    CacheMigrationResult,
+    migrate_polars_caches,
+)
 from histdatacom.cache_status import (
     CacheRunStatusResult,
     collect_cache_run_status,
@@ -37,7 +41,7 @@ def build_parser() -> argparse.ArgumentParser:
         "cleanup_command",
         nargs="?",
         default="sources",
-        choices=("sources", "transient-sources", "status"),
+        choices=("sources", "transient-sources", "status", "migrate-caches"),
         help="cleanup operation to run",
     )
     parser.add_argument(
@@ -49,7 +53,10 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--apply",
         action="store_true",
-        help="delete matched source artifacts; omit for a dry run",
+        help=(
+            "delete matched source artifacts or rewrite migratable caches; "
+            "omit for a dry run"
+        ),
     )
     parser.add_argument(
         "-p",
@@ -128,6 +135,14 @@ def main(argv: Sequence[str] | None = None) -> int:
         _write_status(status_result, as_json=args.json)
         return 1 if status_result.errors else 0
 
+    if args.cleanup_command == "migrate-caches":
+        migration_result = migrate_polars_caches(
+            args.data_directory,
+            apply=args.apply,
+        )
+        _write_migration(migration_result, as_json=args.json)
+        return 1 if migration_result.errors else 0
+
     if args.cleanup_command not in {"sources", "transient-sources"}:
         parser.error(f"unsupported cleanup command: {args.cleanup_command}")
 
@@ -225,6 +240,41 @@ def _write_result(result: SourceCleanupResult, *, as_json: bool) -> None:
         print(f"errors: {len(result.errors)}", file=sys.stderr)  # noqa:T201
 
 
+def _write_migration(result: CacheMigrationResult, *, as_json: bool) -> None:
+    if as_json:
+        print(
+            json.dumps(result.to_dict(), indent=2, sort_keys=True)
+        )  # noqa:T201
+        return
+
+    payload = result.to_dict()
+    if result.dry_run:
+        print(  # noqa:T201
+            f"Would migrate {result.pending_count} of {result.cache_count} "
+            f".data cache(s) under {payload['root']} to format "
+            f"v{result.format_version}."
+        )
+    else:
+        print(  # noqa:T201
+            f"Migrated {result.migrated_count} of {result.cache_count} "
+            f".data cache(s) under {payload['root']} to format "
+            f"v{result.format_version} "
+            f"({_format_bytes(result.size_before_bytes)} -> "
+            f"{_format_bytes(result.size_after_bytes)})."
+        )
+    if result.legacy_count:
+        print(  # noqa:T201
+            f"{result.legacy_count} legacy cache(s) cannot be migrated and "
+            "must be rebuilt:"
+        )
+        for path in result.legacy_paths:
+            print(f"legacy: {path}")  # noqa:T201
+    if result.dry_run and result.pending_count:
+        print("Re-run with --apply to rewrite these caches.")  # noqa:T201
+    if result.errors:
+        print(f"errors: {len(result.errors)}", file=sys.stderr)  # noqa:T201
+
+
 def _write_status(result: CacheRunStatusResult, *, as_json: bool) -> None:
     payload = result.to_dict()
     if as_json:
@@ -162,6 +162,7 @@ class ArgParser(argparse.ArgumentParser):  # noqa:H601
             epilog=(
                 "Commands:\n"
                 "  analytics   Run offline data analytics operations\n"
+                "  bench       Run offline data-plane micro-benchmarks\n"
                 "  cleanup     Remove transient source artifacts\n"
                 "  datasets    Resolve and verify versioned local datasets\n"
                 "  groups      List instrument groups and major triangles\n"
@@ -170,6 +171,7 @@ class ArgParser(argparse.ArgumentParser):  # noqa:H601
                 "  reconstruction  Plan, run, and inspect reconstruction\n"
                 "  runtime     Inspect and manage the orchestration runtime\n\n"
                 "Run `histdatacom analytics --help` for analytics commands.\n"
+                "Run `histdatacom bench --help` for benchmark options.\n"
                 "Run `histdatacom cleanup --help` for cleanup commands.\n"
                 "Run `histdatacom datasets --help` for dataset commands.\n"
                 "Run `histdatacom groups --help` for group discovery commands.\n"
@@ -288,6 +290,16 @@ class ArgParser(argparse.ArgumentParser):  # noqa:H601
                     "--quality-max-warnings requires --quality or --repo-quality"
                 )
                 raise SystemExit(1)
+            if self.arg_namespace.quality_jobs != 1:
+                print(  # noqa:T201
+                    "--quality-jobs requires --quality or --repo-quality"
+                )
+                raise SystemExit(1)
+            if self.arg_namespace.quality_incremental:
+                print(  # noqa:T201
+                    "--quality-incremental requires --quality or --repo-quality"
+                )
+                raise SystemExit(1)
             if self.arg_namespace.quality_profile_path:
                 print(  # noqa:T201
                     "--quality-profile requires --quality, --repo-quality, "
@@ -816,6 +828,12 @@ class ArgParser(argparse.ArgumentParser):  # noqa:H601
                     str(self.arg_namespace.quality_max_warnings),
                 ]
             )
+            if self.arg_namespace.quality_jobs != 1:
+                args.extend(
+                    ["--quality-jobs", str(self.arg_namespace.quality_jobs)]
+                )
+            if self.arg_namespace.quality_incremental:
+                args.append("--quality-incremental")
             return args
 
         self.arg_namespace.timeframes = Timeframe.convert_to_values(
@@ -2064,6 +2082,25 @@ class ArgParser(argparse.ArgumentParser):  # noqa:H601
                 "defaults to 0"
             ),
         )
+        quality_args.add_argument(
+            "--quality-jobs",
+            dest="quality_jobs",
+            type=_non_negative_int,
+            metavar="N",
+            help=(
+                "evaluate quality targets in N worker processes; 0 sizes the "
+                "pool from -c/--cpu_utilization. Defaults to 1 (serial)"
+            ),
+        )
+        quality_args.add_argument(
+            "--quality-incremental",
+            dest="quality_incremental",
+            action="store_true",
+            help=(
+                "reuse per-target rule results stored in the manifest status "
+                "store and re-scan only new or changed targets"
+            ),
+        )
 
     def _sanitize_input(self) -> None:  # noqa:DAR401
         """Clean user-input before run.
@@ -202,6 +202,8 @@ _SCALAR_ARGS = {
     "quality_fail_on": "--quality-fail-on",
     "quality_max_errors": "--quality-max-errors",
     "quality_max_warnings": "--quality-max-warnings",
+    "quality_jobs": "--quality-jobs",
+    "quality_incremental": "--quality-incremental",
     "quality_preflight_evidence_max_age_seconds": (
         "--quality-preflight-evidence-max-age-seconds"
     ),
@@ -336,7 +338,12 @@ _GROUPS_TRUE_FLAG_ARGS = {
     "triangles": "--triangles",
 }
 _GROUPS_ALLOWED_KEYS = {"command", "group"} | set(_GROUPS_TRUE_FLAG_ARGS)
-_CLEANUP_COMMANDS = {"sources", "status", "transient-sources"}
+_CLEANUP_COMMANDS = {
+    "migrate-caches",
+    "sources",
+    "status",
+    "transient-sources",
+}
 _CLEANUP_ALIASES = {
     **_COMMAND_KEY_ALIASES,
     "cleanup_command": "command",
@@ -579,6 +586,7 @@ _JOBS_COMMANDS = {
     "resume",
     "retry",
     "submit",
+    "timings",
 }
 _JOBS_ALIASES = {
     **_COMMAND_KEY_ALIASES,
@@ -625,6 +633,7 @@ _JOBS_IDENTITY_COMMANDS = {
     "result",
     "resume",
     "retry",
+    "timings",
 }
 _JOBS_REASON_COMMANDS = {"cancel", "resume", "retry"}
 _JOBS_RECOMPUTE_COMMANDS = {"resume", "retry"}
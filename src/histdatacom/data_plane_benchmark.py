@@ -0,0 +1,557 @@
+"""Reproducible offline micro-benchmarks for the tick data plane.
+
+The suite writes synthetic HistData tick CSV and ZIP fixtures, builds month
+caches from them, and times the parse, datetime, cache, merge, line-protocol,
+and quality-scan paths without network access or a Temporal server.  Reports
+follow the pytest-benchmark JSON layout so existing tooling can chart them,
+and a saved report can be used as the baseline for regression checks.
+"""
+
+from __future__ import annotations
+
+import datetime
+import math
+import os
+import platform
+import statistics
+import tempfile
+import time
+import zipfile
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from histdatacom.resource_usage import peak_rss_bytes
+from histdatacom.runtime_contracts import JSONValue, WorkItem
+
+DEFAULT_BENCHMARK_ROWS = 200_000
+DEFAULT_BENCHMARK_MONTHS = 2
+DEFAULT_BENCHMARK_ROUNDS = 3
+DEFAULT_REGRESSION_TOLERANCE = 0.25
+BENCHMARK_PAIR = "EURUSD"
+BENCHMARK_YEAR = 2012
+BENCHMARK_GROUP = "data-plane"
+_MONTH_SPAN_MS = 27 * 86_400_000
+_MEGABYTE = 1_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkFixtures:
+    """Synthetic tick inputs and the month caches built from them."""
+
+    root: Path
+    rows_per_month: int
+    csv_paths: tuple[Path, ...]
+    zip_paths: tuple[Path, ...]
+    cache_root: Path
+    cache_paths: tuple[Path, ...]
+    work_items: tuple[WorkItem, ...]
+
+    @property
+    def total_rows(self) -> int:
+        """Return tick rows across every fixture month."""
+        return self.rows_per_month * len(self.csv_paths)
+
+
+@dataclass(frozen=True, slots=True)
+class _BenchmarkCase:
+    name: str
+    run: Callable[[], object]
+    rows: int
+    bytes_processed: int
+    setup: Callable[[], None] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkComparison:
+    """One case's median time against the stored baseline."""
+
+    name: str
+    baseline_median: float
+    current_median: float
+    tolerance: float
+    regressed: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "regressed",
+            self.current_median > self.baseline_median * (1 + self.tolerance),
+        )
+
+    @property
+    def ratio(self) -> float:
+        """Return current over baseline median time."""
+        if self.baseline_median <= 0:
+            return math.inf if self.current_median > 0 else 1.0
+        return self.current_median / self.baseline_median
+
+    def to_dict(self) -> dict[str, JSONValue]:
+        """Return JSON-compatible comparison metadata."""
+        return {
+            "name": self.name,
+            "baseline_median": self.baseline_median,
+            "current_median": self.current_median,
+            "ratio": round(self.ratio, 4),
+            "tolerance": self.tolerance,
+            "regressed": self.regressed,
+        }
+
+
+def benchmark_case_names() -> tuple[str, ...]:
+    """Return the benchmark cases in the order the suite runs them."""
+    return (
+        "read_ascii_csv",
+        "read_ascii_zip",
+        "datetime_to_utc_ms",
+        "write_polars_cache",
+        "read_polars_cache",
+        "merge_cache_items",
+        "format_influx_line",
+        "influx_line_encoder",
+        "tick_quality_scan",
+        "time_quality_scan",
+    )
+
+
+def write_benchmark_fixtures(
+    root: Path,
+    *,
+    rows: int = DEFAULT_BENCHMARK_ROWS,
+    months: int = DEFAULT_BENCHMARK_MONTHS,
+) -> BenchmarkFixtures:
+    """Write deterministic tick CSV, ZIP, and cache fixtures under ``root``.
+
+    Each month holds ``rows`` evenly spaced EURUSD ticks in HistData's
+    ``YYYYMMDD HHMMSSfff`` EST-no-DST layout.  Caches use the repository
+    ``ascii/T/<PAIR>/<YEAR>/<MM>`` layout so quality discovery finds them.
+    """
+    from histdatacom.histdata_ascii import (
+        CACHE_FILENAME,
+        convert_polars_datetime_to_utc_ms,
+        read_ascii_file_to_polars,
+        write_polars_cache,
+    )
+    from histdatacom.records import Record
+
+    rows = max(1, int(rows))
+    months = max(1, min(12, int(months)))
+    csv_dir = root / "csv"
+    zip_dir = root / "zip"
+    cache_root = root / "cache"
+    csv_dir.mkdir(parents=True, exist_ok=True)
+    zip_dir.mkdir(parents=True, exist_ok=True)
+
+    csv_paths: list[Path] = []
+    zip_paths: list[Path] = []
+    cache_paths: list[Path] = []
+    work_items: list[WorkItem] = []
+    for month in range(1, months + 1):
+        period = f"{BENCHMARK_YEAR}{month:02d}"
+        csv_name = f"DAT_ASCII_{BENCHMARK_PAIR}_T_{period}.csv"
+        csv_path = csv_dir / csv_name
+        synthetic_tick_frame(rows, month=month).write_csv(
+            csv_path,
+            include_header=False,
+        )
+        zip_path = (
+            zip_dir / f"HISTDATA_COM_ASCII_{BENCHMARK_PAIR}_T{period}.zip"
+        )
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.write(csv_path, arcname=csv_name)
+
+        data_dir = (
+            cache_root
+            / "ascii"
+            / "T"
+            / BENCHMARK_PAIR
+            / (str(BENCHMARK_YEAR))
+            / f"{month:02d}"
+        )
+        data_dir.mkdir(parents=True, exist_ok=True)
+        frame = convert_polars_datetime_to_utc_ms(
+            read_ascii_file_to_polars(csv_path, "T"),
+            "T",
+        )
+        cache_path = data_dir / CACHE_FILENAME
+        write_polars_cache(frame, cache_path)
+
+        csv_paths.append(csv_path)
+        zip_paths.append(zip_path)
+        cache_paths.append(cache_path)
+        work_items.append(
+            WorkItem.from_record(
+                Record(
+                    data_dir=f"{data_dir}{os.sep}",
+                    cache_filename=CACHE_FILENAME,
+                    cache_start=str(frame["datetime"][0]),
+                    cache_end=str(frame["datetime"][-1]),
+                    data_format="ascii",
+                    data_timeframe="T",
+                    data_fxpair=BENCHMARK_PAIR.lower(),
+                    data_year=str(BENCHMARK_YEAR),
+                    data_month=str(month),
+                )
+            )
+        )
+    return BenchmarkFixtures(
+        root=root,
+        rows_per_month=rows,
+        csv_paths=tuple(csv_paths),
+        zip_paths=tuple(zip_paths),
+        cache_root=cache_root,
+        cache_paths=tuple(cache_paths),
+        work_items=tuple(work_items),
+    )
+
+
+def synthetic_tick_frame(rows: int, *, month: int = 1) -> Any:
+    """Return one month of raw HistData tick text columns.
+
+    Quotes walk deterministically so spreads and price changes vary without
+    a random seed.
+    """
+    import polars as pl
+
+    start = datetime.datetime(
+        BENCHMARK_YEAR, month, 2, tzinfo=datetime.timezone.utc
+    )
+    start_ms = int(start.timestamp() * 1000)
+    step = max(1, _MONTH_SPAN_MS // max(rows, 1))
+    index = pl.int_range(0, rows, eager=True)
+    bid = 1.3 + (index % 997).cast(pl.Float64) * 0.00001
+    return pl.DataFrame(
+        {
+            "datetime": pl.from_epoch(index * step + start_ms, time_unit="ms"),
+            "bid": bid,
+            "ask": bid + 0.00008 + (index % 7).cast(pl.Float64) * 0.00001,
+            "vol": pl.repeat(0, rows, dtype=pl.Int32, eager=True),
+        }
+    ).with_columns(
+        pl.col("datetime").dt.strftime("%Y%m%d %H%M%S%3f"),
+        pl.col("bid").round(5),
+        pl.col("ask").round(5),
+    )
+
+
+def run_data_plane_benchmarks(
+    fixtures: BenchmarkFixtures,
+    *,
+    rounds: int = DEFAULT_BENCHMARK_ROUNDS,
+    cases: Iterable[str] | None = None,
+) -> dict[str, JSONValue]:
+    """Time the selected cases and return a pytest-benchmark style report.
+
+    Each case runs ``rounds`` times after its optional setup.  Throughput is
+    derived from the median round.  ``peak_rss_bytes`` is the process
+    high-water mark once the case finishes, so cases run in a fixed order
+    and a fresh process gives comparable numbers.
+    """
+    selected = _selected_cases(cases)
+    benchmarks: list[JSONValue] = []
+    for case in _benchmark_cases(fixtures):
+        if case.name not in selected:
+            continue
+        benchmarks.append(_measure_case(case, rounds=max(1, int(rounds))))
+    return {
+        "machine_info": _machine_info(),
+        "commit_info": {},
+        "benchmarks": benchmarks,
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "version": _histdatacom_version(),
+        "fixture": {
+            "pair": BENCHMARK_PAIR,
+            "months": len(fixtures.csv_paths),
+            "rows_per_month": fixtures.rows_per_month,
+        },
+    }
+
+
+def run_data_plane_benchmark_suite(
+    *,
+    rows: int = DEFAULT_BENCHMARK_ROWS,
+    months: int = DEFAULT_BENCHMARK_MONTHS,
+    rounds: int = DEFAULT_BENCHMARK_ROUNDS,
+    cases: Iterable[str] | None = None,
+    workdir: Path | None = None,
+) -> dict[str, JSONValue]:
+    """Write fixtures into a temporary directory and run the benchmarks."""
+    with tempfile.TemporaryDirectory(
+        prefix="histdatacom-bench-",
+        dir=workdir,
+    ) as workspace:
+        fixtures = write_benchmark_fixtures(
+            Path(workspace),
+            rows=rows,
+            months=months,
+        )
+        return run_data_plane_benchmarks(
+            fixtures,
+            rounds=rounds,
+            cases=cases,
+        )
+
+
+def compare_benchmark_reports(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    tolerance: float = DEFAULT_REGRESSION_TOLERANCE,
+) -> tuple[BenchmarkComparison, ...]:
+    """Compare median times for cases present in both reports.
+
+    A case regresses when its median exceeds the baseline median by more
+    than ``tolerance`` (a fraction, so ``0.25`` allows 25% slower).
+    """
+    baseline_medians = _median_by_name(baseline)
+    return tuple(
+        BenchmarkComparison(
+            name=name,
+            baseline_median=baseline_medians[name],
+            current_median=median,
+            tolerance=tolerance,
+        )
+        for name, median in _median_by_name(current).items()
+        if name in baseline_medians
+    )
+
+
+def format_benchmark_report(
+    report: Mapping[str, Any],
+    comparisons: Sequence[BenchmarkComparison] = (),
+) -> str:
+    """Return a compact text table for a benchmark report."""
+    by_name = {comparison.name: comparison for comparison in comparisons}
+    fixture = report.get("fixture") or {}
+    lines = [
+        "Data-plane benchmarks "
+        f"({fixture.get('months', 0)} month(s) x "
+        f"{fixture.get('rows_per_month', 0)} rows)"
+    ]
+    for benchmark in report.get("benchmarks", ()):
+        stats = benchmark["stats"]
+        extra = benchmark["extra_info"]
+        line = (
+            f"  {benchmark['name']}: median={stats['median'] * 1000:.1f}ms "
+            f"rows/s={extra['rows_per_second']:,.0f} "
+            f"MB/s={extra['mb_per_second']:.1f} "
+            f"peak_rss={extra['peak_rss_bytes'] / _MEGABYTE:.0f}MB"
+        )
+        comparison = by_name.get(benchmark["name"])
+        if comparison is not None:
+            verdict = "REGRESSED" if comparison.regressed else "ok"
+            line += f" vs baseline x{comparison.ratio:.2f} {verdict}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _selected_cases(cases: Iterable[str] | None) -> frozenset[str]:
+    names = benchmark_case_names()
+    if cases is None:
+        return frozenset(names)
+    selected = frozenset(cases)
+    unknown = sorted(selected - set(names))
+    if unknown:
+        raise ValueError(f"unknown benchmark case(s): {', '.join(unknown)}")
+    return selected
+
+
+def _benchmark_cases(fixtures: BenchmarkFixtures) -> list[_BenchmarkCase]:
+    import polars as pl
+
+    from histdatacom.activity_stages import merge_cache_items
+    from histdatacom.data_quality.discovery import discover_quality_targets
+    from histdatacom.data_quality.engine import run_quality_assessment
+    from histdatacom.data_quality.rules import quality_rules_for_groups
+    from histdatacom.data_quality.time import clear_timestamp_scan_caches
+    from histdatacom.histdata_ascii import (
+        format_influx_line,
+        influx_line_encoder,
+        polars_datetime_to_utc_ms_expr,
+        read_ascii_file_to_polars,
+        read_polars_cache,
+        write_polars_cache,
+    )
+
+    csv_path = fixtures.csv_paths[0]
+    zip_path = fixtures.zip_paths[0]
+    cache_path = fixtures.cache_paths[0]
+    rows = fixtures.rows_per_month
+    raw_frame = read_ascii_file_to_polars(csv_path, "T")
+    cache_frame = read_polars_cache(cache_path)
+    cache_bytes = sum(path.stat().st_size for path in fixtures.cache_paths)
+    write_target = fixtures.root / "write" / ".data"
+    write_target.parent.mkdir(parents=True, exist_ok=True)
+    quality_targets = discover_quality_targets([fixtures.cache_root]).targets
+
+    def write_cache() -> None:
+        write_polars_cache(cache_frame, write_target)
+
+    def format_lines() -> None:
+        for row in cache_frame.iter_rows():
+            format_influx_line(BENCHMARK_PAIR, "ascii", "T", row)
+
+    def encode_lines() -> None:
+        influx_line_encoder(BENCHMARK_PAIR, "ascii", "T", cache_frame).encode(
+            cache_frame
+        )
+
+    def quality_scan(groups: tuple[str, ...]) -> Callable[[], object]:
+        rules = quality_rules_for_groups(groups)
+        return lambda: run_quality_assessment(quality_targets, rules)
+
+    write_cache()
+    return [
+        _BenchmarkCase(
+            "read_ascii_csv",
+            lambda: read_ascii_file_to_polars(csv_path, "T"),
+            rows,
+            csv_path.stat().st_size,
+        ),
+        _BenchmarkCase(
+            "read_ascii_zip",
+            lambda: read_ascii_file_to_polars(zip_path, "T"),
+            rows,
+            zip_path.stat().st_size,
+        ),
+        _BenchmarkCase(
+            "datetime_to_utc_ms",
+            lambda: raw_frame.select(polars_datetime_to_utc_ms_expr("T")),
+            rows,
+            int(raw_frame.select(pl.col("datetime")).estimated_size()),
+        ),
+        _BenchmarkCase(
+            "write_polars_cache",
+            write_cache,
+            rows,
+            write_target.stat().st_size,
+        ),
+        _BenchmarkCase(
+            "read_polars_cache",
+            lambda: read_polars_cache(cache_path, memory_map=False),
+            rows,
+            cache_path.stat().st_size,
+        ),
+        _BenchmarkCase(
+            "merge_cache_items",
+            lambda: merge_cache_items(
+                fixtures.work_items,
+                return_type="polars",
+            ),
+            fixtures.total_rows,
+            cache_bytes,
+        ),
+        _BenchmarkCase(
+            "format_influx_line",
+            format_lines,
+            rows,
+            cache_path.stat().st_size,
+        ),
+        _BenchmarkCase(
+            "influx_line_encoder",
+            encode_lines,
+            rows,
+            cache_path.stat().st_size,
+        ),
+        _BenchmarkCase(
+            "tick_quality_scan",
+            quality_scan(("ticks",)),
+            fixtures.total_rows,
+            cache_bytes,
+        ),
+        _BenchmarkCase(
+            "time_quality_scan",
+            quality_scan(("time",)),
+            fixtures.total_rows,
+            cache_bytes,
+            setup=clear_timestamp_scan_caches,
+        ),
+    ]
+
+
+def _measure_case(
+    case: _BenchmarkCase,
+    *,
+    rounds: int,
+) -> dict[str, JSONValue]:
+    samples: list[float] = []
+    for _ in range(rounds):
+        if case.setup is not None:
+            case.setup()
+        started = time.perf_counter()
+        case.run()
+        samples.append(time.perf_counter() - started)
+    median = statistics.median(samples)
+    return {
+        "group": BENCHMARK_GROUP,
+        "name": case.name,
+        "fullname": f"histdatacom.data_plane_benchmark::{case.name}",
+        "params": None,
+        "stats": _round_stats(samples),
+        "extra_info": {
+            "rows": case.rows,
+            "bytes": case.bytes_processed,
+            "rows_per_second": round(case.rows / median, 1) if median else 0,
+            "mb_per_second": (
+                round(case.bytes_processed / _MEGABYTE / median, 3)
+                if median
+                else 0
+            ),
+            "peak_rss_bytes": peak_rss_bytes(),
+        },
+    }
+
+
+def _round_stats(samples: list[float]) -> dict[str, JSONValue]:
+    ordered = sorted(samples)
+    mean = statistics.fmean(ordered)
+    if len(ordered) > 1:
+        q1, _, q3 = statistics.quantiles(ordered, n=4, method="inclusive")
+    else:
+        q1 = q3 = ordered[0]
+    return {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": mean,
+        "stddev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "rounds": len(ordered),
+        "median": statistics.median(ordered),
+        "iqr": q3 - q1,
+        "q1": q1,
+        "q3": q3,
+        "iterations": 1,
+        "total": math.fsum(ordered),
+        "ops": 1 / mean if mean else 0.0,
+    }
+
+
+def _median_by_name(report: Mapping[str, Any]) -> dict[str, float]:
+    medians: dict[str, float] = {}
+    for benchmark in report.get("benchmarks") or ():
+        try:
+            medians[str(benchmark["name"])] = float(
+                benchmark["stats"]["median"]
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return medians
+
+
+def _machine_info() -> dict[str, JSONValue]:
+    return {
+        "node": platform.node(),
+        "processor": platform.processor(),
+        "machine": platform.machine(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "cpu_count": os.cpu_count() or 0,
+    }
+
+
+def _histdatacom_version() -> str:
+    from histdatacom import __version__
+
+    return str(__version__)
@@ -151,6 +151,7 @@ from histdatacom.data_quality.engine import (
     QUALITY_SKIP_EVENTS_SCHEMA_VERSION,
     QUALITY_SKIP_REASON_DUPLICATE_ARCHIVE_PREFERRED_CSV,
     evaluate_quality_rule,
+    resolve_quality_jobs,
     run_quality_assessment,
 )
 from histdatacom.data_quality.exponential_smoothing import (
@@ -299,6 +300,21 @@ from histdatacom.data_quality.bounded_payload_contracts import (
     representative_bounded_quality_payload,
     representative_quality_report,
 )
+from histdatacom.data_quality.frame_cache import (
+    DEFAULT_TARGET_FRAME_CACHE_BYTES,
+    TARGET_FRAME_CACHE_BYTES_ENV,
+    TARGET_FRAME_CACHE_METADATA_KEY,
+    TargetFrameCache,
+    active_target_frame_cache,
+    use_target_frame_cache,
+)
+from histdatacom.data_quality.incremental import (
+    QUALITY_RESULT_REUSE_METADATA_KEY,
+    QUALITY_RESULT_REUSE_SCHEMA_VERSION,
+    quality_rule_version,
+    quality_target_content_key,
+    quality_target_key,
+)
 from histdatacom.data_quality.limits import (
     BoundedReportLimit,
     bounded_report_limit,
@@ -622,12 +638,17 @@ from histdatacom.data_quality.ticks import (
     ASCII_TICK_MICROSTRUCTURE_RULE_ID,
     ASCII_TICK_SPREAD_REGIME_RULE_ID,
     ASCII_TICK_SPREAD_RULE_ID,
+    DEFAULT_TICK_SCAN_ENGINE,
     HistDataAsciiTickMicrostructureRule,
     HistDataAsciiTickSpreadRegimeRule,
     HistDataAsciiTickSpreadRule,
     HistDataTickMicrostructureThresholds,
     HistDataTickSpreadRegimeThresholds,
     HistDataTickSpreadThresholds,
+    TICK_SCAN_ENGINE_COLUMNAR,
+    TICK_SCAN_ENGINE_ROWS,
+    TICK_SCAN_ENGINES,
+    evaluate_tick_quality_bundle,
     ticks_quality_rules,
 )
 
@@ -642,6 +663,10 @@ __all__ = [
     "ASCII_TICK_MICROSTRUCTURE_RULE_ID",
     "ASCII_TICK_SPREAD_REGIME_RULE_ID",
     "ASCII_TICK_SPREAD_RULE_ID",
+    "DEFAULT_TICK_SCAN_ENGINE",
+    "TICK_SCAN_ENGINE_COLUMNAR",
+    "TICK_SCAN_ENGINE_ROWS",
+    "TICK_SCAN_ENGINES",
     "ASSET_CLASS_FX",
     "ASSET_CLASS_INDEX",
     "ASSET_CLASS_METAL",
@@ -816,6 +841,7 @@ __all__ = [
     "DEFAULT_SYNTHETIC_TICK_ROUNDING_DIGITS",
     "DEFAULT_SYNTHETIC_TICK_SEED",
     "DEFAULT_QUALITY_SKIP_COUNT_LIMIT",
+    "DEFAULT_TARGET_FRAME_CACHE_BYTES",
     "DEFAULT_QUALITY_SKIP_EVENT_LIMIT",
     "DEFAULT_QUALITY_REPAIR_PLAN_EVIDENCE_LIMIT",
     "DEFAULT_QUALITY_REPAIR_PLAN_ITEM_LIMIT",
@@ -854,6 +880,8 @@ __all__ = [
     "DEFAULT_WEEKEND_ACTIVITY_POLICY",
     "EXPECTED_SESSION_CLOSURE_POLICIES",
     "QUALITY_REPAIR_PLAN_SCHEMA_VERSION",
+    "QUALITY_RESULT_REUSE_METADATA_KEY",
+    "QUALITY_RESULT_REUSE_SCHEMA_VERSION",
     "QUALITY_REPORT_SCHEMA_VERSION",
     "SERIES_FINGERPRINT_RULE_ID",
     "SYNTHETIC_CONSTRAINT_BOUNDED_PAYLOAD_KEY",
@@ -869,6 +897,9 @@ __all__ = [
     "SYNTHETIC_TICK_STATUS_CODES",
     "SyntheticTickGenerationProfile",
     "SyntheticTickGenerationResult",
+    "TARGET_FRAME_CACHE_BYTES_ENV",
+    "TARGET_FRAME_CACHE_METADATA_KEY",
+    "TargetFrameCache",
     "TIMESTAMP_CONTINUITY_METADATA_KEY",
     "TIME_SERIES_FINGERPRINT_COVERAGE_METADATA_KEY",
     "TIME_SERIES_FINGERPRINT_COVERAGE_SCHEMA_VERSION",
@@ -1057,6 +1088,7 @@ __all__ = [
     "ensure_tick_training_features",
     "enrich_tick_cache_with_training_features",
     "evaluate_quality_rule",
+    "evaluate_tick_quality_bundle",
     "fingerprint_contract_audit",
     "fingerprint_quality_rules",
     "decomposition_training_projection",
@@ -1138,11 +1170,14 @@ __all__ = [
     "quality_profile_report_metadata",
     "quality_profile_source_kind",
     "quality_report_from_training_features",
+    "quality_rule_version",
     "quality_rules_for_groups",
     "quality_run_rules_for_groups",
     "quality_support_for_target",
     "quality_support_from_metadata",
+    "quality_target_content_key",
     "quality_target_from_path",
+    "quality_target_key",
     "resolve_quality_profile",
     "discover_known_quality_findings",
     "classify_remediation_actionability",
@@ -1155,7 +1190,10 @@ __all__ = [
     "remediation_catalog_audit_to_json",
     "RemediationActionability",
     "RemediationActionabilityDecision",
+    "resolve_quality_jobs",
     "run_quality_assessment",
+    "active_target_frame_cache",
+    "use_target_frame_cache",
     "classical_model_comparison_from_saved_results",
     "classical_model_comparison_summary",
     "project_classical_model_comparison_onto_training_frame",
@@ -24,6 +24,10 @@ from histdatacom.data_quality.calendar_profiles import (
     HistDataCalendarWindowTag,
     default_calendar_profile,
 )
+from histdatacom.data_quality.frame_cache import (
+    read_target_bytes,
+    read_target_zip_member,
+)
 from histdatacom.data_quality.symbols import symbol_metadata_for
 from histdatacom.data_quality.time import (
     _SourceReadError as _TimestampSourceReadError,
@@ -1694,7 +1698,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
     path = Path(target.path)
     if target.kind is QualityTargetKind.CSV:
         try:
-            return _TextPayload(data=path.read_bytes())
+            return _TextPayload(data=read_target_bytes(path))
         except OSError as exc:
             raise _SourceReadError(
                 code="DOMAIN_CALENDAR_SOURCE_UNREADABLE",
@@ -1718,11 +1722,10 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
                         metadata={"member_count": 0},
                     )
                 member = sorted(members)[0]
-                with archive.open(member) as source:
-                    return _TextPayload(
-                        data=source.read(),
-                        source_member=member,
-                    )
+                return _TextPayload(
+                    data=read_target_zip_member(archive, path, member),
+                    source_member=member,
+                )
         except zipfile.BadZipFile as exc:
             raise _SourceReadError(
                 code="DOMAIN_CALENDAR_ZIP_UNREADABLE",
@@ -551,6 +551,8 @@ def _slice_commands(
                 *target_paths,
                 "--quality-checks",
                 *quality_checks,
+                "--quality-jobs",
+                "0",
                 "--quality-report",
                 report_path,
                 "--data-directory",
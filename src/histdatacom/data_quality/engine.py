@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING
 
+from histdatacom.concurrency import get_pool_cpu_count
 from histdatacom.data_quality.contracts import (
     QualityReport,
     QualityRule,
@@ -28,16 +31,33 @@ from histdatacom.data_quality.fingerprints import (
     series_fingerprint_topology_attention_summary,
     series_fingerprint_topology_summary,
 )
+from histdatacom.data_quality.frame_cache import (
+    TARGET_FRAME_CACHE_METADATA_KEY,
+    TargetFrameCache,
+    target_frame_cache_bytes,
+    use_target_frame_cache,
+)
+from histdatacom.data_quality.incremental import (
+    QUALITY_RESULT_REUSE_METADATA_KEY,
+    quality_result_reuse_metadata,
+    quality_rule_version,
+    quality_target_content_key,
+    quality_target_key,
+)
 from histdatacom.data_quality.limits import (
     BoundedReportLimit,
     bounded_report_limit,
 )
 from histdatacom.data_quality.ticks import (
+    DEFAULT_TICK_SCAN_ENGINE,
     can_evaluate_tick_quality_bundle,
     evaluate_tick_quality_bundle,
 )
 from histdatacom.runtime_contracts import JSONValue
 
+if TYPE_CHECKING:
+    from histdatacom.manifest_store import ManifestStatusStore
+
 QualityProgressCallback = Callable[[Mapping[str, JSONValue]], None]
 
 QUALITY_ENGINE_METADATA_KEY = "quality_engine"
@@ -69,8 +89,57 @@ def run_quality_assessment(
     run_rules: Iterable[QualityRunRule] = (),
     metadata: Mapping[str, JSONValue] | None = None,
     progress_callback: QualityProgressCallback | None = None,
+    tick_scan_engine: str = DEFAULT_TICK_SCAN_ENGINE,
+    target_frame_cache: TargetFrameCache | None = None,
+    jobs: int = 1,
+    result_store: ManifestStatusStore | None = None,
+) -> QualityReport:
+    """Run every rule against every target through one orchestration path.
+
+    Rules read their sources through one engine-owned
+    ``TargetFrameCache`` for the whole run, so a file shared by several
+    rules is decoded once while it stays fresh and within the byte budget.
+
+    With ``jobs`` above one, targets fan out over a process pool.  Results
+    are merged back into the serial plan order, so the report is identical
+    to a serial run; progress events arrive as each target finishes.
+
+    With a ``result_store``, per-target rule results are looked up by rule
+    id, rule version, and target content key.  Unchanged targets are served
+    from the store, only new or changed targets are evaluated, and the
+    ``quality_engine`` metadata records which results were reused.
+    """
+    frame_cache = (
+        TargetFrameCache(target_frame_cache_bytes())
+        if target_frame_cache is None
+        else target_frame_cache
+    )
+    with use_target_frame_cache(frame_cache):
+        return _run_quality_assessment(
+            targets,
+            rules,
+            run_rules=run_rules,
+            metadata=metadata,
+            progress_callback=progress_callback,
+            tick_scan_engine=tick_scan_engine,
+            frame_cache=frame_cache,
+            jobs=jobs,
+            result_store=result_store,
+        )
+
+
+def _run_quality_assessment(
+    targets: Iterable[QualityTarget],
+    rules: Iterable[QualityRule],
+    *,
+    run_rules: Iterable[QualityRunRule],
+    metadata: Mapping[str, JSONValue] | None,
+    progress_callback: QualityProgressCallback | None,
+    tick_scan_engine: str,
+    frame_cache: TargetFrameCache,
+    jobs: int,
+    result_store: ManifestStatusStore | None,
 ) -> QualityReport:
-    """Run every rule against every target through one orchestration path."""
     target_tuple = tuple(targets)
     rule_tuple = tuple(rules)
     run_rule_tuple = tuple(run_rules)
@@ -135,69 +204,19 @@ def run_quality_assessment(
         run_rule_count=len(run_rule_tuple),
     )
 
-    rule_results_list: list[QualityRuleResult] = []
     completed = 0
-    for (
-        target_index,
-        target,
-        rule_group,
-    ) in evaluation_plan:
-        group_rules = tuple(rule for _, rule in rule_group)
-        if can_evaluate_tick_quality_bundle(target, group_rules):
-            first_rule_index, first_rule = rule_group[0]
-            _emit_quality_progress(
-                progress_callback,
-                phase="rule_start",
-                completed=completed,
-                total=total_evaluation_count,
-                target_count=len(target_tuple),
-                rule_count=len(rule_tuple),
-                run_rule_count=len(run_rule_tuple),
-                target_index=target_index,
-                rule_index=first_rule_index,
-                rule_id=first_rule.rule_id,
-                target=target,
-            )
-            bundle_results = evaluate_tick_quality_bundle(target, group_rules)
-            for result_index, (
-                (rule_index, rule),
-                result,
-            ) in enumerate(zip(rule_group, bundle_results, strict=True)):
-                if result_index:
-                    _emit_quality_progress(
-                        progress_callback,
-                        phase="rule_start",
-                        completed=completed,
-                        total=total_evaluation_count,
-                        target_count=len(target_tuple),
-                        rule_count=len(rule_tuple),
-                        run_rule_count=len(run_rule_tuple),
-                        target_index=target_index,
-                        rule_index=rule_index,
-                        rule_id=rule.rule_id,
-                        target=target,
-                    )
-                rule_results_list.append(result)
-                completed += 1
-                _emit_quality_progress(
-                    progress_callback,
-                    phase="rule_complete",
-                    completed=completed,
-                    total=total_evaluation_count,
-                    target_count=len(target_tuple),
-                    rule_count=len(rule_tuple),
-                    run_rule_count=len(run_rule_tuple),
-                    target_index=target_index,
-                    rule_index=rule_index,
-                    rule_id=rule.rule_id,
-                    target=target,
-                )
-            continue
-
-        rule_index, rule = rule_group[0]
+    group_results: list[list[QualityRuleResult]] = [[] for _ in evaluation_plan]
+
+    def emit_rule_progress(
+        phase: str,
+        target_index: int,
+        target: QualityTarget,
+        rule_index: int,
+        rule: QualityRule,
+    ) -> None:
         _emit_quality_progress(
             progress_callback,
-            phase="rule_start",
+            phase=phase,
             completed=completed,
             total=total_evaluation_count,
             target_count=len(target_tuple),
@@ -208,20 +227,94 @@ def run_quality_assessment(
             rule_id=rule.rule_id,
             target=target,
         )
-        rule_results_list.append(evaluate_quality_rule(rule, target))
-        completed += 1
-        _emit_quality_progress(
-            progress_callback,
-            phase="rule_complete",
-            completed=completed,
-            total=total_evaluation_count,
-            target_count=len(target_tuple),
-            rule_count=len(rule_tuple),
-            run_rule_count=len(run_rule_tuple),
-            target_index=target_index,
-            rule_index=rule_index,
-            rule_id=rule.rule_id,
-            target=target,
+
+    def record_group_results(
+        plan_index: int,
+        results: tuple[QualityRuleResult, ...],
+        *,
+        first_started: bool,
+    ) -> None:
+        nonlocal completed
+        target_index, target, rule_group = evaluation_plan[plan_index]
+        for result_index, ((rule_index, rule), result) in enumerate(
+            zip(rule_group, results, strict=True)
+        ):
+            if result_index or not first_started:
+                emit_rule_progress(
+                    "rule_start", target_index, target, rule_index, rule
+                )
+            group_results[plan_index].append(result)
+            completed += 1
+            emit_rule_progress(
+                "rule_complete", target_index, target, rule_index, rule
+            )
+
+    plan_store_keys: list[tuple[tuple[str, str, str, str], ...]] = []
+    reused_group_results: dict[int, tuple[QualityRuleResult, ...]] = {}
+    if result_store is not None:
+        plan_store_keys, reused_group_results = _stored_plan_results(
+            evaluation_plan,
+            result_store,
+        )
+        for plan_index, results in reused_group_results.items():
+            record_group_results(plan_index, results, first_started=False)
+    pending_plan_indexes = [
+        plan_index
+        for plan_index in range(len(evaluation_plan))
+        if plan_index not in reused_group_results
+    ]
+    pending_target_count = len(
+        {evaluation_plan[index][0] for index in pending_plan_indexes}
+    )
+
+    worker_count = min(max(1, jobs), pending_target_count)
+    if worker_count > 1:
+        for plan_index, results in _evaluate_plan_in_processes(
+            evaluation_plan,
+            pending_plan_indexes,
+            worker_count=worker_count,
+            tick_scan_engine=tick_scan_engine,
+            frame_cache=frame_cache,
+        ):
+            record_group_results(plan_index, results, first_started=False)
+    else:
+        for plan_index in pending_plan_indexes:
+            target_index, target, rule_group = evaluation_plan[plan_index]
+            first_rule_index, first_rule = rule_group[0]
+            emit_rule_progress(
+                "rule_start",
+                target_index,
+                target,
+                first_rule_index,
+                first_rule,
+            )
+            record_group_results(
+                plan_index,
+                _evaluate_rule_group(
+                    target,
+                    rule_group,
+                    tick_scan_engine=tick_scan_engine,
+                ),
+                first_started=True,
+            )
+    rule_results_list = [
+        result for results in group_results for result in results
+    ]
+    result_reuse: dict[str, JSONValue] | None = None
+    if result_store is not None:
+        result_store.write_quality_rule_results(
+            (*key, result.to_dict())
+            for plan_index in pending_plan_indexes
+            for key, result in zip(
+                plan_store_keys[plan_index],
+                group_results[plan_index],
+                strict=True,
+            )
+        )
+        result_reuse = _result_reuse_metadata(
+            evaluation_plan,
+            reused_group_results,
+            evaluated_target_count=pending_target_count,
         )
 
     rule_results = tuple(rule_results_list)
@@ -235,6 +328,8 @@ def run_quality_assessment(
             run_rule_count=len(run_rule_tuple),
             executed_target_rule_count=len(rule_results_list),
             skip_events=ordered_skip_events,
+            frame_cache=frame_cache,
+            result_reuse=result_reuse,
         )
     fingerprint_skip_events = tuple(
         event
@@ -320,6 +415,21 @@ def run_quality_assessment(
     merged_metadata = dict(base_metadata)
     for report in run_reports:
         merged_metadata.update(report.metadata)
+    if (
+        ordered_skip_events
+        or frame_cache.hit_count
+        or frame_cache.miss_count
+        or result_reuse is not None
+    ):
+        merged_metadata[QUALITY_ENGINE_METADATA_KEY] = _quality_engine_metadata(
+            target_count=len(target_tuple),
+            rule_count=len(rule_tuple),
+            run_rule_count=len(run_rule_tuple),
+            executed_target_rule_count=len(rule_results_list),
+            skip_events=ordered_skip_events,
+            frame_cache=frame_cache,
+            result_reuse=result_reuse,
+        )
 
     _emit_quality_progress(
         progress_callback,
@@ -348,6 +458,175 @@ def run_quality_assessment(
     )
 
 
+def resolve_quality_jobs(
+    jobs: int | None,
+    *,
+    cpu_utilization: str | int | None = None,
+) -> int:
+    """Return the quality worker count, sizing ``0`` from the CPU policy."""
+    if jobs is None or int(jobs) <= 0:
+        return get_pool_cpu_count(cpu_utilization)
+    return int(jobs)
+
+
+def _evaluate_rule_group(
+    target: QualityTarget,
+    rule_group: tuple[tuple[int, QualityRule], ...],
+    *,
+    tick_scan_engine: str,
+) -> tuple[QualityRuleResult, ...]:
+    group_rules = tuple(rule for _, rule in rule_group)
+    if can_evaluate_tick_quality_bundle(target, group_rules):
+        return tuple(
+            evaluate_tick_quality_bundle(
+                target,
+                group_rules,
+                scan_engine=tick_scan_engine,
+            )
+        )
+    return tuple(evaluate_quality_rule(rule, target) for rule in group_rules)
+
+
+def _evaluate_target_rule_groups(
+    plan_entries: tuple[
+        tuple[int, QualityTarget, tuple[tuple[int, QualityRule], ...]], ...
+    ],
+    tick_scan_engine: str,
+    frame_cache_bytes: int,
+) -> tuple[tuple[tuple[QualityRuleResult, ...], ...], dict[str, JSONValue]]:
+    """Evaluate one target's rule groups in a worker process."""
+    frame_cache = TargetFrameCache(frame_cache_bytes)
+    with use_target_frame_cache(frame_cache):
+        results = tuple(
+            _evaluate_rule_group(
+                target,
+                rule_group,
+                tick_scan_engine=tick_scan_engine,
+            )
+            for _, target, rule_group in plan_entries
+        )
+    return results, frame_cache.metadata()
+
+
+def _evaluate_plan_in_processes(
+    evaluation_plan: list[
+        tuple[int, QualityTarget, tuple[tuple[int, QualityRule], ...]]
+    ],
+    pending_plan_indexes: Iterable[int],
+    *,
+    worker_count: int,
+    tick_scan_engine: str,
+    frame_cache: TargetFrameCache,
+) -> Iterator[tuple[int, tuple[QualityRuleResult, ...]]]:
+    """Yield ``(plan_index, results)`` as per-target worker tasks finish."""
+    plan_indexes_by_target: dict[int, list[int]] = {}
+    for plan_index in pending_plan_indexes:
+        target_index = evaluation_plan[plan_index][0]
+        plan_indexes_by_target.setdefault(target_index, []).append(plan_index)
+
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        futures = {
+            executor.submit(
+                _evaluate_target_rule_groups,
+                tuple(evaluation_plan[index] for index in plan_indexes),
+                tick_scan_engine,
+                frame_cache.max_bytes,
+            ): plan_indexes
+            for plan_indexes in plan_indexes_by_target.values()
+        }
+        try:
+            for future in as_completed(futures):
+                group_results, cache_counters = future.result()
+                frame_cache.merge_counters(cache_counters)
+                yield from zip(futures[future], group_results, strict=True)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _stored_plan_results(
+    evaluation_plan: list[
+        tuple[int, QualityTarget, tuple[tuple[int, QualityRule], ...]]
+    ],
+    result_store: ManifestStatusStore,
+) -> tuple[
+    list[tuple[tuple[str, str, str, str], ...]],
+    dict[int, tuple[QualityRuleResult, ...]],
+]:
+    """Return store keys per plan entry and the groups the store can serve.
+
+    A rule group is reused only when every rule in it has a current stored
+    result, so tick bundles are never split between store and evaluation.
+    """
+    rule_versions: dict[int, str] = {}
+    target_keys: dict[int, tuple[str, str]] = {}
+    plan_store_keys: list[tuple[tuple[str, str, str, str], ...]] = []
+    for target_index, target, rule_group in evaluation_plan:
+        if target_index not in target_keys:
+            target_keys[target_index] = (
+                quality_target_key(target),
+                quality_target_content_key(target),
+            )
+        target_key, content_key = target_keys[target_index]
+        for rule_index, rule in rule_group:
+            if rule_index not in rule_versions:
+                rule_versions[rule_index] = quality_rule_version(rule)
+        plan_store_keys.append(
+            tuple(
+                (
+                    rule.rule_id,
+                    target_key,
+                    rule_versions[rule_index],
+                    content_key,
+                )
+                for rule_index, rule in rule_group
+            )
+        )
+    stored = result_store.get_quality_rule_results(
+        key for keys in plan_store_keys for key in keys
+    )
+    reused: dict[int, tuple[QualityRuleResult, ...]] = {}
+    for plan_index, keys in enumerate(plan_store_keys):
+        payloads = [stored.get((rule_id, key)) for rule_id, key, _, _ in keys]
+        if all(payload is not None for payload in payloads):
+            reused[plan_index] = tuple(
+                QualityRuleResult.from_dict(payload)
+                for payload in payloads
+                if payload is not None
+            )
+    return plan_store_keys, reused
+
+
+def _result_reuse_metadata(
+    evaluation_plan: list[
+        tuple[int, QualityTarget, tuple[tuple[int, QualityRule], ...]]
+    ],
+    reused_group_results: Mapping[int, tuple[QualityRuleResult, ...]],
+    *,
+    evaluated_target_count: int,
+) -> dict[str, JSONValue]:
+    reused_rule_counts: Counter[int] = Counter()
+    reused_targets: dict[int, QualityTarget] = {}
+    evaluated_rule_count = 0
+    for plan_index, (target_index, target, rule_group) in enumerate(
+        evaluation_plan
+    ):
+        if plan_index in reused_group_results:
+            reused_rule_counts[target_index] += len(rule_group)
+            reused_targets[target_index] = target
+        else:
+            evaluated_rule_count += len(rule_group)
+    return quality_result_reuse_metadata(
+        reused_targets=(
+            (target, reused_rule_counts[target_index])
+            for target_index, target in reused_targets.items()
+        ),
+        reused_rule_evaluation_count=sum(reused_rule_counts.values()),
+        evaluated_rule_evaluation_count=evaluated_rule_count,
+        evaluated_target_count=evaluated_target_count,
+    )
+
+
 def _merge_targets(
     targets: tuple[QualityTarget, ...],
     *target_groups: tuple[QualityTarget, ...],
@@ -366,13 +645,15 @@ def _quality_engine_metadata(
     run_rule_count: int,
     executed_target_rule_count: int,
     skip_events: tuple[QualitySkipEvent, ...],
+    frame_cache: TargetFrameCache,
+    result_reuse: dict[str, JSONValue] | None = None,
 ) -> dict[str, JSONValue]:
     skip_reason_counts = Counter(event.reason_code for event in skip_events)
     duplicate_archive_skip_count = skip_reason_counts[
         QUALITY_SKIP_REASON_DUPLICATE_ARCHIVE_PREFERRED_CSV
     ]
     planned_target_rule_count = target_count * rule_count
-    return {
+    metadata: dict[str, JSONValue] = {
         "schema_version": QUALITY_ENGINE_SCHEMA_VERSION,
         "target_count": target_count,
         "rule_count": rule_count,
@@ -387,7 +668,11 @@ def _quality_engine_metadata(
             "prefer_extracted_csv_for_non_inventory_rules"
         ),
         "skip_events": _quality_skip_events_metadata(skip_events),
+        TARGET_FRAME_CACHE_METADATA_KEY: frame_cache.metadata(),
     }
+    if result_reuse is not None:
+        metadata[QUALITY_RESULT_REUSE_METADATA_KEY] = result_reuse
+    return metadata
 
 
 def _quality_skip_events_metadata(
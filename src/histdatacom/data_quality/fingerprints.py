@@ -57,6 +57,10 @@ from histdatacom.data_quality.exponential_smoothing import (
     ExponentialSmoothingProfile,
     exponential_smoothing_from_model_input,
 )
+from histdatacom.data_quality.frame_cache import (
+    read_target_bytes,
+    read_target_zip_member,
+)
 from histdatacom.data_quality.limits import (
     BoundedReportLimit,
     bounded_report_limit,
@@ -8572,7 +8576,7 @@ def _duration_ms(
 def _read_text_payload(target: QualityTarget) -> _TextPayload:
     path = Path(target.path)
     if target.kind is QualityTargetKind.CSV:
-        return _TextPayload(text=path.read_bytes().decode("utf-8"))
+        return _TextPayload(text=read_target_bytes(path).decode("utf-8"))
 
     with zipfile.ZipFile(path) as archive:
         members = tuple(
@@ -8584,7 +8588,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
             raise ValueError("zip_csv_member_unavailable")
         member = members[0]
         return _TextPayload(
-            text=archive.read(member).decode("utf-8"),
+            text=read_target_zip_member(archive, path, member).decode("utf-8"),
             source_member=member,
         )
 
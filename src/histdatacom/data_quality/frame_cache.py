@@ -0,0 +1,206 @@
+"""Bounded per-run cache of decoded target sources for data-quality rules."""
+
+from __future__ import annotations
+
+import os
+import zipfile
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from histdatacom.histdata_ascii import read_polars_cache
+from histdatacom.runtime_contracts import JSONValue
+
+_T = TypeVar("_T")
+
+DEFAULT_TARGET_FRAME_CACHE_BYTES = 512 << 20
+TARGET_FRAME_CACHE_BYTES_ENV = "HISTDATACOM_QUALITY_FRAME_CACHE_MB"
+TARGET_FRAME_CACHE_METADATA_KEY = "target_frame_cache"
+
+_ACTIVE_TARGET_FRAME_CACHE: ContextVar["TargetFrameCache | None"] = ContextVar(
+    "histdatacom_target_frame_cache", default=None
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    value: Any
+    size_bytes: int
+
+
+class TargetFrameCache:
+    """LRU cache of target payloads keyed by path and file freshness.
+
+    Entries are keyed by the resolved path plus ``st_mtime_ns`` and
+    ``st_size``, so a file rewritten during a campaign is decoded again rather
+    than served stale.  Eviction is by total decoded byte size; a payload
+    larger than the whole budget is returned to the caller without being kept.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_TARGET_FRAME_CACHE_BYTES):
+        if max_bytes < 0:
+            raise ValueError("target frame cache max_bytes must be >= 0")
+        self.max_bytes = int(max_bytes)
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self.oversized_count = 0
+        self.current_bytes = 0
+        self.peak_bytes = 0
+        self._entries: OrderedDict[tuple[object, ...], _CacheEntry] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(
+        self,
+        kind: str,
+        path: str | Path,
+        loader: Callable[[], _T],
+        *,
+        size_of: Callable[[_T], int],
+    ) -> _T:
+        """Return the cached ``kind`` payload for ``path`` or load it."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return loader()
+        key = (
+            kind,
+            os.path.realpath(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hit_count += 1
+            return entry.value
+        self.miss_count += 1
+        value = loader()
+        size_bytes = max(0, int(size_of(value)))
+        if size_bytes > self.max_bytes:
+            self.oversized_count += 1
+            return value
+        self._entries[key] = _CacheEntry(value=value, size_bytes=size_bytes)
+        self.current_bytes += size_bytes
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size_bytes
+            self.eviction_count += 1
+        self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+        return value
+
+    def merge_counters(self, counters: Mapping[str, JSONValue]) -> None:
+        """Add counters reported by a worker process's own cache."""
+        self.hit_count += _int_counter(counters, "hit_count")
+        self.miss_count += _int_counter(counters, "miss_count")
+        self.eviction_count += _int_counter(counters, "eviction_count")
+        self.oversized_count += _int_counter(counters, "oversized_count")
+        self.peak_bytes = max(
+            self.peak_bytes,
+            _int_counter(counters, "peak_bytes"),
+        )
+
+    def clear(self) -> None:
+        """Drop every cached payload while keeping the counters."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def metadata(self) -> dict[str, JSONValue]:
+        """Return JSON counters for the ``quality_engine`` metadata block."""
+        return {
+            "max_bytes": self.max_bytes,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "eviction_count": self.eviction_count,
+            "oversized_count": self.oversized_count,
+            "entry_count": len(self._entries),
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+def _int_counter(counters: Mapping[str, JSONValue], key: str) -> int:
+    value = counters.get(key, 0)
+    if isinstance(value, bool) or not isinstance(value, int):
+        return 0
+    return value
+
+
+def target_frame_cache_bytes() -> int:
+    """Return the configured per-run target frame cache budget in bytes."""
+    raw = os.environ.get(TARGET_FRAME_CACHE_BYTES_ENV, "").strip()
+    if not raw:
+        return DEFAULT_TARGET_FRAME_CACHE_BYTES
+    try:
+        megabytes = int(raw)
+    except ValueError:
+        return DEFAULT_TARGET_FRAME_CACHE_BYTES
+    return max(0, megabytes) << 20
+
+
+def active_target_frame_cache() -> TargetFrameCache | None:
+    """Return the target frame cache installed for the current run, if any."""
+    return _ACTIVE_TARGET_FRAME_CACHE.get()
+
+
+@contextmanager
+def use_target_frame_cache(
+    cache: TargetFrameCache | None,
+) -> Iterator[TargetFrameCache | None]:
+    """Install ``cache`` for quality rule reads inside the ``with`` block."""
+    token = _ACTIVE_TARGET_FRAME_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_TARGET_FRAME_CACHE.reset(token)
+
+
+def read_target_polars_cache(path: str | Path) -> Any:
+    """Read a Polars cache through the active target frame cache."""
+    cache = active_target_frame_cache()
+    if cache is None:
+        return read_polars_cache(path)
+    return cache.get_or_load(
+        "polars_cache",
+        path,
+        lambda: read_polars_cache(path),
+        size_of=lambda frame: frame.estimated_size(),
+    )
+
+
+def read_target_bytes(path: str | Path) -> bytes:
+    """Read a source file's bytes through the active target frame cache."""
+    cache = active_target_frame_cache()
+    source_path = Path(path)
+    if cache is None:
+        return source_path.read_bytes()
+    return cache.get_or_load(
+        "bytes",
+        source_path,
+        source_path.read_bytes,
+        size_of=len,
+    )
+
+
+def read_target_zip_member(
+    archive: zipfile.ZipFile,
+    path: str | Path,
+    member: str,
+) -> bytes:
+    """Read one decompressed ZIP member through the active cache."""
+    cache = active_target_frame_cache()
+    if cache is None:
+        return archive.read(member)
+    return cache.get_or_load(
+        f"zip_member:{member}",
+        path,
+        lambda: archive.read(member),
+        size_of=len,
+    )
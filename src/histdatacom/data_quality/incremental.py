@@ -0,0 +1,141 @@
+"""Keys for reusing stored per-target quality rule results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+import histdatacom
+from histdatacom.data_quality.contracts import (
+    QualityRule,
+    QualityTarget,
+    QualityTargetKind,
+)
+from histdatacom.data_quality.limits import bounded_report_limit
+from histdatacom.histdata_ascii import CACHE_FILENAME
+from histdatacom.runtime_contracts import JSONValue
+
+QUALITY_RESULT_REUSE_METADATA_KEY = "result_reuse"
+QUALITY_RESULT_REUSE_SCHEMA_VERSION = "histdatacom.quality-result-reuse.v1"
+DEFAULT_QUALITY_RESULT_REUSE_TARGET_LIMIT = 128
+_SHA256_CHUNK_SIZE = 1024 * 1024
+
+
+def quality_rule_version(rule: QualityRule) -> str:
+    """Return a digest of the rule implementation and its thresholds.
+
+    The digest covers the package version, the rule class, and the rule's
+    dataclass ``repr``, so a profile threshold change or an upgrade stops
+    earlier results from being reused.
+    """
+    rule_type = type(rule)
+    encoded = "\n".join(
+        (
+            histdatacom.__version__,
+            f"{rule_type.__module__}.{rule_type.__qualname__}",
+            repr(rule),
+        )
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def quality_target_key(target: QualityTarget) -> str:
+    """Return the stable store key for one target's results."""
+    path = str(Path(target.path).expanduser().resolve(strict=False))
+    return f"{target.kind.value}:{path}"
+
+
+def quality_target_content_key(target: QualityTarget) -> str:
+    """Return a digest of the target descriptor and its content evidence.
+
+    ASCII sources are hashed.  Polars caches are identified by size and
+    modification time, and a sibling cache next to a source is folded in
+    because rules prefer it when it is fresh.
+    """
+    digest = hashlib.sha256(
+        json.dumps(target.to_dict(), sort_keys=True).encode("utf-8")
+    )
+    path = Path(target.path)
+    digest.update(_path_evidence(path, hash_content=_hash_content(target)))
+    if target.kind in {QualityTargetKind.CSV, QualityTargetKind.ZIP}:
+        cache_path = path.with_name(CACHE_FILENAME)
+        digest.update(_path_evidence(cache_path, hash_content=False))
+        digest.update(_sibling_freshness(path, cache_path))
+    return digest.hexdigest()
+
+
+def quality_result_reuse_metadata(
+    *,
+    reused_targets: Iterable[tuple[QualityTarget, int]],
+    reused_rule_evaluation_count: int,
+    evaluated_rule_evaluation_count: int,
+    evaluated_target_count: int,
+) -> dict[str, JSONValue]:
+    """Return publish-safe accounting for results served from the store."""
+    reused = sorted(
+        reused_targets,
+        key=lambda item: (
+            item[0].data_format,
+            item[0].timeframe,
+            item[0].symbol,
+            item[0].period,
+            item[0].kind.value,
+        ),
+    )
+    limit = bounded_report_limit(
+        None,
+        default_limit=DEFAULT_QUALITY_RESULT_REUSE_TARGET_LIMIT,
+        maximum_limit=DEFAULT_QUALITY_RESULT_REUSE_TARGET_LIMIT,
+        allow_unbounded=False,
+    )
+    included = limit.slice(reused)
+    return {
+        "schema_version": QUALITY_RESULT_REUSE_SCHEMA_VERSION,
+        "store": "manifest_status_store",
+        "reused_rule_evaluation_count": reused_rule_evaluation_count,
+        "evaluated_rule_evaluation_count": evaluated_rule_evaluation_count,
+        "reused_target_count": len(reused),
+        "evaluated_target_count": evaluated_target_count,
+        "reused_targets": [
+            {
+                "target_kind": target.kind.value,
+                "data_format": target.data_format,
+                "timeframe": target.timeframe,
+                "symbol": target.symbol,
+                "period": target.period,
+                "rule_evaluation_count": rule_count,
+            }
+            for target, rule_count in included
+        ],
+        "limit_metadata": limit.count_payload(len(reused)),
+    }
+
+
+def _hash_content(target: QualityTarget) -> bool:
+    return target.kind in {QualityTargetKind.CSV, QualityTargetKind.ZIP}
+
+
+def _sibling_freshness(source_path: Path, cache_path: Path) -> bytes:
+    try:
+        fresh = cache_path.stat().st_mtime_ns >= source_path.stat().st_mtime_ns
+    except OSError:
+        return b"fresh:unknown;"
+    return f"fresh:{fresh};".encode("utf-8")
+
+
+def _path_evidence(path: Path, *, hash_content: bool) -> bytes:
+    try:
+        stat = path.stat()
+    except OSError:
+        return f"{path.name}:missing;".encode("utf-8")
+    if not path.is_file():
+        return f"{path.name}:{stat.st_mtime_ns}:not-file;".encode("utf-8")
+    if not hash_content:
+        return f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8")
+    digest = hashlib.sha256()
+    with path.open("rb") as source:
+        for chunk in iter(lambda: source.read(_SHA256_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return f"{path.name}:sha256:{digest.hexdigest()};".encode("utf-8")
@@ -17,6 +17,11 @@ from histdatacom.data_quality.contracts import (
     QualityTarget,
     QualityTargetKind,
 )
+from histdatacom.data_quality.frame_cache import (
+    read_target_bytes,
+    read_target_polars_cache,
+    read_target_zip_member,
+)
 from histdatacom.data_quality.polars_cache import (
     read_fresh_sibling_polars_cache,
     read_quality_polars_cache,
@@ -26,7 +31,6 @@ from histdatacom.histdata_ascii import (
     columns_for_timeframe,
     delimiter_for_timeframe,
     parse_histdata_datetime_to_utc_ms,
-    read_polars_cache,
 )
 from histdatacom.runtime_contracts import JSONValue
 
@@ -534,7 +538,7 @@ def _profile_ascii_text_target(target: QualityTarget) -> _IngestionProfile:
 def _profile_cache_target(target: QualityTarget) -> _IngestionProfile:
     path = Path(target.path)
     try:
-        frame = read_polars_cache(path)
+        frame = read_target_polars_cache(path)
     except ValueError as exc:
         raise _SourceReadError(
             code="ASCII_CACHE_UNREADABLE",
@@ -587,7 +591,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
     path = Path(target.path)
     if target.kind is QualityTargetKind.CSV:
         try:
-            return _TextPayload(path.read_bytes())
+            return _TextPayload(read_target_bytes(path))
         except OSError as exc:
             raise _source_error(
                 "ASCII_TEXT_UNREADABLE",
@@ -612,7 +616,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
                 )
             member = members[0]
             return _TextPayload(
-                data=archive.read(member),
+                data=read_target_zip_member(archive, path, member),
                 source_member=member,
             )
     except _SourceReadError:
@@ -7,7 +7,8 @@ from pathlib import Path
 from typing import Any
 
 from histdatacom.data_quality.contracts import QualityTarget, QualityTargetKind
-from histdatacom.histdata_ascii import CACHE_FILENAME, read_polars_cache
+from histdatacom.data_quality.frame_cache import read_target_polars_cache
+from histdatacom.histdata_ascii import CACHE_FILENAME
 
 
 @dataclass(frozen=True, slots=True)
@@ -73,7 +74,7 @@ def read_fingerprint_parity_polars_cache(
     try:
         source_stat = source_path.stat()
         cache_stat = cache_path.stat()
-        frame = read_polars_cache(cache_path)
+        frame = read_target_polars_cache(cache_path)
     except (OSError, ValueError):
         return None
     columns = set(getattr(frame, "columns", ()))
@@ -98,7 +99,7 @@ def read_quality_polars_cache(
     if target.kind is QualityTargetKind.CACHE:
         cache_path = Path(target.path)
         try:
-            frame = read_polars_cache(cache_path)
+            frame = read_target_polars_cache(cache_path)
         except (OSError, ValueError):
             return None
 
@@ -2363,7 +2363,7 @@ def _cross_series_fingerprint_summary(
 def _quality_engine_summary(
     report: QualityReport,
 ) -> dict[str, JSONValue] | None:
-    """Return structured quality-engine metadata when evaluations were skipped."""
+    """Return structured quality-engine metadata when the run recorded any."""
     return _optional_mapping_payload(
         report.metadata.get(QUALITY_ENGINE_METADATA_KEY)
     )
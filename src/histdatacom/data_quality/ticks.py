@@ -31,6 +31,10 @@ from histdatacom.data_quality.calendar import (
     SESSION_STATE_SUNDAY_OPEN,
     SESSION_STATE_WEEKEND_CLOSURE,
 )
+from histdatacom.data_quality.frame_cache import (
+    read_target_bytes,
+    read_target_zip_member,
+)
 from histdatacom.data_quality.polars_cache import read_quality_polars_cache
 from histdatacom.data_quality.symbols import (
     ASSET_CLASS_INDEX,
@@ -67,6 +71,31 @@ DAILY_ROLLOVER_SOURCE_MINUTES = (16 * 60 + 55, 17 * 60 + 5)
 FRIDAY_CLOSE_SOURCE_MINUTES = (16 * 60, 17 * 60)
 SUNDAY_OPEN_SOURCE_MINUTES = (17 * 60, 18 * 60)
 LONDON_FIX_UTC_MINUTES = (15 * 60 + 55, 16 * 60 + 5)
+TICK_SCAN_ENGINE_ROWS = "rows"
+TICK_SCAN_ENGINE_COLUMNAR = "columnar"
+TICK_SCAN_ENGINES = (TICK_SCAN_ENGINE_ROWS, TICK_SCAN_ENGINE_COLUMNAR)
+DEFAULT_TICK_SCAN_ENGINE = TICK_SCAN_ENGINE_ROWS
+_TOP_CANDIDATE_CHUNK_ROWS = 65_536
+_REGIME_SESSION_KEYS = (
+    SESSION_ASIA,
+    SESSION_LONDON,
+    SESSION_NEW_YORK,
+    SESSION_NO_ACTIVE_WINDOW,
+    SESSION_MARKET_CLOSED,
+)
+_REGIME_SPECIAL_TAGS = (
+    SESSION_STATE_WEEKEND_CLOSURE,
+    SESSION_STATE_SUNDAY_OPEN,
+    SESSION_STATE_FRIDAY_CLOSE,
+    "daily_rollover",
+    "london_4pm_fix_window",
+    "month_end_fix_window",
+    "quarter_end_fix_window",
+    "year_end_fix_window",
+    "month_end",
+    "quarter_end",
+    "year_end",
+)
 _ThresholdT = TypeVar("_ThresholdT")
 
 
@@ -1146,11 +1175,26 @@ def can_evaluate_tick_quality_bundle(
 def evaluate_tick_quality_bundle(
     target: QualityTarget,
     rules: Sequence[QualityRule],
+    *,
+    scan_engine: str = DEFAULT_TICK_SCAN_ENGINE,
 ) -> tuple[QualityRuleResult, ...]:
-    """Evaluate the cache-backed TICK rule trio through shared scans."""
+    """Evaluate the cache-backed TICK rule trio through shared scans.
+
+    ``scan_engine`` selects the per-row state machines (``"rows"``) or the
+    Polars expression engine (``"columnar"``); both produce identical
+    findings.
+    """
     if not can_evaluate_tick_quality_bundle(target, rules):
         msg = "target and rules do not describe a cache-backed TICK bundle"
         raise ValueError(msg)
+    if scan_engine not in TICK_SCAN_ENGINES:
+        msg = f"unsupported tick scan engine: {scan_engine}"
+        raise ValueError(msg)
+    scan_rows = (
+        _scan_tick_cache_quality_columns
+        if scan_engine == TICK_SCAN_ENGINE_COLUMNAR
+        else _scan_tick_cache_quality_rows
+    )
 
     spread_rule = rules[0]
     microstructure_rule = rules[1]
@@ -1251,7 +1295,7 @@ def evaluate_tick_quality_bundle(
     )
 
     try:
-        scans = _scan_tick_cache_quality_rows(
+        scans = scan_rows(
             frame,
             target=target,
             source_member="",
@@ -1393,7 +1437,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
     path = Path(target.path)
     if target.kind is QualityTargetKind.CSV:
         try:
-            return _TextPayload(path.read_bytes())
+            return _TextPayload(read_target_bytes(path))
         except OSError as exc:
             raise _source_error(
                 "ASCII_TICK_SPREAD_SOURCE_UNREADABLE",
@@ -1418,7 +1462,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
                 )
             member = members[0]
             return _TextPayload(
-                data=archive.read(member),
+                data=read_target_zip_member(archive, path, member),
                 source_member=member,
             )
     except _SourceReadError:
@@ -1809,6 +1853,755 @@ def _scan_tick_cache_quality_rows(
     )
 
 
+@dataclass(slots=True)
+class _TickColumnSampler:
+    frame: Any
+    target: QualityTarget
+    source_member: str
+    symbol_key: str
+    regime_samples: dict[int, _TickSpreadRegimeSample] = field(
+        default_factory=dict
+    )
+
+    def row(self, row_number: int) -> tuple[object, ...]:
+        """Return the raw cache cells for one 1-based row number."""
+        return cast(tuple[object, ...], self.frame.row(row_number - 1))
+
+    def parsed(self, row_number: int) -> _TickSpreadSample:
+        """Return the row-engine sample for one valid bid/ask row."""
+        datetime_value, bid_value, ask_value, volume_value = self.row(
+            row_number
+        )
+        parsed = _cache_parsed_tick_spread_sample(
+            datetime_value,
+            bid_value,
+            ask_value,
+            volume_value,
+            row_number=row_number,
+            source_member=self.source_member,
+        )
+        if parsed is None:
+            msg = f"row {row_number} does not carry a finite bid/ask pair"
+            raise ValueError(msg)
+        return parsed
+
+    def regime(self, row_number: int) -> _TickSpreadRegimeSample:
+        """Return the row-engine spread-regime sample for one profiled row."""
+        sample = self.regime_samples.get(row_number)
+        if sample is None:
+            sample = _tick_spread_regime_sample(
+                self.target,
+                self.parsed(row_number),
+                symbol_key=self.symbol_key,
+            )
+            self.regime_samples[row_number] = sample
+        return sample
+
+
+def _scan_tick_cache_quality_columns(
+    frame: Any,
+    *,
+    target: QualityTarget,
+    source_member: str,
+    spread_thresholds: HistDataTickSpreadThresholds,
+    microstructure_thresholds: HistDataTickMicrostructureThresholds,
+    regime_thresholds: HistDataTickSpreadRegimeThresholds,
+) -> _TickQualityScans:
+    """Compute the row-engine tick scans with Polars expressions."""
+    import polars as pl
+
+    try:
+        duplicate_count = _cache_duplicate_count(frame)
+        ticks = _tick_quality_column_frame(frame)
+    except Exception as exc:
+        raise _SourceReadError(
+            code="ASCII_TICK_SPREAD_CACHE_SCHEMA_UNSUPPORTED",
+            message="Polars cache could not be projected for tick spread "
+            "checks.",
+            metadata={
+                "required_columns": list(columns_for_timeframe(TICK)),
+                "error_type": type(exc).__name__,
+                "error": str(exc),
+            },
+        ) from exc
+
+    sampler = _TickColumnSampler(
+        frame=frame,
+        target=target,
+        source_member=source_member,
+        symbol_key=normalize_histdata_symbol(target.symbol),
+    )
+    valid = ticks.filter(pl.col("valid"))
+    counts = ticks.select(
+        (pl.col("missing_column") != "").sum().alias("missing"),
+        pl.col("invalid").sum().alias("invalid"),
+    ).row(0, named=True)
+    invalid_tick_count = int(counts["missing"]) + int(counts["invalid"])
+
+    spread_scan = _scan_tick_spread_columns(
+        ticks,
+        valid,
+        sampler=sampler,
+        thresholds=spread_thresholds,
+    )
+    microstructure_scan = _scan_tick_microstructure_columns(
+        valid,
+        sampler=sampler,
+        thresholds=microstructure_thresholds,
+    )
+    microstructure_scan.row_count = ticks.height
+    microstructure_scan.invalid_tick_count = invalid_tick_count
+    microstructure_scan.duplicate_row_count = duplicate_count
+    if duplicate_count:
+        microstructure_scan.duplicate_rows.extend(
+            _cache_duplicate_samples_columns(frame, ticks, sampler=sampler)
+        )
+    regime_scan = _scan_tick_spread_regime_columns(
+        valid,
+        sampler=sampler,
+    )
+    regime_scan.row_count = ticks.height
+    regime_scan.invalid_tick_count = invalid_tick_count
+    _record_cache_spread_regime_warnings(
+        regime_scan,
+        thresholds=regime_thresholds,
+    )
+    return _TickQualityScans(
+        spread=spread_scan,
+        microstructure=microstructure_scan,
+        spread_regime=regime_scan,
+        source_member=source_member,
+    )
+
+
+def _tick_quality_column_frame(frame: Any) -> Any:
+    import polars as pl
+
+    if frame.schema["datetime"].is_integer():
+        timestamp = pl.col("datetime").cast(pl.Int64)
+    else:
+        timestamp = pl.lit(None, dtype=pl.Int64)
+    missing_column = (
+        pl.when(pl.col("bid").is_null())
+        .then(pl.lit("bid"))
+        .when(pl.col("ask").is_null())
+        .then(pl.lit("ask"))
+        .otherwise(pl.lit(""))
+    )
+    ticks = frame.select(
+        pl.int_range(1, pl.len() + 1, dtype=pl.Int64).alias("row_number"),
+        timestamp.alias("timestamp_utc_ms"),
+        pl.col("bid").cast(pl.Float64, strict=False),
+        pl.col("ask").cast(pl.Float64, strict=False),
+        missing_column.alias("missing_column"),
+    )
+    finite = (
+        pl.col("bid").is_not_null()
+        & pl.col("ask").is_not_null()
+        & pl.col("bid").is_finite()
+        & pl.col("ask").is_finite()
+    )
+    return ticks.with_columns(
+        (pl.col("missing_column") == "").alias("present"),
+        finite.fill_null(False).alias("finite"),
+    ).with_columns(
+        (pl.col("present") & pl.col("finite")).alias("valid"),
+        (pl.col("present") & ~pl.col("finite")).alias("invalid"),
+        (pl.col("ask") - pl.col("bid")).alias("spread"),
+        # Every non-valid row closes all open runs, so valid rows that share
+        # a segment id were adjacent in the row engine's state machines.
+        (~(pl.col("present") & pl.col("finite"))).cum_sum().alias("segment"),
+    )
+
+
+def _scan_tick_spread_columns(
+    ticks: Any,
+    valid: Any,
+    *,
+    sampler: _TickColumnSampler,
+    thresholds: HistDataTickSpreadThresholds,
+) -> _TickSpreadScan:
+    import polars as pl
+
+    summary = valid.select(
+        (pl.col("spread") < 0.0).sum().alias("negative"),
+        (pl.col("spread") == 0.0).sum().alias("zero"),
+        pl.col("spread").min().alias("min_spread"),
+        pl.col("spread").max().alias("max_spread"),
+    ).row(0, named=True)
+    scan = _TickSpreadScan(
+        row_count=ticks.height,
+        parsed_row_count=valid.height,
+        missing_bid_ask_count=ticks.filter(
+            pl.col("missing_column") != ""
+        ).height,
+        invalid_bid_ask_count=ticks.filter(pl.col("invalid")).height,
+        negative_spread_count=int(summary["negative"] or 0),
+        zero_spread_count=int(summary["zero"] or 0),
+        min_spread=summary["min_spread"],
+        max_spread=summary["max_spread"],
+    )
+
+    missing_rows = ticks.filter(pl.col("missing_column") != "").head(
+        MAX_TICK_SAMPLES
+    )
+    for row_number, column in missing_rows.select(
+        "row_number",
+        "missing_column",
+    ).iter_rows():
+        datetime_value, bid_value, ask_value, volume_value = sampler.row(
+            row_number
+        )
+        _append_spread_sample(
+            scan.missing_bid_ask,
+            _cache_sample_from_row(
+                datetime_value,
+                bid_value,
+                ask_value,
+                volume_value,
+                row_number=row_number,
+                column=column,
+                source_member=sampler.source_member,
+                metadata={
+                    "expected_field_count": len(columns_for_timeframe(TICK)),
+                    "field_count": len(columns_for_timeframe(TICK)),
+                    "required_columns": list(TICK_PRICE_COLUMNS),
+                },
+            ),
+        )
+    for row_number in _head_row_numbers(ticks.filter(pl.col("invalid"))):
+        datetime_value, bid_value, ask_value, volume_value = sampler.row(
+            row_number
+        )
+        _append_spread_sample(
+            scan.invalid_bid_ask,
+            _cache_invalid_bid_ask_sample(
+                datetime_value,
+                bid_value,
+                ask_value,
+                volume_value,
+                row_number=row_number,
+                source_member=sampler.source_member,
+            ),
+        )
+    for row_number in _head_row_numbers(valid.filter(pl.col("spread") < 0.0)):
+        _append_spread_sample(
+            scan.negative_spreads,
+            sampler.parsed(row_number),
+        )
+
+    zero_runs = _flag_runs(
+        ticks.with_columns(
+            (pl.col("valid") & (pl.col("spread") == 0.0))
+            .fill_null(False)
+            .alias("flag")
+        )
+    ).filter(pl.col("run_length") >= thresholds.zero_spread_run_length)
+    for start_row, end_row, run_length, _previous_row in zero_runs.head(
+        MAX_TICK_SAMPLES
+    ).iter_rows():
+        _finalize_zero_spread_run(
+            scan,
+            sampler.parsed(start_row),
+            sampler.parsed(end_row),
+            run_length,
+            thresholds,
+        )
+    scan.zero_spread_run_count = zero_runs.height
+    return scan
+
+
+def _scan_tick_microstructure_columns(
+    valid: Any,
+    *,
+    sampler: _TickColumnSampler,
+    thresholds: HistDataTickMicrostructureThresholds,
+) -> _TickMicrostructureScan:
+    import polars as pl
+
+    pairs = valid.with_columns(
+        pl.col("row_number").shift(1).alias("previous_row"),
+        (
+            pl.col("timestamp_utc_ms") - pl.col("timestamp_utc_ms").shift(1)
+        ).alias("interval_ms"),
+        (pl.col("bid") != pl.col("bid").shift(1)).alias("bid_changed"),
+        (pl.col("ask") != pl.col("ask").shift(1)).alias("ask_changed"),
+        (pl.col("segment") == pl.col("segment").shift(1))
+        .fill_null(False)
+        .alias("paired"),
+    )
+    interval = pl.col("interval_ms")
+    stale = (
+        pl.col("paired")
+        & interval.is_between(0, thresholds.stale_max_gap_ms)
+        & ~pl.col("bid_changed")
+        & ~pl.col("ask_changed")
+    ).fill_null(False)
+    burst = (
+        pl.col("paired")
+        & interval.is_between(0, thresholds.burst_max_interval_ms)
+    ).fill_null(False)
+    direction = (
+        pl.when(
+            pl.col("paired") & pl.col("bid_changed") & ~pl.col("ask_changed")
+        )
+        .then(pl.lit("bid_only"))
+        .when(pl.col("paired") & pl.col("ask_changed") & ~pl.col("bid_changed"))
+        .then(pl.lit("ask_only"))
+        .otherwise(pl.lit(""))
+    )
+    pairs = pairs.with_columns(
+        stale.alias("stale"),
+        burst.alias("burst"),
+        direction.alias("direction"),
+    )
+    summary = pairs.select(
+        pl.col("stale").sum().alias("stale"),
+        pl.col("burst").sum().alias("burst"),
+        (pl.col("direction") == "bid_only").sum().alias("bid_only"),
+        (pl.col("direction") == "ask_only").sum().alias("ask_only"),
+    ).row(0, named=True)
+    scan = _TickMicrostructureScan(
+        parsed_row_count=valid.height,
+        stale_quote_repeat_count=int(summary["stale"] or 0),
+        burst_interval_count=int(summary["burst"] or 0),
+        bid_only_movement_count=int(summary["bid_only"] or 0),
+        ask_only_movement_count=int(summary["ask_only"] or 0),
+    )
+    scan.one_sided_movement_count = (
+        scan.bid_only_movement_count + scan.ask_only_movement_count
+    )
+
+    # A run of n flagged pairs spans n + 1 ticks and starts at the tick
+    # before the first flagged pair.
+    stale_runs = _flag_runs(
+        pairs.with_columns(pl.col("stale").alias("flag"))
+    ).with_columns((pl.col("run_length") + 1).alias("run_length"))
+    stale_runs = stale_runs.filter(
+        pl.col("run_length") >= thresholds.stale_quote_run_length
+    )
+    for _start_row, end_row, run_length, previous_row in stale_runs.head(
+        MAX_TICK_SAMPLES
+    ).iter_rows():
+        _finalize_stale_quote_run(
+            scan,
+            sampler.parsed(previous_row),
+            sampler.parsed(end_row),
+            run_length,
+            thresholds,
+        )
+    scan.stale_quote_run_count = stale_runs.height
+    scan.stale_quote_run_row_count = int(
+        stale_runs.get_column("run_length").sum() or 0
+    )
+
+    burst_runs = _flag_runs(
+        pairs.with_columns(pl.col("burst").alias("flag"))
+    ).with_columns((pl.col("run_length") + 1).alias("run_length"))
+    burst_runs = burst_runs.filter(
+        pl.col("run_length") >= thresholds.burst_run_length
+    )
+    for _start_row, end_row, run_length, previous_row in burst_runs.head(
+        MAX_TICK_SAMPLES
+    ).iter_rows():
+        _finalize_burst_run(
+            scan,
+            sampler.parsed(previous_row),
+            sampler.parsed(end_row),
+            run_length,
+            thresholds,
+        )
+    scan.burst_run_count = burst_runs.height
+    scan.burst_tick_count = int(burst_runs.get_column("run_length").sum() or 0)
+
+    one_sided_runs = (
+        pairs.filter(pl.col("direction") != "")
+        .with_columns(
+            (
+                (pl.col("direction") != pl.col("direction").shift(1))
+                | (pl.col("row_number").shift(1) != pl.col("previous_row"))
+            )
+            .fill_null(True)
+            .cum_sum()
+            .alias("run_id")
+        )
+        .group_by("run_id", maintain_order=True)
+        .agg(
+            pl.col("row_number").first().alias("start_row"),
+            pl.col("row_number").last().alias("end_row"),
+            pl.len().alias("run_length"),
+            pl.col("previous_row").first().alias("previous_row"),
+            pl.col("direction").first().alias("direction"),
+        )
+        .filter(pl.col("run_length") >= thresholds.one_sided_run_length)
+    )
+    for (
+        _run_id,
+        start_row,
+        end_row,
+        run_length,
+        previous_row,
+        run_direction,
+    ) in one_sided_runs.head(MAX_TICK_SAMPLES).iter_rows():
+        _finalize_one_sided_run(
+            scan,
+            sampler.parsed(start_row),
+            sampler.parsed(end_row),
+            sampler.parsed(previous_row),
+            run_length,
+            run_direction,
+            thresholds,
+        )
+    scan.one_sided_run_count = one_sided_runs.height
+    return scan
+
+
+def _scan_tick_spread_regime_columns(
+    valid: Any,
+    *,
+    sampler: _TickColumnSampler,
+) -> _TickSpreadRegimeScan:
+    import polars as pl
+
+    timestamp = pl.col("timestamp_utc_ms")
+    scan = _TickSpreadRegimeScan(
+        parsed_row_count=valid.height,
+        invalid_timestamp_count=valid.filter(timestamp.is_null()).height,
+        negative_spread_count=valid.filter(
+            timestamp.is_not_null() & (pl.col("spread") < 0.0)
+        ).height,
+    )
+    profiled = _tick_spread_regime_columns(
+        valid.filter(timestamp.is_not_null() & (pl.col("spread") >= 0.0))
+    )
+    scan.profiled_row_count = profiled.height
+    if not profiled.height:
+        return scan
+
+    scan.symbol_profiles[sampler.symbol_key or "unknown"] = (
+        _spread_regime_profile_columns(profiled, sampler=sampler)
+    )
+    for hour_frame in profiled.partition_by(
+        "source_hour",
+        maintain_order=True,
+    ):
+        source_hour = int(hour_frame.get_column("source_hour")[0])
+        scan.source_hour_profiles[f"{source_hour:02d}"] = (
+            _spread_regime_profile_columns(hour_frame, sampler=sampler)
+        )
+    for key in _profile_keys_in_row_order(profiled, _REGIME_SESSION_KEYS):
+        scan.session_profiles[key] = _spread_regime_profile_columns(
+            profiled.filter(pl.col(key)),
+            sampler=sampler,
+        )
+    for key in _profile_keys_in_row_order(profiled, _REGIME_SPECIAL_TAGS):
+        scan.special_regime_profiles[key] = _spread_regime_profile_columns(
+            profiled.filter(pl.col(key)),
+            sampler=sampler,
+        )
+    scan.global_profile = _spread_regime_profile_columns(
+        profiled,
+        sampler=sampler,
+    )
+    scan.liquid_profile = _spread_regime_profile_columns(
+        profiled.filter(pl.col("liquid")),
+        sampler=sampler,
+    )
+
+    row_numbers = profiled.get_column("row_number")
+    spreads = profiled.get_column("spread")
+    for position in _top_candidate_positions(spreads):
+        scan.wide_candidates.append(sampler.regime(int(row_numbers[position])))
+    jump_values = (spreads - spreads.shift(1)).abs().slice(1)
+    scan.spread_jump_values = jump_values.to_list()
+    for position in _top_candidate_positions(jump_values):
+        previous = sampler.regime(int(row_numbers[position]))
+        sample = sampler.regime(int(row_numbers[position + 1]))
+        scan.spread_jump_candidates.append(
+            _TickSpreadRegimeSample(
+                sample=sample.sample,
+                symbol_key=sample.symbol_key,
+                source_hour=sample.source_hour,
+                utc_hour=sample.utc_hour,
+                session_state=sample.session_state,
+                session_keys=sample.session_keys,
+                special_regime_keys=sample.special_regime_keys,
+                previous=previous.sample,
+                spread_delta=cast(float, sample.spread)
+                - cast(float, previous.spread),
+            )
+        )
+    return scan
+
+
+def _tick_spread_regime_columns(profiled: Any) -> Any:
+    """Project the row-engine session, hour and special-tag helpers."""
+    import polars as pl
+
+    utc = pl.from_epoch(pl.col("timestamp_utc_ms"), time_unit="ms")
+    source = pl.from_epoch(
+        pl.col("timestamp_utc_ms") - EST_NO_DST_OFFSET_MS,
+        time_unit="ms",
+    )
+    projected = profiled.with_columns(
+        (utc.dt.hour().cast(pl.Int32) * 60 + utc.dt.minute()).alias(
+            "utc_minute"
+        ),
+        (source.dt.hour().cast(pl.Int32) * 60 + source.dt.minute()).alias(
+            "source_minute"
+        ),
+        source.dt.hour().alias("source_hour"),
+        (source.dt.weekday() - 1).alias("source_weekday"),
+        source.dt.month().alias("source_month"),
+        (source.dt.day() == source.dt.month_end().dt.day()).alias("month_end"),
+    )
+    weekday = pl.col("source_weekday")
+    source_minute = pl.col("source_minute")
+    utc_minute = pl.col("utc_minute")
+    session_state = (
+        pl.when(weekday == 5)
+        .then(pl.lit(SESSION_STATE_WEEKEND_CLOSURE))
+        .when(
+            (weekday == FX_FRIDAY_CLOSE_WEEKDAY)
+            & _minute_in_window_expr(
+                source_minute,
+                *FRIDAY_CLOSE_SOURCE_MINUTES,
+            )
+        )
+        .then(pl.lit(SESSION_STATE_FRIDAY_CLOSE))
+        .when(
+            (weekday == FX_FRIDAY_CLOSE_WEEKDAY)
+            & (source_minute >= FX_CLOSE_OPEN_MINUTE)
+        )
+        .then(pl.lit(SESSION_STATE_WEEKEND_CLOSURE))
+        .when(
+            (weekday == FX_SUNDAY_OPEN_WEEKDAY)
+            & (source_minute < FX_CLOSE_OPEN_MINUTE)
+        )
+        .then(pl.lit(SESSION_STATE_WEEKEND_CLOSURE))
+        .when(
+            (weekday == FX_SUNDAY_OPEN_WEEKDAY)
+            & _minute_in_window_expr(
+                source_minute,
+                *SUNDAY_OPEN_SOURCE_MINUTES,
+            )
+        )
+        .then(pl.lit(SESSION_STATE_SUNDAY_OPEN))
+        .otherwise(pl.lit(SESSION_STATE_MARKET_OPEN))
+    )
+    projected = projected.with_columns(session_state.alias("session_state"))
+    state = pl.col("session_state")
+    clock_open = state != SESSION_STATE_WEEKEND_CLOSURE
+    month_end = pl.col("month_end")
+    quarter_end = month_end & pl.col("source_month").is_in([3, 6, 9, 12])
+    year_end = (pl.col("source_month") == 12) & month_end
+    london_fix = _minute_in_window_expr(utc_minute, *LONDON_FIX_UTC_MINUTES)
+    projected = projected.with_columns(
+        (clock_open & (utc_minute < 9 * 60)).alias(SESSION_ASIA),
+        (
+            clock_open & utc_minute.is_between(7 * 60, 16 * 60, closed="left")
+        ).alias(SESSION_LONDON),
+        (
+            clock_open & utc_minute.is_between(12 * 60, 21 * 60, closed="left")
+        ).alias(SESSION_NEW_YORK),
+        (state == SESSION_STATE_WEEKEND_CLOSURE).alias(
+            SESSION_STATE_WEEKEND_CLOSURE
+        ),
+        (state == SESSION_STATE_SUNDAY_OPEN).alias(SESSION_STATE_SUNDAY_OPEN),
+        (state == SESSION_STATE_FRIDAY_CLOSE).alias(SESSION_STATE_FRIDAY_CLOSE),
+        _minute_in_window_expr(
+            source_minute,
+            *DAILY_ROLLOVER_SOURCE_MINUTES,
+        ).alias("daily_rollover"),
+        london_fix.alias("london_4pm_fix_window"),
+        (london_fix & month_end).alias("month_end_fix_window"),
+        (london_fix & quarter_end).alias("quarter_end_fix_window"),
+        (london_fix & year_end).alias("year_end_fix_window"),
+        quarter_end.alias("quarter_end"),
+        year_end.alias("year_end"),
+    )
+    active = (
+        pl.col(SESSION_ASIA) | pl.col(SESSION_LONDON) | pl.col(SESSION_NEW_YORK)
+    )
+    special = pl.any_horizontal(*(pl.col(tag) for tag in _REGIME_SPECIAL_TAGS))
+    return projected.with_columns(
+        (~active & (state == SESSION_STATE_MARKET_OPEN)).alias(
+            SESSION_NO_ACTIVE_WINDOW
+        ),
+        (~active & (state != SESSION_STATE_MARKET_OPEN)).alias(
+            SESSION_MARKET_CLOSED
+        ),
+        ((state == SESSION_STATE_MARKET_OPEN) & active & ~special).alias(
+            "liquid"
+        ),
+    )
+
+
+def _minute_in_window_expr(
+    minute: Any,
+    start_minute: int,
+    end_minute: int,
+) -> Any:
+    if start_minute <= end_minute:
+        return minute.is_between(start_minute, end_minute, closed="left")
+    return (minute >= start_minute) | (minute < end_minute)
+
+
+def _profile_keys_in_row_order(
+    profiled: Any,
+    keys: tuple[str, ...],
+) -> list[str]:
+    """Return present profile keys in the row engine's insertion order."""
+    import polars as pl
+
+    first_rows = profiled.select(
+        pl.col(key).arg_true().first().alias(key) for key in keys
+    ).row(0)
+    present = [
+        (first_row, order, key)
+        for order, (key, first_row) in enumerate(
+            zip(keys, first_rows, strict=True)
+        )
+        if first_row is not None
+    ]
+    return [key for _first_row, _order, key in sorted(present)]
+
+
+def _spread_regime_profile_columns(
+    profile_frame: Any,
+    *,
+    sampler: _TickColumnSampler,
+) -> _SpreadRegimeProfile:
+    profile = _SpreadRegimeProfile(
+        values=profile_frame.get_column("spread").to_list()
+    )
+    if not profile.values:
+        return profile
+    profile.samples = [
+        _materialize_spread_regime_sample(sampler.regime(row_number))
+        for row_number in _head_row_numbers(profile_frame)
+    ]
+    max_position = profile_frame.get_column("spread").arg_max()
+    profile.max_sample = _materialize_spread_regime_sample(
+        sampler.regime(
+            int(profile_frame.get_column("row_number")[max_position])
+        )
+    )
+    return profile
+
+
+def _top_candidate_positions(scores: Any) -> list[int]:
+    """Replay ``_record_top_regime_candidate`` over a score column.
+
+    Only rows scoring above the smallest retained candidate can replace it,
+    so each chunk is pre-filtered in Polars before the exact replay.
+    """
+    positions: list[int] = []
+    retained: list[float] = []
+    for position, score in enumerate(scores.head(MAX_TICK_SAMPLES).to_list()):
+        positions.append(position)
+        retained.append(score)
+    for offset in range(
+        MAX_TICK_SAMPLES,
+        scores.len(),
+        _TOP_CANDIDATE_CHUNK_ROWS,
+    ):
+        chunk = scores.slice(offset, _TOP_CANDIDATE_CHUNK_ROWS)
+        mask = chunk > min(retained)
+        for position, score in zip(
+            (mask.arg_true() + offset).to_list(),
+            chunk.filter(mask).to_list(),
+            strict=True,
+        ):
+            min_index, min_score = min(
+                enumerate(retained),
+                key=lambda item: item[1],
+            )
+            if score > min_score:
+                positions[min_index] = position
+                retained[min_index] = score
+    return positions
+
+
+def _flag_runs(flagged: Any) -> Any:
+    """Return consecutive ``flag`` runs with start, end and length."""
+    import polars as pl
+
+    return (
+        flagged.with_columns(pl.col("flag").rle_id().alias("run_id"))
+        .filter(pl.col("flag"))
+        .group_by("run_id", maintain_order=True)
+        .agg(
+            pl.col("row_number").first().alias("start_row"),
+            pl.col("row_number").last().alias("end_row"),
+            pl.len().alias("run_length"),
+            (
+                pl.col("previous_row").first()
+                if "previous_row" in flagged.columns
+                else pl.lit(None, dtype=pl.Int64)
+            ).alias("previous_row"),
+        )
+        .drop("run_id")
+    )
+
+
+def _head_row_numbers(frame: Any) -> list[int]:
+    return [
+        int(row_number)
+        for row_number in frame.get_column("row_number")
+        .head(MAX_TICK_SAMPLES)
+        .to_list()
+    ]
+
+
+def _cache_duplicate_count(frame: Any) -> int:
+    import polars as pl
+
+    valid_frame = frame.filter(
+        pl.col("bid").is_not_null()
+        & pl.col("ask").is_not_null()
+        & pl.col("bid").is_finite()
+        & pl.col("ask").is_finite()
+    )
+    return max(valid_frame.height - valid_frame.unique().height, 0)
+
+
+def _cache_duplicate_samples_columns(
+    frame: Any,
+    ticks: Any,
+    *,
+    sampler: _TickColumnSampler,
+) -> list[_TickSpreadSample]:
+    import polars as pl
+
+    keys = list(frame.columns)
+    duplicates = (
+        frame.with_columns(
+            ticks.get_column("row_number"),
+            ticks.get_column("valid"),
+        )
+        .filter(pl.col("valid"))
+        .with_columns(
+            pl.col("row_number").first().over(keys).alias("duplicate_of")
+        )
+        .filter(pl.col("row_number") != pl.col("duplicate_of"))
+        .head(MAX_TICK_SAMPLES)
+    )
+    samples: list[_TickSpreadSample] = []
+    for row_number, duplicate_of in duplicates.select(
+        "row_number",
+        "duplicate_of",
+    ).iter_rows():
+        _append_spread_sample(
+            samples,
+            _duplicate_microstructure_sample(
+                sampler.parsed(row_number),
+                sampler.parsed(duplicate_of),
+            ),
+        )
+    return samples
+
+
 def _record_cache_spread_row(
     scan: _TickSpreadScan,
     parsed: _TickSpreadSample,
@@ -2181,15 +2974,7 @@ def _cache_duplicate_summary(
     *,
     source_member: str,
 ) -> tuple[int, list[_TickSpreadSample]]:
-    import polars as pl
-
-    valid_frame = frame.filter(
-        pl.col("bid").is_not_null()
-        & pl.col("ask").is_not_null()
-        & pl.col("bid").is_finite()
-        & pl.col("ask").is_finite()
-    )
-    duplicate_count = max(valid_frame.height - valid_frame.unique().height, 0)
+    duplicate_count = _cache_duplicate_count(frame)
     if not duplicate_count:
         return 0, []
 
@@ -21,6 +21,10 @@ from histdatacom.data_quality.contracts import (
     QualityTarget,
     QualityTargetKind,
 )
+from histdatacom.data_quality.frame_cache import (
+    read_target_bytes,
+    read_target_zip_member,
+)
 from histdatacom.data_quality.limits import (
     BoundedReportLimit,
     bounded_report_limit,
@@ -815,7 +819,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
     path = Path(target.path)
     if target.kind is QualityTargetKind.CSV:
         try:
-            return _TextPayload(path.read_bytes())
+            return _TextPayload(read_target_bytes(path))
         except OSError as exc:
             raise _source_error(
                 "ASCII_TIME_SOURCE_UNREADABLE",
@@ -840,7 +844,7 @@ def _read_text_payload(target: QualityTarget) -> _TextPayload:
                 )
             member = members[0]
             return _TextPayload(
-                data=archive.read(member),
+                data=read_target_zip_member(archive, path, member),
                 source_member=member,
             )
     except _SourceReadError:
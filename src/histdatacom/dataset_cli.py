@@ -10,6 +10,7 @@ import sys
 from typing import Any
 
 from histdatacom.datasets import (
+    ArtifactVerificationCache,
     DatasetCatalog,
     DatasetContractError,
     DatasetOrigin,
@@ -53,12 +54,14 @@ def build_parser() -> argparse.ArgumentParser:
         "verify", help="Resolve and hash-verify a dataset version."
     )
     verify.add_argument("reference")
+    _add_verification_args(verify)
 
     replay = subparsers.add_parser(
         "replay",
         help="Replay an existing receipt without re-resolving its alias.",
     )
     replay.add_argument("receipt")
+    _add_verification_args(replay)
     return parser
 
 
@@ -94,13 +97,17 @@ def main(argv: Sequence[str] | None = None) -> int:
                     "receipt_path": str(Path(args.receipt).resolve()),
                 }
         elif args.command == "verify":
-            payload = catalog.verify(args.reference).to_dict()
+            payload = catalog.verify(
+                args.reference, **_verification_options(args)
+            ).to_dict()
         else:
             receipt = read_resolution_receipt(args.receipt)
             replayed = catalog.replay(receipt)
             payload = {
                 "resolution": replayed.to_dict(),
-                "verification": catalog.verify(replayed).to_dict(),
+                "verification": catalog.verify(
+                    replayed, **_verification_options(args)
+                ).to_dict(),
                 "alias_re_resolved": False,
             }
         _emit(payload)
@@ -130,6 +137,35 @@ def _add_scope_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--ensemble-member")
 
 
+def _add_verification_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--paranoid",
+        action="store_true",
+        help=(
+            "Re-hash every artifact even when the verification cache next to "
+            "the catalog says it is unchanged."
+        ),
+    )
+    parser.add_argument(
+        "--hash-jobs",
+        type=int,
+        default=1,
+        help="Threads used to hash artifacts that need a full SHA-256.",
+    )
+
+
+def _verification_options(args: argparse.Namespace) -> dict[str, Any]:
+    if args.hash_jobs < 1:
+        raise ValueError("--hash-jobs must be >= 1")
+    return {
+        "verification_cache": ArtifactVerificationCache.for_catalog(
+            args.catalog
+        ),
+        "paranoid": bool(args.paranoid),
+        "hash_jobs": int(args.hash_jobs),
+    }
+
+
 def _emit(payload: JSONValue) -> None:
     bounded = _bounded_value(payload)
     encoded = json.dumps(bounded, sort_keys=True, separators=(",", ":"))
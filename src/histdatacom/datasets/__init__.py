@@ -51,6 +51,11 @@ from histdatacom.datasets.projection import (
     project_observed_ascii_ticks_v2,
     synthetic_event_lineage_v2,
 )
+from histdatacom.datasets.verification import (
+    VERIFICATION_CACHE_SUFFIX,
+    ArtifactVerificationCache,
+    verification_cache_path,
+)
 
 __all__ = [
     "CANONICAL_TICK_ARTIFACT_KIND",
@@ -62,6 +67,8 @@ __all__ = [
     "FIXTURE_PROVIDER_ID",
     "HISTDATA_ADAPTER_ID",
     "HISTDATA_PROVIDER_ID",
+    "VERIFICATION_CACHE_SUFFIX",
+    "ArtifactVerificationCache",
     "CanonicalObservedPartitionV2",
     "DatasetAliasV1",
     "DatasetCatalog",
@@ -95,5 +102,6 @@ __all__ = [
     "project_observed_ascii_ticks_v2",
     "read_resolution_receipt",
     "synthetic_event_lineage_v2",
+    "verification_cache_path",
     "write_resolution_receipt",
 ]
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 import csv
 import hashlib
-import math
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
@@ -25,6 +24,10 @@ from histdatacom.datasets.contracts import (
     normalize_period,
     normalize_symbol,
 )
+from histdatacom.datasets.verification import (
+    ArtifactVerificationCache,
+    verify_artifact_refs,
+)
 from histdatacom.histdata_ascii import (
     MAX_HISTDATA_SOURCE_ORDER_REGRESSION_MS,
     MAX_HISTDATA_SOURCE_ORDER_REGRESSIONS_PER_PARTITION,
@@ -81,6 +84,10 @@ class ProviderAdapter(Protocol):
 class HistDataProviderAdapter:
     """Adapter for existing HistData Polars Arrow IPC ``.data`` caches."""
 
+    verification_cache: ArtifactVerificationCache | None = field(
+        default=None, compare=False
+    )
+
     @property
     def provider(self) -> SourceProviderDescriptorV1:
         return SourceProviderDescriptorV1(
@@ -231,7 +238,7 @@ class HistDataProviderAdapter:
 
     def read_partition(self, partition: CanonicalObservedPartitionV2) -> Any:
         _require_adapter_partition(partition, self.descriptor)
-        _verify_partition_artifact(partition)
+        _verify_partition_artifact(partition, cache=self.verification_cache)
         frame = _read_histdata_frame(Path(partition.artifact.path))
         validation = _validate_canonical_frame(
             frame,
@@ -258,6 +265,9 @@ class FixtureProviderAdapter:
     source_provider_id: str = FIXTURE_PROVIDER_ID
     licensing_policy: DatasetLicensingPolicy = DatasetLicensingPolicy.PUBLIC
     redistribution_allowed: bool = True
+    verification_cache: ArtifactVerificationCache | None = field(
+        default=None, compare=False
+    )
 
     @property
     def provider(self) -> SourceProviderDescriptorV1:
@@ -394,7 +404,7 @@ class FixtureProviderAdapter:
 
     def read_partition(self, partition: CanonicalObservedPartitionV2) -> Any:
         _require_adapter_partition(partition, self.descriptor)
-        _verify_partition_artifact(partition)
+        _verify_partition_artifact(partition, cache=self.verification_cache)
         frame = _read_fixture_frame(Path(partition.artifact.path))
         validation = _validate_canonical_frame(
             frame, Path(partition.artifact.path)
@@ -674,54 +684,62 @@ def _validate_canonical_frame(
             DatasetFailureCode.INCONSISTENT_COVERAGE,
             f"canonical tick partition is empty: {path}",
         )
-    timestamps = [
-        int(value) for value in frame.get_column("datetime").to_list()
-    ]
-    bids = frame.get_column("bid").to_list()
-    asks = frame.get_column("ask").to_list()
-    previous: int | None = None
-    regression_count = 0
-    maximum_regression = 0
-    for ordinal, (timestamp, bid_value, ask_value) in enumerate(
-        zip(timestamps, bids, asks, strict=True), start=1
+    import polars as pl  # pylint: disable=import-outside-toplevel
+
+    timestamp = pl.col("datetime").cast(pl.Int64, strict=False)
+    bid = pl.col("bid").cast(pl.Float64, strict=False)
+    ask = pl.col("ask").cast(pl.Float64, strict=False)
+    regression = (timestamp.shift(1) - timestamp).clip(lower_bound=0)
+    is_regression = (regression > 0).fill_null(False)
+    non_numeric = bid.is_null() | ask.is_null()
+    invalid_quote = non_numeric | ~(
+        bid.is_finite() & ask.is_finite() & (bid > 0.0) & (ask >= bid)
+    ).fill_null(False)
+    rejected_regression = is_regression & (
+        (regression > maximum_timestamp_regression_ms)
+        | (is_regression.cum_sum() > maximum_timestamp_regression_count)
+    ).fill_null(False)
+    summary = frame.select(
+        pl.arg_where(timestamp.is_null()).first().alias("first_null"),
+        pl.arg_where(non_numeric).first().alias("first_non_numeric"),
+        pl.arg_where(invalid_quote).first().alias("first_invalid_quote"),
+        pl.arg_where(rejected_regression).first().alias("first_regression"),
+        timestamp.min().alias("first_ms"),
+        timestamp.max().alias("last_ms"),
+        is_regression.sum().alias("regression_count"),
+        regression.max().fill_null(0).alias("maximum_regression"),
+    ).row(0, named=True)
+    first_null = summary["first_null"]
+    first_invalid_quote = summary["first_invalid_quote"]
+    first_regression = summary["first_regression"]
+    if first_invalid_quote is not None and (
+        first_regression is None or first_invalid_quote <= first_regression
     ):
-        try:
-            bid = float(bid_value)
-            ask = float(ask_value)
-        except (TypeError, ValueError) as err:
-            raise DatasetContractError(
-                DatasetFailureCode.MALFORMED_QUOTE,
-                f"partition row {ordinal} has non-numeric bid/ask",
-            ) from err
-        if (
-            not math.isfinite(bid)
-            or not math.isfinite(ask)
-            or bid <= 0.0
-            or ask < bid
-        ):
-            raise DatasetContractError(
-                DatasetFailureCode.MALFORMED_QUOTE,
-                f"partition row {ordinal} has invalid bid/ask",
-            )
-        if previous is not None and timestamp < previous:
-            regression = previous - timestamp
-            regression_count += 1
-            maximum_regression = max(maximum_regression, regression)
-            if (
-                regression > maximum_timestamp_regression_ms
-                or regression_count > maximum_timestamp_regression_count
-            ):
-                raise DatasetContractError(
-                    DatasetFailureCode.INCONSISTENT_COVERAGE,
-                    f"partition row {ordinal} timestamp regresses",
-                )
-        previous = timestamp
+        reason = (
+            "non-numeric bid/ask"
+            if first_invalid_quote == summary["first_non_numeric"]
+            else "invalid bid/ask"
+        )
+        raise DatasetContractError(
+            DatasetFailureCode.MALFORMED_QUOTE,
+            f"partition row {first_invalid_quote + 1} has {reason}",
+        )
+    if first_null is not None:
+        raise DatasetContractError(
+            DatasetFailureCode.AMBIGUOUS_CLOCK,
+            f"partition row {first_null + 1} has no integer timestamp",
+        )
+    if first_regression is not None:
+        raise DatasetContractError(
+            DatasetFailureCode.INCONSISTENT_COVERAGE,
+            f"partition row {first_regression + 1} timestamp regresses",
+        )
     return _CanonicalFrameValidation(
         row_count=row_count,
-        first_ms=min(timestamps),
-        last_ms=max(timestamps),
-        timestamp_regression_count=regression_count,
-        maximum_timestamp_regression_ms=maximum_regression,
+        first_ms=int(summary["first_ms"]),
+        last_ms=int(summary["last_ms"]),
+        timestamp_regression_count=int(summary["regression_count"]),
+        maximum_timestamp_regression_ms=int(summary["maximum_regression"]),
     )
 
 
@@ -743,23 +761,16 @@ def _require_adapter_partition(
         )
 
 
-def _verify_partition_artifact(partition: CanonicalObservedPartitionV2) -> None:
-    path = Path(partition.artifact.path)
-    if not path.is_file():
-        raise DatasetContractError(
-            DatasetFailureCode.ARTIFACT_MISSING,
-            f"partition artifact is missing: {path}",
-        )
-    if path.stat().st_size != partition.artifact.size_bytes:
-        raise DatasetContractError(
-            DatasetFailureCode.ARTIFACT_SIZE_MISMATCH,
-            f"partition artifact size changed: {path}",
-        )
-    if _file_sha256(path) != partition.artifact.sha256:
-        raise DatasetContractError(
-            DatasetFailureCode.ARTIFACT_HASH_MISMATCH,
-            f"partition artifact hash changed: {path}",
-        )
+def _verify_partition_artifact(
+    partition: CanonicalObservedPartitionV2,
+    *,
+    cache: ArtifactVerificationCache | None = None,
+) -> None:
+    verify_artifact_refs(
+        (partition.artifact,),
+        label="partition artifact",
+        cache=cache,
+    )
 
 
 def _match_expected_hash(actual: str, expected: str | None, path: Path) -> None:
@@ -32,7 +32,12 @@ from histdatacom.datasets.contracts import (
     normalize_period,
     normalize_symbol,
 )
-from histdatacom.runtime_contracts import ArtifactRef, JSONValue
+from histdatacom.datasets.verification import (
+    DEFAULT_VERIFICATION_HASH_JOBS,
+    ArtifactVerificationCache,
+    verify_artifact_refs,
+)
+from histdatacom.runtime_contracts import JSONValue
 
 DATASET_CATALOG_SCHEMA_VERSION = "histdatacom.dataset-catalog.v1"
 MAX_DATASET_CATALOG_BYTES = 16 * 1024 * 1024
@@ -436,21 +441,37 @@ class DatasetCatalog:
             )
 
     def verify(
-        self, reference: str | DatasetResolutionV1
+        self,
+        reference: str | DatasetResolutionV1,
+        *,
+        verification_cache: ArtifactVerificationCache | None = None,
+        paranoid: bool = False,
+        hash_jobs: int = DEFAULT_VERIFICATION_HASH_JOBS,
     ) -> DatasetVerificationV1:
-        """Hash-verify every partition and qualification evidence artifact."""
+        """Hash-verify every partition and qualification evidence artifact.
+
+        With a ``verification_cache``, files whose device, inode, size, and
+        mtime are unchanged since their last hash are not re-read;
+        ``paranoid`` hashes everything again.  Cold files are hashed on up
+        to ``hash_jobs`` threads.
+        """
         if isinstance(reference, DatasetResolutionV1):
             resolution = self.replay(reference)
         else:
             resolution = self.resolve(reference)
         version = self._version_map()[resolution.dataset_version_id]
-        hashes: list[str] = []
-        for partition in version.partitions:
-            _verify_artifact(partition.artifact)
-            hashes.append(partition.artifact.sha256)
-        for evidence in version.qualification_evidence:
-            _verify_artifact(evidence)
-            hashes.append(evidence.sha256)
+        artifacts = (
+            *(partition.artifact for partition in version.partitions),
+            *version.qualification_evidence,
+        )
+        verify_artifact_refs(
+            artifacts,
+            label="catalog artifact",
+            cache=verification_cache,
+            paranoid=paranoid,
+            hash_jobs=hash_jobs,
+        )
+        hashes = [artifact.sha256 for artifact in artifacts]
         return DatasetVerificationV1(
             dataset_version_id=version.dataset_version_id,
             manifest_sha256=version.manifest_sha256,
@@ -714,29 +735,6 @@ def _scope_matches_version(
             )
 
 
-def _verify_artifact(ref: ArtifactRef) -> None:
-    path = Path(ref.path)
-    if not path.is_file():
-        raise DatasetContractError(
-            DatasetFailureCode.ARTIFACT_MISSING,
-            f"catalog artifact is missing: {path}",
-        )
-    if path.stat().st_size != ref.size_bytes:
-        raise DatasetContractError(
-            DatasetFailureCode.ARTIFACT_SIZE_MISMATCH,
-            f"catalog artifact size differs: {path}",
-        )
-    digest = hashlib.sha256()
-    with path.open("rb") as source:
-        for chunk in iter(lambda: source.read(1024 * 1024), b""):
-            digest.update(chunk)
-    if digest.hexdigest() != ref.sha256:
-        raise DatasetContractError(
-            DatasetFailureCode.ARTIFACT_HASH_MISMATCH,
-            f"catalog artifact hash differs: {path}",
-        )
-
-
 def _unique(values: tuple[Any, ...], key: Any, name: str) -> None:
     identities = [key(item) for item in values]
     if len(set(identities)) != len(identities):
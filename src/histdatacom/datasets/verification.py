@@ -0,0 +1,212 @@
+"""Persistent SHA-256 verification cache for catalog artifacts."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from histdatacom.datasets.contracts import (
+    DatasetContractError,
+    DatasetFailureCode,
+)
+from histdatacom.runtime_contracts import ArtifactRef
+
+VERIFICATION_CACHE_SUFFIX = ".verified.sqlite3"
+DEFAULT_VERIFICATION_HASH_JOBS = 1
+_SHA256_CHUNK_SIZE = 1024 * 1024
+
+
+def verification_cache_path(catalog_path: str | Path) -> Path:
+    """Return the verification sidecar path stored next to a catalog."""
+    target = Path(catalog_path).expanduser().resolve()
+    return target.with_name(f"{target.name}{VERIFICATION_CACHE_SUFFIX}")
+
+
+class ArtifactVerificationCache:
+    """SQLite sidecar mapping file identity to a previously computed SHA-256.
+
+    Rows are keyed by resolved path and matched on device, inode, size, and
+    ``st_mtime_ns``.  A rewritten, replaced, or touched file therefore misses
+    the cache and is hashed again.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS verified_artifacts (
+                    path TEXT PRIMARY KEY,
+                    device INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    verified_at_utc TEXT NOT NULL
+                );
+                """)
+
+    @classmethod
+    def for_catalog(cls, catalog_path: str | Path) -> ArtifactVerificationCache:
+        """Open the sidecar cache that belongs to one catalog file."""
+        return cls(verification_cache_path(catalog_path))
+
+    def lookup(self, path: Path, stat: os.stat_result) -> str | None:
+        """Return the cached digest when ``path`` still has ``stat`` identity."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT sha256
+                FROM verified_artifacts
+                WHERE path = ?
+                    AND device = ?
+                    AND inode = ?
+                    AND size_bytes = ?
+                    AND mtime_ns = ?
+                """,
+                (
+                    str(path),
+                    stat.st_dev,
+                    stat.st_ino,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ),
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def record_many(
+        self,
+        entries: Iterable[tuple[Path, os.stat_result, str]],
+    ) -> None:
+        """Store freshly computed digests for their current file identity."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO verified_artifacts (
+                    path,
+                    device,
+                    inode,
+                    size_bytes,
+                    mtime_ns,
+                    sha256,
+                    verified_at_utc
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    device=excluded.device,
+                    inode=excluded.inode,
+                    size_bytes=excluded.size_bytes,
+                    mtime_ns=excluded.mtime_ns,
+                    sha256=excluded.sha256,
+                    verified_at_utc=excluded.verified_at_utc
+                """,
+                [
+                    (
+                        str(path),
+                        stat.st_dev,
+                        stat.st_ino,
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        digest,
+                        now,
+                    )
+                    for path, stat, digest in entries
+                ],
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+
+def verify_artifact_refs(
+    refs: Iterable[ArtifactRef],
+    *,
+    label: str,
+    cache: ArtifactVerificationCache | None = None,
+    paranoid: bool = False,
+    hash_jobs: int = DEFAULT_VERIFICATION_HASH_JOBS,
+) -> None:
+    """Fail closed unless every artifact still has its recorded size and hash.
+
+    Artifacts whose device, inode, size, and mtime match a cached digest skip
+    re-hashing unless ``paranoid`` is set.  The remaining files are hashed on
+    up to ``hash_jobs`` threads, and their digests are written back to the
+    cache.  Failures are reported in input order.
+    """
+    pending: list[tuple[ArtifactRef, Path, os.stat_result]] = []
+    checked: list[tuple[ArtifactRef, Path, str | None]] = []
+    for ref in refs:
+        path = Path(ref.path)
+        if not path.is_file():
+            raise DatasetContractError(
+                DatasetFailureCode.ARTIFACT_MISSING,
+                f"{label} is missing: {path}",
+            )
+        stat = path.stat()
+        if stat.st_size != ref.size_bytes:
+            raise DatasetContractError(
+                DatasetFailureCode.ARTIFACT_SIZE_MISMATCH,
+                f"{label} size differs: {path}",
+            )
+        cache_key = path.resolve()
+        cached = (
+            None if cache is None or paranoid else cache.lookup(cache_key, stat)
+        )
+        if cached is None:
+            pending.append((ref, cache_key, stat))
+        checked.append((ref, path, cached))
+
+    digests = _hash_files(
+        [path for _, path, _ in pending],
+        hash_jobs=hash_jobs,
+        label=label,
+    )
+    if cache is not None and pending:
+        cache.record_many(
+            (path, stat, digest)
+            for (_, path, stat), digest in zip(pending, digests, strict=True)
+        )
+    computed = iter(digests)
+    for ref, path, cached in checked:
+        digest = cached if cached is not None else next(computed)
+        if digest != ref.sha256:
+            raise DatasetContractError(
+                DatasetFailureCode.ARTIFACT_HASH_MISMATCH,
+                f"{label} hash differs: {path}",
+            )
+
+
+def _hash_files(
+    paths: list[Path],
+    *,
+    hash_jobs: int,
+    label: str,
+) -> list[str]:
+    workers = min(max(1, int(hash_jobs)), len(paths))
+    if workers <= 1:
+        return [_file_sha256(path, label=label) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(lambda path: _file_sha256(path, label=label), paths)
+        )
+
+
+def _file_sha256(path: Path, *, label: str) -> str:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as source:
+            for chunk in iter(lambda: source.read(_SHA256_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError as err:
+        raise DatasetContractError(
+            DatasetFailureCode.ARTIFACT_MISSING,
+            f"{label} cannot be hashed: {path}",
+        ) from err
+    return digest.hexdigest()
@@ -37,6 +37,8 @@ DEFAULT_HELPER_ARGS: dict[str, Any] = {
     "quality_fail_on": "error",
     "quality_max_errors": 0,
     "quality_max_warnings": 0,
+    "quality_jobs": 1,
+    "quality_incremental": False,
     "quality_preflight_evidence_allow_stale": False,
     "quality_preflight_evidence_max_age_seconds": 86400,
     "quality_preflight_evidence_path": "",
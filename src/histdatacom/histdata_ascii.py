@@ -7,13 +7,20 @@ semantics that must survive the backend migration to Polars.
 from __future__ import annotations
 
 import csv
+import json
 import math
+import os
+import threading
 import zipfile
+from collections import OrderedDict
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from histdatacom.stage_timing import StageTimer
 
 EST_NO_DST_OFFSET_MS = 18_000_000
 # Real HistData tick archives can preserve one one-hour source-order fallback
@@ -27,7 +34,24 @@ TICK = "T"
 
 TICK_COLUMNS = ("datetime", "bid", "ask", "vol")
 CACHE_FILENAME = ".data"
+DEFAULT_ASCII_CHUNK_BYTES = 8 * 1024 * 1024
+MIN_ASCII_CHUNK_BYTES = 64 * 1024
+# Parsing one block briefly holds its text, the Polars string and typed
+# columns, and the converted output; budget blocks well below the ceiling.
+ASCII_CHUNK_MEMORY_FACTOR = 8
 CACHE_FORMAT = "Polars Arrow IPC"
+# Version 2 caches are compressed IPC files written in fixed-size record
+# batches, each summarized in a sidecar footer index beside the ``.data`` file.
+CACHE_FORMAT_VERSION = 2
+CACHE_COMPRESSION = "zstd"
+CACHE_RECORD_BATCH_ROWS = 65_536
+CACHE_INDEX_SUFFIX = ".index"
+CACHE_COMPRESSIONS = ("uncompressed", "lz4", "zstd")
+CACHE_COMPRESSION_ENV = "HISTDATACOM_CACHE_COMPRESSION"
+# Opt-in shared reads: uncompressed caches are memory-mapped and every caller
+# in the process reuses one frame per (path, st_mtime_ns, st_size).
+CACHE_MEMORY_MAP_ENV = "HISTDATACOM_CACHE_MEMORY_MAP"
+MAPPED_CACHE_FRAME_LIMIT = 32
 LEGACY_CACHE_ERROR = (
     f"cannot read cache file as {CACHE_FORMAT}. Existing legacy caches must "
     f"be regenerated: delete the {CACHE_FILENAME} file and "
@@ -44,6 +68,96 @@ class CacheSummary:
     end: int
 
 
+@dataclass(frozen=True)
+class CacheBatchStats:
+    """Row span and ``datetime`` bounds of one cache record batch."""
+
+    offset: int
+    rows: int
+    datetime_min: int | None
+    datetime_max: int | None
+
+    def overlaps(
+        self, start_utc_ms: int | None, end_utc_ms: int | None
+    ) -> bool:
+        """Return whether the batch can hold rows in ``[start, end)``."""
+        if self.datetime_min is None or self.datetime_max is None:
+            return False
+        if start_utc_ms is not None and self.datetime_max < start_utc_ms:
+            return False
+        return end_utc_ms is None or self.datetime_min < end_utc_ms
+
+
+@dataclass(frozen=True)
+class CacheIndex:
+    """Footer index of a versioned cache, tied to the file it describes."""
+
+    format_version: int
+    compression: str
+    batch_rows: int
+    row_count: int
+    size_bytes: int
+    mtime_ns: int
+    batches: tuple[CacheBatchStats, ...]
+
+    def row_spans(
+        self,
+        start_utc_ms: int | None,
+        end_utc_ms: int | None,
+    ) -> tuple[tuple[int, int], ...]:
+        """Return merged ``(offset, length)`` spans overlapping a range."""
+        spans: list[tuple[int, int]] = []
+        for batch in self.batches:
+            if not batch.overlaps(start_utc_ms, end_utc_ms):
+                continue
+            if spans and sum(spans[-1]) == batch.offset:
+                spans[-1] = (spans[-1][0], spans[-1][1] + batch.rows)
+            else:
+                spans.append((batch.offset, batch.rows))
+        return tuple(spans)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON payload stored in the index sidecar."""
+        return {
+            "format_version": self.format_version,
+            "compression": self.compression,
+            "batch_rows": self.batch_rows,
+            "row_count": self.row_count,
+            "size_bytes": self.size_bytes,
+            "mtime_ns": self.mtime_ns,
+            "batches": [
+                [
+                    batch.offset,
+                    batch.rows,
+                    batch.datetime_min,
+                    batch.datetime_max,
+                ]
+                for batch in self.batches
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "CacheIndex":
+        """Rebuild an index from its JSON payload."""
+        return cls(
+            format_version=int(payload["format_version"]),
+            compression=str(payload["compression"]),
+            batch_rows=int(payload["batch_rows"]),
+            row_count=int(payload["row_count"]),
+            size_bytes=int(payload["size_bytes"]),
+            mtime_ns=int(payload["mtime_ns"]),
+            batches=tuple(
+                CacheBatchStats(
+                    offset=int(offset),
+                    rows=int(rows),
+                    datetime_min=None if low is None else int(low),
+                    datetime_max=None if high is None else int(high),
+                )
+                for offset, rows, low, high in payload["batches"]
+            ),
+        )
+
+
 @dataclass(frozen=True)
 class ParsedAsciiBatch:
     """Parsed HistData ASCII rows plus schema and cache summary."""
@@ -300,16 +414,21 @@ def _raw_polars_cast_expr(column: str) -> Any:
 def _single_csv_member_from_zip(path: Path) -> bytes:
     """Return the single CSV member payload from a HistData ZIP archive."""
     with zipfile.ZipFile(path) as archive:
-        names = tuple(
-            name
-            for name in archive.namelist()
-            if not name.endswith("/") and Path(name).suffix.lower() == ".csv"
-        )
-        if len(names) != 1:
-            raise ValueError("expected ZIP archive to contain one CSV file")
-        if filename_has_unsupported_raw_dimensions(names[0]):
-            raise ValueError("raw import supports ASCII tick inputs only")
-        return archive.read(names[0])
+        return archive.read(_single_csv_member_name(archive))
+
+
+def _single_csv_member_name(archive: zipfile.ZipFile) -> str:
+    """Return the single supported CSV member name in a HistData archive."""
+    names = tuple(
+        name
+        for name in archive.namelist()
+        if not name.endswith("/") and Path(name).suffix.lower() == ".csv"
+    )
+    if len(names) != 1:
+        raise ValueError("expected ZIP archive to contain one CSV file")
+    if filename_has_unsupported_raw_dimensions(names[0]):
+        raise ValueError("raw import supports ASCII tick inputs only")
+    return names[0]
 
 
 def filename_has_unsupported_raw_dimensions(filename: str | Path) -> bool:
@@ -360,16 +479,264 @@ def read_ascii_file_to_polars(path: Path, timeframe: str) -> Any:
     return _read_csv_to_polars(path, timeframe)
 
 
-def write_polars_cache(frame: Any, path: Path) -> None:
-    """Write a Polars dataframe cache using Arrow IPC payloads."""
+def ascii_chunk_bytes_for_memory_limit(memory_limit_bytes: int | None) -> int:
+    """Return the source block size that fits one parse in a memory ceiling."""
+    if memory_limit_bytes is None:
+        return DEFAULT_ASCII_CHUNK_BYTES
+    if memory_limit_bytes < 1:
+        raise ValueError("memory limit must be a positive number of bytes")
+    return max(
+        MIN_ASCII_CHUNK_BYTES,
+        min(
+            DEFAULT_ASCII_CHUNK_BYTES,
+            memory_limit_bytes // ASCII_CHUNK_MEMORY_FACTOR,
+        ),
+    )
+
+
+def iter_ascii_polars_chunks(
+    path: Path,
+    timeframe: str,
+    *,
+    chunk_bytes: int = DEFAULT_ASCII_CHUNK_BYTES,
+    timer: StageTimer | None = None,
+) -> Iterator[Any]:
+    """Yield UTC-millisecond tick frames from a CSV file or ZIP archive.
+
+    ZIP members are inflated incrementally and the source is parsed in
+    line-aligned blocks of about ``chunk_bytes`` with typed schema overrides,
+    so only one block of text is alive at a time.  Blocks with padded legacy
+    fields fall back to the trimmed string parse.  When ``timer`` is given,
+    source reads, CSV parsing, and datetime conversion are timed separately.
+    """
+    if filename_has_unsupported_raw_dimensions(path):
+        raise ValueError("raw import supports ASCII tick inputs only")
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be a positive integer")
+    columns_for_timeframe(timeframe)
+    timer = timer or StageTimer()
+    with ExitStack() as stack:
+        if path.suffix.lower() == ".zip":
+            read_phase = "zip_inflate"
+            archive = stack.enter_context(zipfile.ZipFile(path))
+            stream = stack.enter_context(
+                archive.open(_single_csv_member_name(archive))
+            )
+        else:
+            read_phase = "csv_read"
+            stream = stack.enter_context(path.open("rb"))
+        for block in timer.timed(
+            read_phase,
+            _iter_line_aligned_blocks(stream, chunk_bytes),
+        ):
+            with timer.span("csv_parse"):
+                frame = _read_ascii_block(block, timeframe)
+            with timer.span("datetime_convert"):
+                frame = convert_polars_datetime_to_utc_ms(frame, timeframe)
+            yield frame
+
+
+def _iter_line_aligned_blocks(stream: Any, chunk_bytes: int) -> Iterator[bytes]:
+    """Yield source blocks that end on a line boundary."""
+    remainder = b""
+    while True:
+        payload = stream.read(chunk_bytes)
+        if not payload:
+            break
+        block = remainder + payload
+        cut = block.rfind(b"\n") + 1
+        if cut == 0:
+            remainder = block
+            continue
+        remainder = block[cut:]
+        if block[:cut].strip():
+            yield block[:cut]
+    if remainder.strip():
+        yield remainder
+
+
+def _read_ascii_block(block: bytes, timeframe: str) -> Any:
+    """Parse one line-aligned source block into typed raw tick columns."""
+    import polars as pl
+
+    columns = list(columns_for_timeframe(timeframe))
+    try:
+        return pl.read_csv(
+            block,
+            has_header=False,
+            separator=delimiter_for_timeframe(timeframe),
+            new_columns=columns,
+            schema_overrides=raw_polars_schema_for_timeframe(timeframe),
+        ).with_columns(pl.col("datetime").str.strip_chars())
+    except pl.exceptions.ComputeError:
+        return _read_csv_to_polars(BytesIO(block), timeframe)
+
+
+_MAPPED_CACHE_FRAMES: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+_MAPPED_CACHE_LOCK = threading.Lock()
+
+
+def cache_compression() -> str:
+    """Return the configured cache compression codec."""
+    value = os.environ.get(CACHE_COMPRESSION_ENV, "").strip().lower()
+    if not value:
+        return CACHE_COMPRESSION
+    if value not in CACHE_COMPRESSIONS:
+        raise ValueError(
+            f"{CACHE_COMPRESSION_ENV} must be one of "
+            f"{', '.join(CACHE_COMPRESSIONS)}"
+        )
+    return value
+
+
+def cache_memory_map_enabled() -> bool:
+    """Return whether shared memory-mapped cache reads are opted in."""
+    value = os.environ.get(CACHE_MEMORY_MAP_ENV, "").strip().lower()
+    return value in {"1", "true", "yes", "on"}
+
+
+def clear_mapped_cache_frames() -> None:
+    """Drop every shared memory-mapped cache frame held by this process."""
+    with _MAPPED_CACHE_LOCK:
+        _MAPPED_CACHE_FRAMES.clear()
+
+
+def write_polars_cache(
+    frame: Any,
+    path: Path,
+    *,
+    compression: str | None = None,
+) -> CacheIndex:
+    """Write a versioned Polars cache and its footer index.
+
+    The frame is written as Arrow IPC in fixed-size record batches, ZSTD
+    compressed unless ``compression`` or ``HISTDATACOM_CACHE_COMPRESSION``
+    selects another codec; ``"uncompressed"`` keeps caches memory-mappable.
+    The index next to the file records each batch's ``datetime`` bounds.
+    """
+    codec = cache_compression() if compression is None else compression
+    if codec not in CACHE_COMPRESSIONS:
+        raise ValueError(f"unsupported cache compression: {codec}")
     _validate_cache_dimensions(frame)
-    frame.write_ipc(path)
+    frame.write_ipc(
+        path,
+        compression=codec,
+        record_batch_size=CACHE_RECORD_BATCH_ROWS,
+    )
+    stat = path.stat()
+    index = CacheIndex(
+        format_version=CACHE_FORMAT_VERSION,
+        compression=codec,
+        batch_rows=CACHE_RECORD_BATCH_ROWS,
+        row_count=frame.height,
+        size_bytes=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        batches=_cache_batch_stats(frame, CACHE_RECORD_BATCH_ROWS),
+    )
+    index_path = cache_index_path(path)
+    temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(index.to_dict()), encoding="utf-8")
+    temp_path.replace(index_path)
+    return index
+
+
+def cache_index_path(path: Path) -> Path:
+    """Return the footer-index sidecar path for a cache file."""
+    return path.with_name(f"{path.name}{CACHE_INDEX_SUFFIX}")
+
+
+def replace_polars_cache(source: Path, target: Path) -> Path:
+    """Move a written cache and its footer index over ``target``."""
+    source.replace(target)
+    source_index = cache_index_path(source)
+    target_index = cache_index_path(target)
+    if source_index.exists():
+        source_index.replace(target_index)
+    else:
+        target_index.unlink(missing_ok=True)
+    return target
 
 
-def read_polars_cache(path: Path) -> Any:
-    """Read a Polars Arrow IPC cache, or fail with migration guidance."""
+def read_cache_index(path: Path) -> CacheIndex | None:
+    """Return the current footer index for ``path``, or ``None``.
+
+    Unversioned caches, unreadable sidecars, and indexes written for a
+    different file size or modification time all read as ``None``.
+    """
+    try:
+        payload = json.loads(cache_index_path(path).read_text(encoding="utf-8"))
+        index = CacheIndex.from_dict(payload)
+        stat = path.stat()
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if (
+        index.format_version != CACHE_FORMAT_VERSION
+        or index.size_bytes != stat.st_size
+        or index.mtime_ns != stat.st_mtime_ns
+    ):
+        return None
+    return index
+
+
+def _cache_batch_stats(
+    frame: Any,
+    batch_rows: int,
+) -> tuple[CacheBatchStats, ...]:
     import polars as pl
 
+    if "datetime" not in frame.columns or frame.height == 0:
+        return ()
+    stats = (
+        frame.select(pl.col("datetime").cast(pl.Int64))
+        .with_row_index("_row")
+        .group_by((pl.col("_row") // batch_rows).alias("_batch"))
+        .agg(
+            pl.len().alias("rows"),
+            pl.col("datetime").min().alias("low"),
+            pl.col("datetime").max().alias("high"),
+        )
+        .sort("_batch")
+    )
+    return tuple(
+        CacheBatchStats(
+            offset=int(batch) * batch_rows,
+            rows=int(rows),
+            datetime_min=low,
+            datetime_max=high,
+        )
+        for batch, rows, low, high in stats.iter_rows()
+    )
+
+
+def read_polars_cache(
+    path: Path,
+    *,
+    start_utc_ms: int | None = None,
+    end_utc_ms: int | None = None,
+    memory_map: bool | None = None,
+) -> Any:
+    """Read a Polars Arrow IPC cache, or fail with migration guidance.
+
+    With a half-open ``[start_utc_ms, end_utc_ms)`` range, versioned caches
+    decode only the record batches whose footer statistics overlap it.
+    ``memory_map`` (default: ``HISTDATACOM_CACHE_MEMORY_MAP``) returns a
+    frame shared by every whole-file reader in the process; uncompressed
+    caches are mapped zero-copy when pyarrow is installed.
+    """
+    import polars as pl
+
+    if memory_map is None:
+        memory_map = cache_memory_map_enabled()
+    if memory_map and start_utc_ms is None and end_utc_ms is None:
+        return _read_mapped_polars_cache(path)
+    if start_utc_ms is not None or end_utc_ms is not None:
+        frame = scan_polars_cache(
+            path,
+            start_utc_ms=start_utc_ms,
+            end_utc_ms=end_utc_ms,
+        ).collect()
+        _validate_cache_dimensions(frame)
+        return frame
     try:
         frame = pl.read_ipc(path)
     except Exception as err:
@@ -378,6 +745,80 @@ def read_polars_cache(path: Path) -> Any:
     return frame
 
 
+def _read_mapped_polars_cache(path: Path) -> Any:
+    try:
+        stat = path.stat()
+    except OSError as err:
+        raise ValueError(LEGACY_CACHE_ERROR) from err
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _MAPPED_CACHE_LOCK:
+        frame = _MAPPED_CACHE_FRAMES.get(key)
+        if frame is not None:
+            _MAPPED_CACHE_FRAMES.move_to_end(key)
+            return frame
+    try:
+        frame = _map_ipc_file(path)
+    except Exception as err:
+        raise ValueError(LEGACY_CACHE_ERROR) from err
+    _validate_cache_dimensions(frame)
+    with _MAPPED_CACHE_LOCK:
+        frame = _MAPPED_CACHE_FRAMES.setdefault(key, frame)
+        _MAPPED_CACHE_FRAMES.move_to_end(key)
+        while len(_MAPPED_CACHE_FRAMES) > MAPPED_CACHE_FRAME_LIMIT:
+            _MAPPED_CACHE_FRAMES.popitem(last=False)
+    return frame
+
+
+def _map_ipc_file(path: Path) -> Any:
+    import polars as pl
+
+    try:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+        import pyarrow.ipc as ipc  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return pl.read_ipc(path)
+    table = ipc.open_file(pa.memory_map(str(path))).read_all()
+    return pl.from_arrow(table, rechunk=False)
+
+
+def scan_polars_cache(
+    path: Path,
+    *,
+    start_utc_ms: int | None = None,
+    end_utc_ms: int | None = None,
+) -> Any:
+    """Lazily scan a Polars Arrow IPC cache, or fail with migration guidance.
+
+    Only the IPC footer is read here; projections and predicates applied to
+    the returned ``LazyFrame`` are pushed down into the scan.  A half-open
+    ``[start_utc_ms, end_utc_ms)`` range is applied as a predicate and, for
+    versioned caches, narrowed to the overlapping record batches first.
+    """
+    import polars as pl
+
+    try:
+        frame = pl.scan_ipc(path)
+        frame.collect_schema()
+    except Exception as err:
+        raise ValueError(LEGACY_CACHE_ERROR) from err
+    if start_utc_ms is None and end_utc_ms is None:
+        return frame
+    index = read_cache_index(path)
+    if index is not None:
+        spans = index.row_spans(start_utc_ms, end_utc_ms)
+        frame = (
+            pl.concat([frame.slice(offset, rows) for offset, rows in spans])
+            if spans
+            else frame.head(0)
+        )
+    predicates = []
+    if start_utc_ms is not None:
+        predicates.append(pl.col("datetime") >= start_utc_ms)
+    if end_utc_ms is not None:
+        predicates.append(pl.col("datetime") < end_utc_ms)
+    return frame.filter(pl.all_horizontal(predicates))
+
+
 def _validate_cache_dimensions(frame: Any) -> None:
     """Reject enriched caches that declare retired raw dimensions."""
     columns = set(getattr(frame, "columns", ()))
@@ -460,6 +901,27 @@ def merge_batches(
     return tuple(row for batch in ordered for row in batch.rows)
 
 
+_INFLUX_EXCLUDED_FIELD_COLUMNS = frozenset(
+    {
+        "datetime",
+        "bid",
+        "ask",
+        "vol",
+        "training_schema_version",
+        "series_id",
+        "row_id",
+        "symbol",
+        "format",
+        "timeframe",
+        "source",
+        "period",
+    }
+)
+_INFLUX_DEFAULT_SOURCE = "histdata.com"
+_INFLUX_OPTIONAL_TAGS = ("period", "row_id")
+_UNSUPPORTED = object()
+
+
 def format_influx_line(
     pair: str,
     data_format: str,
@@ -508,7 +970,7 @@ def _influx_tags(
     data_format: str,
     timeframe: str,
 ) -> str:
-    source = str(values.get("source") or "histdata.com")
+    source = str(values.get("source") or _INFLUX_DEFAULT_SOURCE)
     tags = {
         "source": source,
         "format": str(values.get("format") or data_format),
@@ -530,22 +992,8 @@ def _influx_fields(values: Mapping[str, Any]) -> str:
     fields: list[str] = []
     _append_influx_field(fields, "bidquote", values.get("bid"))
     _append_influx_field(fields, "askquote", values.get("ask"))
-    excluded = {
-        "datetime",
-        "bid",
-        "ask",
-        "vol",
-        "training_schema_version",
-        "series_id",
-        "row_id",
-        "symbol",
-        "format",
-        "timeframe",
-        "source",
-        "period",
-    }
     for name, value in values.items():
-        if name in excluded:
+        if name in _INFLUX_EXCLUDED_FIELD_COLUMNS:
             continue
         _append_influx_field(fields, name, value)
     return ",".join(fields)
@@ -589,3 +1037,240 @@ def _escape_influx_key(value: Any) -> str:
         .replace(",", "\\,")
         .replace("=", "\\=")
     )
+
+
+@dataclass(frozen=True)
+class InfluxLineEncoder:
+    """Columnar line-protocol encoder planned once for one cache frame.
+
+    The measurement and any tag that is constant across the cache are
+    rendered once; per-row tags and fields are assembled with Polars string
+    expressions.  Frames with column types the expressions do not cover fall
+    back to ``format_influx_line`` so the payload stays byte-identical.
+    """
+
+    pair: str
+    data_format: str
+    timeframe: str
+    columns: tuple[str, ...]
+    line_expr: Any | None
+
+    def encode(self, frame: Any) -> bytes:
+        """Return newline-delimited line protocol for one frame slice."""
+        if frame.height < 1:
+            return b""
+        if self.line_expr is None:
+            return "\n".join(
+                format_influx_line(
+                    self.pair,
+                    self.data_format,
+                    self.timeframe,
+                    row,
+                    columns=self.columns,
+                )
+                for row in frame.iter_rows()
+            ).encode("utf-8")
+        lines = frame.select(self.line_expr).to_series()
+        return str(lines.str.join("\n").item()).encode("utf-8")
+
+
+def influx_line_encoder(
+    pair: str,
+    data_format: str,
+    timeframe: str,
+    frame: Any,
+) -> InfluxLineEncoder:
+    """Plan a batch line-protocol encoder for a raw or enriched tick cache."""
+    _validate_influx_dimensions(data_format, timeframe)
+    for column in ("format", "timeframe"):
+        if column not in frame.columns:
+            continue
+        for value in frame.get_column(column).unique().to_list():
+            _validate_influx_dimensions(
+                str((value if column == "format" else None) or data_format),
+                str((value if column == "timeframe" else None) or timeframe),
+            )
+    return InfluxLineEncoder(
+        pair=pair,
+        data_format=data_format,
+        timeframe=timeframe,
+        columns=tuple(frame.columns),
+        line_expr=_influx_line_expr(pair, data_format, timeframe, frame),
+    )
+
+
+def encode_influx_lines(
+    pair: str,
+    data_format: str,
+    timeframe: str,
+    frame: Any,
+) -> bytes:
+    """Return line protocol for every row of a Polars cache frame."""
+    return influx_line_encoder(pair, data_format, timeframe, frame).encode(
+        frame
+    )
+
+
+def _influx_line_expr(
+    pair: str,
+    data_format: str,
+    timeframe: str,
+    frame: Any,
+) -> Any | None:
+    import polars as pl
+
+    schema = frame.schema
+    tag_defaults = {
+        "source": _INFLUX_DEFAULT_SOURCE,
+        "format": data_format,
+        "timeframe": timeframe,
+    }
+    tags: list[Any] = []
+    for key in (*tag_defaults, *_INFLUX_OPTIONAL_TAGS):
+        tag = _influx_tag_expr(frame, key, tag_defaults.get(key))
+        if tag is _UNSUPPORTED:
+            return None
+        if tag is not None:
+            tags.append(tag)
+
+    fields: list[Any] = []
+    field_columns = [("bidquote", "bid"), ("askquote", "ask")]
+    field_columns.extend(
+        (name, name)
+        for name in frame.columns
+        if name not in _INFLUX_EXCLUDED_FIELD_COLUMNS
+    )
+    for name, column in field_columns:
+        if column not in schema:
+            continue
+        value = _influx_field_value_expr(pl.col(column), schema[column])
+        if value is _UNSUPPORTED:
+            return None
+        if value is not None:
+            fields.append(pl.lit(f"{_escape_influx_key(name)}=") + value)
+
+    timestamp_column = "datetime" if "datetime" in schema else frame.columns[0]
+    if not schema[timestamp_column].is_integer():
+        return None
+    timestamp = pl.col(timestamp_column).cast(pl.String).fill_null("None")
+    return pl.concat_str(
+        [
+            pl.lit(f"{_escape_influx_key(pair)},"),
+            pl.concat_str(tags, separator=",", ignore_nulls=True),
+            pl.lit(" "),
+            (
+                pl.concat_str(fields, separator=",", ignore_nulls=True)
+                if fields
+                else pl.lit("")
+            ),
+            pl.lit(" "),
+            timestamp,
+        ]
+    ).alias("line")
+
+
+def _influx_tag_expr(frame: Any, key: str, default: str | None) -> Any:
+    """Return a tag literal, a per-row tag expression, or ``None``."""
+    import polars as pl
+
+    if key not in frame.columns:
+        if default is None:
+            return None
+        return pl.lit(_influx_tag_text(key, default))
+
+    column = frame.get_column(key)
+    if column.n_unique() == 1:
+        text = _influx_tag_text(key, _influx_tag_value(column[0], default))
+        return None if text is None else pl.lit(text)
+
+    dtype = column.dtype
+    if not (dtype.is_integer() or dtype in (pl.String, pl.Categorical)):
+        return _UNSUPPORTED
+    value = pl.col(key).cast(pl.String)
+    if default is not None:
+        empty = value.is_null() | (value == "")
+        if dtype.is_integer():
+            empty = value.is_null() | (pl.col(key) == 0)
+        value = pl.when(empty).then(pl.lit(default)).otherwise(value)
+    else:
+        value = pl.when(value != "").then(value)
+    return pl.lit(f"{_escape_influx_key(key)}=") + _escape_influx_key_expr(
+        value
+    )
+
+
+def _influx_tag_value(value: Any, default: str | None) -> Any:
+    if default is None:
+        return value
+    return value or default
+
+
+def _influx_tag_text(key: str, value: Any) -> str | None:
+    if value in (None, ""):
+        return None
+    return f"{_escape_influx_key(key)}={_escape_influx_key(value)}"
+
+
+def _influx_field_value_expr(expr: Any, dtype: Any) -> Any:
+    """Return a field-value expression, ``None`` to skip, or unsupported."""
+    import polars as pl
+
+    if dtype == pl.Null:
+        return None
+    if dtype == pl.Boolean:
+        return (
+            pl.when(expr).then(pl.lit("true")).when(~expr).then(pl.lit("false"))
+        )
+    if dtype.is_integer():
+        return expr.cast(pl.String) + pl.lit("i")
+    if dtype.is_float():
+        return pl.when(expr.is_finite()).then(_python_float_text_expr(expr))
+    if dtype in (pl.String, pl.Categorical) or isinstance(dtype, pl.Enum):
+        escaped = (
+            expr.cast(pl.String)
+            .str.replace_all("\\", "\\\\", literal=True)
+            .str.replace_all('"', '\\"', literal=True)
+        )
+        return pl.lit('"') + escaped + pl.lit('"')
+    return _UNSUPPORTED
+
+
+def _python_float_text_expr(expr: Any) -> Any:
+    """Render floats exactly as Python ``str(float)`` does.
+
+    Polars and Python both emit the shortest round-tripping digits, but they
+    switch to scientific notation at different magnitudes and Polars does not
+    zero-pad single-digit exponents.
+    """
+    import polars as pl
+
+    text = expr.cast(pl.Float64).cast(pl.String)
+    small = text.str.extract_groups(r"^(-?)0\.0000(0*)([0-9])([0-9]*)$")
+    fraction = small.struct.field("4")
+    scientific = pl.concat_str(
+        [
+            small.struct.field("1"),
+            small.struct.field("3"),
+            pl.when(fraction != "")
+            .then(pl.lit(".") + fraction)
+            .otherwise(pl.lit("")),
+            pl.lit("e-"),
+            (small.struct.field("2").str.len_chars() + 5)
+            .cast(pl.String)
+            .str.zfill(2),
+        ]
+    )
+    return (
+        pl.when(small.struct.field("3").is_not_null())
+        .then(scientific)
+        .otherwise(text.str.replace(r"e-([0-9])$", "e-0${1}"))
+    )
+
+
+def _escape_influx_key_expr(expr: Any) -> Any:
+    return (
+        expr.str.replace_all("\\", "\\\\", literal=True)
+        .str.replace_all(" ", "\\ ", literal=True)
+        .str.replace_all(",", "\\,", literal=True)
+        .str.replace_all("=", "\\=", literal=True)
+    )
@@ -161,6 +161,8 @@ class RuntimeContext:
     quality_fail_on: str
     quality_max_errors: int
     quality_max_warnings: int
+    quality_jobs: int
+    quality_incremental: bool
     quality_preflight: bool
     quality_preflight_evidence_allow_stale: bool
     quality_preflight_evidence_max_age_seconds: int
@@ -620,6 +622,8 @@ def _resolve_runtime_context(options: Options) -> RuntimeContext:
         quality_fail_on=str(args["quality_fail_on"]),
         quality_max_errors=int(args["quality_max_errors"]),
         quality_max_warnings=int(args["quality_max_warnings"]),
+        quality_jobs=int(args["quality_jobs"]),
+        quality_incremental=bool(args["quality_incremental"]),
         quality_preflight=bool(args["quality_preflight"]),
         quality_preflight_evidence_allow_stale=bool(
             args["quality_preflight_evidence_allow_stale"]
@@ -1415,6 +1419,7 @@ def main(
         cli_args,
         {
             "analytics",
+            "bench",
             "cleanup",
             "datasets",
             "groups",
@@ -1424,6 +1429,12 @@ def main(
             "runtime",
         },
     )
+    if not options and routed_command == "bench":
+        from histdatacom.bench_cli import main as bench_main
+
+        return bench_main(
+            remove_routed_command_from_cli_args(cli_args, "bench")
+        )
     if not options and routed_command == "cleanup":
         from histdatacom.cleanup_cli import main as cleanup_main
 
@@ -22,6 +22,12 @@ from histdatacom.exceptions import (
     InfluxDependencyError,
 )
 from histdatacom.histdata_ascii import format_influx_line
+from histdatacom.influx_bulk import (
+    INFLUX_BULK_WRITER,
+    InfluxBulkWriter,
+    influx_max_in_flight,
+    influx_writer_kind,
+)
 from histdatacom.helper_args import helper_runtime_args
 from histdatacom.legacy_boundary import warn_legacy_side_effect
 from histdatacom.observability import ProgressState, progress_increment
@@ -31,7 +37,7 @@ from histdatacom.utils import check_installed_module, load_influx_yaml
 if TYPE_CHECKING:
     from histdatacom.records import Record
 
-LineSink = Callable[[list[str]], None]
+LineSink = Callable[[bytes], None]
 INFLUX_CONFIG_FIELDS = (
     "INFLUX_ORG",
     "INFLUX_BUCKET",
@@ -75,7 +81,7 @@ class Influx:  # noqa:H601
             unit="records",
             status=WorkStatus.INFLUX_UPLOAD,
         )
-        with InfluxBatchWriter(runtime_args) as writer:
+        with influx_batch_writer(runtime_args) as writer:
             with Progress(
                 TextColumn(text_format="[cyan]Uploading to InfluxDB"),
                 BarColumn(),
@@ -201,8 +207,8 @@ class InfluxBatchWriter:
         """Close the underlying client resources."""
         self.close()
 
-    def write_lines(self, lines: list[str]) -> None:
-        """Write one bounded line-protocol batch."""
+    def write_lines(self, lines: list[str] | bytes) -> None:
+        """Write one bounded line-protocol batch or encoded payload."""
         if not lines:
             return
 
@@ -223,15 +229,31 @@ class InfluxBatchWriter:
         self.close()
 
 
+def influx_batch_writer(
+    args: Mapping[str, Any],
+) -> InfluxBatchWriter | InfluxBulkWriter:
+    """Return the Influx writer selected by ``HISTDATACOM_INFLUX_WRITER``.
+
+    The default is the ``influxdb_client`` writer; ``bulk`` selects the
+    pooled, gzip-compressed :class:`InfluxBulkWriter`.
+    """
+    if influx_writer_kind() != INFLUX_BULK_WRITER:
+        return InfluxBatchWriter(args)
+    return InfluxBulkWriter(
+        _args_with_influx_config(args),
+        max_in_flight=influx_max_in_flight(),
+    )
+
+
 def _line_sink(emit_lines: LineSink | Any) -> LineSink:
     if callable(emit_lines):
 
-        def call_sink(lines: list[str]) -> None:
+        def call_sink(lines: bytes) -> None:
             emit_lines(lines)
 
         return call_sink
 
-    def put_sink(lines: list[str]) -> None:
+    def put_sink(lines: bytes) -> None:
         emit_lines.put(lines)
 
     return put_sink
@@ -0,0 +1,316 @@
+"""Pooled, gzip-compressed bulk writes to the InfluxDB v2 write API."""
+
+from __future__ import annotations
+
+import gzip
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Mapping
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from histdatacom.exceptions import InfluxConfigurationError, InfluxImportError
+
+INFLUX_WRITER_ENV = "HISTDATACOM_INFLUX_WRITER"
+INFLUX_MAX_IN_FLIGHT_ENV = "HISTDATACOM_INFLUX_MAX_IN_FLIGHT"
+INFLUX_CLIENT_WRITER = "client"
+INFLUX_BULK_WRITER = "bulk"
+DEFAULT_INFLUX_MAX_IN_FLIGHT = 4
+DEFAULT_INFLUX_BATCH_LINES = 5000
+DEFAULT_INFLUX_MAX_RETRIES = 5
+DEFAULT_INFLUX_WRITE_TIMEOUT_SECONDS = 30.0
+INFLUX_RETRY_BASE_SECONDS = 0.5
+INFLUX_RETRY_MAX_SECONDS = 30.0
+INFLUX_POOL_CONNECTIONS = 16
+INFLUX_GZIP_LEVEL = 1
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_BISECT_STATUS_CODES = frozenset({400, 413, 422})
+_ERROR_BODY_LIMIT = 512
+
+
+class InfluxBulkWriter:
+    """Write line protocol to ``/api/v2/write`` on background threads.
+
+    Payloads from successive ``write_lines`` calls are coalesced into
+    bodies of about ``batch_lines`` lines, gzip-compressed, and posted
+    through a process-wide pooled session.  At most ``max_in_flight``
+    bodies are outstanding; further writes block until one finishes.
+
+    Throttling, server errors, and network failures are retried with
+    jittered exponential backoff.  A 400, 413, or 422 response splits the
+    body in half and retries each half, so only the offending lines are
+    rejected.  Rejected lines and exhausted retries are raised by the next
+    ``write_lines`` call or by ``flush``.
+    """
+
+    def __init__(
+        self,
+        args: Mapping[str, Any],
+        *,
+        max_in_flight: int = DEFAULT_INFLUX_MAX_IN_FLIGHT,
+        batch_lines: int = DEFAULT_INFLUX_BATCH_LINES,
+        max_retries: int = DEFAULT_INFLUX_MAX_RETRIES,
+        timeout: float = DEFAULT_INFLUX_WRITE_TIMEOUT_SECONDS,
+        session: requests.Session | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        missing = [
+            key
+            for key in ("INFLUX_ORG", "INFLUX_BUCKET", "INFLUX_URL")
+            if not args.get(key)
+        ]
+        if missing:
+            raise InfluxConfigurationError(
+                f"InfluxDB bulk writes require {', '.join(missing)}."
+            )
+        self.write_url = f"{str(args['INFLUX_URL']).rstrip('/')}/api/v2/write"
+        self.params = {
+            "org": str(args["INFLUX_ORG"]),
+            "bucket": str(args["INFLUX_BUCKET"]),
+            "precision": "ms",
+        }
+        self.headers = {
+            "Content-Encoding": "gzip",
+            "Content-Type": "text/plain; charset=utf-8",
+        }
+        if args.get("INFLUX_TOKEN"):
+            self.headers["Authorization"] = f"Token {args['INFLUX_TOKEN']}"
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.batch_lines = max(1, int(batch_lines))
+        self.max_retries = max(0, int(max_retries))
+        self.timeout = timeout
+        self.session = session or shared_influx_session()
+        self._sleep = sleep
+        self._jitter = jitter
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight,
+            thread_name_prefix="influx-write",
+        )
+        self._pending: list[bytes] = []
+        self._pending_lines = 0
+        self._futures: set[Future[None]] = set()
+        self._failure: BaseException | None = None
+        self._rejection = ""
+        self._lock = threading.Lock()
+        self.batches_written = 0
+        self.lines_written = 0
+        self.lines_rejected = 0
+        self.retries = 0
+
+    def __enter__(self) -> "InfluxBulkWriter":
+        """Return this writer for context-managed imports."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Flush outstanding bodies and stop the writer threads."""
+        self.close()
+
+    def write_lines(self, lines: list[str] | bytes) -> None:
+        """Queue one line-protocol batch, blocking while the window is full."""
+        self._raise_failure()
+        payload = (
+            lines if isinstance(lines, bytes) else "\n".join(lines).encode()
+        )
+        payload = payload.strip(b"\n")
+        if not payload:
+            return
+        self._pending.append(payload)
+        self._pending_lines += payload.count(b"\n") + 1
+        if self._pending_lines >= self.batch_lines:
+            self._submit_pending()
+
+    def flush(self) -> None:
+        """Send any coalesced lines and wait for every outstanding body."""
+        self._submit_pending()
+        with self._lock:
+            futures = tuple(self._futures)
+        wait(futures)
+        self._raise_failure()
+        if self.lines_rejected:
+            raise InfluxImportError(
+                f"InfluxDB rejected {self.lines_rejected} line(s): "
+                f"{self._rejection}",
+                code="INFLUX_WRITE_REJECTED",
+                retryable=False,
+                detail={"rejected_line_count": self.lines_rejected},
+            )
+
+    def close(self) -> None:
+        """Flush outstanding bodies and stop the writer threads."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def terminate(self) -> None:
+        """Compatibility alias for interrupt handlers."""
+        self.close()
+
+    def _submit_pending(self) -> None:
+        if not self._pending:
+            return
+        body = b"\n".join(self._pending)
+        self._pending = []
+        self._pending_lines = 0
+        self._slots.acquire()
+        future = self._executor.submit(self._write_body, body)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._body_finished)
+
+    def _body_finished(self, future: Future[None]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+            error = future.exception()
+            if error is not None and self._failure is None:
+                self._failure = error
+        self._slots.release()
+
+    def _raise_failure(self) -> None:
+        with self._lock:
+            failure = self._failure
+        if failure is not None:
+            raise failure
+
+    def _write_body(self, body: bytes) -> None:
+        self._write_bisecting(body.split(b"\n"))
+
+    def _write_bisecting(self, lines: list[bytes]) -> None:
+        status, message = self._post(b"\n".join(lines))
+        if status < 300:
+            with self._lock:
+                self.batches_written += 1
+                self.lines_written += len(lines)
+            return
+        if status not in _BISECT_STATUS_CODES:
+            raise InfluxImportError(
+                f"InfluxDB write failed with HTTP {status}: {message}",
+                code="INFLUX_WRITE_FAILED",
+                retryable=False,
+                detail={"status_code": status},
+            )
+        if len(lines) == 1:
+            with self._lock:
+                self.lines_rejected += 1
+                self._rejection = self._rejection or message
+            return
+        middle = len(lines) // 2
+        self._write_bisecting(lines[:middle])
+        self._write_bisecting(lines[middle:])
+
+    def _post(self, body: bytes) -> tuple[int, str]:
+        data = gzip.compress(body, compresslevel=INFLUX_GZIP_LEVEL)
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(
+                    self.write_url,
+                    params=self.params,
+                    headers=self.headers,
+                    data=data,
+                    timeout=self.timeout,
+                )
+            except requests.RequestException as err:
+                if attempt >= self.max_retries:
+                    raise _retryable_write_error(str(err)) from err
+                self._backoff(attempt, None)
+                attempt += 1
+                continue
+            with response:
+                status = response.status_code
+                message = response.text[:_ERROR_BODY_LIMIT]
+                retry_after = response.headers.get("Retry-After")
+            if status not in _RETRY_STATUS_CODES:
+                return status, message
+            if attempt >= self.max_retries:
+                raise _retryable_write_error(
+                    f"InfluxDB write failed with HTTP {status}: {message}"
+                )
+            self._backoff(attempt, retry_after)
+            attempt += 1
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> None:
+        with self._lock:
+            self.retries += 1
+        ceiling = min(
+            INFLUX_RETRY_MAX_SECONDS,
+            INFLUX_RETRY_BASE_SECONDS * 2**attempt,
+        )
+        delay = ceiling * self._jitter()
+        try:
+            delay = max(delay, float(retry_after or 0))
+        except ValueError:
+            pass
+        self._sleep(min(delay, INFLUX_RETRY_MAX_SECONDS))
+
+
+_SHARED_SESSIONS: dict[int, requests.Session] = {}
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def shared_influx_session() -> requests.Session:
+    """Return this process's pooled session for InfluxDB writes.
+
+    A forked child gets its own session instead of the parent's sockets.
+    """
+    pid = os.getpid()
+    with _SHARED_SESSION_LOCK:
+        session = _SHARED_SESSIONS.get(pid)
+        if session is None:
+            _SHARED_SESSIONS.clear()
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=INFLUX_POOL_CONNECTIONS,
+                pool_maxsize=INFLUX_POOL_CONNECTIONS,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SHARED_SESSIONS[pid] = session
+        return session
+
+
+def influx_writer_kind() -> str:
+    """Return the configured Influx writer: ``client`` or ``bulk``."""
+    value = (os.environ.get(INFLUX_WRITER_ENV) or INFLUX_CLIENT_WRITER).strip()
+    kind = value.lower()
+    if kind not in {INFLUX_CLIENT_WRITER, INFLUX_BULK_WRITER}:
+        raise InfluxConfigurationError(
+            f"{INFLUX_WRITER_ENV} must be '{INFLUX_CLIENT_WRITER}' or "
+            f"'{INFLUX_BULK_WRITER}': {value!r}"
+        )
+    return kind
+
+
+def influx_max_in_flight() -> int:
+    """Return the configured number of concurrent bulk write bodies."""
+    value = os.environ.get(INFLUX_MAX_IN_FLIGHT_ENV) or None
+    if value is None:
+        return DEFAULT_INFLUX_MAX_IN_FLIGHT
+    try:
+        max_in_flight = int(value)
+    except ValueError as err:
+        raise _invalid_max_in_flight(value) from err
+    if max_in_flight < 1:
+        raise _invalid_max_in_flight(value)
+    return max_in_flight
+
+
+def _invalid_max_in_flight(value: str) -> InfluxConfigurationError:
+    return InfluxConfigurationError(
+        f"{INFLUX_MAX_IN_FLIGHT_ENV} must be a positive integer: {value!r}"
+    )
+
+
+def _retryable_write_error(message: str) -> InfluxImportError:
+    return InfluxImportError(
+        message,
+        code="INFLUX_IMPORT_RETRYABLE",
+        retryable=True,
+        detail={"idempotent_retry": True},
+    )
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 from histdatacom.runtime_contracts import (
     ArtifactRef,
@@ -18,6 +23,7 @@ from histdatacom.runtime_contracts import (
     WorkStatus,
     derive_work_id,
 )
+from histdatacom.stage_timing import summarize_stage_timings
 
 MANIFEST_DIRECTORY = ".histdatacom"
 MANIFEST_DB_FILENAME = "manifest-status.sqlite3"
@@ -34,6 +40,15 @@ LIVE_SNAPSHOT_ARTIFACT_LIMIT = 200
 LIVE_STATUS_EVENT_RETENTION_LIMIT = 200
 LIVE_STAGE_RESULT_RETENTION_LIMIT = 25
 LIVE_ARTIFACT_RETENTION_LIMIT = 200
+MANIFEST_CACHED_STATEMENTS = 256
+MANIFEST_MMAP_SIZE_BYTES = 64 << 20
+MANIFEST_POOL_CONNECTIONS_PER_THREAD = 8
+REPOSITORY_PAIR_ORDERS = {
+    "pair_asc": "pair ASC",
+    "pair_dsc": "pair DESC",
+    "start_asc": "start_yearmonth ASC, pair ASC",
+    "start_dsc": "start_yearmonth DESC, pair ASC",
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -126,86 +141,30 @@ class ManifestStatusStore:
         message: str = "Work item status stored.",
     ) -> None:
         """Upsert a work item and append a status event."""
-        payload = work_item.to_dict()
+        self.write_work_items_many((work_item,), source=source, message=message)
+
+    def write_work_items_many(
+        self,
+        work_items: Iterable[WorkItem],
+        *,
+        source: str = "work_item",
+        message: str = "Work item status stored.",
+    ) -> int:
+        """Upsert work items and their status events in one transaction."""
+        items = tuple(work_items)
+        if not items:
+            return 0
         now = _utc_now()
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO work_items (
-                    work_id,
-                    status,
-                    status_text,
-                    url,
-                    data_dir,
-                    data_dir_key,
-                    data_format,
-                    data_timeframe,
-                    data_fxpair,
-                    data_datemonth,
-                    cache_start,
-                    cache_end,
-                    cache_line_count,
-                    payload_json,
-                    updated_at_utc,
-                    schema_version
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(work_id) DO UPDATE SET
-                    status=excluded.status,
-                    status_text=excluded.status_text,
-                    url=excluded.url,
-                    data_dir=excluded.data_dir,
-                    data_dir_key=excluded.data_dir_key,
-                    data_format=excluded.data_format,
-                    data_timeframe=excluded.data_timeframe,
-                    data_fxpair=excluded.data_fxpair,
-                    data_datemonth=excluded.data_datemonth,
-                    cache_start=excluded.cache_start,
-                    cache_end=excluded.cache_end,
-                    cache_line_count=excluded.cache_line_count,
-                    payload_json=excluded.payload_json,
-                    updated_at_utc=excluded.updated_at_utc,
-                    schema_version=excluded.schema_version
-                """,
-                (
-                    work_item.work_id,
-                    work_item.status.value,
-                    work_item.status_text,
-                    work_item.url,
-                    work_item.data_dir,
-                    _path_key(work_item.data_dir),
-                    work_item.data_format,
-                    work_item.data_timeframe,
-                    work_item.data_fxpair,
-                    work_item.data_datemonth,
-                    work_item.cache_start,
-                    work_item.cache_end,
-                    work_item.cache_line_count,
-                    _json_dumps(payload),
-                    now,
-                    MANIFEST_SCHEMA_VERSION,
-                ),
-            )
-            self._insert_status_event(
-                conn,
-                owner_kind="work_item",
-                owner_id=work_item.work_id,
-                event=StatusEvent(
-                    status=work_item.status,
-                    stage=source,
+        with self._transaction() as conn:
+            for work_item in items:
+                self._upsert_work_item(
+                    conn,
+                    work_item,
+                    source=source,
                     message=message,
-                    work_id=work_item.work_id,
-                    timestamp_utc=now,
-                ),
-            )
-            _delete_owner_overflow_rows(
-                conn,
-                table="status_events",
-                id_column="id",
-                owner_kind="work_item",
-                owner_id=work_item.work_id,
-                keep=LIVE_STATUS_EVENT_RETENTION_LIMIT,
-            )
+                    now=now,
+                )
+        return len(items)
 
     def write_dataset_plan(
         self,
@@ -226,7 +185,7 @@ class ManifestStatusStore:
             "metadata": dict(metadata or {}),
         }
         now = _utc_now()
-        with self._connect() as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 INSERT INTO dataset_plans (
@@ -257,12 +216,14 @@ class ManifestStatusStore:
                     MANIFEST_SCHEMA_VERSION,
                 ),
             )
-        for item in work_items:
-            self.write_work_item(
-                item,
-                source="dataset_plan",
-                message="Dataset plan work item stored.",
-            )
+            for item in work_items:
+                self._upsert_work_item(
+                    conn,
+                    item,
+                    source="dataset_plan",
+                    message="Dataset plan work item stored.",
+                    now=now,
+                )
         return self.dataset_plan_ref(plan_id, work_item_count=len(work_items))
 
     def dataset_plan_ref(
@@ -503,71 +464,18 @@ class ManifestStatusStore:
 
     def write_stage_result(self, result: StageResult) -> None:
         """Persist activity stage output metadata outside workflow history."""
-        payload = result.to_dict()
+        self.write_stage_results_many((result,))
+
+    def write_stage_results_many(self, results: Iterable[StageResult]) -> int:
+        """Persist a batch of activity stage results in one transaction."""
+        stage_results = tuple(results)
+        if not stage_results:
+            return 0
         now = _utc_now()
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO stage_results (
-                    work_id,
-                    stage,
-                    status,
-                    failure_json,
-                    metrics_json,
-                    payload_json,
-                    created_at_utc
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    result.work_id,
-                    result.stage,
-                    result.status.value,
-                    _json_dumps(payload.get("failure")),
-                    _json_dumps(payload.get("metrics", {})),
-                    _json_dumps(payload),
-                    now,
-                ),
-            )
-            for event in result.events:
-                self._insert_status_event(
-                    conn,
-                    owner_kind="work_item",
-                    owner_id=result.work_id,
-                    event=event,
-                )
-            for artifact in result.artifacts:
-                self._insert_artifact(
-                    conn,
-                    owner_kind="work_item",
-                    owner_id=result.work_id,
-                    work_id=result.work_id,
-                    artifact=artifact,
-                    created_at_utc=now,
-                )
-            _delete_work_item_overflow_rows(
-                conn,
-                table="stage_results",
-                id_column="id",
-                work_id=result.work_id,
-                keep=LIVE_STAGE_RESULT_RETENTION_LIMIT,
-            )
-            _delete_owner_overflow_rows(
-                conn,
-                table="status_events",
-                id_column="id",
-                owner_kind="work_item",
-                owner_id=result.work_id,
-                keep=LIVE_STATUS_EVENT_RETENTION_LIMIT,
-            )
-            _delete_owner_overflow_rows(
-                conn,
-                table="artifacts",
-                id_column="id",
-                owner_kind="work_item",
-                owner_id=result.work_id,
-                keep=LIVE_ARTIFACT_RETENTION_LIMIT,
-            )
+        with self._transaction() as conn:
+            for result in stage_results:
+                self._insert_stage_result(conn, result, now=now)
+        return len(stage_results)
 
     def write_live_stage_update(
         self,
@@ -582,13 +490,22 @@ class ManifestStatusStore:
         metadata: Mapping[str, JSONValue] | None = None,
     ) -> dict[str, Any]:
         """Persist one activity result and merge it into a live job snapshot."""
-        if work_item is not None:
-            self.write_work_item(
-                work_item,
-                source=result.stage,
-                message=f"{result.stage} work item status stored.",
+        now = _utc_now()
+        with self._transaction() as conn:
+            if work_item is not None:
+                self._upsert_work_item(
+                    conn,
+                    work_item,
+                    source=result.stage,
+                    message=f"{result.stage} work item status stored.",
+                    now=now,
+                )
+            self._insert_stage_result(
+                conn,
+                result,
+                now=now,
+                request_id=request_id,
             )
-        self.write_stage_result(result)
 
         stored = self.get_job_snapshot(job_id) or {}
         snapshot = _live_snapshot_payload(
@@ -887,6 +804,31 @@ class ManifestStatusStore:
             ).fetchall()
         return tuple(dict(json.loads(str(row["payload_json"]))) for row in rows)
 
+    def stage_timing_summary(
+        self,
+        *,
+        request_id: str = "",
+    ) -> dict[str, JSONValue]:
+        """Return per-stage, per-phase p50/p95 timings from stage results.
+
+        ``request_id`` limits the report to results persisted by one run's
+        activities; an empty value aggregates every stored result.
+        """
+        query = "SELECT stage, metrics_json FROM stage_results"
+        params: tuple[str, ...] = ()
+        if request_id:
+            query += " WHERE json_extract(payload_json, '$.request_id') = ?"
+            params = (request_id,)
+        with self._connect() as conn:
+            rows = conn.execute(f"{query} ORDER BY id ASC", params).fetchall()
+        return summarize_stage_timings(
+            (
+                str(row["stage"]),
+                _coerce_mapping(json.loads(row["metrics_json"])),
+            )
+            for row in rows
+        )
+
     def list_artifacts(
         self,
         owner_id: str,
@@ -915,6 +857,236 @@ class ManifestStatusStore:
             for row in rows
         )
 
+    def get_quality_rule_results(
+        self,
+        keys: Iterable[tuple[str, str, str, str]],
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Return stored quality rule results that are still current.
+
+        ``keys`` holds ``(rule_id, target_key, rule_version, content_key)``
+        tuples. Rows recorded for another rule version or content key are
+        not returned; the next write for that rule and target replaces them.
+        """
+        found: dict[tuple[str, str], dict[str, Any]] = {}
+        with self._connect() as conn:
+            for rule_id, target_key, rule_version, content_key in keys:
+                row = conn.execute(
+                    """
+                    SELECT result_json
+                    FROM quality_rule_results
+                    WHERE rule_id = ?
+                        AND target_key = ?
+                        AND rule_version = ?
+                        AND content_key = ?
+                    """,
+                    (rule_id, target_key, rule_version, content_key),
+                ).fetchone()
+                if row is not None:
+                    found[(rule_id, target_key)] = dict(
+                        json.loads(str(row["result_json"]))
+                    )
+        return found
+
+    def write_quality_rule_results(
+        self,
+        rows: Iterable[tuple[str, str, str, str, Mapping[str, Any]]],
+    ) -> int:
+        """Upsert per-target quality rule results in one transaction."""
+        now = _utc_now()
+        values = [
+            (
+                rule_id,
+                target_key,
+                rule_version,
+                content_key,
+                _json_dumps(result),
+                now,
+            )
+            for rule_id, target_key, rule_version, content_key, result in rows
+        ]
+        if not values:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO quality_rule_results (
+                    rule_id,
+                    target_key,
+                    rule_version,
+                    content_key,
+                    result_json,
+                    updated_at_utc
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(rule_id, target_key) DO UPDATE SET
+                    rule_version=excluded.rule_version,
+                    content_key=excluded.content_key,
+                    result_json=excluded.result_json,
+                    updated_at_utc=excluded.updated_at_utc
+                """,
+                values,
+            )
+        return len(values)
+
+    def repository_index_is_current(self, repo_path: str | Path) -> bool:
+        """Return whether the repository index mirrors ``repo_path`` as is.
+
+        The indexed file is matched on device, inode, size, and
+        ``st_mtime_ns``; any rewrite of the ``.repo`` file invalidates it.
+        """
+        try:
+            stat = Path(repo_path).stat()
+        except OSError:
+            return False
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT 1
+                FROM repository_sources
+                WHERE path = ?
+                    AND device = ?
+                    AND inode = ?
+                    AND size_bytes = ?
+                    AND mtime_ns = ?
+                """,
+                (
+                    _path_key(repo_path),
+                    stat.st_dev,
+                    stat.st_ino,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ),
+            ).fetchone()
+        return row is not None
+
+    def sync_repository_index(
+        self,
+        repo_data: Mapping[str, Any],
+        *,
+        repo_path: str | Path,
+        source_stat: os.stat_result,
+    ) -> int:
+        """Mirror repository pair ranges into the indexed table.
+
+        Only pairs whose entry changed are upserted and pairs no longer
+        present are deleted, all in one transaction.  ``source_stat`` is the
+        identity of ``repo_path`` taken before ``repo_data`` was read.
+        Returns the number of inserted, updated, or deleted pairs.
+        """
+        entries = {
+            str(pair): _json_dumps(dict(entry))
+            for pair, entry in repo_data.items()
+            if isinstance(entry, Mapping)
+            and "start" in entry
+            and "end" in entry
+        }
+        now = _utc_now()
+        with self._transaction() as conn:
+            stored = {
+                str(row["pair"]): str(row["entry_json"])
+                for row in conn.execute(
+                    "SELECT pair, entry_json FROM repository_pairs"
+                )
+            }
+            changed = [
+                (
+                    pair,
+                    str(repo_data[pair]["start"]),
+                    str(repo_data[pair]["end"]),
+                    entry_json,
+                    now,
+                )
+                for pair, entry_json in entries.items()
+                if stored.get(pair) != entry_json
+            ]
+            removed = [(pair,) for pair in stored if pair not in entries]
+            conn.executemany(
+                """
+                INSERT INTO repository_pairs (
+                    pair,
+                    start_yearmonth,
+                    end_yearmonth,
+                    entry_json,
+                    updated_at_utc
+                )
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(pair) DO UPDATE SET
+                    start_yearmonth=excluded.start_yearmonth,
+                    end_yearmonth=excluded.end_yearmonth,
+                    entry_json=excluded.entry_json,
+                    updated_at_utc=excluded.updated_at_utc
+                """,
+                changed,
+            )
+            conn.executemany(
+                "DELETE FROM repository_pairs WHERE pair = ?",
+                removed,
+            )
+            conn.execute("DELETE FROM repository_sources")
+            conn.execute(
+                """
+                INSERT INTO repository_sources (
+                    path,
+                    device,
+                    inode,
+                    size_bytes,
+                    mtime_ns,
+                    repo_hash,
+                    synced_at_utc
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    _path_key(repo_path),
+                    source_stat.st_dev,
+                    source_stat.st_ino,
+                    source_stat.st_size,
+                    source_stat.st_mtime_ns,
+                    str(repo_data.get("hash", "") or ""),
+                    now,
+                ),
+            )
+        return len(changed) + len(removed)
+
+    def query_repository_pairs(
+        self,
+        pairs: Iterable[str] = (),
+        *,
+        by: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Return indexed pair ranges, optionally for ``pairs`` only.
+
+        ``by`` accepts the ``--by`` sort keys; unknown keys sort by pair.
+        """
+        selected = sorted({str(pair) for pair in pairs})
+        order = REPOSITORY_PAIR_ORDERS.get(by or "", "pair ASC")
+        where = ""
+        if selected:
+            placeholders = ",".join("?" for _ in selected)
+            where = f"WHERE pair IN ({placeholders})"
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT pair, entry_json
+                FROM repository_pairs
+                {where}
+                ORDER BY {order}
+                """,
+                selected,
+            ).fetchall()
+        return {
+            str(row["pair"]): dict(json.loads(str(row["entry_json"])))
+            for row in rows
+        }
+
+    def repository_pair_count(self) -> int:
+        """Return the number of indexed repository pairs."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS pair_count FROM repository_pairs"
+            ).fetchone()
+        return int(row["pair_count"])
+
     def prune_retention(
         self,
         *,
@@ -1007,6 +1179,8 @@ class ManifestStatusStore:
         return deleted
 
     def _ensure_schema(self) -> None:
+        if _MANIFEST_CONNECTIONS.schema_ready(self.db_path):
+            return
         with self._connect() as conn:
             user_version = _read_user_version(conn)
             if user_version > MANIFEST_SCHEMA_VERSION:
@@ -1107,13 +1281,213 @@ class ManifestStatusStore:
                     ON jobs(status);
                 CREATE INDEX IF NOT EXISTS idx_jobs_request_id
                     ON jobs(request_id);
+                CREATE TABLE IF NOT EXISTS quality_rule_results (
+                    rule_id TEXT NOT NULL,
+                    target_key TEXT NOT NULL,
+                    rule_version TEXT NOT NULL,
+                    content_key TEXT NOT NULL,
+                    result_json TEXT NOT NULL,
+                    updated_at_utc TEXT NOT NULL,
+                    PRIMARY KEY (rule_id, target_key)
+                );
+                CREATE TABLE IF NOT EXISTS repository_pairs (
+                    pair TEXT PRIMARY KEY,
+                    start_yearmonth TEXT NOT NULL,
+                    end_yearmonth TEXT NOT NULL,
+                    entry_json TEXT NOT NULL,
+                    updated_at_utc TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_repository_pairs_start
+                    ON repository_pairs(start_yearmonth, pair);
+                CREATE TABLE IF NOT EXISTS repository_sources (
+                    path TEXT PRIMARY KEY,
+                    device INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    repo_hash TEXT NOT NULL,
+                    synced_at_utc TEXT NOT NULL
+                );
                 """)
             _migrate_manifest_schema(conn, user_version)
+        _MANIFEST_CONNECTIONS.mark_schema_ready(self.db_path)
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return _MANIFEST_CONNECTIONS.connection(self.db_path)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a batch of writes as one ``BEGIN IMMEDIATE`` transaction."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _upsert_work_item(
+        self,
+        conn: sqlite3.Connection,
+        work_item: WorkItem,
+        *,
+        source: str,
+        message: str,
+        now: str,
+    ) -> None:
+        payload = work_item.to_dict()
+        conn.execute(
+            """
+            INSERT INTO work_items (
+                work_id,
+                status,
+                status_text,
+                url,
+                data_dir,
+                data_dir_key,
+                data_format,
+                data_timeframe,
+                data_fxpair,
+                data_datemonth,
+                cache_start,
+                cache_end,
+                cache_line_count,
+                payload_json,
+                updated_at_utc,
+                schema_version
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(work_id) DO UPDATE SET
+                status=excluded.status,
+                status_text=excluded.status_text,
+                url=excluded.url,
+                data_dir=excluded.data_dir,
+                data_dir_key=excluded.data_dir_key,
+                data_format=excluded.data_format,
+                data_timeframe=excluded.data_timeframe,
+                data_fxpair=excluded.data_fxpair,
+                data_datemonth=excluded.data_datemonth,
+                cache_start=excluded.cache_start,
+                cache_end=excluded.cache_end,
+                cache_line_count=excluded.cache_line_count,
+                payload_json=excluded.payload_json,
+                updated_at_utc=excluded.updated_at_utc,
+                schema_version=excluded.schema_version
+            """,
+            (
+                work_item.work_id,
+                work_item.status.value,
+                work_item.status_text,
+                work_item.url,
+                work_item.data_dir,
+                _path_key(work_item.data_dir),
+                work_item.data_format,
+                work_item.data_timeframe,
+                work_item.data_fxpair,
+                work_item.data_datemonth,
+                work_item.cache_start,
+                work_item.cache_end,
+                work_item.cache_line_count,
+                _json_dumps(payload),
+                now,
+                MANIFEST_SCHEMA_VERSION,
+            ),
+        )
+        self._insert_status_event(
+            conn,
+            owner_kind="work_item",
+            owner_id=work_item.work_id,
+            event=StatusEvent(
+                status=work_item.status,
+                stage=source,
+                message=message,
+                work_id=work_item.work_id,
+                timestamp_utc=now,
+            ),
+        )
+        _delete_owner_overflow_rows(
+            conn,
+            table="status_events",
+            id_column="id",
+            owner_kind="work_item",
+            owner_id=work_item.work_id,
+            keep=LIVE_STATUS_EVENT_RETENTION_LIMIT,
+        )
+
+    def _insert_stage_result(
+        self,
+        conn: sqlite3.Connection,
+        result: StageResult,
+        *,
+        now: str,
+        request_id: str = "",
+    ) -> None:
+        payload = result.to_dict()
+        if request_id:
+            payload["request_id"] = request_id
+        conn.execute(
+            """
+            INSERT INTO stage_results (
+                work_id,
+                stage,
+                status,
+                failure_json,
+                metrics_json,
+                payload_json,
+                created_at_utc
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                result.work_id,
+                result.stage,
+                result.status.value,
+                _json_dumps(payload.get("failure")),
+                _json_dumps(payload.get("metrics", {})),
+                _json_dumps(payload),
+                now,
+            ),
+        )
+        for event in result.events:
+            self._insert_status_event(
+                conn,
+                owner_kind="work_item",
+                owner_id=result.work_id,
+                event=event,
+            )
+        for artifact in result.artifacts:
+            self._insert_artifact(
+                conn,
+                owner_kind="work_item",
+                owner_id=result.work_id,
+                work_id=result.work_id,
+                artifact=artifact,
+                created_at_utc=now,
+            )
+        _delete_work_item_overflow_rows(
+            conn,
+            table="stage_results",
+            id_column="id",
+            work_id=result.work_id,
+            keep=LIVE_STAGE_RESULT_RETENTION_LIMIT,
+        )
+        _delete_owner_overflow_rows(
+            conn,
+            table="status_events",
+            id_column="id",
+            owner_kind="work_item",
+            owner_id=result.work_id,
+            keep=LIVE_STATUS_EVENT_RETENTION_LIMIT,
+        )
+        _delete_owner_overflow_rows(
+            conn,
+            table="artifacts",
+            id_column="id",
+            owner_kind="work_item",
+            owner_id=result.work_id,
+            keep=LIVE_ARTIFACT_RETENTION_LIMIT,
+        )
 
     def _insert_status_event(
         self,
@@ -1243,6 +1617,108 @@ class ManifestStatusStore:
         )
 
 
+class _ManifestConnectionPool:
+    """Per-thread SQLite connections shared by stores for the same file.
+
+    Each thread keeps one tuned connection per database path, so stores built
+    per record or per activity reuse it instead of reconnecting.  A cached
+    connection is replaced when the file is removed or recreated, the least
+    recently used one is closed past ``MANIFEST_POOL_CONNECTIONS_PER_THREAD``,
+    and the cache is dropped in a forked child.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._schema_ready: set[tuple[str, int, int]] = set()
+        self._pid = os.getpid()
+
+    def connection(self, db_path: Path) -> sqlite3.Connection:
+        """Return this thread's connection to ``db_path``."""
+        connections = self._thread_connections()
+        key = str(db_path)
+        identity = _file_identity(db_path)
+        cached = connections.pop(key, None)
+        if cached is not None:
+            if identity is not None and cached[0] == identity:
+                connections[key] = cached
+                return cached[1]
+            cached[1].close()
+        conn = _open_manifest_connection(db_path)
+        connections[key] = (_file_identity(db_path), conn)
+        while len(connections) > MANIFEST_POOL_CONNECTIONS_PER_THREAD:
+            _, (_, evicted) = connections.popitem(last=False)
+            evicted.close()
+        return conn
+
+    def schema_ready(self, db_path: Path) -> bool:
+        """Return whether this process already prepared the schema."""
+        identity = _file_identity(db_path)
+        with self._lock:
+            self._reset_after_fork()
+            return identity is not None and identity in self._schema_ready
+
+    def mark_schema_ready(self, db_path: Path) -> None:
+        """Record that the schema for ``db_path`` is current."""
+        identity = _file_identity(db_path)
+        if identity is None:
+            return
+        with self._lock:
+            self._reset_after_fork()
+            self._schema_ready.add(identity)
+
+    def close_thread_connections(self) -> None:
+        """Close every connection opened by the calling thread."""
+        connections = self._thread_connections()
+        for _, conn in connections.values():
+            conn.close()
+        connections.clear()
+
+    def _thread_connections(
+        self,
+    ) -> OrderedDict[
+        str, tuple[tuple[str, int, int] | None, sqlite3.Connection]
+    ]:
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            self._local.pid = pid
+            self._local.connections = OrderedDict()
+        return self._local.connections
+
+    def _reset_after_fork(self) -> None:
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._schema_ready = set()
+
+
+_MANIFEST_CONNECTIONS = _ManifestConnectionPool()
+
+
+def close_manifest_connections() -> None:
+    """Close the calling thread's pooled manifest/status connections."""
+    _MANIFEST_CONNECTIONS.close_thread_connections()
+
+
+def _open_manifest_connection(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        db_path,
+        cached_statements=MANIFEST_CACHED_STATEMENTS,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA mmap_size={MANIFEST_MMAP_SIZE_BYTES}")
+    return conn
+
+
+def _file_identity(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return str(path), stat.st_dev, stat.st_ino
+
+
 def restore_record_from_manifest(
     record: Any,
     *,
@@ -109,6 +109,7 @@ from histdatacom.market_context.positioning import (
     default_cftc_positioning_symbol_mappings,
     preflight_cftc_positioning_corpus,
     query_cftc_positioning_corpus,
+    query_cftc_positioning_corpus_windows,
     read_cftc_positioning_corpus,
     replay_cftc_positioning_corpus,
     require_cftc_positioning_corpus,
@@ -223,6 +224,7 @@ __all__ = [
     "default_cftc_positioning_symbol_mappings",
     "preflight_cftc_positioning_corpus",
     "query_cftc_positioning_corpus",
+    "query_cftc_positioning_corpus_windows",
     "read_cftc_positioning_corpus",
     "replay_cftc_positioning_corpus",
     "require_cftc_positioning_corpus",
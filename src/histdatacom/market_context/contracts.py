@@ -13,8 +13,9 @@ import hashlib
 import json
 import math
 import re
+from bisect import bisect_left
 from collections.abc import Iterable, Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import (
@@ -589,6 +590,12 @@ class MarketContextTimelineV1:
     limitations: tuple[str, ...]
     timeline_id: str = ""
     schema_version: str = MARKET_CONTEXT_TIMELINE_SCHEMA_VERSION
+    _index: _MarketContextTimelineIndex = field(
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"reconstruction_schema": False},
+    )
 
     def __post_init__(self) -> None:
         if self.schema_version != MARKET_CONTEXT_TIMELINE_SCHEMA_VERSION:
@@ -638,6 +645,9 @@ class MarketContextTimelineV1:
             )
         object.__setattr__(self, "timeline_id", expected)
         _ensure_payload_size(self.to_dict(), MAX_MARKET_CONTEXT_TIMELINE_BYTES)
+        object.__setattr__(
+            self, "_index", _MarketContextTimelineIndex.build(ordered)
+        )
 
     def identity_payload(self) -> dict[str, JSONValue]:
         """Return the complete deterministic timeline identity payload."""
@@ -1227,31 +1237,31 @@ def query_market_context(
     limit = _positive_int(max_events, "max_events")
     if limit > MAX_MARKET_CONTEXT_QUERY_EVENTS:
         raise ValueError("max_events exceeds the v1 query limit")
+    index = timeline._index
+    affected = [
+        *(
+            index.currencies.get(item, frozenset())
+            for item in requested_currencies
+        ),
+        *(index.symbols.get(item, frozenset()) for item in requested_symbols),
+    ]
+    of_kind = [index.kinds.get(item, frozenset()) for item in requested_kinds]
+    visible_until = (
+        cast(int, as_of)
+        if selected_view is MarketContextView.EX_ANTE
+        else INT64_MAX
+    )
     matched: list[MarketContextEventV1] = []
     hidden_by_availability = False
-    for event in timeline.events:
-        if not event.overlaps(start, end):
+    for position in index.overlapping(start, end):
+        if affected and not any(position in item for item in affected):
             continue
-        if requested_currencies or requested_symbols:
-            currency_match = bool(
-                set(requested_currencies).intersection(
-                    event.affected_currencies
-                )
-            )
-            symbol_match = bool(
-                set(requested_symbols).intersection(event.affected_symbols)
-            )
-            if not (currency_match or symbol_match):
-                continue
-        if requested_kinds and event.kind not in requested_kinds:
+        if of_kind and not any(position in item for item in of_kind):
             continue
-        if selected_view is MarketContextView.EX_ANTE and (
-            event.first_known_at_ns > cast(int, as_of)
-            or event.available_at_ns > cast(int, as_of)
-        ):
+        if index.known_at_ns[position] > visible_until:
             hidden_by_availability = True
             continue
-        matched.append(event)
+        matched.append(timeline.events[position])
         if len(matched) > limit:
             raise MarketContextQueryLimitError(
                 "market context query exceeds configured event limit"
@@ -1419,6 +1429,83 @@ def market_context_information_inputs(
     return tuple(results)
 
 
+@dataclass(frozen=True, slots=True)
+class _MarketContextTimelineIndex:
+    """Interval and posting-list index over one ordered timeline.
+
+    Conditioned windows are sorted by start and covered by a max-end segment
+    tree, so an overlap query visits only the subtrees that can still reach
+    the query start.  Posting lists hold timeline positions, which keeps
+    query results in timeline order.
+    """
+
+    starts: tuple[int, ...]
+    positions: tuple[int, ...]
+    max_ends: tuple[int, ...]
+    leaves: int
+    known_at_ns: tuple[int, ...]
+    currencies: Mapping[str, frozenset[int]]
+    symbols: Mapping[str, frozenset[int]]
+    kinds: Mapping[MarketContextKind, frozenset[int]]
+
+    @classmethod
+    def build(
+        cls, events: Sequence[MarketContextEventV1]
+    ) -> "_MarketContextTimelineIndex":
+        """Index events already in timeline order."""
+        by_start = sorted(
+            range(len(events)), key=lambda item: events[item].window_start_ns
+        )
+        leaves = 1 << max(0, len(events) - 1).bit_length()
+        max_ends = [INT64_MIN] * (2 * leaves)
+        for offset, position in enumerate(by_start):
+            max_ends[leaves + offset] = events[position].window_end_ns
+        for node in range(leaves - 1, 0, -1):
+            max_ends[node] = max(max_ends[2 * node], max_ends[2 * node + 1])
+        currencies: dict[str, set[int]] = {}
+        symbols: dict[str, set[int]] = {}
+        kinds: dict[MarketContextKind, set[int]] = {}
+        for position, event in enumerate(events):
+            for currency in event.affected_currencies:
+                currencies.setdefault(currency, set()).add(position)
+            for symbol in event.affected_symbols:
+                symbols.setdefault(symbol, set()).add(position)
+            kinds.setdefault(event.kind, set()).add(position)
+        return cls(
+            starts=tuple(events[item].window_start_ns for item in by_start),
+            positions=tuple(by_start),
+            max_ends=tuple(max_ends),
+            leaves=leaves,
+            known_at_ns=tuple(
+                max(item.first_known_at_ns, item.available_at_ns)
+                for item in events
+            ),
+            currencies={
+                key: frozenset(value) for key, value in currencies.items()
+            },
+            symbols={key: frozenset(value) for key, value in symbols.items()},
+            kinds={key: frozenset(value) for key, value in kinds.items()},
+        )
+
+    def overlapping(self, start_ns: int, end_ns: int) -> list[int]:
+        """Return ordered positions whose windows overlap ``[start, end)``."""
+        count = bisect_left(self.starts, end_ns)
+        found: list[int] = []
+        pending = [(1, 0, self.leaves)]
+        while pending:
+            node, low, high = pending.pop()
+            if low >= count or self.max_ends[node] <= start_ns:
+                continue
+            if node >= self.leaves:
+                found.append(self.positions[low])
+                continue
+            middle = (low + high) // 2
+            pending.append((2 * node + 1, middle, high))
+            pending.append((2 * node, low, middle))
+        found.sort()
+        return found
+
+
 def _validate_timeline_events(
     events: Sequence[MarketContextEventV1],
     coverage_start_ns: int,
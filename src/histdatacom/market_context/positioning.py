@@ -24,8 +24,9 @@ import statistics
 import time
 import tempfile
 import zipfile
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field, replace
 from datetime import date, datetime, time as datetime_time, timedelta, timezone
 from enum import Enum
@@ -1240,6 +1241,12 @@ class CftcPositioningCorpusV1:
     limitations: tuple[str, ...]
     corpus_id: str = ""
     schema_version: str = CFTC_POSITIONING_CORPUS_SCHEMA_VERSION
+    _index: Mapping[_CftcContractKey, _CftcContractHistory] = field(
+        init=False,
+        repr=False,
+        compare=False,
+        metadata={"reconstruction_schema": False},
+    )
 
     def __post_init__(self) -> None:
         if self.schema_version != CFTC_POSITIONING_CORPUS_SCHEMA_VERSION:
@@ -1372,6 +1379,7 @@ class CftcPositioningCorpusV1:
         if self.corpus_id and self.corpus_id != expected:
             raise ValueError("CFTC corpus identity differs")
         object.__setattr__(self, "corpus_id", expected)
+        object.__setattr__(self, "_index", _cftc_contract_histories(snapshots))
 
     def identity_payload(self) -> dict[str, JSONValue]:
         return {
@@ -1793,8 +1801,9 @@ class CftcPositioningQueryV1:
         object.__setattr__(self, "status", status)
         object.__setattr__(self, "reason", reason)
         object.__setattr__(self, "age_seconds", ages)
-        _ensure_payload_size(self.identity_payload(), MAX_CFTC_QUERY_BYTES)
-        expected = _stable_id("cftc-positioning-query", self.identity_payload())
+        payload = self.identity_payload()
+        _ensure_payload_size(payload, MAX_CFTC_QUERY_BYTES)
+        expected = _stable_id("cftc-positioning-query", payload)
         if self.query_id and self.query_id != expected:
             raise ValueError("CFTC positioning query identity differs")
         object.__setattr__(self, "query_id", expected)
@@ -2667,6 +2676,88 @@ def query_cftc_positioning_corpus(
 ) -> CftcPositioningQueryV1:
     """Select latest known weekly state, keeping all report schemas separate."""
     mode = InformationMode.from_value(information_mode)
+    selected_symbols, families, scopes = _query_scope(
+        symbols, report_families, report_scopes
+    )
+    _validate_query_interval(start_ns, end_ns, mode, as_of_ns)
+    return _query_positioning_window(
+        corpus,
+        start_ns=start_ns,
+        end_ns=end_ns,
+        mode=mode,
+        as_of_ns=as_of_ns,
+        selected_symbols=selected_symbols,
+        families=families,
+        scopes=scopes,
+        max_staleness_days=max_staleness_days,
+        known_count=lambda history: bisect_right(history.starts, start_ns),
+    )
+
+
+def query_cftc_positioning_corpus_windows(
+    corpus: CftcPositioningCorpusV1,
+    *,
+    windows: Sequence[tuple[int, int, int | None]],
+    information_mode: InformationMode,
+    symbols: Sequence[str] = ("EURUSD", "GBPUSD", "EURGBP"),
+    report_families: Sequence[CftcReportFamily] = (
+        CftcReportFamily.LEGACY,
+        CftcReportFamily.TFF,
+    ),
+    report_scopes: Sequence[CftcReportScope] = (
+        CftcReportScope.FUTURES_ONLY,
+        CftcReportScope.COMBINED,
+    ),
+    max_staleness_days: int | None = None,
+) -> tuple[CftcPositioningQueryV1, ...]:
+    """Answer start-sorted ``(start_ns, end_ns, as_of_ns)`` windows in one pass.
+
+    Each contract keeps a cursor into its report-date ordered history, so the
+    sweep merges windows against weekly rows instead of rescanning the corpus.
+    Results equal ``query_cftc_positioning_corpus()`` for every window.
+    """
+    mode = InformationMode.from_value(information_mode)
+    selected_symbols, families, scopes = _query_scope(
+        symbols, report_families, report_scopes
+    )
+    values = tuple(tuple(item) for item in windows)
+    for start_ns, end_ns, as_of_ns in values:
+        _validate_query_interval(start_ns, end_ns, mode, as_of_ns)
+    if any(later[0] < earlier[0] for earlier, later in zip(values, values[1:])):
+        raise ValueError("CFTC query windows must be sorted by start")
+    cursors: dict[int, int] = {}
+
+    def advance(history: _CftcContractHistory, start_ns: int) -> int:
+        count = cursors.get(id(history), 0)
+        while count < len(history.starts) and history.starts[count] <= start_ns:
+            count += 1
+        cursors[id(history)] = count
+        return count
+
+    return tuple(
+        _query_positioning_window(
+            corpus,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            mode=mode,
+            as_of_ns=as_of_ns,
+            selected_symbols=selected_symbols,
+            families=families,
+            scopes=scopes,
+            max_staleness_days=max_staleness_days,
+            known_count=lambda history, start=start_ns: advance(history, start),
+        )
+        for start_ns, end_ns, as_of_ns in values
+    )
+
+
+def _query_scope(
+    symbols: Sequence[str],
+    report_families: Sequence[CftcReportFamily],
+    report_scopes: Sequence[CftcReportScope],
+) -> tuple[
+    tuple[str, ...], tuple[CftcReportFamily, ...], tuple[CftcReportScope, ...]
+]:
     selected_symbols = _normalized_symbols(symbols)
     families = tuple(
         sorted(
@@ -2680,7 +2771,22 @@ def query_cftc_positioning_corpus(
             key=lambda item: item.value,
         )
     )
-    _validate_query_interval(start_ns, end_ns, mode, as_of_ns)
+    return selected_symbols, families, scopes
+
+
+def _query_positioning_window(
+    corpus: CftcPositioningCorpusV1,
+    *,
+    start_ns: int,
+    end_ns: int,
+    mode: InformationMode,
+    as_of_ns: int | None,
+    selected_symbols: tuple[str, ...],
+    families: tuple[CftcReportFamily, ...],
+    scopes: tuple[CftcReportScope, ...],
+    max_staleness_days: int | None,
+    known_count: Callable[[_CftcContractHistory], int],
+) -> CftcPositioningQueryV1:
     if not selected_symbols or not families or not scopes:
         raise ValueError("CFTC query scope cannot be empty")
     supported_symbols = {item.symbol for item in corpus.symbol_mappings}
@@ -2732,47 +2838,27 @@ def query_cftc_positioning_corpus(
                 continue
             for scope in scopes:
                 for code in codes:
-                    candidates = sorted(
-                        (
-                            item
-                            for item in corpus.snapshots
-                            if item.report_family is family
-                            and item.report_scope is scope
-                            and item.contract_code == code
-                            and item.measurement_start_ns <= start_ns
-                        ),
-                        key=lambda item: item.measurement_start_ns,
-                        reverse=True,
-                    )
+                    history = corpus._index.get((family, scope, code))
+                    count = 0 if history is None else known_count(history)
                     seam = f"{symbol}/{family.value}/{scope.value}/{code}"
-                    if not candidates:
+                    if history is None or not count:
                         missing.append(seam)
                         continue
                     if mode is InformationMode.EX_ANTE_SIMULATION:
-                        time_eligible = [
-                            item
-                            for item in candidates
-                            if item.release_evidence.strict_ex_ante_time_eligible
-                            and item.release_evidence.knowledge_at_ns
-                            is not None
-                            and cutoff_ns is not None
-                            and item.release_evidence.knowledge_at_ns
-                            <= cutoff_ns
-                        ]
-                        if not time_eligible:
+                        if not history.time_eligible(
+                            count, cast(int, cutoff_ns)
+                        ):
                             unavailable.append(seam)
                             continue
-                        vintage_eligible = [
-                            item
-                            for item in time_eligible
-                            if item.strict_ex_ante_eligible
-                        ]
-                        if not vintage_eligible:
+                        vintage = history.latest_vintage(
+                            count, cast(int, cutoff_ns)
+                        )
+                        if vintage is None:
                             restatement_incomplete.append(seam)
                             continue
-                        candidate = vintage_eligible[0]
+                        candidate = vintage
                     else:
-                        candidate = candidates[0]
+                        candidate = history.snapshots[count - 1]
                     age_seconds = max(
                         0,
                         (start_ns - candidate.measurement_start_ns)
@@ -3552,6 +3638,110 @@ def _peak_memory_bytes() -> int:
     return peak_rss_bytes()
 
 
+_CftcContractKey = tuple[CftcReportFamily, CftcReportScope, str]
+
+
+@dataclass(frozen=True, slots=True)
+class _CftcContractHistory:
+    """Report-date ordered snapshots for one family/scope/contract.
+
+    ``vintages`` holds positions of original verified rows; PRE
+    ``current_state_only`` rows stay out of it and can never satisfy a strict
+    ex-ante selection, however early their publication time is known.
+    """
+
+    snapshots: tuple[CftcPositioningSnapshotV1, ...]
+    report_dates: tuple[str, ...]
+    starts: tuple[int, ...]
+    knowledge_at_ns: tuple[int | None, ...]
+    timed: tuple[int, ...]
+    timed_first_known_ns: tuple[int, ...]
+    vintages: tuple[int, ...]
+
+    @classmethod
+    def build(
+        cls, snapshots: Sequence[CftcPositioningSnapshotV1]
+    ) -> "_CftcContractHistory":
+        knowledge = tuple(
+            item.release_evidence.knowledge_at_ns for item in snapshots
+        )
+        timed = tuple(
+            position
+            for position, item in enumerate(snapshots)
+            if item.release_evidence.strict_ex_ante_time_eligible
+        )
+        first_known: list[int] = []
+        for position in timed:
+            value = cast(int, knowledge[position])
+            first_known.append(
+                min(first_known[-1], value) if first_known else value
+            )
+        return cls(
+            snapshots=tuple(snapshots),
+            report_dates=tuple(item.report_date for item in snapshots),
+            starts=tuple(item.measurement_start_ns for item in snapshots),
+            knowledge_at_ns=knowledge,
+            timed=timed,
+            timed_first_known_ns=tuple(first_known),
+            vintages=tuple(
+                position
+                for position, item in enumerate(snapshots)
+                if item.strict_ex_ante_eligible
+            ),
+        )
+
+    def time_eligible(self, count: int, cutoff_ns: int) -> bool:
+        """Whether any of the first ``count`` rows was verifiably known."""
+        timed = bisect_left(self.timed, count)
+        return bool(timed) and self.timed_first_known_ns[timed - 1] <= cutoff_ns
+
+    def latest_vintage(
+        self, count: int, cutoff_ns: int
+    ) -> CftcPositioningSnapshotV1 | None:
+        """Return the latest original vintage known by ``cutoff_ns``."""
+        for index in range(bisect_left(self.vintages, count) - 1, -1, -1):
+            position = self.vintages[index]
+            if cast(int, self.knowledge_at_ns[position]) <= cutoff_ns:
+                return self.snapshots[position]
+        return None
+
+    def trailing(
+        self, report_date: str, limit: int, *, as_of_ns: int | None
+    ) -> list[CftcPositioningSnapshotV1]:
+        """Return up to ``limit`` rows through ``report_date``, oldest first.
+
+        With ``as_of_ns`` only original vintages known by then are eligible.
+        """
+        count = bisect_right(self.report_dates, report_date)
+        if as_of_ns is None:
+            return list(self.snapshots[max(0, count - limit) : count])
+        rows: list[CftcPositioningSnapshotV1] = []
+        for index in range(bisect_left(self.vintages, count) - 1, -1, -1):
+            if len(rows) == limit:
+                break
+            position = self.vintages[index]
+            if cast(int, self.knowledge_at_ns[position]) <= as_of_ns:
+                rows.append(self.snapshots[position])
+        rows.reverse()
+        return rows
+
+
+def _cftc_contract_histories(
+    snapshots: Sequence[CftcPositioningSnapshotV1],
+) -> dict[_CftcContractKey, _CftcContractHistory]:
+    grouped: dict[_CftcContractKey, list[CftcPositioningSnapshotV1]] = (
+        defaultdict(list)
+    )
+    for item in sorted(snapshots, key=lambda item: item.report_date):
+        grouped[
+            (item.report_family, item.report_scope, item.contract_code)
+        ].append(item)
+    return {
+        key: _CftcContractHistory.build(values)
+        for key, values in grouped.items()
+    }
+
+
 def _derive_query_values(
     corpus: CftcPositioningCorpusV1,
     selected: Sequence[CftcPositioningSnapshotV1],
@@ -3583,26 +3773,21 @@ def _derive_query_values(
         )
         metrics[f"{prefix}.net"] = net
         metrics[f"{prefix}.net_open_interest"] = net / oi if oi else 0.0
-        history = sorted(
+        history = corpus._index[
             (
-                item
-                for item in corpus.snapshots
-                if item.report_family is snapshot.report_family
-                and item.report_scope is snapshot.report_scope
-                and item.contract_code == snapshot.contract_code
-                and item.report_date <= snapshot.report_date
-                and (
-                    information_mode is InformationMode.EX_POST_RECONSTRUCTION
-                    or (
-                        item.strict_ex_ante_eligible
-                        and item.release_evidence.knowledge_at_ns is not None
-                        and as_of_ns is not None
-                        and item.release_evidence.knowledge_at_ns <= as_of_ns
-                    )
-                )
+                snapshot.report_family,
+                snapshot.report_scope,
+                snapshot.contract_code,
+            )
+        ].trailing(
+            snapshot.report_date,
+            52,
+            as_of_ns=(
+                None
+                if information_mode is InformationMode.EX_POST_RECONSTRUCTION
+                else cast(int, as_of_ns)
             ),
-            key=lambda item: item.report_date,
-        )[-52:]
+        )
         historical_nets: list[float] = []
         for item in history:
             historical_pair = _primary_position_pair(
@@ -37,6 +37,8 @@ class Options:
         "quality_fail_on",
         "quality_max_errors",
         "quality_max_warnings",
+        "quality_jobs",
+        "quality_incremental",
         "quality_preflight",
         "quality_preflight_evidence_allow_stale",
         "quality_preflight_evidence_max_age_seconds",
@@ -115,6 +117,8 @@ class Options:
         self.quality_fail_on: str = "error"
         self.quality_max_errors: int = 0
         self.quality_max_warnings: int = 0
+        self.quality_jobs: int = 1
+        self.quality_incremental: bool = False
         self.quality_preflight: bool = False
         self.quality_preflight_evidence_allow_stale: bool = False
         self.quality_preflight_evidence_max_age_seconds: int = 86400
@@ -195,6 +195,18 @@ _EXPORTS: dict[str, tuple[str, str]] = {
         "histdatacom.orchestration.workflows",
         "MAX_WORK_ITEMS_PER_BATCH_METADATA_KEY",
     ),
+    "MAX_IN_FLIGHT_PER_LANE_METADATA_KEY": (
+        "histdatacom.orchestration.workflows",
+        "MAX_IN_FLIGHT_PER_LANE_METADATA_KEY",
+    ),
+    "PIPELINING_METADATA_KEY": (
+        "histdatacom.orchestration.workflows",
+        "PIPELINING_METADATA_KEY",
+    ),
+    "STREAM_WORK_ITEMS_METADATA_KEY": (
+        "histdatacom.orchestration.workflows",
+        "STREAM_WORK_ITEMS_METADATA_KEY",
+    ),
     "TASK_QUEUE_METADATA_KEY": (
         "histdatacom.orchestration.workflow_metadata",
         "TASK_QUEUE_METADATA_KEY",
@@ -605,6 +617,14 @@ _EXPORTS: dict[str, tuple[str, str]] = {
         "histdatacom.orchestration.workflows",
         "max_parallel_child_workflows",
     ),
+    "max_in_flight_per_lane": (
+        "histdatacom.orchestration.workflows",
+        "max_in_flight_per_lane",
+    ),
+    "stream_work_items": (
+        "histdatacom.orchestration.workflows",
+        "stream_work_items",
+    ),
     "merge_cache_activity": (
         "histdatacom.orchestration.activities",
         "merge_cache_activity",
@@ -670,6 +690,10 @@ _EXPORTS: dict[str, tuple[str, str]] = {
         "histdatacom.orchestration.contracts",
         "status_has_csv_artifact",
     ),
+    "stored_job_stage_timings": (
+        "histdatacom.orchestration.client",
+        "stored_job_stage_timings",
+    ),
     "submit_control_job": (
         "histdatacom.orchestration.client",
         "submit_control_job",
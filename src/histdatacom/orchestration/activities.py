@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import replace
 from importlib import import_module
 import logging
@@ -18,12 +20,14 @@ from histdatacom.activity_stages import (
     extract_csv_work_item,
     import_to_influx_work_item,
     merge_cache_work_items,
+    normalize_dataset_pairs,
     read_repository_data_file,
-    repository_pair_data,
+    read_repository_index,
     repository_refresh_stage,
     validate_url_work_item,
     write_repository_data_file,
 )
+from histdatacom.archive_downloads import archive_host_concurrency
 from histdatacom.cancellation import (
     cancellation_metadata,
     cleanup_partial_artifacts,
@@ -43,6 +47,7 @@ from histdatacom.data_quality import (
     provenance_manifest_metadata,
     quality_rules_for_groups,
     quality_run_rules_for_groups,
+    resolve_quality_jobs,
     run_quality_assessment,
     write_quality_report,
 )
@@ -204,16 +209,22 @@ def dataset_plan_activity(payload: dict[str, Any]) -> dict[str, Any]:
             dict[str, Any],
             {"work_items": [], "result": result.to_dict()},
         )
-    repository_ranges = (
-        read_repository_data_file(repo_path)
-        if (
-            (not request.start_yearmonth and not request.end_yearmonth)
-            or bool(request.random_window)
+    store = ManifestStatusStore(data_root)
+    repository_ranges: dict[str, Any] = {}
+    repository_range_count = 0
+    if (
+        (not request.start_yearmonth and not request.end_yearmonth)
+        or bool(request.random_window)
+    ) and repo_path.exists():
+        requested_pairs = normalize_dataset_pairs(request.pairs)
+        repository_ranges = (
+            read_repository_index(repo_path, requested_pairs) or {}
         )
-        and repo_path.exists()
-        else {}
-    )
-    repository_range_count = len(repository_pair_data(repository_ranges))
+        if set(requested_pairs) - set(repository_ranges):
+            # Random windows reject an unlisted pair only when the
+            # repository lists other pairs, so keep the full inventory.
+            repository_ranges = read_repository_index(repo_path) or {}
+        repository_range_count = store.repository_pair_count()
 
     output = dataset_plan_stage(
         start_yearmonth=request.start_yearmonth,
@@ -233,7 +244,6 @@ def dataset_plan_activity(payload: dict[str, Any]) -> dict[str, Any]:
         output.result.work_id,
         "dataset_plan",
     )
-    store = ManifestStatusStore(data_root)
     plan_ref = store.write_dataset_plan(
         plan_id=plan_id,
         request_id=request.request_id,
@@ -382,6 +392,17 @@ def data_quality_activity(payload: dict[str, Any]) -> dict[str, Any]:
             ),
             metadata=quality_metadata,
             progress_callback=emit_quality_progress,
+            jobs=resolve_quality_jobs(
+                request.quality_jobs,
+                cpu_utilization=request.cpu_utilization,
+            ),
+            result_store=(
+                ManifestStatusStore(
+                    set_working_data_dir(request.data_directory)
+                )
+                if request.quality_incremental
+                else None
+            ),
         )
         decision = exit_policy.evaluate(report.summary())
         artifact = write_quality_report(report, _quality_report_path(request))
@@ -684,6 +705,7 @@ def download_archives_activity(
         lambda work_item: download_archive_work_item(work_item, args=args),
         payload=payload,
         request=request,
+        workers=archive_host_concurrency(),
     )
     if len(outputs) == 1:
         return _activity_output_payload(outputs[0])
@@ -1164,9 +1186,9 @@ def _require_resolved_random_window(
 
 
 def _influx_batch_writer(args: Mapping[str, Any]) -> Any:
-    from histdatacom.influx import InfluxBatchWriter
+    from histdatacom.influx import influx_batch_writer
 
-    return InfluxBatchWriter(dict(args))
+    return influx_batch_writer(dict(args))
 
 
 def _dataset_plan_batches(
@@ -1218,13 +1240,13 @@ def _import_to_influx_with_writer(
     batch_events: list[StatusEvent] = []
     batch_index = 0
 
-    def emit_lines(lines: list[str]) -> None:
+    def emit_lines(payload: bytes) -> None:
         nonlocal batch_index
-        writer.write_lines(lines)
+        writer.write_lines(payload)
         batch_index += 1
         metadata: dict[str, JSONValue] = {
             "batch_index": batch_index,
-            "line_count": len(lines),
+            "line_count": payload.count(b"\n") + 1 if payload else 0,
             "cache_path": str(
                 Path(work_item.data_dir, work_item.cache_filename)
             ),
@@ -1311,27 +1333,75 @@ def _cancellable_outputs(
     *,
     payload: Mapping[str, Any],
     request: RunRequest,
+    workers: int = 1,
 ) -> tuple[ActivityStageOutput, ...]:
+    """Run work items in order, stopping at the first cancellation check.
+
+    With ``workers`` above one, up to that many items run concurrently on
+    a thread pool.  Cancellation is still checked before each item starts
+    and outputs are observed in work-item order.
+    """
     total = len(work_items)
     outputs: list[ActivityStageOutput] = []
-    for index, work_item in enumerate(work_items, start=1):
-        if _activity_cancelled():
+    if workers <= 1:
+        for index, work_item in enumerate(work_items, start=1):
+            if _activity_cancelled():
+                outputs.append(
+                    _observe_and_persist_activity_output(
+                        _cancelled_activity_output(work_item, stage),
+                        total=total,
+                        completed=len(outputs),
+                        increment=0,
+                        payload=payload,
+                        request=request,
+                    )
+                )
+                break
             outputs.append(
                 _observe_and_persist_activity_output(
-                    _cancelled_activity_output(work_item, stage),
+                    run_one(work_item),
                     total=total,
-                    completed=len(outputs),
-                    increment=0,
+                    completed=index,
                     payload=payload,
                     request=request,
                 )
             )
-            break
+        return tuple(outputs)
+
+    pending = iter(work_items)
+    in_flight: deque[Future[ActivityStageOutput]] = deque()
+    cancelled_item: WorkItem | None = None
+    with ThreadPoolExecutor(
+        max_workers=min(workers, total or 1),
+        thread_name_prefix=f"histdatacom-{stage}",
+    ) as executor:
+        while True:
+            while cancelled_item is None and len(in_flight) < workers:
+                work_item = next(pending, None)
+                if work_item is None:
+                    break
+                if _activity_cancelled():
+                    cancelled_item = work_item
+                    break
+                in_flight.append(executor.submit(run_one, work_item))
+            if not in_flight:
+                break
+            outputs.append(
+                _observe_and_persist_activity_output(
+                    in_flight.popleft().result(),
+                    total=total,
+                    completed=len(outputs) + 1,
+                    payload=payload,
+                    request=request,
+                )
+            )
+    if cancelled_item is not None:
         outputs.append(
             _observe_and_persist_activity_output(
-                run_one(work_item),
+                _cancelled_activity_output(cancelled_item, stage),
                 total=total,
-                completed=index,
+                completed=len(outputs),
+                increment=0,
                 payload=payload,
                 request=request,
             )
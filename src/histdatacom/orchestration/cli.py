@@ -37,6 +37,7 @@ from histdatacom.orchestration.client import (
     resume_job_sync,
     resolve_orchestration_worker_config,
     retry_job_sync,
+    stored_job_stage_timings,
     submit_control_job_sync,
 )
 from histdatacom.orchestration.control import (
@@ -361,6 +362,7 @@ def _add_jobs_args(parser: argparse.ArgumentParser) -> None:
         ("logs", "show one job's event/log view"),
         ("artifacts", "show one job's artifact view"),
         ("result", "show one job's result payload"),
+        ("timings", "show one job's per-stage p50/p95 phase timings"),
         ("cancel", "request job cancellation"),
         ("retry", "start a deterministic retry replacement job"),
         ("resume", "start a deterministic resume replacement job"),
@@ -722,6 +724,29 @@ def _write_preflight_payload(payload: dict, *, as_json: bool) -> None:
     print(f"workspace: {payload['workspace']}")  # noqa:T201
 
 
+def _write_stage_timings_payload(payload: dict, *, as_json: bool) -> None:
+    """Write per-stage phase timing percentiles as JSON or a text table."""
+    if as_json:
+        _write_control_payload(payload, as_json=True)
+        return
+    print(f"{payload['workflow_id']}: stage timings")  # noqa:T201
+    stages = payload.get("stages", {})
+    if not stages:
+        print("no timed stage results")  # noqa:T201
+        return
+    for stage, summary in stages.items():
+        print(  # noqa:T201
+            f"{stage}: items={summary['count']} "
+            f"bytes_in={summary['bytes_in']} bytes_out={summary['bytes_out']}"
+        )
+        for phase, timing in summary["phases"].items():
+            print(  # noqa:T201
+                f"  {phase}: p50={timing['p50_ms']:.3f}ms "
+                f"p95={timing['p95_ms']:.3f}ms "
+                f"total={timing['total_ms']:.3f}ms n={timing['count']}"
+            )
+
+
 def _format_schedule_filters(
     *,
     active_only: bool,
@@ -923,6 +948,17 @@ def _run_jobs_command(args: argparse.Namespace) -> int:
         }
         _write_control_payload(payload, as_json=args.json)
         return 0
+    if args.jobs_command == "timings":
+        timings = stored_job_stage_timings(
+            args.workflow_id,
+            config=config,
+            supervisor=supervisor,
+        )
+        _write_stage_timings_payload(
+            {"schema_version": CONTROL_SCHEMA_VERSION, **timings},
+            as_json=args.json,
+        )
+        return 0
     if args.jobs_command == "cancel":
         snapshot = cancel_job_sync(
             args.workflow_id,
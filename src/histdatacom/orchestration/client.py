@@ -1938,6 +1938,35 @@ def list_stored_job_statuses(
     )
 
 
+def stored_job_stage_timings(
+    workflow_id: str,
+    *,
+    config: OrchestrationWorkerConfig | None = None,
+    supervisor: OrchestrationSupervisor | None = None,
+    status_store: ManifestStatusStore | None = None,
+) -> dict[str, JSONValue]:
+    """Return per-phase stage timing percentiles for one stored job.
+
+    Timings come from the ``stage_results`` rows that the job's activities
+    persisted, so Temporal does not need to be running.
+    """
+    resolved_config = resolve_orchestration_worker_config(
+        config=config,
+        supervisor=supervisor,
+    )
+    store = status_store or orchestration_job_store(resolved_config)
+    snapshot = _stored_job_snapshot_or_raise(
+        workflow_id,
+        config=resolved_config,
+        status_store=store,
+    )
+    return {
+        "workflow_id": snapshot.workflow_id,
+        "request_id": snapshot.request_id,
+        "stages": store.stage_timing_summary(request_id=snapshot.request_id),
+    }
+
+
 async def _start_replacement_job(
     workflow_id: str,
     *,
@@ -42,7 +42,10 @@ from histdatacom.orchestration.workflows import (
     BATCHING_METADATA_KEY,
     FANOUT_METADATA_KEY,
     MAX_PARALLEL_CHILD_WORKFLOWS_METADATA_KEY,
+    MAX_IN_FLIGHT_PER_LANE_METADATA_KEY,
     MAX_WORK_ITEMS_PER_BATCH_METADATA_KEY,
+    PIPELINING_METADATA_KEY,
+    STREAM_WORK_ITEMS_METADATA_KEY,
 )
 
 LIVE_RUNTIME_THROUGHPUT_ENV = "HISTDATACOM_LIVE_RUNTIME_THROUGHPUT"
@@ -198,6 +201,8 @@ def default_throughput_benchmark_matrix(
     requests_timeout: str = DEFAULT_THROUGHPUT_TIMEOUT_SECONDS,
     max_work_items_per_batch: int = 1,
     max_parallel_child_workflows: int = 2,
+    stream_work_items: bool = False,
+    max_in_flight_per_lane: int = 4,
 ) -> tuple[ThroughputBenchmarkScenario, ...]:
     """Return the issue-180/181 representative non-Influx benchmark matrix."""
     data_root = Path(data_directory).expanduser()
@@ -213,6 +218,11 @@ def default_throughput_benchmark_matrix(
         },
         "benchmark_issue": 180,
     }
+    if stream_work_items:
+        metadata[PIPELINING_METADATA_KEY] = {
+            STREAM_WORK_ITEMS_METADATA_KEY: True,
+            MAX_IN_FLIGHT_PER_LANE_METADATA_KEY: max_in_flight_per_lane,
+        }
 
     def request(name: str, **kwargs: Any) -> RunRequest:
         return RunRequest(
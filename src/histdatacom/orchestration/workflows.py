@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import nullcontext
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import timedelta
 import hashlib
+import heapq
 from importlib import import_module
 import logging
 from typing import Any, Callable, Mapping, Protocol, TypeVar, cast
@@ -629,6 +630,28 @@ DEFAULT_MAX_PARALLEL_CHILD_WORKFLOWS = 4
 FANOUT_METADATA_KEY = "temporal_fanout"
 MAX_PARALLEL_CHILD_WORKFLOWS_METADATA_KEY = "max_parallel_child_workflows"
 SYMBOL_TIMEFRAME_WORKFLOW = "SymbolTimeframeWorkflow"
+PIPELINING_METADATA_KEY = "temporal_pipelining"
+STREAM_WORK_ITEMS_METADATA_KEY = "stream_work_items"
+MAX_IN_FLIGHT_PER_LANE_METADATA_KEY = "max_in_flight_per_lane"
+DEFAULT_MAX_IN_FLIGHT_PER_LANE = 4
+_PIPELINED_SUMMED_METRICS = frozenset(
+    {
+        "child_stage_count",
+        "sampled_child_stage_count",
+        "work_item_count",
+        "artifact_count",
+        "event_count",
+    }
+)
+PIPELINED_WORKFLOWS = frozenset(
+    {
+        "ValidateUrlsWorkflow",
+        "DownloadArchivesWorkflow",
+        "ExtractCsvWorkflow",
+        "BuildCacheWorkflow",
+        "ImportWorkflow",
+    }
+)
 
 
 def workflow_topology_document() -> dict[str, JSONValue]:
@@ -644,6 +667,9 @@ def workflow_topology_document() -> dict[str, JSONValue]:
             "max_parallel_child_workflows": (
                 MAX_PARALLEL_CHILD_WORKFLOWS_METADATA_KEY
             ),
+            "pipelining": PIPELINING_METADATA_KEY,
+            "stream_work_items": STREAM_WORK_ITEMS_METADATA_KEY,
+            "max_in_flight_per_lane": MAX_IN_FLIGHT_PER_LANE_METADATA_KEY,
             "dataset_plan_ref": DATASET_PLAN_REF_KEY,
             "dataset_plan_batches": DATASET_PLAN_BATCHES_KEY,
             "plan_spill": PLAN_SPILL_METADATA_KEY,
@@ -662,7 +688,10 @@ def workflow_topology_document() -> dict[str, JSONValue]:
             "work items are grouped into deterministic "
             "pair/timeframe/format/year-month batches before operation "
             "workflows run. Independent symbol/timeframe batch workflows are "
-            "started with deterministic bounded fan-out."
+            "started with deterministic bounded fan-out. With "
+            "stream_work_items enabled, each work item moves to the next "
+            "per-item stage as soon as its previous stage finishes, within "
+            "bounded per-lane in-flight windows."
         ),
         "workflows": [spec.to_dict() for spec in WORKFLOW_TOPOLOGY],
     }
@@ -833,6 +862,36 @@ def max_parallel_child_workflows(
     return _positive_parallelism(value)
 
 
+def stream_work_items(request: RunRequest) -> bool:
+    """Return whether symbol batches pipeline work items across stages."""
+    pipelining = request.metadata.get(PIPELINING_METADATA_KEY)
+    value: object | None = None
+    if isinstance(pipelining, Mapping):
+        value = pipelining.get(STREAM_WORK_ITEMS_METADATA_KEY)
+    if value is None:
+        value = request.metadata.get(STREAM_WORK_ITEMS_METADATA_KEY)
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+def max_in_flight_per_lane(
+    request: RunRequest,
+    *,
+    default: int = DEFAULT_MAX_IN_FLIGHT_PER_LANE,
+) -> int:
+    """Return the per-lane child window used by streamed symbol batches."""
+    pipelining = request.metadata.get(PIPELINING_METADATA_KEY)
+    value: object | None = None
+    if isinstance(pipelining, Mapping):
+        value = pipelining.get(MAX_IN_FLIGHT_PER_LANE_METADATA_KEY)
+    if value is None:
+        value = request.metadata.get(MAX_IN_FLIGHT_PER_LANE_METADATA_KEY)
+    if value is None:
+        return _positive_in_flight(default)
+    return _positive_in_flight(value)
+
+
 async def execute_histdata_run_workflow(
     request: RunRequest,
     *,
@@ -1501,6 +1560,10 @@ async def _execute_child_plan(
     current_plan_ref = dict(plan_ref or {})
     current_plan_batches: tuple[dict[str, str], ...] = ()
     pending_invocations = list(invocations)
+    pipelined = (
+        workflow_name == SYMBOL_TIMEFRAME_WORKFLOW
+        and stream_work_items(request)
+    )
     index = 0
     while index < len(pending_invocations):
         invocation = pending_invocations[index]
@@ -1545,6 +1608,47 @@ async def _execute_child_plan(
                 break
             continue
 
+        stage_invocations, next_index = (
+            _pipelined_invocations(pending_invocations, start_index=index)
+            if pipelined
+            else ((), index)
+        )
+        if len(stage_invocations) > 1 and (
+            stage_work_items := _partition_work_items(
+                current_work_items,
+                _string_mapping(invocation.payload.get("partition", {})),
+            )
+        ):
+            stage_results, current_work_items = (
+                await _execute_pipelined_invocations(
+                    request,
+                    parent_workflow=workflow_name,
+                    invocations=stage_invocations,
+                    work_items=stage_work_items,
+                    executor=executor,
+                )
+            )
+            current_plan_ref = {}
+            for stage_invocation, result in zip(
+                stage_invocations,
+                stage_results,
+            ):
+                results.append(result)
+                progress.record_child(stage_invocation.workflow_name, result)
+                _workflow_log_child_result(
+                    request,
+                    parent_workflow=workflow_name,
+                    invocation=stage_invocation,
+                    result=result,
+                )
+            index = next_index
+            if any(
+                result.status == WorkStatus.CANCELLED
+                for result in stage_results
+            ):
+                break
+            continue
+
         prepared = _prepare_child_invocation(
             invocation,
             current_work_items,
@@ -1651,6 +1755,247 @@ async def _execute_child_plan(
     )
 
 
+class _LaneWindow:
+    """Bounded in-flight child window for one task-queue lane.
+
+    Waiters are admitted by ``(-stage_index, item_position)`` so items that
+    are further along the pipeline drain before new items enter it.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._available = capacity
+        self._waiters: list[tuple[tuple[int, int], asyncio.Future[None]]] = []
+
+    async def acquire(self, priority: tuple[int, int]) -> None:
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+        waiter: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        heapq.heappush(self._waiters, (priority, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _priority, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._available += 1
+
+
+def _pipelined_invocations(
+    invocations: list[WorkflowInvocation],
+    *,
+    start_index: int,
+) -> tuple[tuple[WorkflowInvocation, ...], int]:
+    group: list[WorkflowInvocation] = []
+    index = start_index
+    while (
+        index < len(invocations)
+        and invocations[index].workflow_name in PIPELINED_WORKFLOWS
+    ):
+        group.append(invocations[index])
+        index += 1
+    return tuple(group), index
+
+
+async def _execute_pipelined_invocations(
+    request: RunRequest,
+    *,
+    parent_workflow: str,
+    invocations: tuple[WorkflowInvocation, ...],
+    work_items: tuple[WorkItem, ...],
+    executor: ChildWorkflowExecutor,
+) -> tuple[tuple[StageResult, ...], tuple[WorkItem, ...]]:
+    """Stream each work item through consecutive per-item stages.
+
+    Every item runs its own child for each stage and moves on as soon as
+    that child finishes, so download and parse lanes overlap.  Child
+    results are folded back into one result per stage, in stage order, so
+    callers see the same shape as the barrier path.  A cancelled child stops
+    new children from starting; in-flight ones are allowed to finish.
+    """
+    capacity = max_in_flight_per_lane(request)
+    windows: dict[TaskQueueLane, _LaneWindow] = {}
+    for invocation in invocations:
+        windows.setdefault(invocation.task_queue_lane, _LaneWindow(capacity))
+    stage_results: list[list[StageResult | None]] = [
+        [None] * len(work_items) for _ in invocations
+    ]
+    outputs: list[tuple[WorkItem, ...]] = [() for _ in work_items]
+    cancelled = False
+    _workflow_log(
+        logging.DEBUG,
+        "Workflow item pipeline started request_id=%s stage_count=%d "
+        "work_item_count=%d max_in_flight=%d",
+        request.request_id,
+        len(invocations),
+        len(work_items),
+        capacity,
+        request_id=request.request_id,
+        parent_workflow=parent_workflow,
+        stage_count=len(invocations),
+        work_item_count=len(work_items),
+        max_in_flight=capacity,
+    )
+
+    async def run_item(position: int, item: WorkItem) -> None:
+        nonlocal cancelled
+        forwarded: tuple[WorkItem, ...] = (item,)
+        for stage_index, invocation in enumerate(invocations):
+            if cancelled or not forwarded:
+                return
+            child = _pipelined_item_invocation(invocation, item, forwarded)
+            window = windows[invocation.task_queue_lane]
+            await window.acquire((-stage_index, position))
+            try:
+                if cancelled:
+                    return
+                try:
+                    result_payload = await executor.execute_child_workflow(
+                        child.workflow_name,
+                        child.payload,
+                        workflow_id=child.workflow_id,
+                        task_queue=child.task_queue,
+                    )
+                except Exception as err:
+                    _workflow_log(
+                        logging.ERROR,
+                        "Workflow child failed request_id=%s "
+                        "parent_workflow=%s child_workflow=%s error=%s",
+                        request.request_id,
+                        parent_workflow,
+                        child.workflow_name,
+                        str(err),
+                        request_id=request.request_id,
+                        parent_workflow=parent_workflow,
+                        child_workflow=child.workflow_name,
+                        child_workflow_id=child.workflow_id,
+                        task_queue=child.task_queue,
+                        error_type=type(err).__name__,
+                        error=str(err),
+                    )
+                    raise
+            finally:
+                window.release()
+            result = _stage_result_from_mapping(
+                result_payload,
+                fallback_stage=invocation.workflow_name,
+            )
+            stage_results[stage_index][position] = result
+            next_items = _forwarded_work_items(result_payload)
+            if next_items or _has_work_item_payload(result_payload):
+                forwarded = next_items
+            if result.status == WorkStatus.CANCELLED:
+                cancelled = True
+                return
+        outputs[position] = forwarded
+
+    tasks = [
+        asyncio.ensure_future(run_item(position, item))
+        for position, item in enumerate(work_items)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    results: list[StageResult] = []
+    for invocation, item_results in zip(invocations, stage_results):
+        ran = tuple(result for result in item_results if result is not None)
+        if not ran and cancelled:
+            break
+        results.append(_pipelined_stage_result(invocation, ran))
+    forwarded_items = tuple(item for output in outputs for item in output)
+    return tuple(results), forwarded_items
+
+
+def _pipelined_item_invocation(
+    invocation: WorkflowInvocation,
+    item: WorkItem,
+    work_items: tuple[WorkItem, ...],
+) -> WorkflowInvocation:
+    suffix = item.work_id.removeprefix("work-")
+    workflow_id = f"{invocation.workflow_id}-{suffix}"
+    payload = _payload_with_work_items(invocation.payload, work_items)
+    payload["workflow_id"] = workflow_id
+    payload["partition"] = cast(
+        JSONValue,
+        {
+            **_string_mapping(invocation.payload.get("partition", {})),
+            "work_ids": ",".join(work_item.work_id for work_item in work_items),
+            "work_item_count": str(len(work_items)),
+        },
+    )
+    return replace(invocation, workflow_id=workflow_id, payload=payload)
+
+
+def _pipelined_stage_result(
+    invocation: WorkflowInvocation,
+    results: tuple[StageResult, ...],
+) -> StageResult:
+    """Fold per-item child results into the stage's batch-shaped result."""
+    if not results:
+        return _skipped_workflow_result(
+            invocation,
+            reason="No forwardable work items for this stage.",
+        )
+    if len(results) == 1:
+        return results[0]
+    statuses = {result.status for result in results}
+    status = next(
+        (
+            candidate
+            for candidate in (
+                WorkStatus.CANCELLED,
+                WorkStatus.FAILED,
+                WorkStatus.RETRIED,
+            )
+            if candidate in statuses
+        ),
+        WorkStatus.COMPLETED,
+    )
+    metrics: dict[str, JSONValue] = {}
+    for result in results:
+        for key, value in result.metrics.items():
+            if key in _PIPELINED_SUMMED_METRICS:
+                metrics[key] = int(cast(int, metrics.get(key, 0))) + (
+                    _non_negative_metric_int(value) or 0
+                )
+            else:
+                metrics.setdefault(key, value)
+    return StageResult(
+        work_id=results[0].work_id,
+        stage=invocation.workflow_name,
+        status=status,
+        artifacts=_bounded_recent(
+            tuple(
+                artifact for result in results for artifact in result.artifacts
+            ),
+            WORKFLOW_SUMMARY_ARTIFACT_LIMIT,
+        ),
+        failure=next(
+            (
+                result.failure
+                for result in results
+                if result.failure is not None
+            ),
+            None,
+        ),
+        metrics=metrics,
+    )
+
+
 def _expand_pending_symbol_invocations(
     request: RunRequest,
     pending_invocations: list[WorkflowInvocation],
@@ -2724,6 +3069,18 @@ def _positive_parallelism(value: object) -> int:
     return normalized
 
 
+def _positive_in_flight(value: object) -> int:
+    if isinstance(value, bool):
+        raise ValueError("max_in_flight_per_lane must be a positive integer")
+    if isinstance(value, int):
+        normalized = value
+    else:
+        normalized = int(str(value))
+    if normalized < 1:
+        raise ValueError("max_in_flight_per_lane must be a positive integer")
+    return normalized
+
+
 def _refresh_progress_plan(
     progress: WorkflowProgress,
     invocations: tuple[WorkflowInvocation, ...],
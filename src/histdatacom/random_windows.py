@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 from functools import lru_cache, reduce
 from operator import or_
-from typing import Any, Mapping, Sequence, cast
+from typing import Any, Iterable, Mapping, Sequence, cast
 from zoneinfo import ZoneInfo
 
 RANDOM_WINDOW_EXPRESSION_SCHEMA_VERSION = (
@@ -528,7 +528,11 @@ def random_window_intervals_for_range(
     range_start_utc_ms: int,
     range_end_utc_ms: int,
 ) -> tuple[tuple[int, int], ...]:
-    """Return selected half-open intervals overlapping one bounded range."""
+    """Return selected half-open intervals overlapping one bounded range.
+
+    The intervals are clipped to the range, sorted, and coalesced, so
+    callers can slice a time-ordered frame once per interval.
+    """
     _validate_ms_interval(
         range_start_utc_ms,
         range_end_utc_ms,
@@ -550,20 +554,40 @@ def random_window_intervals_for_range(
             selection.support_start_utc_ms,
             selection.support_end_utc_ms,
         )
-    return tuple(
+    return coalesce_random_window_intervals(
         (max(start, range_start_utc_ms), min(end, range_end_utc_ms))
         for start, end in candidates
         if start < range_end_utc_ms and end > range_start_utc_ms
     )
 
 
+def coalesce_random_window_intervals(
+    intervals: Iterable[tuple[int, int]],
+) -> tuple[tuple[int, int], ...]:
+    """Return a sorted union of half-open intervals without overlaps."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return tuple(merged)
+
+
 def filter_polars_frame_to_random_window(
     frame: Any,
     selection: RandomWindowSelectionV1 | Mapping[str, Any] | None,
     *,
     timestamp_column: str = "datetime",
 ) -> Any:
-    """Filter one eager Polars frame to the exact selected interval union."""
+    """Filter one eager Polars frame to the exact selected interval union.
+
+    A time-ordered integer timestamp column is binary-searched once per
+    interval and the matching row ranges are sliced out.  Unordered frames
+    fall back to a row predicate.
+    """
     if selection is None:
         return frame
     resolved = (
@@ -579,12 +603,20 @@ def filter_polars_frame_to_random_window(
         return frame
     import polars as pl
 
-    bounds = frame.select(
-        pl.col(timestamp_column).min().alias("start"),
-        pl.col(timestamp_column).max().alias("end"),
-    ).row(0)
-    range_start = int(bounds[0])
-    range_end = int(bounds[1]) + 1
+    timestamps = frame.get_column(timestamp_column)
+    sorted_integers = timestamps.dtype.is_integer() and (
+        timestamps.null_count() == 0 and timestamps.is_sorted()
+    )
+    if sorted_integers:
+        range_start = int(timestamps[0])
+        range_end = int(timestamps[-1]) + 1
+    else:
+        bounds = frame.select(
+            pl.col(timestamp_column).min().alias("start"),
+            pl.col(timestamp_column).max().alias("end"),
+        ).row(0)
+        range_start = int(bounds[0])
+        range_end = int(bounds[1]) + 1
     intervals = random_window_intervals_for_range(
         resolved,
         range_start_utc_ms=range_start,
@@ -592,11 +624,56 @@ def filter_polars_frame_to_random_window(
     )
     if not intervals:
         return frame.head(0)
+    if not sorted_integers:
+        return frame.filter(
+            random_window_polars_predicate(
+                intervals,
+                timestamp_column=timestamp_column,
+            )
+        )
+    return _slice_sorted_frame_to_intervals(frame, timestamps, intervals)
+
+
+def _slice_sorted_frame_to_intervals(
+    frame: Any,
+    timestamps: Any,
+    intervals: Sequence[tuple[int, int]],
+) -> Any:
+    """Binary-search each interval in a sorted column and concatenate slices."""
+    import polars as pl
+
+    bounds = pl.Series(
+        [bound for interval in intervals for bound in interval],
+        dtype=timestamps.dtype,
+    )
+    offsets = timestamps.search_sorted(bounds, side="left").to_list()
+    slices = [
+        frame.slice(offset, end_offset - offset)
+        for offset, end_offset in zip(offsets[::2], offsets[1::2])
+        if end_offset > offset
+    ]
+    if not slices:
+        return frame.head(0)
+    if len(slices) == 1:
+        return slices[0]
+    return pl.concat(slices)
+
+
+def random_window_polars_predicate(
+    intervals: Sequence[tuple[int, int]],
+    *,
+    timestamp_column: str = "datetime",
+) -> Any:
+    """Return a Polars predicate for a non-empty half-open interval union."""
+    if not intervals:
+        raise RandomWindowError("random-window predicate requires intervals")
+    import polars as pl
+
     predicates = [
         (pl.col(timestamp_column) >= start) & (pl.col(timestamp_column) < end)
         for start, end in intervals
     ]
-    return frame.filter(reduce(or_, predicates))
+    return reduce(or_, predicates)
 
 
 @lru_cache(maxsize=64)
@@ -1041,6 +1118,7 @@ __all__ = [
     "parse_random_window_expression",
     "random_window_intervals_for_range",
     "random_window_planning_yearmonths",
+    "random_window_polars_predicate",
     "random_window_requires_seed",
     "random_window_selection_from_metadata",
     "resolve_random_window_selection",
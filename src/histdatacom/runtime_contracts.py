@@ -428,6 +428,8 @@ class RunRequest:
     quality_fail_on: str = "error"
     quality_max_errors: int = 0
     quality_max_warnings: int = 0
+    quality_jobs: int = 1
+    quality_incremental: bool = False
     quality_profile_path: str = ""
     quality_profile: dict[str, JSONValue] = field(default_factory=dict)
     repo_quality_refresh: bool = False
@@ -529,6 +531,10 @@ class RunRequest:
             quality_max_warnings=int(
                 getattr(options, "quality_max_warnings", 0) or 0
             ),
+            quality_jobs=int(getattr(options, "quality_jobs", 1) or 0),
+            quality_incremental=bool(
+                getattr(options, "quality_incremental", False)
+            ),
             quality_profile_path=str(
                 getattr(options, "quality_profile_path", "") or ""
             ),
@@ -574,6 +580,8 @@ class RunRequest:
             "quality_fail_on": self.quality_fail_on,
             "quality_max_errors": self.quality_max_errors,
             "quality_max_warnings": self.quality_max_warnings,
+            "quality_jobs": self.quality_jobs,
+            "quality_incremental": self.quality_incremental,
             "quality_profile_path": self.quality_profile_path,
             "quality_profile": dict(self.quality_profile),
             "repo_quality_refresh": self.repo_quality_refresh,
@@ -630,6 +638,8 @@ class RunRequest:
             ),
             quality_max_errors=int(data.get("quality_max_errors", 0) or 0),
             quality_max_warnings=int(data.get("quality_max_warnings", 0) or 0),
+            quality_jobs=int(data.get("quality_jobs", 1) or 0),
+            quality_incremental=bool(data.get("quality_incremental", False)),
             quality_profile_path=str(
                 data.get("quality_profile_path", "") or ""
             ),
@@ -0,0 +1,134 @@
+"""Monotonic span timers and byte counters for activity stage metrics."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from histdatacom.runtime_contracts import JSONValue
+
+TIMINGS_METRIC_KEY = "timings_ms"
+BYTES_IN_METRIC_KEY = "bytes_in"
+BYTES_OUT_METRIC_KEY = "bytes_out"
+
+_T = TypeVar("_T")
+
+
+class StageTimer:
+    """Accumulate per-phase wall time and bytes for one stage invocation.
+
+    Spans with the same phase name add up, so a phase timed once per chunk
+    reports its total for the work item.  The timer is always on: a span
+    costs two ``perf_counter_ns`` calls and a dict update.
+    """
+
+    __slots__ = ("_clock", "_spans_ns", "bytes_in", "bytes_out")
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        self._clock = clock
+        self._spans_ns: dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @contextmanager
+    def span(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block as ``phase``."""
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.add(phase, self._clock() - started)
+
+    def add(self, phase: str, elapsed_ns: int) -> None:
+        """Add an externally measured duration to ``phase``."""
+        self._spans_ns[phase] = self._spans_ns.get(phase, 0) + elapsed_ns
+
+    def timed(self, phase: str, items: Iterable[_T]) -> Iterator[_T]:
+        """Yield from ``items``, timing each ``next`` call as ``phase``."""
+        iterator = iter(items)
+        while True:
+            started = self._clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(phase, self._clock() - started)
+                return
+            self.add(phase, self._clock() - started)
+            yield item
+
+    def count_bytes(self, *, bytes_in: int = 0, bytes_out: int = 0) -> None:
+        """Add to the stage's input and output byte counters."""
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+
+    def metrics(self) -> dict[str, JSONValue]:
+        """Return the timing block merged into ``StageResult.metrics``."""
+        return {
+            TIMINGS_METRIC_KEY: {
+                phase: round(elapsed_ns / 1_000_000, 3)
+                for phase, elapsed_ns in self._spans_ns.items()
+            },
+            BYTES_IN_METRIC_KEY: self.bytes_in,
+            BYTES_OUT_METRIC_KEY: self.bytes_out,
+        }
+
+
+def summarize_stage_timings(
+    results: Iterable[tuple[str, Mapping[str, Any]]],
+) -> dict[str, JSONValue]:
+    """Aggregate ``(stage, metrics)`` pairs into per-phase p50/p95 reports.
+
+    Metrics without a timing block, such as reused artifacts recorded before
+    timing existed, are skipped.
+    """
+    samples: dict[str, dict[str, list[float]]] = {}
+    totals: dict[str, dict[str, int]] = {}
+    for stage, metrics in results:
+        timings = metrics.get(TIMINGS_METRIC_KEY)
+        if not isinstance(timings, Mapping):
+            continue
+        stage_samples = samples.setdefault(stage, {})
+        for phase, elapsed_ms in timings.items():
+            if isinstance(elapsed_ms, (int, float)):
+                stage_samples.setdefault(str(phase), []).append(
+                    float(elapsed_ms)
+                )
+        stage_totals = totals.setdefault(
+            stage,
+            {"count": 0, BYTES_IN_METRIC_KEY: 0, BYTES_OUT_METRIC_KEY: 0},
+        )
+        stage_totals["count"] += 1
+        for key in (BYTES_IN_METRIC_KEY, BYTES_OUT_METRIC_KEY):
+            value = metrics.get(key)
+            if isinstance(value, int):
+                stage_totals[key] += value
+    return {
+        stage: {
+            **totals[stage],
+            "phases": {
+                phase: _phase_summary(values)
+                for phase, values in sorted(samples[stage].items())
+            },
+        }
+        for stage in sorted(samples)
+    }
+
+
+def _phase_summary(values: list[float]) -> dict[str, JSONValue]:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "total_ms": round(math.fsum(ordered), 3),
+        "p50_ms": _nearest_rank(ordered, 0.50),
+        "p95_ms": _nearest_rank(ordered, 0.95),
+        "max_ms": ordered[-1],
+    }
+
+
+def _nearest_rank(ordered: list[float], quantile: float) -> float:
+    rank = max(1, math.ceil(quantile * len(ordered)))
+    return ordered[rank - 1]
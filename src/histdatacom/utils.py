@@ -18,6 +18,7 @@ from rich import print  # pylint: disable=redefined-builtin
 
 API_RETURN_TYPE_MODULES = {
     "arrow": "pyarrow",
+    "lazy": "polars",
     "pandas": "pandas",
     "polars": "polars",
 }
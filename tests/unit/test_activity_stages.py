@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import hashlib
 import io
+import json
 import shutil
 import zipfile
 from pathlib import Path
@@ -33,7 +34,9 @@ from histdatacom.activity_stages import (
     parse_histdata_form_metadata,
     read_repository_data_file,
     repository_data_with_record,
+    read_repository_index,
     repository_refresh_stage,
+    scan_cache_items,
     validate_url_work_item,
     write_repository_data_file,
 )
@@ -1136,6 +1139,20 @@ def test_build_cache_work_item_writes_cache_from_csv(
     assert set(required_training_feature_columns()).issubset(schema)
     assert output.result.artifacts[0].path == str(tmp_path / CACHE_FILENAME)
     assert output.result.artifacts[0].sha256
+    assert set(output.result.metrics["timings_ms"]) == {
+        "csv_read",
+        "csv_parse",
+        "datetime_convert",
+        "training_features",
+        "ipc_write",
+        "cache_hash",
+    }
+    assert output.result.metrics["bytes_in"] == (
+        (FIXTURES / filename).stat().st_size
+    )
+    assert output.result.metrics["bytes_out"] == (
+        (tmp_path / CACHE_FILENAME).stat().st_size
+    )
 
 
 def test_build_cache_work_item_reuses_existing_cache(
@@ -1246,6 +1263,37 @@ def test_build_cache_work_item_invalid_source_is_failed(
     assert not (tmp_path / CACHE_FILENAME).exists()
 
 
+def test_build_cache_work_item_enforces_memory_limit(
+    tmp_path: Path,
+) -> None:
+    """Sources decoding past the configured ceiling fail without a cache."""
+    filename = "DAT_ASCII_EURUSD_T_201202.csv"
+    rows = "".join(
+        f"20120201 {index // 1000:06d}{index % 1000:03d},1.3066,1.3067,0\n"
+        for index in range(60_000)
+    )
+    (tmp_path / filename).write_text(rows, encoding="utf-8")
+    record = Record(
+        data_dir=f"{tmp_path}{os.sep}",
+        csv_filename=filename,
+        zip_filename="missing.zip",
+        data_format="ascii",
+        data_timeframe="T",
+        data_fxpair="eurusd",
+        status=WorkStatus.CSV_FILE.value,
+    )
+
+    output = build_cache_work_item(
+        WorkItem.from_record(record),
+        args={**_args(tmp_path), "cache_memory_limit_mb": 1},
+    )
+
+    assert output.work_item.status is WorkStatus.FAILED
+    assert output.result.failure is not None
+    assert output.result.failure.code == "CACHE_MEMORY_LIMIT_EXCEEDED"
+    assert not (tmp_path / CACHE_FILENAME).exists()
+
+
 def test_build_cache_work_item_noops_unsupported_raw_dimensions(
     tmp_path: Path,
 ) -> None:
@@ -1493,6 +1541,164 @@ def test_merge_cache_items_fails_on_empty_selected_projection(
         )
 
 
+def _month_cache_items(tmp_path: Path) -> list[WorkItem]:
+    """Write three hourly-spaced month caches and return their work items."""
+    import polars as pl
+
+    items = []
+    for month, start in enumerate(
+        (1_704_067_200_000, 1_706_745_600_000, 1_709_251_200_000),
+        start=1,
+    ):
+        data_dir = tmp_path / f"2024{month:02d}"
+        data_dir.mkdir()
+        datetimes = [start + offset * 3_600_000 for offset in range(48)]
+        write_polars_cache(
+            pl.DataFrame(
+                {
+                    "datetime": datetimes,
+                    "bid": [1.1 + offset / 1000 for offset in range(48)],
+                    "ask": [1.2 + offset / 1000 for offset in range(48)],
+                    "vol": [0] * 48,
+                },
+                schema={
+                    "datetime": pl.Int64,
+                    "bid": pl.Float64,
+                    "ask": pl.Float64,
+                    "vol": pl.Int32,
+                },
+            ),
+            data_dir / CACHE_FILENAME,
+        )
+        items.append(
+            WorkItem.from_record(
+                Record(
+                    data_dir=f"{data_dir}{os.sep}",
+                    cache_filename=CACHE_FILENAME,
+                    cache_start=str(datetimes[0]),
+                    cache_end=str(datetimes[-1]),
+                    data_format="ascii",
+                    data_timeframe="T",
+                    data_fxpair="eurusd",
+                )
+            )
+        )
+    return items
+
+
+def test_scan_cache_items_skips_months_outside_requested_range(
+    tmp_path: Path,
+) -> None:
+    """Lazy scans should only open months whose bounds overlap the range."""
+    import polars as pl
+
+    items = _month_cache_items(tmp_path)
+    start = 1_706_745_600_000 + 3_600_000
+    end = start + 3 * 3_600_000
+    for skipped in (items[0], items[2]):
+        Path(skipped.data_dir, CACHE_FILENAME).write_bytes(b"not a cache")
+
+    scan = scan_cache_items(
+        list(reversed(items)),
+        columns=("datetime", "bid"),
+        start_utc_ms=start,
+        end_utc_ms=end,
+    )
+
+    assert isinstance(scan, pl.LazyFrame)
+    merged = scan.collect()
+    assert merged.columns == ["datetime", "bid"]
+    assert merged["datetime"].to_list() == [
+        start,
+        start + 3_600_000,
+        start + 7_200_000,
+    ]
+
+
+def test_lazy_cache_merge_matches_eager_random_window_merge(
+    tmp_path: Path,
+) -> None:
+    """The lazy return type should collect to the eager merge result."""
+    import polars as pl
+
+    items = _month_cache_items(tmp_path)
+    selection = RandomWindowSelectionV1(
+        expression="6h",
+        mode="random",
+        support_start_utc_ms=1_704_067_200_000,
+        support_end_utc_ms=1_711_929_600_000,
+        seed=4,
+        selected_start_utc_ms=1_706_745_600_000 - 3_600_000,
+        selected_end_utc_ms=1_706_745_600_000 + 5 * 3_600_000,
+    )
+    Path(items[2].data_dir, CACHE_FILENAME).write_bytes(b"not a cache")
+
+    lazy = merge_cache_items(
+        items,
+        return_type="lazy",
+        output_timezone="America/New_York",
+        random_selection=selection,
+    )
+    eager = merge_cache_items(
+        items[:2],
+        return_type="polars",
+        output_timezone="America/New_York",
+        random_selection=selection,
+    )
+
+    assert isinstance(lazy, pl.LazyFrame)
+    assert lazy.collect().equals(eager)
+    assert eager.height == 5
+
+
+def test_merge_cache_items_skips_months_outside_random_window(
+    tmp_path: Path,
+) -> None:
+    """Eager merges should never open months the window cannot reach."""
+    items = _month_cache_items(tmp_path)
+    selection = RandomWindowSelectionV1(
+        expression="2h",
+        mode="random",
+        support_start_utc_ms=1_704_067_200_000,
+        support_end_utc_ms=1_711_929_600_000,
+        seed=4,
+        selected_start_utc_ms=1_706_745_600_000 + 3_600_000,
+        selected_end_utc_ms=1_706_745_600_000 + 3 * 3_600_000,
+    )
+    for skipped in (items[0], items[2]):
+        Path(skipped.data_dir, CACHE_FILENAME).write_bytes(b"not a cache")
+
+    merged = merge_cache_items(
+        items,
+        return_type="polars",
+        random_selection=selection,
+    )
+
+    assert merged["datetime"].to_list() == [
+        1_706_745_600_000 + 3_600_000,
+        1_706_745_600_000 + 2 * 3_600_000,
+    ]
+
+
+def test_scan_cache_items_fails_when_no_month_overlaps_selection(
+    tmp_path: Path,
+) -> None:
+    """A random window outside every month should fail before collection."""
+    items = _month_cache_items(tmp_path)
+    selection = RandomWindowSelectionV1(
+        expression="1h",
+        mode="random",
+        support_start_utc_ms=1_704_067_200_000,
+        support_end_utc_ms=1_711_929_600_000,
+        seed=4,
+        selected_start_utc_ms=1_710_979_200_000,
+        selected_end_utc_ms=1_710_982_800_000,
+    )
+
+    with pytest.raises(RandomWindowEmptySelectionError, match="no cache rows"):
+        scan_cache_items(items, random_selection=selection)
+
+
 def test_merge_cache_work_items_noops_unsupported_raw_dimensions(
     tmp_path: Path,
 ) -> None:
@@ -1516,6 +1722,32 @@ def test_merge_cache_work_items_noops_unsupported_raw_dimensions(
     assert output.data == []
 
 
+def test_merge_cache_items_streams_months_in_cache_order(
+    tmp_path: Path,
+) -> None:
+    """Concurrent month reads should stream in cache order and match concat."""
+    import polars as pl
+
+    items = _month_cache_items(tmp_path)
+    shuffled = [items[2], items[0], items[1]]
+
+    streamed = merge_cache_items(
+        shuffled,
+        return_type="polars",
+        materialize=False,
+        read_workers=3,
+        max_in_flight=1,
+    )
+    frames = list(streamed)
+    merged = merge_cache_items(shuffled, return_type="polars")
+
+    assert [frame["datetime"][0] for frame in frames] == [
+        int(item.cache_start) for item in items
+    ]
+    assert pl.concat(frames).equals(merged)
+    assert merged.height == 3 * 48
+
+
 def test_merge_cache_items_rejects_unsupported_private_input(
     tmp_path: Path,
 ) -> None:
@@ -1547,7 +1779,7 @@ def test_import_to_influx_work_item_emits_batches_without_writer(
         data_fxpair="eurusd",
         status=WorkStatus.CACHE_READY.value,
     )
-    emitted: list[list[str]] = []
+    emitted: list[bytes] = []
 
     output = import_to_influx_work_item(
         WorkItem.from_record(record),
@@ -1557,9 +1789,18 @@ def test_import_to_influx_work_item_emits_batches_without_writer(
 
     assert output.work_item.status is WorkStatus.INFLUX_UPLOAD
     assert output.result.status is WorkStatus.INFLUX_UPLOAD
-    assert output.result.metrics == {"batch_count": 2, "line_count": 3}
-    assert [len(batch) for batch in emitted] == [2, 1]
-    first_line = emitted[0][0]
+    metrics = output.result.metrics
+    assert (metrics["batch_count"], metrics["line_count"]) == (2, 3)
+    assert set(metrics["timings_ms"]) == {
+        "cache_read",
+        "training_features",
+        "line_format",
+        "line_write",
+    }
+    assert metrics["bytes_out"] == sum(len(payload) for payload in emitted)
+    batches = [payload.decode("utf-8").split("\n") for payload in emitted]
+    assert [len(batch) for batch in batches] == [2, 1]
+    first_line = batches[0][0]
     assert "row_id=1" in first_line.split(" ", maxsplit=1)[0]
     assert "bidquote=1.3066" in first_line
     assert "askquote=1.30677" in first_line
@@ -1612,7 +1853,7 @@ def test_influx_projection_filters_before_augmentation_and_preserves_metadata(
             },
         }
     )
-    emitted: list[list[str]] = []
+    emitted: list[bytes] = []
 
     output = import_to_influx_work_item(
         item,
@@ -1622,7 +1863,7 @@ def test_influx_projection_filters_before_augmentation_and_preserves_metadata(
 
     assert output.result.metrics["line_count"] == 1
     assert len(emitted) == 1
-    assert emitted[0][0].endswith(f" {start}")
+    assert emitted[0].endswith(f" {start}".encode())
     assert output.work_item.metadata == item.metadata
     assert read_polars_cache(tmp_path / CACHE_FILENAME).height == 3
 
@@ -1631,7 +1872,7 @@ def test_import_to_influx_work_item_noops_unsupported_raw_dimensions(
     tmp_path: Path,
 ) -> None:
     """Influx projection must not mark retired raw dimensions uploaded."""
-    emitted: list[list[str]] = []
+    emitted: list[bytes] = []
     record = Record(
         data_dir=f"{tmp_path}{os.sep}",
         data_format="metatrader",
@@ -1968,6 +2209,36 @@ def test_repository_refresh_stage_writes_artifact_and_available_data(
     assert "hash_utc" in written
 
 
+def test_repository_index_follows_repository_file_rewrites(
+    tmp_path: Path,
+) -> None:
+    """Pair listings should come from the index and track the .repo file."""
+    repo_path = tmp_path / ".repo"
+
+    assert read_repository_index(repo_path) is None
+
+    write_repository_data_file(
+        {
+            "eurusd": {"start": "200005", "end": "202212"},
+            "gbpusd": {"start": "200005", "end": "202212"},
+        },
+        repo_path,
+    )
+    assert read_repository_index(repo_path, ("gbpusd",)) == {
+        "gbpusd": {"start": "200005", "end": "202212"}
+    }
+
+    repo_path.write_text(
+        json.dumps({"audusd": {"start": "200101", "end": "202212"}}),
+        encoding="UTF-8",
+    )
+    os.utime(repo_path, ns=(1, 1))
+
+    assert read_repository_index(repo_path, by="pair_dsc") == {
+        "audusd": {"start": "200101", "end": "202212"}
+    }
+
+
 def test_repository_write_removes_partial_temp_on_failure(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -319,6 +319,43 @@ def test_merge_records_accepts_explicit_records_without_queue(
     )
 
 
+def test_merge_records_lazy_return_type_scans_caches(
+    tmp_path: Path,
+) -> None:
+    """The lazy API return should defer cache reads until collection."""
+    import polars as pl
+
+    from histdatacom.api import Api
+
+    source = Api._import_file_to_polars(
+        SimpleNamespace(data_timeframe="T"),
+        FIXTURES / "DAT_ASCII_EURUSD_T_201202.csv",
+    )
+    first = _write_cache_record(
+        tmp_path,
+        "lazy-first",
+        source.slice(0, 1),
+        pair="eurusd",
+        timeframe="T",
+        start=EXPECTED_TICK_DATETIMES[0],
+    )
+    second = _write_cache_record(
+        tmp_path,
+        "lazy-second",
+        source.slice(1, 2),
+        pair="eurusd",
+        timeframe="T",
+        start=EXPECTED_TICK_DATETIMES[1],
+    )
+
+    result = Api(return_type="lazy").merge_records([second, first])
+
+    assert isinstance(result, pl.LazyFrame)
+    assert result.select("datetime").collect().to_series().to_list() == (
+        EXPECTED_TICK_DATETIMES
+    )
+
+
 def test_merge_records_declared_random_window_requires_resolved_selection(
     tmp_path: Path,
 ) -> None:
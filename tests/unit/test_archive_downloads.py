@@ -0,0 +1,235 @@
+"""Tests for pooled, host-limited HistData archive downloads."""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+import time
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import pytest
+
+from histdatacom.activity_stages import download_histdata_archive_to_record
+from histdatacom.archive_downloads import (
+    ARCHIVE_HOST_CONCURRENCY_ENV,
+    ARCHIVE_REQUESTS_PER_SECOND_ENV,
+    ArchiveDownloadEngine,
+    HostRateLimiter,
+    archive_host_concurrency,
+    archive_requests_per_second,
+)
+from histdatacom.exceptions import ArchiveDownloadError
+from histdatacom.records import Record
+from histdatacom.runtime_contracts import WorkStatus
+
+
+def _zip_bytes(member: str) -> bytes:
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w") as archive:
+        archive.writestr(member, "rows\n" * 4096)
+    return stream.getvalue()
+
+
+class _ArchiveServer(ThreadingHTTPServer):
+    """Local stand-in for the HistData ``get.php`` form endpoint."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _ArchiveHandler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.requests = 0
+        self.connections: set[int] = set()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/get.php"
+
+
+class _ArchiveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _ArchiveServer
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        form = parse_qs(self.rfile.read(length).decode())
+        filename = (
+            f"DAT_ASCII_{form['fxpair'][0].upper()}_T_"
+            f"{form['datemonth'][0]}"
+        )
+        with self.server.lock:
+            self.server.active += 1
+            self.server.requests += 1
+            self.server.max_active = max(
+                self.server.max_active,
+                self.server.active,
+            )
+            self.server.connections.add(id(self.connection))
+        try:
+            time.sleep(0.02)
+            payload = _zip_bytes(f"{filename}.csv")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/zip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header(
+                "Content-Disposition",
+                f'attachment; filename="{filename}.zip"',
+            )
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with self.server.lock:
+                self.server.active -= 1
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+@pytest.fixture
+def archive_server() -> Iterator[_ArchiveServer]:
+    server = _ArchiveServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _record(data_dir: Path, month: int) -> Record:
+    return Record(
+        url=(
+            "http://www.histdata.com/download-free-forex-data/"
+            f"?/ascii/tick-data-quotes/eurusd/2022/{month}"
+        ),
+        status=WorkStatus.URL_VALID.value,
+        data_dir=f"{data_dir}{os.sep}",
+        data_tk="token",
+        data_date="2022",
+        data_datemonth=f"2022{month:02d}",
+        data_format="ASCII",
+        data_timeframe="T",
+        data_fxpair="eurusd",
+    )
+
+
+def test_engine_streams_archives_over_limited_keep_alive_connections(
+    tmp_path: Path,
+    archive_server: _ArchiveServer,
+) -> None:
+    """Concurrent downloads share at most ``host_concurrency`` sockets."""
+    engine = ArchiveDownloadEngine(host_concurrency=2, requests_per_second=0)
+    records = [_record(tmp_path, month) for month in range(1, 9)]
+
+    def download(record: Record):  # noqa: ANN202
+        return download_histdata_archive_to_record(
+            record,
+            timeout=5,
+            post_headers={},
+            engine=engine,
+            archive_url=archive_server.url,
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(records)) as executor:
+            results = list(executor.map(download, records))
+    finally:
+        engine.close()
+
+    assert archive_server.requests == len(records)
+    assert archive_server.max_active <= 2
+    assert len(archive_server.connections) <= 2
+    for record, result in zip(records, results, strict=True):
+        path = tmp_path / f"DAT_ASCII_EURUSD_T_{record.data_datemonth}.zip"
+        assert result.path == str(path)
+        assert record.zip_filename == path.name
+        with zipfile.ZipFile(path) as archive:
+            assert archive.testzip() is None
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_completed_partial_archive_is_promoted_without_a_request(
+    tmp_path: Path,
+) -> None:
+    """A valid leftover temp ZIP is reused; a truncated one is discarded."""
+    from histdatacom.runtime_contracts import derive_work_id
+
+    complete = _record(tmp_path, 1)
+    truncated = _record(tmp_path, 2)
+    for record in (complete, truncated):
+        suffix = derive_work_id(record.url).removeprefix("work-")
+        filename = f"DAT_ASCII_EURUSD_T_{record.data_datemonth}"
+        payload = _zip_bytes(f"{filename}.csv")
+        if record is truncated:
+            payload = payload[: len(payload) // 2]
+        (tmp_path / f".{filename}.zip.{suffix}.tmp").write_bytes(payload)
+
+    def refuse(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+        raise AssertionError("a completed archive must not be requested")
+
+    result = download_histdata_archive_to_record(
+        complete,
+        timeout=5,
+        post_headers={},
+        post_archive=refuse,
+    )
+    assert result.path == str(tmp_path / "DAT_ASCII_EURUSD_T_202201.zip")
+    assert complete.zip_filename == result.filename
+
+    with pytest.raises(ArchiveDownloadError) as failure:
+        download_histdata_archive_to_record(
+            truncated,
+            timeout=5,
+            post_headers={},
+            post_archive=lambda *args, **kwargs: (_ for _ in ()).throw(
+                ArchiveDownloadError(
+                    "ARCHIVE_NETWORK_ERROR", "offline", retryable=True
+                )
+            ),
+        )
+    assert failure.value.code == "ARCHIVE_NETWORK_ERROR"
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_host_rate_limiter_spaces_request_starts_per_host() -> None:
+    """Each host gets its own start schedule."""
+    now = [0.0]
+    sleeps: list[float] = []
+    limiter = HostRateLimiter(
+        4,
+        clock=lambda: now[0],
+        sleep=sleeps.append,
+    )
+
+    limiter.acquire("a")
+    limiter.acquire("a")
+    limiter.acquire("b")
+    limiter.acquire("a")
+
+    assert sleeps == [0.25, 0.5]
+
+
+def test_archive_limits_read_and_validate_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Invalid limits fail closed with a structured error."""
+    monkeypatch.setenv(ARCHIVE_HOST_CONCURRENCY_ENV, "6")
+    monkeypatch.setenv(ARCHIVE_REQUESTS_PER_SECOND_ENV, "0")
+    assert archive_host_concurrency() == 6
+    assert archive_requests_per_second() == 0.0
+
+    monkeypatch.setenv(ARCHIVE_HOST_CONCURRENCY_ENV, "0")
+    with pytest.raises(ArchiveDownloadError) as failure:
+        archive_host_concurrency()
+    assert failure.value.code == "ARCHIVE_DOWNLOAD_LIMIT_INVALID"
+    assert not failure.value.retryable
@@ -0,0 +1,129 @@
+"""Tests for the offline data-plane benchmark suite and CLI."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from histdatacom import bench_cli, histdata_com
+from histdatacom.data_plane_benchmark import (
+    benchmark_case_names,
+    compare_benchmark_reports,
+    run_data_plane_benchmarks,
+    write_benchmark_fixtures,
+)
+from histdatacom.histdata_ascii import (
+    convert_polars_datetime_to_utc_ms,
+    read_ascii_file_to_polars,
+    read_polars_cache,
+)
+
+
+def test_benchmark_fixtures_parse_like_histdata_tick_months(
+    tmp_path: Path,
+) -> None:
+    """CSV, ZIP, and cache fixtures describe the same synthetic ticks."""
+    fixtures = write_benchmark_fixtures(tmp_path, rows=500, months=2)
+
+    from_csv = read_ascii_file_to_polars(fixtures.csv_paths[1], "T")
+    from_zip = read_ascii_file_to_polars(fixtures.zip_paths[1], "T")
+    cached = read_polars_cache(fixtures.cache_paths[1])
+
+    assert from_csv.equals(from_zip)
+    assert from_csv.height == 500
+    assert from_csv["datetime"][0] == "20120202 000000000"
+    assert convert_polars_datetime_to_utc_ms(from_csv, "T").equals(cached)
+    assert (from_csv["ask"] > from_csv["bid"]).all()
+    assert fixtures.total_rows == 1000
+    assert [item.cache_start for item in fixtures.work_items] == [
+        str(read_polars_cache(path)["datetime"][0])
+        for path in fixtures.cache_paths
+    ]
+
+
+def test_benchmark_report_uses_pytest_benchmark_layout(
+    tmp_path: Path,
+) -> None:
+    """Every case reports timing stats, throughput, and peak RSS."""
+    fixtures = write_benchmark_fixtures(tmp_path, rows=200, months=1)
+
+    report = run_data_plane_benchmarks(fixtures, rounds=2)
+
+    assert set(report) >= {"machine_info", "benchmarks", "datetime", "version"}
+    assert [case["name"] for case in report["benchmarks"]] == list(
+        benchmark_case_names()
+    )
+    for case in report["benchmarks"]:
+        assert case["stats"]["rounds"] == 2
+        assert case["stats"]["min"] <= case["stats"]["median"]
+        assert case["extra_info"]["rows_per_second"] > 0
+        assert case["extra_info"]["bytes"] > 0
+        assert case["extra_info"]["peak_rss_bytes"] >= 0
+
+    with pytest.raises(ValueError, match="unknown benchmark case"):
+        run_data_plane_benchmarks(fixtures, cases=["vectorize_everything"])
+
+
+def _report(**medians: float) -> dict:
+    return {
+        "benchmarks": [
+            {"name": name, "stats": {"median": median}}
+            for name, median in medians.items()
+        ]
+    }
+
+
+def test_baseline_comparison_flags_slowdowns_past_tolerance() -> None:
+    """Only cases slower than the baseline by more than tolerance regress."""
+    comparisons = compare_benchmark_reports(
+        _report(read_ascii_csv=1.2, read_polars_cache=1.3, new_case=9.0),
+        _report(read_ascii_csv=1.0, read_polars_cache=1.0),
+        tolerance=0.25,
+    )
+
+    assert {item.name: item.regressed for item in comparisons} == {
+        "read_ascii_csv": False,
+        "read_polars_cache": True,
+    }
+    assert comparisons[1].to_dict()["ratio"] == 1.3
+
+
+def test_bench_cli_saves_report_and_exits_nonzero_on_regression(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A saved report is a baseline; a faster baseline fails the run."""
+    saved = tmp_path / "bench.json"
+    argv = ["--rows", "100", "--months", "1", "--rounds", "1"]
+    argv += ["--case", "read_ascii_csv", "--workdir", str(tmp_path)]
+
+    assert bench_cli.main([*argv, "--save", str(saved)]) == 0
+    assert "read_ascii_csv: median=" in capsys.readouterr().out
+
+    baseline = json.loads(saved.read_text(encoding="utf-8"))
+    baseline["benchmarks"][0]["stats"]["median"] = 1e-9
+    saved.write_text(json.dumps(baseline), encoding="utf-8")
+
+    assert bench_cli.main([*argv, "--baseline", str(saved), "--json"]) == 1
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["baseline_comparison"][0]["regressed"] is True
+
+
+def test_histdatacom_main_dispatches_bench_command(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The top-level histdatacom command should route benchmarks."""
+    captured: dict[str, tuple[str, ...]] = {}
+
+    def fake_bench_main(argv: list[str]) -> int:
+        captured["argv"] = tuple(argv)
+        return 0
+
+    monkeypatch.setattr(bench_cli, "main", fake_bench_main)
+    monkeypatch.setattr(sys, "argv", ["histdatacom", "bench", "--json"])
+
+    assert histdata_com.main() == 0
+    assert captured["argv"] == ("--json",)
@@ -8,7 +8,9 @@ from pathlib import Path
 
 import pytest
 
+from histdatacom.broker_capture import storage as broker_capture_storage
 from histdatacom.broker_capture import (
+    BROKER_CAPTURE_ARROW_ARTIFACT_KIND,
     AppendOnlyBrokerCaptureWriterV1,
     BrokerAdapterMessageV1,
     BrokerCaptureActivitySemantics,
@@ -18,8 +20,10 @@ from histdatacom.broker_capture import (
     BrokerCaptureEventV1,
     BrokerCaptureExistingSessionError,
     BrokerCaptureIntegrityError,
+    BrokerCapturePartitionEncoding,
     BrokerCapturePriceTextSemantics,
     BrokerCaptureQuotaError,
+    BrokerCaptureReplaySourceV1,
     BrokerCaptureReplaySummaryV1,
     BrokerCaptureRetentionError,
     BrokerCaptureSessionManifestV1,
@@ -412,6 +416,231 @@ def test_existing_session_and_corrupt_replay_fail_closed(
         replay_broker_capture_session(tmp_path, manifest)
 
 
+def test_group_commit_buffers_until_size_or_delay_and_matches_per_event(
+    tmp_path: Path,
+) -> None:
+    now = [0]
+    session = _session(11)
+    source, _messages = _fixture_source(session)
+    events = tuple(source.iter_events())
+    group_policy = _policy(
+        group_commit_max_bytes=4096,
+        group_commit_max_delay_ns=1_000_000,
+    )
+    writer = AppendOnlyBrokerCaptureWriterV1(
+        tmp_path / "group",
+        session=session,
+        storage_policy=group_policy,
+        clock=lambda: now[0],
+    )
+    partial = (
+        tmp_path
+        / "group"
+        / session.session_id
+        / "partition-000000.jsonl.partial"
+    )
+
+    writer.append(events[0])
+    writer.append(events[1])
+    assert partial.stat().st_size == 0
+    now[0] = 1_000_000
+    writer.append(events[2])
+    committed = partial.stat().st_size
+    assert committed == sum(
+        len((event.to_json() + "\n").encode("utf-8")) for event in events[:3]
+    )
+    writer.append(events[3])
+    assert partial.stat().st_size == committed
+    writer.flush()
+    assert partial.stat().st_size > committed
+    for event in events[4:]:
+        writer.append(event)
+    group_manifest = writer.close()
+
+    per_event = AppendOnlyBrokerCaptureWriterV1(
+        tmp_path / "per-event", session=session, storage_policy=_policy()
+    )
+    consume_broker_capture_source(_fixture_source(session)[0], sink=per_event)
+    per_event_manifest = per_event.close()
+
+    assert group_manifest.event_count == per_event_manifest.event_count == 17
+    assert [p.data_artifact.sha256 for p in group_manifest.partitions] == [
+        p.data_artifact.sha256 for p in per_event_manifest.partitions
+    ]
+    assert inspect_broker_capture_session(
+        tmp_path / "group", session.session_id
+    ).clean
+    replay_consumer = _CollectingConsumer()
+    replay_broker_capture_session(
+        tmp_path / "group", group_manifest, consumers=(replay_consumer,)
+    )
+    assert replay_consumer.events == list(events)
+
+
+def test_group_commit_policy_bounds_are_paired_and_identity_stable() -> None:
+    group_policy = _policy(
+        group_commit_max_bytes=4096,
+        group_commit_max_delay_ns=1_000_000,
+    )
+    assert group_policy.group_commit
+    assert not _policy().group_commit
+    assert "group_commit_max_bytes" not in _policy().identity_payload()
+    assert group_policy.policy_id != _policy().policy_id
+    assert (
+        BrokerCaptureStoragePolicyV1.from_json(group_policy.to_json())
+        == group_policy
+    )
+    with pytest.raises(ValueError, match="byte and a delay bound"):
+        _policy(group_commit_max_bytes=4096)
+    with pytest.raises(ValueError, match="partition byte limit"):
+        _policy(
+            group_commit_max_bytes=4 * 1024**2,
+            group_commit_max_delay_ns=1_000_000,
+        )
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_replay_hashes_while_parsing_and_reports_tampering_as_hash_mismatch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    read_ahead: int,
+) -> None:
+    session = _session(13)
+    source, _messages = _fixture_source(session)
+    events = tuple(source.iter_events())
+    writer = AppendOnlyBrokerCaptureWriterV1(
+        tmp_path,
+        session=session,
+        storage_policy=_policy(max_partition_events=5),
+    )
+    consume_broker_capture_source(_fixture_source(session)[0], sink=writer)
+    manifest = writer.close()
+    assert len(manifest.partitions) > 2
+
+    def second_read(path: Path) -> str:
+        raise AssertionError(f"partition hashed in a separate pass: {path}")
+
+    monkeypatch.setattr(broker_capture_storage, "_file_sha256", second_read)
+    collected = _CollectingConsumer()
+    replay_broker_capture_session(
+        tmp_path,
+        manifest,
+        consumers=(collected,),
+        read_ahead=read_ahead,
+    )
+    assert collected.events == list(events)
+
+    last_path = tmp_path / manifest.partitions[-1].data_artifact.path
+    original = last_path.read_bytes()
+    tampered = original.replace(
+        b'"capture_sequence":', b'"capture_sequencf":', 1
+    )
+    assert len(tampered) == len(original)
+    last_path.write_bytes(tampered)
+    with pytest.raises(BrokerCaptureIntegrityError, match="hash") as caught:
+        replay_broker_capture_session(tmp_path, manifest, read_ahead=read_ahead)
+    if read_ahead == 0:
+        assert isinstance(caught.value.__context__, TypeError)
+    with pytest.raises(ValueError, match="read_ahead"):
+        BrokerCaptureReplaySourceV1(tmp_path, manifest, read_ahead=-1)
+
+
+@pytest.mark.parametrize("group_commit", [False, True])
+def test_arrow_partitions_keep_the_artifact_contract_and_replay_as_batches(
+    tmp_path: Path, group_commit: bool
+) -> None:
+    pytest.importorskip("pyarrow")
+    session = _session(12)
+    source, _messages = _fixture_source(session)
+    events = tuple(source.iter_events())
+    group = {"group_commit_max_bytes": 4096, "group_commit_max_delay_ns": 1}
+    arrow_policy = _policy(
+        partition_encoding=BrokerCapturePartitionEncoding.ARROW_IPC,
+        **(group if group_commit else {}),
+    )
+    writer = AppendOnlyBrokerCaptureWriterV1(
+        tmp_path / "arrow", session=session, storage_policy=arrow_policy
+    )
+    consume_broker_capture_source(_fixture_source(session)[0], sink=writer)
+    manifest = writer.close()
+    jsonl = AppendOnlyBrokerCaptureWriterV1(
+        tmp_path / "jsonl", session=session, storage_policy=_policy()
+    )
+    consume_broker_capture_source(_fixture_source(session)[0], sink=jsonl)
+    jsonl_manifest = jsonl.close()
+
+    assert "partition_encoding" not in _policy().identity_payload()
+    assert arrow_policy.policy_id != _policy().policy_id
+    assert (
+        BrokerCaptureStoragePolicyV1.from_json(arrow_policy.to_json())
+        == arrow_policy
+    )
+    assert "encoding" not in jsonl_manifest.partitions[0].identity_payload()
+    for partition in manifest.partitions:
+        assert partition.encoding is BrokerCapturePartitionEncoding.ARROW_IPC
+        assert (
+            partition.data_artifact.kind == BROKER_CAPTURE_ARROW_ARTIFACT_KIND
+        )
+        assert partition.data_artifact.path.endswith(".arrow")
+        data = (tmp_path / "arrow" / partition.data_artifact.path).read_bytes()
+        assert len(data) == partition.data_artifact.size_bytes
+        assert (
+            hashlib.sha256(data).hexdigest() == partition.data_artifact.sha256
+        )
+    assert BrokerCaptureSessionManifestV1.from_json(manifest.to_json()) == (
+        manifest
+    )
+    assert inspect_broker_capture_session(
+        tmp_path / "arrow", session.session_id
+    ).clean
+
+    collected = _CollectingConsumer()
+    summary = replay_broker_capture_session(
+        tmp_path / "arrow", manifest, consumers=(collected,)
+    )
+    assert collected.events == list(events)
+    assert (
+        summary.logical_content_sha256
+        == replay_broker_capture_session(
+            tmp_path / "jsonl", jsonl_manifest
+        ).logical_content_sha256
+    )
+    batches = list(
+        BrokerCaptureReplaySourceV1(
+            tmp_path / "arrow", manifest
+        ).iter_record_batches()
+    )
+    jsonl_batches = list(
+        BrokerCaptureReplaySourceV1(
+            tmp_path / "jsonl", jsonl_manifest
+        ).iter_record_batches()
+    )
+    assert sum(batch.num_rows for batch in batches) == len(events)
+    assert [
+        value
+        for batch in batches
+        for value in batch.column("capture_sequence").to_pylist()
+    ] == [event.capture_sequence for event in events]
+    assert [
+        value for batch in batches for value in batch.column("bid").to_pylist()
+    ] == [
+        value
+        for batch in jsonl_batches
+        for value in batch.column("bid").to_pylist()
+    ]
+
+    first = tmp_path / "arrow" / manifest.partitions[0].data_artifact.path
+    corrupted = bytearray(first.read_bytes())
+    corrupted[-12] ^= 0xFF
+    first.write_bytes(bytes(corrupted))
+    with pytest.raises(BrokerCaptureIntegrityError, match="hash"):
+        list(
+            BrokerCaptureReplaySourceV1(
+                tmp_path / "arrow", manifest
+            ).iter_record_batches()
+        )
+
+
 def _session(seed: int) -> BrokerCaptureSessionV1:
     return BrokerCaptureSessionV1(**_session_kwargs(seed))
 
@@ -14,6 +14,7 @@ from histdatacom.broker_capture import (
     BrokerCaptureEligibilityStatus,
     BrokerCaptureEventKind,
     BrokerCaptureEventV1,
+    BrokerCapturePartitionEncoding,
     BrokerCapturePriceTextSemantics,
     BrokerCaptureSessionManifestV1,
     BrokerCaptureSessionV1,
@@ -398,6 +399,36 @@ def test_fingerprint_artifacts_are_atomic_immutable_and_verified(
         load_broker_delivery_fingerprint(target)
 
 
+def test_arrow_captures_fit_the_same_cells_from_record_batches(
+    tmp_path: Path,
+) -> None:
+    """Columnar fitting of Arrow partitions matches per-event JSONL fitting."""
+    pytest.importorskip("pyarrow")
+    config = BrokerDeliveryFitConfigV1(min_cell_support=4)
+    fitted = {}
+    for encoding in BrokerCapturePartitionEncoding:
+        root = tmp_path / encoding.value
+        manifest = _capture(
+            root,
+            seed=1,
+            wall_start_ns=BASE_WALL_NS,
+            partition_encoding=encoding,
+        )
+        fitted[encoding] = fit_broker_delivery_fingerprint(
+            root,
+            (manifest,),
+            config=config,
+            market_context_timeline=_timeline(),
+        )
+
+    jsonl = fitted[BrokerCapturePartitionEncoding.JSONL]
+    arrow = fitted[BrokerCapturePartitionEncoding.ARROW_IPC]
+    assert arrow.cells == jsonl.cells
+    assert [item.logical_content_sha256 for item in arrow.capture_evidence] == [
+        item.logical_content_sha256 for item in jsonl.capture_evidence
+    ]
+
+
 def test_capture_identity_mixing_is_refused(tmp_path: Path) -> None:
     first = _capture(tmp_path / "first", seed=14, wall_start_ns=BASE_WALL_NS)
     second = _capture(
@@ -614,6 +645,9 @@ def _capture(
     completed: bool = True,
     clock_correction_ns: int | None = None,
     adapter_config_sha256: str = CONFIG_SHA256,
+    partition_encoding: BrokerCapturePartitionEncoding = (
+        BrokerCapturePartitionEncoding.JSONL
+    ),
 ) -> BrokerCaptureSessionManifestV1:
     session = BrokerCaptureSessionV1(
         adapter_id="fixture.broker",
@@ -631,7 +665,7 @@ def _capture(
     writer = AppendOnlyBrokerCaptureWriterV1(
         root,
         session=session,
-        storage_policy=_storage_policy(),
+        storage_policy=_storage_policy(partition_encoding),
     )
     messages: list[BrokerAdapterMessageV1] = [
         BrokerAdapterMessageV1(
@@ -777,7 +811,11 @@ def _quote(
     )
 
 
-def _storage_policy() -> BrokerCaptureStoragePolicyV1:
+def _storage_policy(
+    partition_encoding: BrokerCapturePartitionEncoding = (
+        BrokerCapturePartitionEncoding.JSONL
+    ),
+) -> BrokerCaptureStoragePolicyV1:
     return BrokerCaptureStoragePolicyV1(
         max_partition_events=7,
         max_partition_bytes=2 * 1024**2,
@@ -787,6 +825,7 @@ def _storage_policy() -> BrokerCaptureStoragePolicyV1:
         max_retained_partitions=100,
         manifest_reserve_bytes=64 * 1024,
         fsync_each_event=False,
+        partition_encoding=partition_encoding,
     )
 
 
@@ -0,0 +1,116 @@
+"""Tests for versioned cache-format migration."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from histdatacom.cache_migration import migrate_polars_caches
+from histdatacom.cleanup_cli import main as cleanup_main
+from histdatacom.histdata_ascii import (
+    CACHE_FILENAME,
+    LEGACY_CACHE_ERROR,
+    read_cache_index,
+    read_polars_cache,
+    write_polars_cache,
+)
+
+
+def _frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "datetime": [1_000, 2_000, 3_000],
+            "bid": [1.1, 1.2, 1.3],
+            "ask": [1.2, 1.3, 1.4],
+            "vol": pl.Series([0, 0, 0], dtype=pl.Int32),
+        }
+    )
+
+
+def _write_caches(root: Path) -> dict[str, Path]:
+    paths = {
+        name: root / "ascii" / "eurusd" / "T" / period / CACHE_FILENAME
+        for name, period in (
+            ("unversioned", "2020-01"),
+            ("current", "2020-02"),
+            ("legacy", "2020-03"),
+        )
+    }
+    for path in paths.values():
+        path.parent.mkdir(parents=True)
+    _frame().write_ipc(paths["unversioned"])
+    write_polars_cache(_frame(), paths["current"])
+    paths["legacy"].write_bytes(b"not an arrow ipc payload")
+    return paths
+
+
+def test_cache_migration_dry_run_reports_without_rewriting(
+    tmp_path: Path,
+) -> None:
+    """Dry runs classify caches and leave every file untouched."""
+    paths = _write_caches(tmp_path)
+    before = paths["unversioned"].read_bytes()
+
+    result = migrate_polars_caches(tmp_path)
+
+    assert result.dry_run is True
+    assert result.cache_count == 3
+    assert result.current_count == 1
+    assert result.pending_count == 1
+    assert result.migrated_count == 0
+    assert result.legacy_paths == (str(paths["legacy"]),)
+    assert result.errors == ()
+    assert paths["unversioned"].read_bytes() == before
+    assert read_cache_index(paths["unversioned"]) is None
+
+
+def test_cache_migration_apply_rewrites_unversioned_caches(
+    tmp_path: Path,
+) -> None:
+    """Applied migrations write indexed caches and keep legacy guidance."""
+    paths = _write_caches(tmp_path)
+
+    result = migrate_polars_caches(tmp_path, apply=True)
+
+    assert result.migrated_count == 1
+    assert read_cache_index(paths["unversioned"]) is not None
+    assert read_polars_cache(paths["unversioned"]).equals(_frame())
+    assert sorted(
+        item.name for item in paths["unversioned"].parent.iterdir()
+    ) == [
+        ".data",
+        ".data.index",
+    ]
+    with pytest.raises(ValueError) as err:
+        read_polars_cache(paths["legacy"])
+    assert str(err.value) == LEGACY_CACHE_ERROR
+    assert migrate_polars_caches(tmp_path).pending_count == 0
+
+
+def test_cleanup_cli_migrate_caches_json(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The cleanup CLI exposes cache migration with the dry-run contract."""
+    _write_caches(tmp_path)
+
+    assert (
+        cleanup_main(
+            [
+                "migrate-caches",
+                "--data-directory",
+                str(tmp_path),
+                "--apply",
+                "--json",
+            ]
+        )
+        == 0
+    )
+
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["dry_run"] is False
+    assert payload["migrated_count"] == 1
+    assert payload["legacy_count"] == 1
@@ -51,6 +51,7 @@ from histdatacom.market_context.positioning import (
     compare_cftc_positioning_corpora,
     preflight_cftc_positioning_corpus,
     query_cftc_positioning_corpus,
+    query_cftc_positioning_corpus_windows,
     read_cftc_positioning_corpus,
     replay_cftc_positioning_corpus,
     require_cftc_positioning_corpus,
@@ -626,6 +627,91 @@ def test_strict_ex_ante_fails_on_time_and_current_state_then_accepts_vintage(
     assert nominal_query.status is CftcPositioningQueryStatus.NOT_AVAILABLE
 
 
+def test_window_batch_matches_single_queries_and_keeps_ex_ante_rules(
+    corpus_build: CftcPositioningCorpusBuildV1,
+) -> None:
+    corpus = corpus_build.corpus
+    vintage_corpus = replace(
+        corpus,
+        snapshots=tuple(
+            (
+                replace(
+                    item,
+                    restatement_status=CftcRestatementStatus.ORIGINAL_VERIFIED,
+                    snapshot_id="",
+                )
+                if item.report_date == "2025-10-07"
+                else item
+            )
+            for item in corpus.snapshots
+        ),
+        corpus_id="",
+    )
+    day_ns = 86_400 * 1_000_000_000
+    starts = [
+        _window_ns("2005-01-01") + index * 97 * day_ns for index in range(75)
+    ]
+    starts += [_window_ns("2025-09-28") + index * day_ns for index in range(60)]
+    scope = {
+        "symbols": ("EURUSD",),
+        "report_families": (CftcReportFamily.LEGACY,),
+        "report_scopes": (CftcReportScope.FUTURES_ONLY,),
+        "max_staleness_days": 60,
+    }
+    statuses: set[CftcPositioningQueryStatus] = set()
+    for source, mode in (
+        (corpus, InformationMode.EX_POST_RECONSTRUCTION),
+        (corpus, InformationMode.EX_ANTE_SIMULATION),
+        (vintage_corpus, InformationMode.EX_ANTE_SIMULATION),
+    ):
+        windows = [
+            (
+                start,
+                start + 3_600_000_000_000,
+                (
+                    start - (start // day_ns % 5) * day_ns
+                    if mode is InformationMode.EX_ANTE_SIMULATION
+                    else None
+                ),
+            )
+            for start in starts
+        ]
+        batch = query_cftc_positioning_corpus_windows(
+            source, windows=windows, information_mode=mode, **scope
+        )
+        single = [
+            query_cftc_positioning_corpus(
+                source,
+                start_ns=start,
+                end_ns=end,
+                as_of_ns=as_of,
+                information_mode=mode,
+                **scope,
+            )
+            for start, end, as_of in windows
+        ]
+        assert [item.query_id for item in batch] == [
+            item.query_id for item in single
+        ]
+        statuses.update(item.status for item in batch)
+    assert CftcPositioningQueryStatus.READY in statuses
+    assert CftcPositioningQueryStatus.RESTATEMENT_INCOMPLETE in statuses
+    assert CftcPositioningQueryStatus.NOT_AVAILABLE in statuses
+
+    with pytest.raises(ValueError, match="sorted by start"):
+        query_cftc_positioning_corpus_windows(
+            corpus,
+            windows=list(reversed(windows)),
+            information_mode=InformationMode.EX_ANTE_SIMULATION,
+        )
+    with pytest.raises(ValueError, match="as_of cannot follow start"):
+        query_cftc_positioning_corpus_windows(
+            corpus,
+            windows=[(starts[0], starts[0] + 1, starts[0] + 1)],
+            information_mode=InformationMode.EX_ANTE_SIMULATION,
+        )
+
+
 def test_content_addressed_write_read_replay_and_diff(
     corpus_build: CftcPositioningCorpusBuildV1, tmp_path: Path
 ) -> None:
@@ -109,7 +109,7 @@ def test_storage_backed_campaign_plan_updates_repo_before_cache_cleanup() -> (
     assert commands[1]["repo_path"] == "data/.repo"
     assert commands[1]["command"] == (
         "histdatacom --repo-quality --quality-target data/ASCII/T/audusd "
-        "--quality-checks all --quality-report "
+        "--quality-checks all --quality-jobs 0 --quality-report "
         "data/.quality/issue-240/"
         "issue-240-001-ascii-t-audusd-quality.json "
         "--data-directory data"
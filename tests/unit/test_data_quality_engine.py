@@ -13,6 +13,7 @@ from histdatacom.data_quality import (
     DEFAULT_QUALITY_SKIP_EVENT_LIMIT,
     QUALITY_ENGINE_METADATA_KEY,
     QUALITY_ENGINE_SCHEMA_VERSION,
+    QUALITY_RESULT_REUSE_METADATA_KEY,
     QUALITY_SKIP_EVENTS_SCHEMA_VERSION,
     QUALITY_SKIP_REASON_DUPLICATE_ARCHIVE_PREFERRED_CSV,
     QualityFinding,
@@ -26,9 +27,17 @@ from histdatacom.data_quality import (
     QualityTarget,
     QualityTargetKind,
     QualityTargetSummary,
+    TARGET_FRAME_CACHE_METADATA_KEY,
+    TargetFrameCache,
+    active_target_frame_cache,
+    resolve_quality_jobs,
     run_quality_assessment,
+    use_target_frame_cache,
 )
+from histdatacom.data_quality.rules import quality_rules_for_groups
+from histdatacom.concurrency import get_pool_cpu_count
 from histdatacom.histdata_ascii import TICK
+from histdatacom.manifest_store import ManifestStatusStore
 from tests.fixtures.histdata_ascii.quality_cases import (
     CLEAN_TICK_CASE,
     HistDataAsciiCase,
@@ -498,6 +507,193 @@ def test_quality_engine_reports_bounded_progress(tmp_path: Path) -> None:
     assert "path" not in str(events)
 
 
+def test_quality_engine_shares_target_frame_cache_across_rules(
+    tmp_path: Path,
+) -> None:
+    """Rules reading the same source should decode it once per run."""
+    target = _target_for_case(tmp_path, CLEAN_TICK_CASE)
+    rules = quality_rules_for_groups(("ingestion", "time", "ticks"))
+
+    report = run_quality_assessment(targets=(target,), rules=rules)
+
+    engine = report.metadata[QUALITY_ENGINE_METADATA_KEY]
+    assert isinstance(engine, dict)
+    assert engine["skipped_rule_evaluation_count"] == 0
+    frame_cache = engine[TARGET_FRAME_CACHE_METADATA_KEY]
+    assert isinstance(frame_cache, dict)
+    assert frame_cache["miss_count"] == 1
+    assert frame_cache["hit_count"] > 0
+    assert frame_cache["eviction_count"] == 0
+    assert active_target_frame_cache() is None
+
+
+def test_quality_engine_parallel_jobs_match_serial_report(
+    tmp_path: Path,
+) -> None:
+    """Process-pool evaluation should merge into the serial report order."""
+    targets = tuple(
+        _target_for_case(tmp_path / case_name, case_by_name(case_name))
+        for case_name in (
+            "clean_tick",
+            "tick_duplicate_row",
+            "tick_negative_spread",
+        )
+    )
+    rules = (
+        _StaticRule(
+            rule_id="manifest.case-observed",
+            description="records that each case was checked",
+            severity_by_case={"tick_duplicate_row": QualitySeverity.INFO},
+        ),
+        *quality_rules_for_groups(("ingestion", "ticks")),
+    )
+    serial_events: list[dict] = []
+    parallel_events: list[dict] = []
+
+    serial = run_quality_assessment(
+        targets=targets,
+        rules=rules,
+        progress_callback=serial_events.append,
+    )
+    parallel = run_quality_assessment(
+        targets=targets,
+        rules=rules,
+        progress_callback=parallel_events.append,
+        jobs=3,
+    )
+
+    assert parallel.rule_results == serial.rule_results
+    assert parallel.to_dict()["summary"] == serial.to_dict()["summary"]
+    assert len(parallel_events) == len(serial_events)
+    assert [event["completed"] for event in parallel_events] == sorted(
+        event["completed"] for event in parallel_events
+    )
+    assert parallel_events[-1] == serial_events[-1]
+    frame_cache = parallel.metadata[QUALITY_ENGINE_METADATA_KEY][
+        TARGET_FRAME_CACHE_METADATA_KEY
+    ]
+    assert frame_cache["miss_count"] == len(targets)
+
+
+def test_quality_engine_reuses_stored_results_for_unchanged_targets(
+    tmp_path: Path,
+) -> None:
+    """Stored results should serve unchanged targets and match a full run."""
+    targets = tuple(
+        _target_for_case(tmp_path / case_name, case_by_name(case_name))
+        for case_name in ("clean_tick", "tick_duplicate_row")
+    )
+    rules = quality_rules_for_groups(("ingestion", "ticks"))
+    store = ManifestStatusStore(tmp_path / "data")
+
+    first = run_quality_assessment(targets, rules, result_store=store)
+    second = run_quality_assessment(targets, rules, result_store=store)
+    full = run_quality_assessment(targets, rules)
+
+    first_reuse = first.metadata[QUALITY_ENGINE_METADATA_KEY][
+        QUALITY_RESULT_REUSE_METADATA_KEY
+    ]
+    second_reuse = second.metadata[QUALITY_ENGINE_METADATA_KEY][
+        QUALITY_RESULT_REUSE_METADATA_KEY
+    ]
+    assert first_reuse["reused_rule_evaluation_count"] == 0
+    assert first_reuse["evaluated_target_count"] == len(targets)
+    assert second_reuse["reused_rule_evaluation_count"] == (
+        len(targets) * len(rules)
+    )
+    assert second_reuse["evaluated_rule_evaluation_count"] == 0
+    assert [item["period"] for item in second_reuse["reused_targets"]] == [
+        "201202",
+        "201202",
+    ]
+    assert second.to_dict()["rule_results"] == full.to_dict()["rule_results"]
+    assert second.to_dict()["summary"] == full.to_dict()["summary"]
+
+    changed = Path(targets[0].path)
+    changed.write_bytes(changed.read_bytes() + changed.read_bytes()[-40:])
+    third = run_quality_assessment(targets, rules, result_store=store)
+    third_reuse = third.metadata[QUALITY_ENGINE_METADATA_KEY][
+        QUALITY_RESULT_REUSE_METADATA_KEY
+    ]
+    assert third_reuse["reused_target_count"] == 1
+    assert third_reuse["evaluated_target_count"] == 1
+    assert (
+        third.to_dict()["rule_results"]
+        == run_quality_assessment(targets, rules).to_dict()["rule_results"]
+    )
+
+
+def test_resolve_quality_jobs_sizes_auto_from_cpu_policy() -> None:
+    """Explicit job counts pass through and zero follows the CPU policy."""
+    assert resolve_quality_jobs(4) == 4
+    assert resolve_quality_jobs(0, cpu_utilization="high") == (
+        get_pool_cpu_count("high")
+    )
+    assert resolve_quality_jobs(None) == get_pool_cpu_count()
+
+
+def test_target_frame_cache_tracks_freshness_and_byte_budget(
+    tmp_path: Path,
+) -> None:
+    """Cached payloads should reload on rewrite and evict by byte size."""
+    first = tmp_path / "first.csv"
+    second = tmp_path / "second.csv"
+    first.write_bytes(b"a" * 8)
+    second.write_bytes(b"b" * 8)
+    loads: list[Path] = []
+
+    def load(path: Path) -> bytes:
+        loads.append(path)
+        return path.read_bytes()
+
+    cache = TargetFrameCache(max_bytes=12)
+    with use_target_frame_cache(cache) as active:
+        assert active is cache
+        assert active_target_frame_cache() is cache
+        for path in (first, first, second, first):
+            cache.get_or_load(
+                "bytes", path, lambda path=path: load(path), size_of=len
+            )
+
+    assert loads == [first, second, first]
+    assert cache.metadata() == {
+        "max_bytes": 12,
+        "hit_count": 1,
+        "miss_count": 3,
+        "eviction_count": 2,
+        "oversized_count": 0,
+        "entry_count": 1,
+        "peak_bytes": 8,
+    }
+
+    first.write_bytes(b"c" * 9)
+    assert cache.get_or_load("bytes", first, first.read_bytes, size_of=len) == (
+        b"c" * 9
+    )
+    assert cache.miss_count == 4
+    assert (
+        cache.get_or_load(
+            "bytes",
+            tmp_path / "large.csv",
+            lambda: b"x" * 13,
+            size_of=len,
+        )
+        == b"x" * 13
+    )
+    assert cache.oversized_count == 0
+    (tmp_path / "large.csv").write_bytes(b"x" * 13)
+    cache.get_or_load(
+        "bytes",
+        tmp_path / "large.csv",
+        lambda: b"x" * 13,
+        size_of=len,
+    )
+    assert cache.oversized_count == 1
+    assert active_target_frame_cache() is None
+    with pytest.raises(ValueError, match="max_bytes"):
+        TargetFrameCache(max_bytes=-1)
+
+
 def test_quality_report_round_trip_recomputes_summary_state(
     tmp_path: Path,
 ) -> None:
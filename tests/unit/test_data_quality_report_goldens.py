@@ -1213,6 +1213,7 @@ def _assert_quality_engine(payload: dict[str, JSONValue]) -> None:
         "skipped_duplicate_archive_rule_evaluation_count",
         "skipped_rule_evaluation_count",
         "target_count",
+        "target_frame_cache",
         "target_rule_evaluation_count",
     }
     assert payload["schema_version"] == QUALITY_ENGINE_SCHEMA_VERSION
@@ -1234,6 +1235,19 @@ def _assert_quality_engine(payload: dict[str, JSONValue]) -> None:
     assert payload["duplicate_archive_scan_policy"] == (
         "prefer_extracted_csv_for_non_inventory_rules"
     )
+    frame_cache = _mapping(payload["target_frame_cache"])
+    assert set(frame_cache) == {
+        "entry_count",
+        "eviction_count",
+        "hit_count",
+        "max_bytes",
+        "miss_count",
+        "oversized_count",
+        "peak_bytes",
+    }
+    assert all(
+        isinstance(value, int) and value >= 0 for value in frame_cache.values()
+    )
 
     skips = _mapping(payload["skip_events"])
     assert set(skips) == {
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+import random
 
+import polars as pl
 import pytest
 
 from histdatacom.data_quality import (
@@ -20,9 +22,13 @@ from histdatacom.data_quality import (
     QualityStatus,
     QualityTarget,
     QualityTargetKind,
+    TICK_SCAN_ENGINE_COLUMNAR,
+    TICK_SCAN_ENGINE_ROWS,
     discover_quality_targets,
+    evaluate_tick_quality_bundle,
     quality_rules_for_groups,
     run_quality_assessment,
+    ticks_quality_rules,
 )
 from histdatacom.histdata_ascii import (
     TICK,
@@ -752,6 +758,172 @@ def test_zip_csv_member_is_scanned_for_tick_spread_findings(
     )
 
 
+@pytest.mark.parametrize(
+    ("seed", "row_count", "symbol"),
+    (
+        (0, 0, "EURUSD"),
+        (1, 1, "EURUSD"),
+        (2, 12, "EURUSD"),
+        (3, 400, "EURUSD"),
+        (4, 2_500, "EURUSD"),
+        (5, 2_500, "XAUUSD"),
+        (6, 2_500, "SPXUSD"),
+        (7, 2_500, ""),
+    ),
+)
+def test_columnar_tick_scan_matches_row_engine(
+    tmp_path: Path,
+    seed: int,
+    row_count: int,
+    symbol: str,
+) -> None:
+    """The Polars scan engine should reproduce row-engine findings exactly."""
+    cache_path = tmp_path / ".data"
+    write_polars_cache(_synthetic_tick_frame(seed, row_count), cache_path)
+    target = QualityTarget(
+        path=str(cache_path),
+        kind=QualityTargetKind.CACHE,
+        data_format="ascii",
+        timeframe=TICK,
+        symbol=symbol,
+        period="201203",
+    )
+
+    row_results = evaluate_tick_quality_bundle(
+        target,
+        ticks_quality_rules(),
+        scan_engine=TICK_SCAN_ENGINE_ROWS,
+    )
+    columnar_results = evaluate_tick_quality_bundle(
+        target,
+        ticks_quality_rules(),
+        scan_engine=TICK_SCAN_ENGINE_COLUMNAR,
+    )
+
+    assert [
+        finding.to_dict()
+        for result in columnar_results
+        for finding in result.findings
+    ] == [
+        finding.to_dict()
+        for result in row_results
+        for finding in result.findings
+    ]
+
+
+def test_tick_quality_bundle_rejects_unknown_scan_engine(
+    tmp_path: Path,
+) -> None:
+    """Scan engines are a closed set so typos fail before any cache read."""
+    target = QualityTarget(
+        path=str(tmp_path / ".data"),
+        kind=QualityTargetKind.CACHE,
+        data_format="ascii",
+        timeframe=TICK,
+        symbol="EURUSD",
+        period="201202",
+    )
+
+    with pytest.raises(ValueError, match="unsupported tick scan engine"):
+        evaluate_tick_quality_bundle(
+            target,
+            ticks_quality_rules(),
+            scan_engine="vectorised",
+        )
+
+
+def test_quality_assessment_threads_tick_scan_engine(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Campaigns can opt into the columnar engine for cache TICK bundles."""
+    cache_path = tmp_path / ".data"
+    write_polars_cache(
+        to_polars_frame(parse_ascii_lines(TICK, CLEAN_TICK_CASE.rows)),
+        cache_path,
+    )
+    target = QualityTarget(
+        path=str(cache_path),
+        kind=QualityTargetKind.CACHE,
+        data_format="ascii",
+        timeframe=TICK,
+        symbol="EURUSD",
+        period="201202",
+    )
+
+    def fail_if_rows_are_scanned(*args, **kwargs):
+        raise AssertionError("columnar campaigns should not walk rows")
+
+    monkeypatch.setattr(
+        tick_rules,
+        "_scan_tick_cache_quality_rows",
+        fail_if_rows_are_scanned,
+    )
+
+    report = run_quality_assessment(
+        (target,),
+        quality_rules_for_groups(("ticks",)),
+        tick_scan_engine=TICK_SCAN_ENGINE_COLUMNAR,
+    )
+
+    assert report.status is QualityStatus.CLEAN
+    summary = _finding(report.findings, "ASCII_TICK_SPREAD_REGIME_SUMMARY")
+    assert summary.metadata["profiled_row_count"] == 3
+
+
+def _synthetic_tick_frame(seed: int, row_count: int) -> pl.DataFrame:
+    """Build a cache frame that exercises every tick scan branch."""
+    rng = random.Random(seed)
+    timestamp_utc_ms = 1_330_560_000_000
+    bid = 1.3
+    rows: list[tuple[int | None, float | None, float | None, int]] = []
+    while len(rows) < row_count:
+        if rows and rng.random() < 0.05:
+            rows.append(rows[-1])
+            continue
+        timestamp_utc_ms += rng.choice(
+            (0, 10, 50, 200, 1_000, 70_000, 3_600_000 * rng.randint(0, 30))
+        )
+        if rng.random() < 0.01:
+            timestamp_utc_ms -= 2_000
+        row_bid: float | None = bid
+        row_ask: float | None = bid + rng.choice(
+            (0.0, 0.0, 0.0001, 0.0002, -0.0001, 0.001, 0.01)
+        )
+        if rows and rng.random() < 0.3:
+            row_bid = rows[-1][1]
+        if rows and rng.random() < 0.2:
+            row_ask = rows[-1][2]
+        roll = rng.random()
+        if roll < 0.02:
+            row_bid = None
+        elif roll < 0.04:
+            row_ask = None
+        elif roll < 0.05:
+            row_bid = float("nan")
+        elif roll < 0.06:
+            row_ask = float("inf")
+        rows.append(
+            (
+                None if rng.random() < 0.02 else timestamp_utc_ms,
+                row_bid,
+                row_ask,
+                rng.choice((0, 0, 25)),
+            )
+        )
+        bid += rng.choice((0.0, 0.0, 0.0001, -0.0001))
+    return pl.DataFrame(
+        rows,
+        schema={
+            "datetime": pl.Int64,
+            "bid": pl.Float64,
+            "ask": pl.Float64,
+            "vol": pl.Int32,
+        },
+        orient="row",
+    )
+
+
 def _report_for_path(path: Path, *, rules=None):
     discovery = discover_quality_targets((path,))
     return run_quality_assessment(
@@ -16,7 +16,9 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from histdatacom.dataset_cli import main as dataset_cli_main
+from histdatacom.datasets import verification as dataset_verification
 from histdatacom.datasets import (
+    ArtifactVerificationCache,
     CANONICAL_TICK_PROJECTION_SCHEMA_VERSION,
     DATASET_TICK_PROJECTION_SCHEMA_VERSION,
     CanonicalObservedPartitionV2,
@@ -292,6 +294,64 @@ def test_histdata_adapter_rejects_timestamp_regression_outside_vendor_bound(
     assert raised.value.code is DatasetFailureCode.INCONSISTENT_COVERAGE
 
 
+@pytest.mark.parametrize(
+    ("bids", "timestamp_offsets", "code", "message"),
+    (
+        (
+            (1.1000, 1.1001, float("nan"), 1.1003),
+            (0, 1_000, 2_000, 0),
+            DatasetFailureCode.MALFORMED_QUOTE,
+            "partition row 3 has invalid bid/ask",
+        ),
+        (
+            (1.1000, 1.1001, 1.1002, 1.1003),
+            (0, 3_600_002, 1, 2_000),
+            DatasetFailureCode.INCONSISTENT_COVERAGE,
+            "partition row 3 timestamp regresses",
+        ),
+        (
+            (1.1000, 1.1001, 1.1002, -1.0),
+            (0, 3_600_000, 1, 2_000),
+            DatasetFailureCode.MALFORMED_QUOTE,
+            "partition row 4 has invalid bid/ask",
+        ),
+    ),
+)
+def test_histdata_adapter_reports_first_offending_partition_row(
+    tmp_path: Path,
+    bids: tuple[float, ...],
+    timestamp_offsets: tuple[int, ...],
+    code: DatasetFailureCode,
+    message: str,
+) -> None:
+    source_root = tmp_path / "ASCII" / "T"
+    path, _ = _write_histdata_cache(source_root)
+    pl.DataFrame(
+        {
+            "datetime": [_START_MS + offset for offset in timestamp_offsets],
+            "bid": bids,
+            "ask": [1.1010] * len(bids),
+            "vol": [0] * len(bids),
+        },
+        schema={
+            "datetime": pl.Int64,
+            "bid": pl.Float64,
+            "ask": pl.Float64,
+            "vol": pl.Int32,
+        },
+    ).write_ipc(path)
+
+    with pytest.raises(DatasetContractError) as raised:
+        HistDataProviderAdapter().inspect_partition(
+            source_root,
+            symbol=_SYMBOL,
+            period=_PERIOD,
+        )
+
+    assert raised.value.code is code
+    assert str(raised.value).endswith(message)
+
+
 def test_fixture_adapter_proves_different_clock_partition_and_provider_boundary(
     tmp_path: Path,
 ) -> None:
@@ -827,6 +887,48 @@ def test_catalog_round_trip_cli_and_receipt_replay_are_installed_surfaces(
     assert json.loads(capsys.readouterr().out)["status"] == "verified"
 
 
+def test_catalog_verification_cache_skips_unchanged_artifacts(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = tmp_path / "ASCII" / "T"
+    path, _ = _write_histdata_cache(root)
+    catalog, _ = _catalog(HistDataProviderAdapter(), root, tmp_path)
+    catalog_path = catalog.write(tmp_path / "catalog.json")
+    cache = ArtifactVerificationCache.for_catalog(catalog_path)
+    hashed: list[Path] = []
+    file_sha256 = dataset_verification._file_sha256
+
+    def counting_sha256(target: Path, *, label: str) -> str:
+        hashed.append(target)
+        return file_sha256(target, label=label)
+
+    monkeypatch.setattr(dataset_verification, "_file_sha256", counting_sha256)
+
+    cold = catalog.verify(
+        "latest-qualified", verification_cache=cache, hash_jobs=2
+    )
+    assert len(hashed) == 2
+    assert cache.path == tmp_path / "catalog.json.verified.sqlite3"
+
+    hashed.clear()
+    warm = catalog.verify("latest-qualified", verification_cache=cache)
+    assert warm == cold
+    assert hashed == []
+
+    catalog.verify("latest-qualified", verification_cache=cache, paranoid=True)
+    assert len(hashed) == 2
+
+    hashed.clear()
+    content = bytearray(path.read_bytes())
+    content[-1] ^= 0xFF
+    path.write_bytes(bytes(content))
+    with pytest.raises(DatasetContractError) as raised:
+        catalog.verify("latest-qualified", verification_cache=cache)
+    assert raised.value.code is DatasetFailureCode.ARTIFACT_HASH_MISMATCH
+    assert hashed == [path.resolve()]
+
+
 @given(
     st.lists(
         st.sampled_from(["EURUSD", "GBPUSD", "EURGBP"]),
@@ -4,30 +4,41 @@ from __future__ import annotations
 
 import zipfile
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from histdatacom.histdata_ascii import (
     CACHE_FILENAME,
+    CACHE_FORMAT_VERSION,
+    CACHE_MEMORY_MAP_ENV,
     CacheSummary,
     EST_NO_DST_OFFSET_MS,
     LEGACY_CACHE_ERROR,
     ParsedAsciiBatch,
     TICK_COLUMNS,
+    ascii_chunk_bytes_for_memory_limit,
+    cache_index_path,
+    clear_mapped_cache_frames,
     convert_polars_datetime_to_utc_ms,
     convert_batch_for_api,
     delimiter_for_timeframe,
+    encode_influx_lines,
     filename_has_unsupported_raw_dimensions,
     format_influx_line,
+    influx_line_encoder,
+    iter_ascii_polars_chunks,
     merge_batches,
     normalize_ascii_row,
     parse_histdata_datetime_to_utc_ms,
     polars_datetime_to_utc_ms_expr,
     read_ascii_file,
     read_ascii_file_to_polars,
+    read_cache_index,
     read_polars_cache,
     raw_polars_schema_for_timeframe,
     rows_as_records,
+    scan_polars_cache,
     summarize_rows,
     write_polars_cache,
 )
@@ -234,6 +245,78 @@ def test_polars_ingest_reads_zip_fixtures_like_csv_files(
     ).to_dicts() == list(expected_records)
 
 
+@pytest.mark.parametrize("archive", (False, True))
+@pytest.mark.parametrize("chunk_bytes", (1, 40, 1 << 20))
+def test_streaming_ingest_matches_whole_file_ingest(
+    tmp_path: Path,
+    archive: bool,
+    chunk_bytes: int,
+) -> None:
+    """Line-aligned streaming blocks should rebuild the eager frame."""
+    import polars as pl
+
+    filename = "DAT_ASCII_EURUSD_T_201202.csv"
+    source = FIXTURES / filename
+    if archive:
+        source = tmp_path / f"{filename}.zip"
+        with zipfile.ZipFile(source, "w", zipfile.ZIP_DEFLATED) as payload:
+            payload.write(FIXTURES / filename, arcname=filename)
+    expected = convert_polars_datetime_to_utc_ms(
+        read_ascii_file_to_polars(source, "T"),
+        "T",
+    )
+
+    chunks = list(
+        iter_ascii_polars_chunks(source, "T", chunk_bytes=chunk_bytes)
+    )
+
+    assert len(chunks) == (1 if chunk_bytes > 1000 else 3)
+    assert pl.concat(chunks).equals(expected)
+
+
+def test_streaming_ingest_trims_padded_blocks(tmp_path: Path) -> None:
+    """Padded legacy blocks should fall back to the trimmed string parse."""
+    path = tmp_path / "padded.csv"
+    path.write_text(
+        "20120201 000003660 ,1.3066    ,1.30677   ,0   \n"
+        "20120201 000004000,1.3067,1.3068,0\n",
+        encoding="utf-8",
+    )
+
+    chunks = list(iter_ascii_polars_chunks(path, "T", chunk_bytes=1))
+
+    assert [chunk.to_dicts() for chunk in chunks] == [
+        [
+            {
+                "datetime": 1328072403660,
+                "bid": 1.3066,
+                "ask": 1.30677,
+                "vol": 0,
+            }
+        ],
+        [
+            {
+                "datetime": 1328072404000,
+                "bid": 1.3067,
+                "ask": 1.3068,
+                "vol": 0,
+            }
+        ],
+    ]
+
+
+def test_ascii_chunk_bytes_follow_memory_limit() -> None:
+    """Memory ceilings should shrink parse blocks within fixed bounds."""
+    assert ascii_chunk_bytes_for_memory_limit(None) == 8 * 1024 * 1024
+    assert ascii_chunk_bytes_for_memory_limit(1 << 40) == 8 * 1024 * 1024
+    assert ascii_chunk_bytes_for_memory_limit(16 * 1024 * 1024) == (
+        2 * 1024 * 1024
+    )
+    assert ascii_chunk_bytes_for_memory_limit(1) == 64 * 1024
+    with pytest.raises(ValueError, match="positive"):
+        ascii_chunk_bytes_for_memory_limit(0)
+
+
 def test_polars_raw_schema_rejects_unsupported_timeframes() -> None:
     """Unsupported layouts should fail before Polars scans input data."""
     with pytest.raises(ValueError, match="unsupported ASCII timeframe"):
@@ -317,6 +400,125 @@ def test_polars_cache_round_trip_preserves_schema_and_values(
     assert round_trip.to_dicts() == frame.to_dicts()
 
 
+def _sorted_tick_frame(rows: int) -> Any:
+    import polars as pl
+
+    return pl.DataFrame(
+        {
+            "datetime": pl.int_range(0, rows, eager=True) * 1_000,
+            "bid": pl.int_range(0, rows, eager=True).cast(pl.Float64),
+        }
+    )
+
+
+def test_polars_cache_writes_versioned_footer_index(tmp_path: Path) -> None:
+    """Versioned caches record per-batch datetime bounds beside the file."""
+    cache_path = tmp_path / CACHE_FILENAME
+
+    written = write_polars_cache(_sorted_tick_frame(150_000), cache_path)
+
+    assert read_cache_index(cache_path) == written
+    assert written.format_version == CACHE_FORMAT_VERSION
+    assert written.row_count == 150_000
+    assert [
+        (batch.offset, batch.rows, batch.datetime_min, batch.datetime_max)
+        for batch in written.batches
+    ] == [
+        (0, 65_536, 0, 65_535_000),
+        (65_536, 65_536, 65_536_000, 131_071_000),
+        (131_072, 18_928, 131_072_000, 149_999_000),
+    ]
+    assert written.row_spans(70_000_000, 80_000_000) == ((65_536, 65_536),)
+    assert written.row_spans(0, 140_000_000) == ((0, 150_000),)
+    assert written.row_spans(200_000_000, None) == ()
+
+
+def test_polars_cache_range_reads_match_filtered_full_reads(
+    tmp_path: Path,
+) -> None:
+    """Index-guided range reads return exactly the half-open range rows."""
+    import polars as pl
+
+    frame = _sorted_tick_frame(150_000)
+    versioned = tmp_path / "versioned" / CACHE_FILENAME
+    unversioned = tmp_path / "unversioned" / CACHE_FILENAME
+    versioned.parent.mkdir()
+    unversioned.parent.mkdir()
+    write_polars_cache(frame, versioned)
+    frame.write_ipc(unversioned)
+    expected = frame.filter(
+        (pl.col("datetime") >= 65_000_000) & (pl.col("datetime") < 70_000_000)
+    )
+
+    for path in (versioned, unversioned):
+        assert read_polars_cache(
+            path,
+            start_utc_ms=65_000_000,
+            end_utc_ms=70_000_000,
+        ).equals(expected)
+    assert (
+        scan_polars_cache(versioned, start_utc_ms=500_000_000)
+        .collect()
+        .is_empty()
+    )
+    assert read_cache_index(unversioned) is None
+
+
+def test_polars_cache_ignores_stale_footer_index(tmp_path: Path) -> None:
+    """An index written for another file version must not steer reads."""
+    cache_path = tmp_path / CACHE_FILENAME
+    write_polars_cache(_sorted_tick_frame(10), cache_path)
+    index_payload = cache_index_path(cache_path).read_text(encoding="utf-8")
+    replacement = _sorted_tick_frame(20)
+    replacement.write_ipc(cache_path)
+    cache_index_path(cache_path).write_text(index_payload, encoding="utf-8")
+
+    assert read_cache_index(cache_path) is None
+    assert read_polars_cache(cache_path, start_utc_ms=15_000).height == 5
+
+
+def test_memory_mapped_cache_reads_share_one_frame_per_file_version(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Opted-in readers share a frame until the cache file changes."""
+    cache_path = tmp_path / CACHE_FILENAME
+    write_polars_cache(
+        _sorted_tick_frame(10),
+        cache_path,
+        compression="uncompressed",
+    )
+    clear_mapped_cache_frames()
+    monkeypatch.setenv(CACHE_MEMORY_MAP_ENV, "1")
+
+    first = read_polars_cache(cache_path)
+    second = read_polars_cache(cache_path)
+    copied = read_polars_cache(cache_path, memory_map=False)
+
+    assert first is second
+    assert copied is not first
+    assert first.equals(_sorted_tick_frame(10))
+    assert read_cache_index(cache_path).compression == "uncompressed"
+
+    write_polars_cache(_sorted_tick_frame(20), cache_path)
+
+    assert read_polars_cache(cache_path).height == 20
+    clear_mapped_cache_frames()
+
+
+def test_memory_mapped_cache_reads_keep_legacy_guidance(
+    tmp_path: Path,
+) -> None:
+    """Shared reads fail with the same migration guidance as copied reads."""
+    cache_path = tmp_path / CACHE_FILENAME
+    cache_path.write_bytes(b"not an arrow ipc payload")
+
+    with pytest.raises(ValueError) as err:
+        read_polars_cache(cache_path, memory_map=True)
+
+    assert str(err.value) == LEGACY_CACHE_ERROR
+
+
 def test_polars_cache_rejects_legacy_cache_payloads(
     tmp_path: Path,
 ) -> None:
@@ -653,3 +855,111 @@ def test_enriched_influx_line_rejects_retired_row_dimensions() -> None:
             row,
             columns=columns,
         )
+
+
+def _row_influx_payload(frame: object) -> bytes:
+    """Return the row formatter's payload for a Polars frame."""
+    return "\n".join(
+        format_influx_line(
+            "eur usd",
+            "ascii",
+            "T",
+            row,
+            columns=frame.columns,  # type: ignore[attr-defined]
+        )
+        for row in frame.iter_rows()  # type: ignore[attr-defined]
+    ).encode("utf-8")
+
+
+def test_columnar_influx_encoder_matches_row_formatter_bytes() -> None:
+    """Batch encoding should stay byte-identical to per-row formatting."""
+    import polars as pl
+
+    floats = [
+        1.30658,
+        -0.0,
+        3e-05,
+        -1.5e-07,
+        0.0001,
+        1e16,
+        1e-300,
+        float("nan"),
+        float("inf"),
+        None,
+    ]
+    frame = pl.DataFrame(
+        {
+            "datetime": [1_000 + index for index in range(len(floats))],
+            "bid": floats,
+            "ask": list(reversed(floats)),
+            "vol": [0] * len(floats),
+            "source": ["histdata.com", "a b", None, "", "x,y=z"] * 2,
+            "format": ["ascii"] * len(floats),
+            "period": ["201202", "", None, "201202", "201203"] * 2,
+            "row_id": [1, 2, None, 4, 5, 6, 7, 8, 9, 10],
+            "spread": floats,
+            "narrow": pl.Series(floats, dtype=pl.Float32),
+            "training_usable": [True, False, None, True, False] * 2,
+            "quality_status_code": pl.Series(
+                [0, 1, None, -3, 2] * 2,
+                dtype=pl.Int32,
+            ),
+            "reason note": ['a"b', "c\\d", None, "", "e f"] * 2,
+            "always_null": [None] * len(floats),
+        }
+    )
+
+    encoder = influx_line_encoder("eur usd", "ascii", "T", frame)
+
+    assert encoder.line_expr is not None
+    assert encode_influx_lines("eur usd", "ascii", "T", frame) == (
+        _row_influx_payload(frame)
+    )
+    assert (
+        b"".join(
+            encoder.encode(frame_slice) + b"\n"
+            for frame_slice in frame.iter_slices(n_rows=3)
+        )
+        == _row_influx_payload(frame) + b"\n"
+    )
+
+
+def test_columnar_influx_encoder_falls_back_for_unplanned_dtypes() -> None:
+    """Column types without an expression path should use the row formatter."""
+    from datetime import date
+
+    import polars as pl
+
+    frame = pl.DataFrame(
+        {
+            "datetime": [1_000, 2_000],
+            "bid": [1.0, 1.1],
+            "ask": [1.2, 1.3],
+            "vol": [0, 0],
+            "session_date": [date(2012, 2, 1), None],
+        }
+    )
+
+    encoder = influx_line_encoder("eur usd", "ascii", "T", frame)
+
+    assert encoder.line_expr is None
+    assert encoder.encode(frame) == _row_influx_payload(frame)
+    assert encoder.encode(frame.head(0)) == b""
+
+
+def test_columnar_influx_encoder_rejects_retired_row_dimensions() -> None:
+    """The batch encoder should enforce the row formatter's dimensions."""
+    import polars as pl
+
+    frame = pl.DataFrame(
+        {
+            "datetime": [1_000, 2_000],
+            "bid": [1.0, 1.1],
+            "ask": [1.2, 1.3],
+            "vol": [0, 0],
+            "timeframe": ["T", "M1"],
+        }
+    )
+
+    with pytest.raises(ValueError, match="unsupported ASCII timeframe: M1"):
+        influx_line_encoder("eurusd", "ascii", "T", frame)
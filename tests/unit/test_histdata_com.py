@@ -2982,6 +2982,10 @@ def test_api_orchestration_materialization_applies_exact_random_window(
     stage_result["work_item"] = {
         "metadata": {RANDOM_WINDOW_SELECTION_METADATA_KEY: selection.to_dict()}
     }
+    stage_result["artifacts"][0]["metadata"].update(
+        start=str(start - 1),
+        end=str(end),
+    )
 
     monkeypatch.setattr(
         histdata_com,
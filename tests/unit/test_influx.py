@@ -102,8 +102,8 @@ def test_import_cache_batches_polars_rows_into_influx_sink(
         def __init__(self) -> None:
             self.items: list[list[str]] = []
 
-        def put(self, item: list[str]) -> None:
-            self.items.append(item)
+        def put(self, item: bytes) -> None:
+            self.items.append(item.decode("utf-8").split("\n"))
 
     frame = _read_cache_frame(
         tmp_path,
@@ -148,8 +148,8 @@ def test_import_cache_enriches_legacy_raw_cache_before_projection(
         def __init__(self) -> None:
             self.items: list[list[str]] = []
 
-        def put(self, item: list[str]) -> None:
-            self.items.append(item)
+        def put(self, item: bytes) -> None:
+            self.items.append(item.decode("utf-8").split("\n"))
 
     source_record = SimpleNamespace(data_timeframe="T")
     raw_frame = Api._import_file_to_polars(
@@ -329,6 +329,8 @@ def test_influx_batch_writer_writes_direct_synchronous_batches(
         }
     ) as writer:
         writer.write_lines(["line-1", "line-2"])
+        writer.write_lines(b"line-3\nline-4")
+        writer.write_lines(b"")
 
     [client] = FakeClient.instances
     assert client.kwargs == {
@@ -344,7 +346,13 @@ def test_influx_batch_writer_writes_direct_synchronous_batches(
             "bucket": "bucket",
             "record": ["line-1", "line-2"],
             "write_precision": "ms",
-        }
+        },
+        {
+            "org": "org",
+            "bucket": "bucket",
+            "record": b"line-3\nline-4",
+            "write_precision": "ms",
+        },
     ]
     assert client.write_api_instance.closed
     assert client.closed
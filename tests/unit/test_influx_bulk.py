@@ -0,0 +1,203 @@
+"""Tests for pooled, gzip-compressed InfluxDB bulk writes."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from histdatacom import influx as influx_module
+from histdatacom.exceptions import InfluxConfigurationError, InfluxImportError
+from histdatacom.influx_bulk import (
+    INFLUX_MAX_IN_FLIGHT_ENV,
+    INFLUX_WRITER_ENV,
+    InfluxBulkWriter,
+    influx_max_in_flight,
+    influx_writer_kind,
+)
+
+_SCRIPT = Path(__file__).parents[2] / "scripts" / "benchmark_influx_writes.py"
+
+
+def _load_benchmark() -> Any:
+    spec = importlib.util.spec_from_file_location("_influx_bench", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmark = _load_benchmark()
+
+ARGS = {
+    "INFLUX_ORG": "org",
+    "INFLUX_BUCKET": "bucket",
+    "INFLUX_TOKEN": "token",
+}
+
+
+@pytest.fixture
+def endpoint() -> Iterator[Any]:
+    server = benchmark.WriteEndpoint(latency_seconds=0.02).start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+def _lines(start: int, count: int, measurement: str = "ticks") -> list[str]:
+    return [
+        f"{measurement},fxpair=EURUSD bidquote=1.{index:04d} {index}"
+        for index in range(start, start + count)
+    ]
+
+
+def test_bulk_writer_coalesces_gzip_bodies_within_in_flight_limit(
+    endpoint: Any,
+) -> None:
+    """Emitted batches share pooled sockets and never exceed the window."""
+    writer = InfluxBulkWriter(
+        {**ARGS, "INFLUX_URL": endpoint.url},
+        max_in_flight=2,
+        batch_lines=50,
+        session=requests.Session(),
+    )
+    with writer:
+        for start in range(0, 1000, 10):
+            writer.write_lines(_lines(start, 10))
+
+    assert endpoint.lines == 1000
+    assert endpoint.requests == 20
+    assert endpoint.gzip_bodies == 20
+    assert endpoint.max_active == 2
+    assert len(endpoint.connections) <= 2
+    assert writer.lines_written == 1000
+    assert writer.batches_written == 20
+
+
+def test_bulk_writer_retries_throttling_with_jittered_backoff(
+    endpoint: Any,
+) -> None:
+    """HTTP 429 responses are retried until the body lands."""
+    endpoint.throttle_every = 2
+    sleeps: list[float] = []
+    writer = InfluxBulkWriter(
+        {**ARGS, "INFLUX_URL": endpoint.url},
+        max_in_flight=1,
+        batch_lines=10,
+        session=requests.Session(),
+        sleep=sleeps.append,
+        jitter=lambda: 0.5,
+    )
+    with writer:
+        for start in range(0, 40, 10):
+            writer.write_lines(_lines(start, 10))
+
+    assert endpoint.lines == 40
+    assert writer.retries == 3
+    assert sleeps == [0.25] * 3
+
+
+def test_bulk_writer_bisects_rejected_bodies_to_the_bad_line(
+    endpoint: Any,
+) -> None:
+    """A 400 rejects only the offending line; the rest still land."""
+    writer = InfluxBulkWriter(
+        {**ARGS, "INFLUX_URL": endpoint.url},
+        batch_lines=64,
+        session=requests.Session(),
+    )
+    writer.write_lines(_lines(0, 40) + _lines(40, 1, "reject") + _lines(41, 23))
+
+    with pytest.raises(InfluxImportError) as failure:
+        writer.close()
+
+    assert failure.value.code == "INFLUX_WRITE_REJECTED"
+    assert not failure.value.retryable
+    assert endpoint.lines == 63
+    assert writer.lines_rejected == 1
+
+
+def test_bulk_writer_surfaces_exhausted_retries_as_retryable(
+    endpoint: Any,
+) -> None:
+    """A server that keeps throttling fails the import as retryable."""
+    endpoint.throttle_every = 1
+    writer = InfluxBulkWriter(
+        {**ARGS, "INFLUX_URL": endpoint.url},
+        max_retries=2,
+        session=requests.Session(),
+        sleep=lambda seconds: None,
+    )
+    writer.write_lines(_lines(0, 5))
+
+    with pytest.raises(InfluxImportError) as failure:
+        writer.close()
+
+    assert failure.value.code == "INFLUX_IMPORT_RETRYABLE"
+    assert failure.value.retryable
+    assert endpoint.requests == 3
+
+
+def test_influx_writer_selection_reads_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The bulk writer is opt-in and invalid settings fail closed."""
+    monkeypatch.delenv(INFLUX_WRITER_ENV, raising=False)
+    monkeypatch.delenv(INFLUX_MAX_IN_FLIGHT_ENV, raising=False)
+    assert influx_writer_kind() == "client"
+    assert influx_max_in_flight() == 4
+
+    monkeypatch.setenv(INFLUX_WRITER_ENV, "Bulk")
+    monkeypatch.setenv(INFLUX_MAX_IN_FLIGHT_ENV, "3")
+    writer = influx_module.influx_batch_writer(
+        {**ARGS, "INFLUX_URL": "http://127.0.0.1:1"}
+    )
+    try:
+        assert isinstance(writer, InfluxBulkWriter)
+        assert writer.max_in_flight == 3
+    finally:
+        writer.close()
+
+    monkeypatch.setenv(INFLUX_MAX_IN_FLIGHT_ENV, "0")
+    with pytest.raises(InfluxConfigurationError):
+        influx_max_in_flight()
+    monkeypatch.setenv(INFLUX_WRITER_ENV, "async")
+    with pytest.raises(InfluxConfigurationError):
+        influx_writer_kind()
+
+
+def test_bulk_writer_blocks_producers_while_the_window_is_full(
+    endpoint: Any,
+) -> None:
+    """Back-pressure holds ``write_lines`` until a body completes."""
+    endpoint.latency_seconds = 0.2
+    writer = InfluxBulkWriter(
+        {**ARGS, "INFLUX_URL": endpoint.url},
+        max_in_flight=1,
+        batch_lines=1,
+        session=requests.Session(),
+    )
+    writer.write_lines(_lines(0, 1))
+    blocked = threading.Event()
+    released = threading.Event()
+
+    def produce() -> None:
+        blocked.set()
+        writer.write_lines(_lines(1, 1))
+        released.set()
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    blocked.wait()
+    assert not released.wait(0.05)
+    thread.join()
+    writer.close()
+    assert endpoint.lines == 2
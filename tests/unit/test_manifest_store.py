@@ -16,6 +16,7 @@ from histdatacom.manifest_store import (
     MANIFEST_DIRECTORY,
     MANIFEST_SCHEMA_VERSION,
     ManifestStatusStore,
+    close_manifest_connections,
 )
 from histdatacom.records import Record
 from histdatacom.runtime_contracts import (
@@ -294,6 +295,135 @@ def test_manifest_store_persists_dataset_plan_work_items(
     ]
 
 
+def test_manifest_store_bulk_writes_commit_one_batch(
+    tmp_path: Path,
+) -> None:
+    """Bulk writes should land together or not at all."""
+    store = ManifestStatusStore(tmp_path)
+    items = tuple(
+        WorkItem(
+            work_id=f"work-eurusd-2022{month:02d}",
+            status=WorkStatus.URL_NEW,
+            data_fxpair="eurusd",
+            data_timeframe="T",
+            data_format="ASCII",
+            data_datemonth=f"2022{month:02d}",
+        )
+        for month in range(1, 13)
+    )
+
+    assert store.write_work_items_many(items, source="batch") == len(items)
+    assert store.write_stage_results_many(
+        StageResult(
+            work_id=item.work_id,
+            stage="validate_url",
+            status=WorkStatus.URL_VALID,
+            metrics={"attempts": 1},
+        )
+        for item in items
+    ) == len(items)
+    with pytest.raises(TypeError):
+        store.write_stage_results_many(
+            (
+                StageResult(
+                    work_id=items[0].work_id,
+                    stage="download_archive",
+                    status=WorkStatus.URL_VALID,
+                ),
+                StageResult(
+                    work_id=items[1].work_id,
+                    stage="download_archive",
+                    status=WorkStatus.URL_VALID,
+                    metrics={"unserializable": object()},
+                ),
+            )
+        )
+
+    assert len(store.list_work_items()) == len(items)
+    [event] = store.status_history(items[0].work_id, owner_kind="work_item")
+    assert event["stage"] == "batch"
+    assert [
+        result["stage"] for result in store.list_stage_results(items[0].work_id)
+    ] == ["validate_url"]
+
+
+def test_manifest_store_pools_tuned_connections_per_database(
+    tmp_path: Path,
+) -> None:
+    """Stores for one root share a connection until the file is replaced."""
+    first = ManifestStatusStore(tmp_path)
+    second = ManifestStatusStore(tmp_path)
+    conn = first._connect()
+
+    assert second._connect() is conn
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    for path in first.db_path.parent.iterdir():
+        path.unlink()
+    replaced = ManifestStatusStore(tmp_path)
+    replaced.write_work_item(
+        WorkItem(work_id="work-after-replace", status=WorkStatus.URL_NEW)
+    )
+
+    assert replaced._connect() is not conn
+    assert [item.work_id for item in replaced.list_work_items()] == [
+        "work-after-replace"
+    ]
+    close_manifest_connections()
+
+
+def test_manifest_store_indexes_repository_pairs_incrementally(
+    tmp_path: Path,
+) -> None:
+    """Repository syncs should touch only changed pairs and query in SQL."""
+    store = ManifestStatusStore(tmp_path)
+    repo_path = tmp_path / ".repo"
+    repo_data = {
+        "eurusd": {"start": "200005", "end": "202212"},
+        "gbpusd": {"start": "200101", "end": "202212"},
+        "usdjpy": {"start": "200005", "end": "202212"},
+        "hash": "first",
+        "hash_utc": 1.0,
+    }
+    repo_path.write_text(json.dumps(repo_data), encoding="UTF-8")
+
+    assert not store.repository_index_is_current(repo_path)
+    assert (
+        store.sync_repository_index(
+            repo_data,
+            repo_path=repo_path,
+            source_stat=repo_path.stat(),
+        )
+        == 3
+    )
+    assert store.repository_index_is_current(repo_path)
+
+    updated = dict(repo_data)
+    updated["gbpusd"] = {"start": "200101", "end": "202301"}
+    del updated["usdjpy"]
+    repo_path.write_text(json.dumps(updated), encoding="UTF-8")
+    os.utime(repo_path, ns=(1, 1))
+
+    assert not store.repository_index_is_current(repo_path)
+    assert (
+        store.sync_repository_index(
+            updated,
+            repo_path=repo_path,
+            source_stat=repo_path.stat(),
+        )
+        == 2
+    )
+    assert store.repository_pair_count() == 2
+    assert list(store.query_repository_pairs(by="start_dsc")) == [
+        "gbpusd",
+        "eurusd",
+    ]
+    assert store.query_repository_pairs({"gbpusd", "audusd"}) == {
+        "gbpusd": {"start": "200101", "end": "202301"}
+    }
+
+
 def test_manifest_store_persists_orchestration_job_snapshots(
     tmp_path: Path,
 ) -> None:
@@ -347,6 +477,48 @@ def test_manifest_store_persists_orchestration_job_snapshots(
     assert artifact["metadata"]["line_count"] == 3
 
 
+def test_manifest_store_summarizes_stage_timings_per_run(
+    tmp_path: Path,
+) -> None:
+    """Live stage results aggregate into per-phase p50/p95 for one run."""
+    store = ManifestStatusStore(tmp_path)
+    for request_id, work_index, parse_ms in (
+        ("run-1", 0, 10.0),
+        ("run-1", 1, 30.0),
+        ("run-1", 2, 20.0),
+        ("run-2", 3, 900.0),
+    ):
+        store.write_live_stage_update(
+            request_id=request_id,
+            job_id=f"histdatacom-{request_id}",
+            result=StageResult(
+                work_id=f"work-{work_index}",
+                stage="build_cache",
+                status=WorkStatus.CACHE_READY,
+                metrics={
+                    "timings_ms": {"csv_parse": parse_ms, "ipc_write": 1.0},
+                    "bytes_in": 100,
+                    "bytes_out": 40,
+                },
+            ),
+        )
+
+    summary = store.stage_timing_summary(request_id="run-1")
+
+    build_cache = summary["build_cache"]
+    assert build_cache["count"] == 3
+    assert build_cache["bytes_in"] == 300
+    assert build_cache["bytes_out"] == 120
+    assert build_cache["phases"]["csv_parse"] == {
+        "count": 3,
+        "total_ms": 60.0,
+        "p50_ms": 20.0,
+        "p95_ms": 30.0,
+        "max_ms": 30.0,
+    }
+    assert store.stage_timing_summary()["build_cache"]["count"] == 4
+
+
 def test_manifest_store_coalesces_repeated_job_artifacts(
     tmp_path: Path,
 ) -> None:
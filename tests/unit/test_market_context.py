@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import random
 from dataclasses import replace
+from datetime import datetime, timezone
 
 import pytest
 
@@ -547,6 +549,131 @@ def test_missing_context_is_explicit_inside_outside_and_incomplete() -> None:
     assert quiet.calendar_state is not None
 
 
+def _scattered_event(rng: random.Random, index: int) -> MarketContextEventV1:
+    event_time = EVENT_TIME_NS + rng.randrange(-20 * DAY_NS, 20 * DAY_NS, 10**9)
+    available = event_time - rng.randrange(-2 * HOUR_NS, 2 * HOUR_NS, 10**9)
+    currencies = rng.sample(("USD", "EUR", "GBP", "JPY"), rng.randint(0, 2))
+    return replace(
+        _initial_event(
+            canonical_key=f"fixture.scattered.{index}",
+            source=_source(retrieved_at_ns=EVENT_TIME_NS + 30 * DAY_NS),
+        ),
+        kind=rng.choice(
+            (
+                MarketContextKind.MACRO_RELEASE,
+                MarketContextKind.CENTRAL_BANK_DECISION,
+                MarketContextKind.SCHEDULED_COMMUNICATION,
+            )
+        ),
+        source_event_time=datetime.fromtimestamp(
+            event_time // 10**9, tz=timezone.utc
+        ).isoformat(),
+        source_timezone="UTC",
+        event_time_ns=event_time,
+        first_known_at_ns=available - rng.randrange(0, DAY_NS, 10**9),
+        available_at_ns=available,
+        pre_event_ns=rng.choice((0, HOUR_NS, 3 * DAY_NS)),
+        post_event_ns=rng.choice((60 * 10**9, 4 * HOUR_NS, 5 * DAY_NS)),
+        affected_currencies=tuple(currencies),
+        affected_symbols=() if currencies else ("EURUSD",),
+        event_id="",
+    )
+
+
+def _scan_market_context(
+    timeline: MarketContextTimelineV1,
+    *,
+    start_ns: int,
+    end_ns: int,
+    as_of_ns: int | None,
+    currencies: tuple[str, ...],
+    symbols: tuple[str, ...],
+    kinds: tuple[MarketContextKind, ...],
+) -> tuple[list[str], bool]:
+    matched = []
+    hidden = False
+    for event in timeline.events:
+        if not event.overlaps(start_ns, end_ns):
+            continue
+        if (currencies or symbols) and not (
+            set(currencies) & set(event.affected_currencies)
+            or set(symbols) & set(event.affected_symbols)
+        ):
+            continue
+        if kinds and event.kind not in kinds:
+            continue
+        if (
+            as_of_ns is not None
+            and max(event.first_known_at_ns, event.available_at_ns) > as_of_ns
+        ):
+            hidden = True
+            continue
+        matched.append(event.event_id)
+    return matched, hidden
+
+
+def test_indexed_query_matches_a_full_timeline_scan() -> None:
+    rng = random.Random(24)
+    timeline = replace(
+        _timeline(),
+        events=tuple(_scattered_event(rng, index) for index in range(120)),
+        timeline_id="",
+    )
+    assert timeline == replace(timeline, timeline_id="")
+
+    for _ in range(300):
+        start = timeline.coverage_start_ns + rng.randrange(40 * DAY_NS)
+        end = start + rng.choice((1, HOUR_NS, DAY_NS, 10 * DAY_NS))
+        view = rng.choice(tuple(MarketContextView))
+        as_of = (
+            start + rng.randrange(-DAY_NS, DAY_NS)
+            if view is MarketContextView.EX_ANTE
+            else None
+        )
+        currencies = tuple(rng.sample(("USD", "EUR", "CHF"), rng.randint(0, 2)))
+        symbols = ("EURUSD",) if rng.random() < 0.3 else ()
+        kinds = tuple(
+            rng.sample(
+                (
+                    MarketContextKind.MACRO_RELEASE,
+                    MarketContextKind.SCHEDULED_COMMUNICATION,
+                ),
+                rng.randint(0, 1),
+            )
+        )
+        expected, hidden = _scan_market_context(
+            timeline,
+            start_ns=start,
+            end_ns=end,
+            as_of_ns=as_of,
+            currencies=currencies,
+            symbols=symbols,
+            kinds=kinds,
+        )
+        try:
+            result = query_market_context(
+                timeline,
+                start_ns=start,
+                end_ns=end,
+                view=view,
+                as_of_ns=as_of,
+                currencies=currencies,
+                symbols=symbols,
+                kinds=kinds,
+                include_calendar=False,
+                max_events=16,
+            )
+        except MarketContextQueryLimitError:
+            assert len(expected) > 16
+            continue
+        assert [item.event_id for item in result.events] == expected
+        if not expected and start < timeline.coverage_end_ns:
+            assert (
+                result.missing_reason
+                is MarketContextMissingReason.NOT_AVAILABLE_AS_OF
+            ) is hidden
+
+
 def test_adapter_seam_retains_source_identity_and_rejects_mismatch() -> None:
     initial = _initial_event()
     adapter = StaticMarketContextSourceAdapterV1(
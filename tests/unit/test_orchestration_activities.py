@@ -96,10 +96,10 @@ class FakeInfluxWriter:
     def __exit__(self, *args: object) -> None:
         self.closed = True
 
-    def write_lines(self, lines: list[str]) -> None:
+    def write_lines(self, lines: bytes) -> None:
         if self.fail_with is not None:
             raise self.fail_with
-        self.batches.append(list(lines))
+        self.batches.append(lines.decode("utf-8").split("\n"))
 
 
 def _form_html(*, token: str = "token", datemonth: str = "2022") -> str:
@@ -1741,6 +1741,8 @@ def test_data_quality_activity_returns_failed_stage_for_policy_failure(
         run_rules=(),
         metadata=None,
         progress_callback=None,
+        jobs=1,
+        result_store=None,
     ):
         target = tuple(targets)[0]
         finding = QualityFinding(
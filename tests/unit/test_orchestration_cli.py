@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from histdatacom.runtime_contracts import RunRequest, WorkStatus
-from histdatacom.runtime_contracts import ArtifactRef, StatusEvent
+from histdatacom.runtime_contracts import ArtifactRef, StageResult, StatusEvent
 from histdatacom.scheduled_run_bundle import build_scheduled_run_bundle
 from histdatacom.orchestration import client as orchestration_client
 from histdatacom.orchestration import cli
@@ -1207,6 +1207,53 @@ def test_orchestration_jobs_offline_cli_reads_persisted_store(
     assert inspect_payload["workflow_id"] == "histdatacom-run-cli"
 
 
+def test_orchestration_jobs_timings_cli_reports_stage_percentiles(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The timings command aggregates the job's persisted stage metrics."""
+    config = build_orchestration_worker_config(
+        runtime_policy=build_orchestration_runtime_policy(
+            workspace=tmp_path / "workspace",
+            runtime_home=tmp_path / "runtime",
+        )
+    )
+    store = orchestration_client.orchestration_job_store(config)
+    store.write_job_snapshot(_snapshot())
+    store.write_live_stage_update(
+        request_id="run-cli",
+        job_id="histdatacom-run-cli",
+        result=StageResult(
+            work_id="work-cli",
+            stage="import_to_influx",
+            status=WorkStatus.INFLUX_UPLOAD,
+            metrics={
+                "timings_ms": {"line_format": 4.0, "line_write": 12.5},
+                "bytes_in": 10,
+                "bytes_out": 20,
+            },
+        ),
+    )
+    monkeypatch.setattr(
+        cli,
+        "_supervisor",
+        lambda args: _StatusOnlySupervisor("stopped"),
+    )
+    monkeypatch.setattr(cli, "_worker_config", lambda args: config)
+
+    json_exit = cli.main(["jobs", "--json", "timings", "histdatacom-run-cli"])
+    payload = json.loads(capsys.readouterr().out)
+    text_exit = cli.main(["jobs", "timings", "histdatacom-run-cli"])
+    text = capsys.readouterr().out
+
+    assert json_exit == text_exit == 0
+    assert payload["request_id"] == "run-cli"
+    phases = payload["stages"]["import_to_influx"]["phases"]
+    assert phases["line_write"]["p95_ms"] == 12.5
+    assert "line_write: p50=12.500ms p95=12.500ms" in text
+
+
 def test_orchestration_jobs_cancel_cli_passes_reason(
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
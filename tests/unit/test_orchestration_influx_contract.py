@@ -44,10 +44,10 @@ class _FakeInfluxWriter:
     def __exit__(self, *args: object) -> None:
         self.closed = True
 
-    def write_lines(self, lines: list[str]) -> None:
+    def write_lines(self, lines: bytes) -> None:
         if self.fail_with is not None:
             raise self.fail_with
-        self.batches.append(list(lines))
+        self.batches.append(lines.decode("utf-8").split("\n"))
 
 
 class _LocalImportActivityExecutor:
@@ -127,7 +127,7 @@ def test_fixture_baseline_measurements_cover_representative_operations(
     csv_path = FIXTURES / "DAT_ASCII_EURUSD_T_201202.csv"
     source_csv = tmp_path / csv_path.name
     source_csv.write_bytes(csv_path.read_bytes())
-    emitted_lines: list[list[str]] = []
+    emitted_lines: list[bytes] = []
 
     validate_item = WorkItem(
         work_id="work-validate",
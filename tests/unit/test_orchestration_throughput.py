@@ -128,6 +128,22 @@ def test_default_throughput_matrix_covers_issue_180_operations(
         "max_parallel_child_workflows": 2
     }
     assert cache.request.api_return_type == "polars"
+    assert "temporal_pipelining" not in cache.request.metadata
+
+
+def test_throughput_matrix_can_stream_work_items(tmp_path: Path) -> None:
+    """The streamed matrix opts every scenario into item pipelining."""
+    scenarios = default_throughput_benchmark_matrix(
+        data_directory=tmp_path,
+        stream_work_items=True,
+        max_in_flight_per_lane=3,
+    )
+
+    assert all(
+        scenario.request.metadata["temporal_pipelining"]
+        == {"stream_work_items": True, "max_in_flight_per_lane": 3}
+        for scenario in scenarios
+    )
 
 
 def test_throughput_report_serializes_performance_envelope(
@@ -836,6 +836,58 @@ class _ThreadingChildExecutor:
         return _operation_payload(workflow_name, payload)
 
 
+class _LaneLatencyChildExecutor:
+    """Fake executor that sleeps per lane and records lane concurrency."""
+
+    def __init__(self, *, cancel_stage: str = "") -> None:
+        self.calls: list[dict[str, object]] = []
+        self.events: list[tuple[str, str, str]] = []
+        self.active: dict[str, int] = {}
+        self.max_active: dict[str, int] = {}
+        self.cancel_stage = cancel_stage
+
+    async def execute_child_workflow(
+        self,
+        workflow_name: str,
+        payload: Mapping[str, JSONValue],
+        *,
+        workflow_id: str,
+        task_queue: str,
+    ) -> Mapping[str, object]:
+        """Return the operation payload after a short lane-bound delay."""
+        self.calls.append(
+            {
+                "workflow_name": workflow_name,
+                "payload": dict(payload),
+                "workflow_id": workflow_id,
+                "task_queue": task_queue,
+            }
+        )
+        self.active[task_queue] = self.active.get(task_queue, 0) + 1
+        self.max_active[task_queue] = max(
+            self.max_active.get(task_queue, 0),
+            self.active[task_queue],
+        )
+        self.events.append(("start", workflow_name, workflow_id))
+        try:
+            await asyncio.sleep(0.001)
+        finally:
+            self.active[task_queue] -= 1
+        self.events.append(("finish", workflow_name, workflow_id))
+        if workflow_name == self.cancel_stage:
+            return StageResult(
+                work_id=workflow_id,
+                stage=workflow_name,
+                status=WorkStatus.CANCELLED,
+                failure=FailureInfo(
+                    code="OPERATION_CANCELLED",
+                    message="operator cancelled",
+                    retryable=False,
+                ),
+            ).to_dict()
+        return _operation_payload(workflow_name, payload)
+
+
 def _planned_work_items() -> tuple[WorkItem, ...]:
     return (
         _work_item("EURUSD", "T", "2022-01"),
@@ -1897,6 +1949,118 @@ def test_symbol_timeframe_workflow_composes_operation_children() -> None:
     ]
 
 
+def _streaming_request(**metadata: object) -> RunRequest:
+    request = _request()
+    return _request(
+        metadata={
+            **request.metadata,
+            workflows.PIPELINING_METADATA_KEY: {
+                workflows.STREAM_WORK_ITEMS_METADATA_KEY: True,
+                workflows.MAX_IN_FLIGHT_PER_LANE_METADATA_KEY: 2,
+                **metadata,
+            },
+        }
+    )
+
+
+def test_streamed_symbol_workflow_matches_barrier_stage_results() -> None:
+    """Item pipelining keeps the barrier path's per-stage summaries."""
+    work_items = _multi_period_work_items(count=5)
+    payload = {
+        "partition": {"pair": "EURUSD", "timeframe": "T"},
+        "work_items": [item.to_dict() for item in work_items],
+    }
+    barrier_executor = _LaneLatencyChildExecutor()
+    streamed_executor = _LaneLatencyChildExecutor()
+
+    barrier = asyncio.run(
+        workflows.SymbolTimeframeWorkflow(executor=barrier_executor).run(
+            {**payload, "request": _request().to_dict()}
+        )
+    )
+    streamed = asyncio.run(
+        workflows.SymbolTimeframeWorkflow(executor=streamed_executor).run(
+            {**payload, "request": _streaming_request().to_dict()}
+        )
+    )
+
+    assert streamed["status"] == barrier["status"]
+    assert streamed["stage_results"] == barrier["stage_results"]
+    assert streamed["work_items"] == barrier["work_items"]
+    assert (
+        streamed["progress"]["completed_children"]
+        == barrier["progress"]["completed_children"]
+        == 6
+    )
+    streamed_names = [call["workflow_name"] for call in streamed_executor.calls]
+    assert streamed_names.count("ValidateUrlsWorkflow") == 5
+    assert streamed_names.count("MergeCacheWorkflow") == 1
+    assert streamed_names.count("ImportWorkflow") == 1
+    assert len(
+        {call["workflow_id"] for call in streamed_executor.calls}
+    ) == len(streamed_executor.calls)
+    assert all(
+        len(_payload_work_items(call)) == 1
+        for call in streamed_executor.calls
+        if call["workflow_name"] != "MergeCacheWorkflow"
+        and call["workflow_name"] != "ImportWorkflow"
+    )
+    assert max(streamed_executor.max_active.values()) <= 2
+    first_extract = streamed_executor.events.index(
+        next(
+            event
+            for event in streamed_executor.events
+            if event[:2] == ("start", "ExtractCsvWorkflow")
+        )
+    )
+    last_download = max(
+        position
+        for position, event in enumerate(streamed_executor.events)
+        if event[:2] == ("finish", "DownloadArchivesWorkflow")
+    )
+    assert first_extract < last_download
+
+
+def test_streamed_symbol_workflow_stops_new_children_after_cancel() -> None:
+    """A cancelled item stage stops items from entering later stages."""
+    executor = _LaneLatencyChildExecutor(
+        cancel_stage="DownloadArchivesWorkflow"
+    )
+    work_items = _multi_period_work_items(count=4)
+
+    summary = asyncio.run(
+        workflows.SymbolTimeframeWorkflow(executor=executor).run(
+            {
+                "request": _streaming_request().to_dict(),
+                "partition": {"pair": "EURUSD", "timeframe": "T"},
+                "work_items": [item.to_dict() for item in work_items],
+            }
+        )
+    )
+
+    names = [call["workflow_name"] for call in executor.calls]
+    assert "ExtractCsvWorkflow" not in names
+    assert "MergeCacheWorkflow" not in names
+    assert summary["status"] == WorkStatus.CANCELLED.value
+    assert [result["stage"] for result in summary["stage_results"]] == [
+        "ValidateUrlsWorkflow",
+        "DownloadArchivesWorkflow",
+    ]
+
+
+def test_streaming_metadata_is_validated() -> None:
+    """Pipelining is opt-in and its lane window must be positive."""
+    assert not workflows.stream_work_items(_request())
+    assert workflows.stream_work_items(_streaming_request())
+    assert workflows.max_in_flight_per_lane(_request()) == (
+        workflows.DEFAULT_MAX_IN_FLIGHT_PER_LANE
+    )
+    with pytest.raises(ValueError, match="max_in_flight_per_lane"):
+        workflows.max_in_flight_per_lane(
+            _streaming_request(max_in_flight_per_lane=0)
+        )
+
+
 def test_cache_only_request_builds_cache_without_merge() -> None:
     """Cache-only jobs should avoid dataframe materialization stages."""
     request = _request(
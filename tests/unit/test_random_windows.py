@@ -13,10 +13,12 @@ from histdatacom.random_windows import (
     RandomWindowSelectionV1,
     RandomWindowSupportError,
     RandomWindowSyntaxError,
+    coalesce_random_window_intervals,
     filter_polars_frame_to_random_window,
     parse_random_window_expression,
     random_window_intervals_for_range,
     random_window_planning_yearmonths,
+    random_window_polars_predicate,
     random_window_requires_seed,
     random_window_selection_from_metadata,
     resolve_random_window_selection,
@@ -292,6 +294,42 @@ def test_exact_half_open_filtering_handles_interval_union() -> None:
     assert intervals
 
 
+def test_sorted_frames_slice_the_coalesced_interval_union() -> None:
+    """Binary-search slicing should match the row predicate on any order."""
+    selection = resolve_random_window_selection(
+        "ldn",
+        seed=None,
+        pairs=("eurusd",),
+        repository_ranges=_repo(eurusd=("202401", "202401")),
+        start_yearmonth="202401",
+        end_yearmonth="202401",
+    )
+    start = _ms("2024-01-01T00:00:00")
+    timestamps = [start + offset * 600_000 for offset in range(6 * 24 * 7)]
+    frame = pl.DataFrame(
+        {"datetime": timestamps, "bid": range(len(timestamps))}
+    )
+    intervals = random_window_intervals_for_range(
+        selection,
+        range_start_utc_ms=timestamps[0],
+        range_end_utc_ms=timestamps[-1] + 1,
+    )
+
+    sliced = filter_polars_frame_to_random_window(frame, selection)
+    unordered = filter_polars_frame_to_random_window(frame.reverse(), selection)
+
+    assert len(intervals) > 1
+    assert sliced.equals(
+        frame.filter(random_window_polars_predicate(intervals))
+    )
+    assert (
+        sorted(unordered["datetime"].to_list()) == sliced["datetime"].to_list()
+    )
+    assert coalesce_random_window_intervals(
+        ((30, 40), (10, 20), (15, 25), (25, 26), (50, 50))
+    ) == ((10, 26), (30, 40))
+
+
 def test_duration_larger_than_support_fails_boundedly() -> None:
     """An impossible requested duration should not substitute another window."""
     with pytest.raises(RandomWindowSupportError, match="exceeds common"):
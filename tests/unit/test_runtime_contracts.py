@@ -139,6 +139,8 @@ def test_run_request_round_trips_options_payload() -> None:
     options.quality_fail_on = "warning"
     options.quality_max_errors = 2
     options.quality_max_warnings = 5
+    options.quality_jobs = 4
+    options.quality_incremental = True
     options.quality_profile_path = "profiles/strict.json"
     options.quality_profile = {
         "schema_version": "histdatacom.quality-profile.v1",
@@ -176,6 +178,8 @@ def test_run_request_round_trips_options_payload() -> None:
     assert restored.quality_fail_on == "warning"
     assert restored.quality_max_errors == 2
     assert restored.quality_max_warnings == 5
+    assert restored.quality_jobs == 4
+    assert restored.quality_incremental is True
     assert restored.quality_profile_path == "profiles/strict.json"
     assert restored.quality_profile["name"] == "strict"
     assert restored.quality_profile["rules"] == {
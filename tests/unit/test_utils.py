@@ -53,13 +53,14 @@ def test_normalize_api_return_type_rejects_unsupported_values(
         normalize_api_return_type(return_type)
 
     assert f"unsupported api_return_type '{return_type}'" in str(err.value)
-    assert "arrow, pandas, polars" in str(err.value)
+    assert "arrow, lazy, pandas, polars" in str(err.value)
 
 
 def test_api_return_type_contract_is_explicit() -> None:
     """Keep the public return-type contract visible."""
     assert SUPPORTED_API_RETURN_TYPES == {
         "arrow",
+        "lazy",
         "pandas",
         "polars",
     }